@@ -1,19 +1,94 @@
 """Dependency injection container for the application."""
 
 from functools import lru_cache
+from typing import Optional
+import logging
+import os
 
 from ..core.config import settings
 from ..core.interfaces import (
     EmbeddingModelProtocol,
     VectorStoreProtocol,
     LLMClientProtocol,
-    QueryProcessorProtocol
+    QueryProcessorProtocol,
+    AsyncEmbeddingModelProtocol,
+    AsyncVectorStoreProtocol,
+    AsyncLLMClientProtocol,
+    AsyncQueryProcessorProtocol,
+    SemanticCacheProtocol,
+    RewriteCacheProtocol,
+    EmbeddingCacheProtocol,
+    SingleFlightProtocol,
+    AsyncSingleFlightProtocol,
+    LexicalIndexProtocol,
+    PipelineMetricsProtocol,
+    TracerProtocol
 )
-from ..infrastructure.embedding import create_embedding_model
-from ..infrastructure.vector_store import create_vector_store
-from ..infrastructure.llm import create_llm_client
-from ..infrastructure.query_processor import create_query_processor
-from ..domain.services import RAGService
+from ..infrastructure.embedding import create_embedding_model, create_async_embedding_model
+from ..infrastructure.vector_store import create_vector_store, create_async_vector_store
+from ..infrastructure.llm import create_llm_client, create_async_llm_client
+from ..infrastructure.query_processor import create_query_processor, create_async_query_processor
+from ..infrastructure.cache import (
+    SemanticCache,
+    RewriteCache,
+    EmbeddingCache,
+    SingleFlight,
+    AsyncSingleFlight
+)
+from ..infrastructure.lexical import BM25Index
+from ..infrastructure.observability import PipelineMetrics, Tracer, SlowRequestLog
+from ..infrastructure.resilience import ResiliencePolicy
+from ..services.preprocessing import PreprocessingService
+from ..domain.services import RAGService, AsyncRAGService
+
+logger = logging.getLogger(__name__)
+
+
+def _resilience_policy(name: str, timeout_seconds: float) -> Optional[ResiliencePolicy]:
+    """Build the resilience policy for one upstream from settings.
+
+    Args:
+        name: Upstream name used in logs and metrics labels
+        timeout_seconds: Per-attempt timeout, 0 for none
+
+    Returns:
+        Resilience policy, or None if resilience is disabled
+    """
+    if not settings.resilience_enabled:
+        return None
+
+    return ResiliencePolicy(
+        name=name,
+        timeout=timeout_seconds,
+        max_retries=settings.upstream_max_retries,
+        backoff_base=settings.upstream_backoff_base_ms / 1000.0,
+        backoff_max=settings.upstream_backoff_max_ms / 1000.0,
+        hedge=settings.hedging_enabled,
+        hedge_quantile=settings.hedge_quantile,
+        hedge_min_samples=settings.hedge_min_samples,
+        hedge_min_delay=settings.hedge_min_delay_ms / 1000.0,
+        failure_threshold=settings.circuit_failure_threshold,
+        reset_timeout=settings.circuit_reset_seconds
+    )
+
+
+@lru_cache()
+def get_embedding_cache() -> Optional[EmbeddingCacheProtocol]:
+    """Get or create the embedding cache shared by both embedding models.
+
+    Returns:
+        Embedding cache instance, or None if disabled
+    """
+    if not settings.embedding_cache_enabled:
+        return None
+
+    return EmbeddingCache(
+        dimension=settings.embedding_dimension,
+        max_entries=settings.embedding_cache_max_entries,
+        dtype=settings.embedding_cache_dtype,
+        cache_dir=settings.embedding_cache_dir or None,
+        flush_every=settings.embedding_cache_flush_every
+    )
 
 
 @lru_cache()
@@ -26,7 +101,15 @@ def get_embedding_model() -> EmbeddingModelProtocol:
     return create_embedding_model(
         api_key=settings.gemini_api_key,
         model_name=settings.embedding_model,
-        dimension=settings.embedding_dimension
+        dimension=settings.embedding_dimension,
+        cache=get_embedding_cache(),
+        coalesce=settings.embedding_coalesce_enabled,
+        coalesce_max_wait_ms=settings.embedding_coalesce_max_wait_ms,
+        coalesce_max_batch_size=settings.embedding_coalesce_max_batch_size,
+        provider=settings.embedding_provider,
+        fake_latency_ms=settings.fake_embedding_latency_ms,
+        resilience=_resilience_policy("embed", settings.embedding_timeout_seconds),
+        metrics=get_metrics()
     )
 
 
@@ -42,7 +125,18 @@ def get_vector_store() -> VectorStoreProtocol:
         port=settings.qdrant_port,
         collection_name=settings.qdrant_collection_name,
         embedding_dimension=settings.embedding_dimension,
-        api_key=settings.qdrant_api_key
+        api_key=settings.qdrant_api_key,
+        provider=settings.vector_store_provider,
+        snapshot_path=settings.vector_snapshot_path,
+        mmap=settings.vector_snapshot_mmap,
+        ann_nlist=settings.ann_nlist,
+        ann_nprobe=settings.ann_nprobe,
+        ann_min_train_size=settings.ann_min_train_size,
+        quantization=settings.vector_quantization,
+        oversampling=settings.quantization_oversampling,
+        rescore=settings.quantization_rescore,
+        upsert_batch_size=settings.qdrant_upsert_batch_size,
+        upsert_parallel=settings.qdrant_upsert_parallel
     )
 
 
@@ -57,7 +151,13 @@ def get_query_processor_llm() -> LLMClientProtocol:
         api_key=settings.gemini_api_key,
         model_name=settings.query_rewriter_model,
         temperature=settings.query_rewriter_temperature,
-        max_tokens=settings.query_rewriter_max_tokens
+        max_tokens=settings.query_rewriter_max_tokens,
+        provider=settings.llm_provider,
+        fake_first_token_ms=settings.fake_llm_first_token_ms,
+        fake_token_ms=settings.fake_llm_token_ms,
+        fake_jitter=settings.fake_llm_jitter,
+        resilience=_resilience_policy("rewrite", settings.rewrite_timeout_seconds),
+        metrics=get_metrics()
     )
 
 
@@ -72,7 +172,30 @@ def get_rag_llm() -> LLMClientProtocol:
         api_key=settings.gemini_api_key,
         model_name=settings.llm_model,
         temperature=settings.llm_temperature,
-        max_tokens=settings.llm_max_tokens
+        max_tokens=settings.llm_max_tokens,
+        provider=settings.llm_provider,
+        fake_first_token_ms=settings.fake_llm_first_token_ms,
+        fake_token_ms=settings.fake_llm_token_ms,
+        fake_jitter=settings.fake_llm_jitter,
+        resilience=_resilience_policy("generate", settings.llm_timeout_seconds),
+        metrics=get_metrics()
+    )
+
+
+@lru_cache()
+def get_rewrite_cache() -> Optional[RewriteCacheProtocol]:
+    """Get or create the query rewrite cache shared by both query processors.
+
+    Returns:
+        Rewrite cache instance, or None if disabled
+    """
+    if not settings.rewrite_cache_enabled:
+        return None
+
+    return RewriteCache(
+        max_entries=settings.rewrite_cache_max_entries,
+        ttl_seconds=settings.rewrite_cache_ttl_seconds,
+        persist_path=settings.rewrite_cache_path
     )
 
 
@@ -84,7 +207,93 @@ def get_query_processor() -> QueryProcessorProtocol:
         Query processor instance
     """
     llm_client = get_query_processor_llm()
-    return create_query_processor(llm_client=llm_client)
+    return create_query_processor(llm_client=llm_client, cache=get_rewrite_cache())
+
+
+@lru_cache()
+def get_answer_cache() -> Optional[SemanticCacheProtocol]:
+    """Get or create the semantic answer cache shared by both RAG services.
+
+    Returns:
+        Semantic cache instance, or None if disabled
+    """
+    if not settings.semantic_cache_enabled:
+        return None
+
+    return SemanticCache(
+        dimension=settings.embedding_dimension,
+        max_entries=settings.semantic_cache_max_entries,
+        ttl_seconds=settings.semantic_cache_ttl_seconds,
+        max_distance=settings.semantic_cache_max_distance
+    )
+
+
+@lru_cache()
+def get_single_flight() -> Optional[SingleFlightProtocol]:
+    """Get or create the in-flight chat deduplication group for the sync service.
+
+    Returns:
+        Single-flight group, or None if disabled
+    """
+    return SingleFlight() if settings.single_flight_enabled else None
+
+
+@lru_cache()
+def get_lexical_index() -> Optional[LexicalIndexProtocol]:
+    """Get or create the BM25 index shared by both RAG services.
+
+    Loads ``lexical_index_path`` if it exists, otherwise builds the index
+    from ``data_file`` and saves it there. Called once at application
+    startup so the first request does not pay for the build; the services
+    reload the snapshot when the vector index version changes.
+
+    Returns:
+        Lexical index instance, or None if disabled
+    """
+    if not settings.lexical_enabled:
+        return None
+
+    index = BM25Index(snapshot_path=settings.lexical_index_path or None)
+    if index.get_stats()["documents"] == 0:
+        if os.path.exists(settings.data_file):
+            index.index_documents(PreprocessingService(settings.data_file).iter_all_chunks())
+        else:
+            logger.warning("No lexical index or data file found, lexical retrieval is inactive")
+    return index
+
+
+@lru_cache()
+def get_metrics() -> Optional[PipelineMetricsProtocol]:
+    """Get or create the metrics recorder shared by both RAG services and the API.
+
+    Returns:
+        Pipeline metrics instance, or None if disabled
+    """
+    return PipelineMetrics() if settings.metrics_enabled else None
+
+
+@lru_cache()
+def get_tracer() -> TracerProtocol:
+    """Get or create the request tracer shared by both RAG services and the API.
+
+    Always created, so a request can ask for its breakdown even when
+    sampling is off.
+
+    Returns:
+        Tracer instance
+    """
+    slow_log = None
+    if settings.slow_request_ms > 0:
+        slow_log = SlowRequestLog(
+            settings.slow_log_path,
+            max_bytes=settings.slow_log_max_bytes,
+            backups=settings.slow_log_backups
+        )
+    return Tracer(
+        sample_rate=settings.trace_sample_rate,
+        slow_threshold_ms=settings.slow_request_ms,
+        slow_log=slow_log
+    )
 
 
 @lru_cache()
@@ -103,5 +312,177 @@ def get_rag_service() -> RAGService:
         embedding_model=embedding_model,
         vector_store=vector_store,
         query_processor=query_processor,
-        llm_client=llm_client
+        llm_client=llm_client,
+        answer_cache=get_answer_cache(),
+        cache_version_check_interval=settings.semantic_cache_version_check_seconds,
+        single_flight=get_single_flight(),
+        rewrite_mode=settings.rewrite_mode,
+        rewrite_score_threshold=settings.rewrite_score_threshold,
+        lexical_index=get_lexical_index(),
+        retrieval_mode=settings.retrieval_mode,
+        fusion=settings.hybrid_fusion,
+        fusion_dense_weight=settings.hybrid_dense_weight,
+        rrf_k=settings.hybrid_rrf_k,
+        lexical_fast_path_threshold=settings.lexical_fast_path_threshold,
+        lexical_score_threshold=settings.lexical_score_threshold,
+        extractive_threshold=settings.extractive_score_threshold if settings.extractive_enabled else 0.0,
+        extractive_template=settings.extractive_template,
+        generation_timeout=settings.generation_timeout_seconds,
+        generation_fallback=settings.generation_fallback_enabled,
+        request_timeout=settings.request_timeout_seconds,
+        rewrite_budget_share=settings.rewrite_budget_share,
+        metrics=get_metrics(),
+        tracer=get_tracer()
+    )
+
+
+@lru_cache()
+def get_async_embedding_model() -> AsyncEmbeddingModelProtocol:
+    """Get or create async embedding model singleton.
+
+    Returns:
+        Async embedding model instance
+    """
+    return create_async_embedding_model(
+        api_key=settings.gemini_api_key,
+        model_name=settings.embedding_model,
+        dimension=settings.embedding_dimension,
+        cache=get_embedding_cache(),
+        coalesce=settings.embedding_coalesce_enabled,
+        coalesce_max_wait_ms=settings.embedding_coalesce_max_wait_ms,
+        coalesce_max_batch_size=settings.embedding_coalesce_max_batch_size,
+        provider=settings.embedding_provider,
+        fake_latency_ms=settings.fake_embedding_latency_ms,
+        resilience=_resilience_policy("embed", settings.embedding_timeout_seconds),
+        metrics=get_metrics()
+    )
+
+
+@lru_cache()
+def get_async_vector_store() -> AsyncVectorStoreProtocol:
+    """Get or create async vector store singleton.
+
+    Returns:
+        Async vector store instance
+    """
+    return create_async_vector_store(
+        host=settings.qdrant_host,
+        port=settings.qdrant_port,
+        collection_name=settings.qdrant_collection_name,
+        embedding_dimension=settings.embedding_dimension,
+        api_key=settings.qdrant_api_key,
+        provider=settings.vector_store_provider,
+        snapshot_path=settings.vector_snapshot_path,
+        mmap=settings.vector_snapshot_mmap,
+        ann_nlist=settings.ann_nlist,
+        ann_nprobe=settings.ann_nprobe,
+        ann_min_train_size=settings.ann_min_train_size,
+        quantization=settings.vector_quantization,
+        oversampling=settings.quantization_oversampling,
+        rescore=settings.quantization_rescore,
+        upsert_batch_size=settings.qdrant_upsert_batch_size,
+        upsert_parallel=settings.qdrant_upsert_parallel
+    )
+
+
+@lru_cache()
+def get_async_query_processor_llm() -> AsyncLLMClientProtocol:
+    """Get or create async query processor LLM client singleton.
+
+    Returns:
+        Async LLM client instance for query processing
+    """
+    return create_async_llm_client(
+        api_key=settings.gemini_api_key,
+        model_name=settings.query_rewriter_model,
+        temperature=settings.query_rewriter_temperature,
+        max_tokens=settings.query_rewriter_max_tokens,
+        provider=settings.llm_provider,
+        fake_first_token_ms=settings.fake_llm_first_token_ms,
+        fake_token_ms=settings.fake_llm_token_ms,
+        fake_jitter=settings.fake_llm_jitter,
+        resilience=_resilience_policy("rewrite", settings.rewrite_timeout_seconds),
+        metrics=get_metrics()
+    )
+
+
+@lru_cache()
+def get_async_rag_llm() -> AsyncLLMClientProtocol:
+    """Get or create async RAG LLM client singleton.
+
+    Returns:
+        Async LLM client instance for RAG generation
+    """
+    return create_async_llm_client(
+        api_key=settings.gemini_api_key,
+        model_name=settings.llm_model,
+        temperature=settings.llm_temperature,
+        max_tokens=settings.llm_max_tokens,
+        provider=settings.llm_provider,
+        fake_first_token_ms=settings.fake_llm_first_token_ms,
+        fake_token_ms=settings.fake_llm_token_ms,
+        fake_jitter=settings.fake_llm_jitter,
+        resilience=_resilience_policy("generate", settings.llm_timeout_seconds),
+        metrics=get_metrics()
+    )
+
+
+@lru_cache()
+def get_async_query_processor() -> AsyncQueryProcessorProtocol:
+    """Get or create async query processor singleton.
+
+    Returns:
+        Async query processor instance
+    """
+    llm_client = get_async_query_processor_llm()
+    return create_async_query_processor(llm_client=llm_client, cache=get_rewrite_cache())
+
+
+@lru_cache()
+def get_async_single_flight() -> Optional[AsyncSingleFlightProtocol]:
+    """Get or create the in-flight chat deduplication group for the async service.
+
+    Returns:
+        Async single-flight group, or None if disabled
+    """
+    return AsyncSingleFlight() if settings.single_flight_enabled else None
+
+
+@lru_cache()
+def get_async_rag_service() -> AsyncRAGService:
+    """Get or create async RAG service singleton used by the API.
+
+    Returns:
+        Async RAG service instance
+    """
+    embedding_model = get_async_embedding_model()
+    vector_store = get_async_vector_store()
+    query_processor = get_async_query_processor()
+    llm_client = get_async_rag_llm()
+
+    return AsyncRAGService(
+        embedding_model=embedding_model,
+        vector_store=vector_store,
+        query_processor=query_processor,
+        llm_client=llm_client,
+        answer_cache=get_answer_cache(),
+        cache_version_check_interval=settings.semantic_cache_version_check_seconds,
+        single_flight=get_async_single_flight(),
+        rewrite_mode=settings.rewrite_mode,
+        rewrite_score_threshold=settings.rewrite_score_threshold,
+        lexical_index=get_lexical_index(),
+        retrieval_mode=settings.retrieval_mode,
+        fusion=settings.hybrid_fusion,
+        fusion_dense_weight=settings.hybrid_dense_weight,
+        rrf_k=settings.hybrid_rrf_k,
+        lexical_fast_path_threshold=settings.lexical_fast_path_threshold,
+        lexical_score_threshold=settings.lexical_score_threshold,
+        extractive_threshold=settings.extractive_score_threshold if settings.extractive_enabled else 0.0,
+        extractive_template=settings.extractive_template,
+        generation_timeout=settings.generation_timeout_seconds,
+        generation_fallback=settings.generation_fallback_enabled,
+        request_timeout=settings.request_timeout_seconds,
+        rewrite_budget_share=settings.rewrite_budget_share,
+        metrics=get_metrics(),
+        tracer=get_tracer()
     )
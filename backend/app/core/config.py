@@ -29,30 +29,142 @@ class Settings(BaseSettings):
         """
         return [origin.strip() for origin in self.cors_origins.split(",")]
 
+    # Vector Store Configuration
+    vector_store_provider: str = "qdrant"
+    vector_snapshot_path: Optional[str] = "data/vector_snapshot"
+    vector_snapshot_mmap: bool = True
+    ann_nlist: int = 0
+    ann_nprobe: int = 16
+    ann_min_train_size: int = 10000
+    vector_quantization: str = "none"
+    quantization_oversampling: float = 2.0
+    quantization_rescore: bool = True
+
     # Qdrant Configuration
     qdrant_host: str = "localhost"
     qdrant_port: int = 6333
     qdrant_collection_name: str = "perso_ai_qa"
     qdrant_api_key: Optional[str] = None
+    qdrant_upsert_batch_size: int = 256
+    qdrant_upsert_parallel: int = 2
+    collection_keep_versions: int = 1
+    collection_gc_grace_seconds: float = 30.0
 
     # Embedding Configuration
     embedding_model: str = "gemini-embedding-001"
     embedding_dimension: int = 768
+    embedding_provider: str = "gemini"
+    fake_embedding_latency_ms: float = 0.0
+
+    # Embedding Cache Configuration
+    embedding_cache_enabled: bool = True
+    embedding_cache_dir: Optional[str] = "cache/embeddings"
+    embedding_cache_max_entries: int = 100000
+    embedding_cache_dtype: str = "float16"
+    embedding_cache_flush_every: int = 1000
+
+    # Embedding Request Coalescing Configuration
+    embedding_coalesce_enabled: bool = False
+    embedding_coalesce_max_wait_ms: float = 5.0
+    embedding_coalesce_max_batch_size: int = 64
+
+    # Bulk Embedding Configuration (indexing script)
+    embedding_batch_size: int = 100
+    embedding_max_concurrency: int = 4
+    embedding_requests_per_minute: float = 0.0
+    embedding_max_retries: int = 3
+    embedding_checkpoint_dir: Optional[str] = "cache/embedding_checkpoints"
 
     # Retrieval Configuration
     top_k_retrieval: int = 3
     similarity_threshold: float = 0.5
 
+    # Lexical / Hybrid Retrieval Configuration
+    lexical_enabled: bool = False
+    lexical_index_path: Optional[str] = "data/lexical_index.json"
+    retrieval_mode: str = "dense"
+    hybrid_fusion: str = "rrf"
+    hybrid_dense_weight: float = 0.5
+    hybrid_rrf_k: int = 60
+    lexical_fast_path_threshold: float = 0.9
+    lexical_score_threshold: float = 0.5
+
+    # Batch Chat Configuration
+    batch_max_queries: int = 1000
+    batch_rewrite_concurrency: int = 8
+    batch_generation_concurrency: int = 8
+    batch_embed_size: int = 100
+
+    # Semantic Answer Cache Configuration
+    semantic_cache_enabled: bool = False
+    semantic_cache_max_entries: int = 1024
+    semantic_cache_ttl_seconds: float = 3600.0
+    semantic_cache_max_distance: float = 0.05
+    semantic_cache_version_check_seconds: float = 5.0
+
+    # In-flight Request Deduplication Configuration
+    single_flight_enabled: bool = True
+
     # LLM Configuration
     gemini_api_key: str
+    llm_provider: str = "gemini"
     llm_model: str = "gemini-2.0-flash"
     llm_temperature: float = 0.1
     llm_max_tokens: int = 512
 
+    # Extractive Answer Configuration
+    extractive_enabled: bool = False
+    extractive_score_threshold: float = 0.93
+    extractive_template: str = "{answer}"
+    generation_timeout_seconds: float = 0.0
+    generation_fallback_enabled: bool = True
+
     # Query Rewriter Configuration
     query_rewriter_model: str = "gemini-2.0-flash"
     query_rewriter_temperature: float = 0.3
     query_rewriter_max_tokens: int = 100
+    rewrite_mode: str = "always"
+    rewrite_score_threshold: float = 0.75
+
+    # Query Rewrite Cache Configuration
+    rewrite_cache_enabled: bool = True
+    rewrite_cache_max_entries: int = 4096
+    rewrite_cache_ttl_seconds: float = 86400.0
+    rewrite_cache_path: Optional[str] = None
+
+    # Fake LLM Configuration (llm_provider=fake, for offline testing)
+    fake_llm_first_token_ms: float = 200.0
+    fake_llm_token_ms: float = 20.0
+    fake_llm_jitter: float = 0.0
+
+    # Upstream Resilience Configuration
+    resilience_enabled: bool = True
+    llm_timeout_seconds: float = 30.0
+    rewrite_timeout_seconds: float = 5.0
+    embedding_timeout_seconds: float = 10.0
+    upstream_max_retries: int = 2
+    upstream_backoff_base_ms: float = 200.0
+    upstream_backoff_max_ms: float = 2000.0
+    hedging_enabled: bool = True
+    hedge_quantile: float = 0.95
+    hedge_min_samples: int = 20
+    hedge_min_delay_ms: float = 50.0
+    circuit_failure_threshold: int = 5
+    circuit_reset_seconds: float = 30.0
+
+    # Request Budget Configuration
+    request_timeout_seconds: float = 0.0
+    rewrite_budget_share: float = 0.3
+
+    # Observability Configuration
+    metrics_enabled: bool = True
+    server_timing_enabled: bool = True
+    trace_sample_rate: float = 1.0
+    slow_request_ms: float = 2000.0
+    slow_log_path: str = "logs/slow_requests.jsonl"
+    slow_log_max_bytes: int = 10 * 1024 * 1024
+    slow_log_backups: int = 5
+    debug_traces_enabled: bool = False
 
     # Data Configuration
     data_file: str = "data/Q&A.xlsx"
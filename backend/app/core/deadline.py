@@ -0,0 +1,232 @@
+"""Per-request latency budget propagated through context variables.
+
+A request opens a budget once; every layer below it (stage slices in the
+RAG service, resilient upstream callers, vector store clients) reads the
+remaining time from the context instead of having it threaded through
+each call.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar, Token, copy_context
+from typing import AsyncIterator, Callable, Iterator, List, Optional, Tuple, TypeVar
+import asyncio
+import time
+
+T = TypeVar("T")
+
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+_degraded: ContextVar[Optional[List[str]]] = ContextVar("degraded_stages", default=None)
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[None]:
+    """Run a block under a deadline, never later than the enclosing one.
+
+    Args:
+        seconds: Time allowed from now; None or <= 0 keeps the enclosing
+            deadline unchanged
+    """
+    current = _deadline.get()
+    if seconds is None or seconds <= 0:
+        expires = current
+    else:
+        expires = time.monotonic() + seconds
+        if current is not None:
+            expires = min(expires, current)
+    token = _deadline.set(expires)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def _open(seconds: Optional[float]) -> Tuple[Token, Token]:
+    """Set a fresh degraded-stage list and a narrowed deadline.
+
+    Returns:
+        Tokens restoring the previous degraded list and deadline
+    """
+    expires = _deadline.get()
+    if seconds is not None and seconds > 0:
+        own = time.monotonic() + seconds
+        expires = own if expires is None else min(expires, own)
+    return _degraded.set([]), _deadline.set(expires)
+
+
+@contextmanager
+def request_budget(seconds: Optional[float]) -> Iterator[List[str]]:
+    """Open the budget of one request.
+
+    Must not be held across a ``yield``: a generator may be resumed or
+    closed in another context, where the reset would fail. Streams use
+    ``iterate_in_context`` with ``open_budget`` instead.
+
+    Args:
+        seconds: Total time allowed for the request; None or <= 0 sets no
+            deadline, but degraded stages are still collected
+
+    Yields:
+        List the names of degraded stages are appended to
+    """
+    degraded_token, deadline_token = _open(seconds)
+    try:
+        yield _degraded.get()
+    finally:
+        _deadline.reset(deadline_token)
+        _degraded.reset(degraded_token)
+
+
+def open_budget(seconds: Optional[float]) -> None:
+    """Open the budget of one request for the rest of the current context.
+
+    Nothing is restored afterwards, so this is only meant as the ``setup``
+    of ``iterate_in_context`` / ``aiterate_in_context``, whose private
+    context is discarded with the stream.
+
+    Args:
+        seconds: Total time allowed for the request; None or <= 0 sets no
+            deadline
+    """
+    _open(seconds)
+
+
+def iterate_in_context(events: Iterator[T], setup: Optional[Callable[[], None]] = None) -> Iterator[T]:
+    """Drive a generator with every step in one private context.
+
+    Context variables a generator sets and resets around its yields (trace
+    spans around streamed tokens, for instance) only pair up if all of its
+    steps run in the same context, which a server resuming the stream from
+    a thread pool or closing it from another task does not guarantee. This
+    copies the caller's context once and runs each step, and the final
+    close, inside that copy.
+
+    Args:
+        events: Generator to drive
+        setup: Optional call run first in the private context, e.g. a
+            ``functools.partial`` of ``open_budget``
+
+    Yields:
+        Items of ``events``
+    """
+    context = copy_context()
+    if setup is not None:
+        context.run(setup)
+    try:
+        while True:
+            try:
+                item = context.run(next, events)
+            except StopIteration:
+                return
+            yield item
+    finally:
+        close = getattr(events, "close", None)
+        if close is not None:
+            context.run(close)
+
+
+async def aiterate_in_context(
+    events: AsyncIterator[T],
+    setup: Optional[Callable[[], None]] = None
+) -> AsyncIterator[T]:
+    """Async counterpart of ``iterate_in_context``.
+
+    Each step runs as a task bound to the private context; cancelling the
+    consumer cancels the step in flight.
+
+    Args:
+        events: Async generator to drive
+        setup: Optional call run first in the private context
+
+    Yields:
+        Items of ``events``
+    """
+    context = copy_context()
+    if setup is not None:
+        context.run(setup)
+    done = object()
+
+    async def step():
+        try:
+            return await events.__anext__()
+        except StopAsyncIteration:
+            return done
+
+    async def close():
+        aclose = getattr(events, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    try:
+        while True:
+            item = await asyncio.create_task(step(), context=context)
+            if item is done:
+                return
+            yield item
+    finally:
+        await asyncio.create_task(close(), context=context)
+
+
+def remaining() -> Optional[float]:
+    """Time left before the current deadline.
+
+    Returns:
+        Seconds left (negative once expired), or None without a deadline
+    """
+    expires = _deadline.get()
+    return None if expires is None else expires - time.monotonic()
+
+
+def bounded_timeout(limit: float = 0.0) -> Optional[float]:
+    """Combine a fixed timeout with the remaining budget.
+
+    Args:
+        limit: Fixed timeout in seconds, 0 for none
+
+    Returns:
+        The smaller of ``limit`` and the remaining budget (at least 0), or
+        None if neither applies
+    """
+    left = remaining()
+    if left is not None:
+        left = max(0.0, left)
+        return min(limit, left) if limit > 0 else left
+    return limit if limit > 0 else None
+
+
+def mark_degraded(stage: str) -> None:
+    """Record that a stage was skipped or replaced to stay within budget.
+
+    Args:
+        stage: Pipeline stage name, e.g. "rewrite" or "generate"
+    """
+    degraded = _degraded.get()
+    if degraded is not None and stage not in degraded:
+        degraded.append(stage)
+
+
+def degraded_stages() -> List[str]:
+    """Stages degraded so far in the current request.
+
+    Returns:
+        Stage names in the order they degraded
+    """
+    return list(_degraded.get() or [])
+
+
+def timed_out(error: BaseException) -> bool:
+    """Check whether an error, or any error it wraps, is a timeout.
+
+    Args:
+        error: Raised exception
+
+    Returns:
+        True if a ``TimeoutError`` (including ``DeadlineExceededError``) is
+        in the cause/context chain
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, TimeoutError):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
@@ -24,3 +24,13 @@ class LLMError(ApplicationError):
 class QueryProcessingError(ApplicationError):
     """Exception raised for query processing operations."""
     pass
+
+
+class CircuitOpenError(ApplicationError):
+    """Exception raised when a circuit breaker rejects a call to an unhealthy upstream."""
+    pass
+
+
+class DeadlineExceededError(ApplicationError, TimeoutError):
+    """Exception raised when a request runs out of its latency budget."""
+    pass
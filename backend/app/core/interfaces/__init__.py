@@ -1,13 +1,37 @@
 """Interfaces module defining contracts for all components."""
 
-from .embedding import EmbeddingModelProtocol
-from .vector_store import VectorStoreProtocol
-from .llm import LLMClientProtocol
-from .query_processor import QueryProcessorProtocol
+from .embedding import EmbeddingModelProtocol, AsyncEmbeddingModelProtocol
+from .vector_store import VectorStoreProtocol, AsyncVectorStoreProtocol
+from .llm import LLMClientProtocol, AsyncLLMClientProtocol
+from .query_processor import QueryProcessorProtocol, AsyncQueryProcessorProtocol
+from .cache import (
+    SemanticCacheProtocol,
+    RewriteCacheProtocol,
+    EmbeddingCacheProtocol,
+    SingleFlightProtocol,
+    AsyncSingleFlightProtocol
+)
+from .lexical import LexicalIndexProtocol
+from .metrics import PipelineMetricsProtocol
+from .tracing import TracerProtocol, SpanProtocol, NOOP_SPAN
 
 __all__ = [
     "EmbeddingModelProtocol",
     "VectorStoreProtocol",
     "LLMClientProtocol",
     "QueryProcessorProtocol",
+    "AsyncEmbeddingModelProtocol",
+    "AsyncVectorStoreProtocol",
+    "AsyncLLMClientProtocol",
+    "AsyncQueryProcessorProtocol",
+    "SemanticCacheProtocol",
+    "RewriteCacheProtocol",
+    "EmbeddingCacheProtocol",
+    "SingleFlightProtocol",
+    "AsyncSingleFlightProtocol",
+    "LexicalIndexProtocol",
+    "PipelineMetricsProtocol",
+    "TracerProtocol",
+    "SpanProtocol",
+    "NOOP_SPAN",
 ]
@@ -0,0 +1,187 @@
+"""Protocol for answer caches."""
+
+from typing import Protocol, Optional, Dict, Any, Hashable, List, Callable, Awaitable, TypeVar
+import numpy as np
+
+T = TypeVar("T")
+
+
+class SemanticCacheProtocol(Protocol):
+    """Protocol defining the interface for similarity-keyed answer caches."""
+
+    def lookup(
+        self,
+        query_embedding: np.ndarray,
+        namespace: Hashable = ""
+    ) -> Optional[Dict[str, Any]]:
+        """Find a cached value whose query embedding is close enough.
+
+        Args:
+            query_embedding: Embedding of the incoming query
+            namespace: Partition key, e.g. retrieval settings
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        ...
+
+    def store(
+        self,
+        query_embedding: np.ndarray,
+        value: Dict[str, Any],
+        namespace: Hashable = "",
+        index_version: Optional[str] = None
+    ) -> None:
+        """Store a value keyed on a query embedding.
+
+        Args:
+            query_embedding: Embedding of the query
+            value: Value to cache
+            namespace: Partition key, e.g. retrieval settings
+            index_version: Index version the value was computed against; the
+                value is dropped if the cache has moved to another version
+        """
+        ...
+
+    def sync_index_version(self, version: Optional[str]) -> bool:
+        """Invalidate every entry if the index version changed.
+
+        Args:
+            version: Current index version, None if unknown
+
+        Returns:
+            True if the cache was invalidated
+        """
+        ...
+
+    def invalidate(self) -> None:
+        """Drop every cached entry."""
+        ...
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters.
+
+        Returns:
+            Dictionary of hit/miss/eviction counters and size
+        """
+        ...
+
+
+class RewriteCacheProtocol(Protocol):
+    """Protocol defining the interface for exact-key string caches."""
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        ...
+
+    def put(self, key: str, value: str) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        ...
+
+    def flush(self) -> None:
+        """Persist pending entries, if the cache is persistent."""
+        ...
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters.
+
+        Returns:
+            Dictionary of hit/miss/eviction counters and size
+        """
+        ...
+
+
+class EmbeddingCacheProtocol(Protocol):
+    """Protocol defining the interface for content-addressed embedding caches."""
+
+    def get_many(self, keys: List[bytes]) -> List[Optional[np.ndarray]]:
+        """Look up embeddings by key.
+
+        Args:
+            keys: Content addresses of the texts
+
+        Returns:
+            Vector per key, or None for misses
+        """
+        ...
+
+    def put_many(self, keys: List[bytes], vectors: np.ndarray) -> None:
+        """Store embeddings.
+
+        Args:
+            keys: Content addresses of the texts
+            vectors: Embeddings aligned with ``keys``
+        """
+        ...
+
+    def flush(self) -> None:
+        """Persist pending entries, if the cache is persistent."""
+        ...
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters.
+
+        Returns:
+            Dictionary of hit/miss counters and size
+        """
+        ...
+
+
+class SingleFlightProtocol(Protocol):
+    """Protocol defining the interface for in-flight call deduplication."""
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless a call with the same key is already running.
+
+        Args:
+            key: Identity of the computation
+            fn: Computation to run
+
+        Returns:
+            Result of ``fn``, possibly computed for a concurrent caller
+        """
+        ...
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get deduplication counters.
+
+        Returns:
+            Dictionary of executed and shared call counts
+        """
+        ...
+
+
+class AsyncSingleFlightProtocol(Protocol):
+    """Protocol defining the interface for in-flight coroutine deduplication."""
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn`` unless a call with the same key is already running.
+
+        Args:
+            key: Identity of the computation
+            fn: Coroutine function to run
+
+        Returns:
+            Result of ``fn``, possibly computed for a concurrent caller
+        """
+        ...
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get deduplication counters.
+
+        Returns:
+            Dictionary of executed and shared call counts
+        """
+        ...
@@ -25,3 +25,26 @@ class EmbeddingModelProtocol(Protocol):
             Embedding dimension
         """
         ...
+
+
+class AsyncEmbeddingModelProtocol(Protocol):
+    """Protocol defining the interface for asynchronous embedding models."""
+
+    async def encode(self, texts: List[str]) -> np.ndarray:
+        """Encode texts into embeddings without blocking the event loop.
+
+        Args:
+            texts: List of text strings to encode
+
+        Returns:
+            Array of embeddings
+        """
+        ...
+
+    def get_dimension(self) -> int:
+        """Get the dimension of embeddings.
+
+        Returns:
+            Embedding dimension
+        """
+        ...
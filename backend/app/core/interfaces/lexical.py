@@ -0,0 +1,47 @@
+"""Protocol for lexical (keyword) indexes."""
+
+from typing import Protocol, List, Dict, Any, Iterable
+
+
+class LexicalIndexProtocol(Protocol):
+    """Protocol defining the interface for in-process lexical indexes."""
+
+    def index_documents(self, chunks: Iterable[Dict[str, Any]]) -> bool:
+        """Replace the indexed documents.
+
+        Args:
+            chunks: Document chunks with question, answer and content,
+                consumed once
+
+        Returns:
+            True if successful
+        """
+        ...
+
+    def search(self, query: str, top_k: int = 10) -> List[Dict[str, Any]]:
+        """Rank documents by lexical relevance to the query.
+
+        Args:
+            query: Query text
+            top_k: Number of results to return
+
+        Returns:
+            List of search results with a normalized ``lexical_score`` in [0, 1]
+        """
+        ...
+
+    def reload(self) -> bool:
+        """Reload the indexed documents from the index's persisted snapshot.
+
+        Returns:
+            True if the documents were reloaded
+        """
+        ...
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index size information.
+
+        Returns:
+            Dictionary with document and vocabulary counts
+        """
+        ...
@@ -1,6 +1,6 @@
 """Protocol for LLM clients."""
 
-from typing import Protocol, Optional
+from typing import Protocol, Optional, Iterator, AsyncIterator
 
 
 class LLMClientProtocol(Protocol):
@@ -23,3 +23,61 @@ class LLMClientProtocol(Protocol):
             Generated text
         """
         ...
+
+    def generate_stream(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Generate text from prompt, yielding pieces as they are produced.
+
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Iterator over generated text fragments
+        """
+        ...
+
+
+class AsyncLLMClientProtocol(Protocol):
+    """Protocol defining the interface for asynchronous LLM clients."""
+
+    async def generate(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate text from prompt without blocking the event loop.
+
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Generated text
+        """
+        ...
+
+    def generate_stream(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """Generate text from prompt, yielding pieces as they are produced.
+
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Async iterator over generated text fragments
+        """
+        ...
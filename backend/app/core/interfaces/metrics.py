@@ -0,0 +1,91 @@
+"""Protocol for pipeline metrics."""
+
+from typing import Protocol, ContextManager
+
+
+class PipelineMetricsProtocol(Protocol):
+    """Protocol defining the interface for RAG pipeline instrumentation."""
+
+    def stage(self, name: str) -> ContextManager[None]:
+        """Time one pipeline stage, counting it as an upstream error if it raises.
+
+        Args:
+            name: Stage name, e.g. "rewrite", "embed", "search", "format"
+                or "generate"
+
+        Returns:
+            Context manager wrapping the stage
+        """
+        ...
+
+    def record_cache(self, cache: str, hit: bool) -> None:
+        """Count one cache lookup.
+
+        Args:
+            cache: Cache name, e.g. "answer"
+            hit: Whether the lookup was a hit
+        """
+        ...
+
+    def record_text(self, kind: str, text: str) -> None:
+        """Count characters and estimated tokens of LLM input or output.
+
+        Args:
+            kind: "prompt" or "completion"
+            text: Text sent to or received from the LLM
+        """
+        ...
+
+    def record_degraded(self, stage: str) -> None:
+        """Count one stage that fell back (rewrite skipped, stored answer served).
+
+        Args:
+            stage: "rewrite" or "generate"
+        """
+        ...
+
+    def record_http(self, method: str, route: str, status: int, seconds: float) -> None:
+        """Count one HTTP request and its latency.
+
+        Args:
+            method: HTTP method
+            route: Route template
+            status: Response status code
+            seconds: Time until the response started
+        """
+        ...
+
+    def record_upstream(self, upstream: str, event: str) -> None:
+        """Count one resilience event of an upstream dependency.
+
+        Args:
+            upstream: Upstream name, e.g. "embed", "rewrite" or "generate"
+            event: "attempt", "retry", "timeout", "deadline", "hedge",
+                "hedge_won" or "rejected"
+        """
+        ...
+
+    def set_circuit_state(self, upstream: str, state: str) -> None:
+        """Publish the circuit breaker state of an upstream dependency.
+
+        Args:
+            upstream: Upstream name
+            state: "closed", "half_open" or "open"
+        """
+        ...
+
+    def in_flight(self) -> ContextManager[None]:
+        """Track a request as in flight while the context is open.
+
+        Returns:
+            Context manager wrapping the request
+        """
+        ...
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text
+        """
+        ...
@@ -16,3 +16,18 @@ class QueryProcessorProtocol(Protocol):
             Processed query
         """
         ...
+
+
+class AsyncQueryProcessorProtocol(Protocol):
+    """Protocol defining the interface for asynchronous query processors."""
+
+    async def process_query(self, query: str) -> str:
+        """Process and potentially rewrite the query without blocking.
+
+        Args:
+            query: Original user query
+
+        Returns:
+            Processed query
+        """
+        ...
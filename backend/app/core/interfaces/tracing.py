@@ -0,0 +1,73 @@
+"""Protocols for request tracing."""
+
+from typing import Protocol, ContextManager, Optional, Dict, Any
+
+
+class SpanProtocol(Protocol):
+    """Protocol for one timed operation within a trace."""
+
+    def set(self, **attributes: Any) -> None:
+        """Attach attributes to the span.
+
+        Args:
+            **attributes: JSON-serializable attribute values
+        """
+        ...
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the span and its children.
+
+        Returns:
+            Dictionary with name, offset, duration, attributes and child spans
+        """
+        ...
+
+
+class TracerProtocol(Protocol):
+    """Protocol defining the interface for request tracers."""
+
+    def trace(self, name: str, force: bool = False, **attributes: Any) -> ContextManager[Optional[SpanProtocol]]:
+        """Start the root span of a request, subject to sampling.
+
+        Args:
+            name: Request name, e.g. the endpoint
+            force: Trace regardless of the sample rate
+            **attributes: Attributes of the root span
+
+        Returns:
+            Context manager yielding the root span, or None if not sampled
+        """
+        ...
+
+    def span(self, name: str, **attributes: Any) -> ContextManager[SpanProtocol]:
+        """Open a child of the current span; a no-op outside a trace.
+
+        Args:
+            name: Operation name
+            **attributes: Attributes of the span
+
+        Returns:
+            Context manager yielding the span
+        """
+        ...
+
+    def annotate(self, **attributes: Any) -> None:
+        """Attach attributes to the current span, if any.
+
+        Args:
+            **attributes: JSON-serializable attribute values
+        """
+        ...
+
+
+class _NoopSpan:
+    """Span handed out outside a sampled trace; records nothing."""
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {}
+
+
+NOOP_SPAN: SpanProtocol = _NoopSpan()
@@ -1,6 +1,6 @@
 """Protocol for vector store operations."""
 
-from typing import Protocol, List, Dict, Any
+from typing import Protocol, List, Dict, Any, Optional
 import numpy as np
 
 
@@ -34,6 +34,33 @@ class VectorStoreProtocol(Protocol):
         """
         ...
 
+    def get_point_ids(self) -> List[str]:
+        """List the IDs of every indexed point.
+
+        Returns:
+            Point IDs
+        """
+        ...
+
+    def delete_points(self, point_ids: List[str]) -> bool:
+        """Delete points by ID.
+
+        Args:
+            point_ids: IDs of the points to delete
+
+        Returns:
+            True if successful
+        """
+        ...
+
+    def flush(self) -> None:
+        """Persist writes that the store buffers in memory.
+
+        Called once after a batch of ``index_documents`` and
+        ``delete_points`` calls; stores that persist every write do nothing.
+        """
+        ...
+
     def search(
         self,
         query_embedding: np.ndarray,
@@ -52,6 +79,24 @@ class VectorStoreProtocol(Protocol):
         """
         ...
 
+    def search_batch(
+        self,
+        query_embeddings: np.ndarray,
+        top_k: int = 5,
+        score_threshold: float = 0.0
+    ) -> List[List[Dict[str, Any]]]:
+        """Search for similar documents for several queries at once.
+
+        Args:
+            query_embeddings: Query embedding vectors, one per row
+            top_k: Number of results to return per query
+            score_threshold: Minimum similarity score
+
+        Returns:
+            List of search results per query, in input order
+        """
+        ...
+
     def get_collection_info(self) -> Dict[str, Any]:
         """Get information about the collection.
 
@@ -67,3 +112,121 @@ class VectorStoreProtocol(Protocol):
             True if healthy
         """
         ...
+
+    def get_index_version(self) -> Optional[str]:
+        """Get a fingerprint that changes whenever the collection is reindexed.
+
+        Returns:
+            Index version string, or None if it cannot be determined
+        """
+        ...
+
+
+class AsyncVectorStoreProtocol(Protocol):
+    """Protocol defining the interface for asynchronous vector store operations."""
+
+    async def create_collection(self, recreate: bool = False) -> bool:
+        """Create a new collection.
+
+        Args:
+            recreate: Whether to recreate if exists
+
+        Returns:
+            True if successful
+        """
+        ...
+
+    async def index_documents(
+        self,
+        embeddings: np.ndarray,
+        chunks: List[Dict[str, Any]]
+    ) -> bool:
+        """Index documents into the vector store.
+
+        Args:
+            embeddings: Document embeddings
+            chunks: Document chunks with metadata
+
+        Returns:
+            True if successful
+        """
+        ...
+
+    async def get_point_ids(self) -> List[str]:
+        """List the IDs of every indexed point.
+
+        Returns:
+            Point IDs
+        """
+        ...
+
+    async def delete_points(self, point_ids: List[str]) -> bool:
+        """Delete points by ID.
+
+        Args:
+            point_ids: IDs of the points to delete
+
+        Returns:
+            True if successful
+        """
+        ...
+
+    async def search(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = 5,
+        score_threshold: float = 0.0
+    ) -> List[Dict[str, Any]]:
+        """Search for similar documents.
+
+        Args:
+            query_embedding: Query embedding vector
+            top_k: Number of results to return
+            score_threshold: Minimum similarity score
+
+        Returns:
+            List of search results with scores
+        """
+        ...
+
+    async def search_batch(
+        self,
+        query_embeddings: np.ndarray,
+        top_k: int = 5,
+        score_threshold: float = 0.0
+    ) -> List[List[Dict[str, Any]]]:
+        """Search for similar documents for several queries at once.
+
+        Args:
+            query_embeddings: Query embedding vectors, one per row
+            top_k: Number of results to return per query
+            score_threshold: Minimum similarity score
+
+        Returns:
+            List of search results per query, in input order
+        """
+        ...
+
+    async def get_collection_info(self) -> Dict[str, Any]:
+        """Get information about the collection.
+
+        Returns:
+            Collection metadata
+        """
+        ...
+
+    async def health_check(self) -> bool:
+        """Check if the vector store is accessible.
+
+        Returns:
+            True if healthy
+        """
+        ...
+
+    async def get_index_version(self) -> Optional[str]:
+        """Get a fingerprint that changes whenever the collection is reindexed.
+
+        Returns:
+            Index version string, or None if it cannot be determined
+        """
+        ...
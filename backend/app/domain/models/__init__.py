@@ -6,6 +6,9 @@ from .schemas import (
     ChatRequest,
     ChatResponse,
     RetrievedChunk,
+    ChatBatchRequest,
+    ChatBatchItem,
+    ChatBatchResponse,
     HealthResponse
 )
 
@@ -15,5 +18,8 @@ __all__ = [
     "ChatRequest",
     "ChatResponse",
     "RetrievedChunk",
+    "ChatBatchRequest",
+    "ChatBatchItem",
+    "ChatBatchResponse",
     "HealthResponse",
 ]
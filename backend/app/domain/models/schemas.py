@@ -1,7 +1,7 @@
 """Pydantic models for request/response validation."""
 
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, Field, constr
+from typing import List, Optional, Dict, Any
 
 
 class Document(BaseModel):
@@ -25,12 +25,17 @@ class ChatRequest(BaseModel):
         default=[],
         description="Previous conversation history"
     )
+    debug: bool = Field(
+        default=False,
+        description="Trace this request and return its timing breakdown (requires debug_traces_enabled)"
+    )
 
 
 class RetrievedChunk(BaseModel):
     """Retrieved knowledge chunk with metadata."""
     content: str = Field(..., description="Chunk content")
-    score: float = Field(..., description="Similarity score")
+    score: Optional[float] = Field(default=None, description="Dense similarity score, absent for lexical-only matches")
+    lexical_score: Optional[float] = Field(default=None, description="Normalized lexical (BM25 question overlap) score")
     metadata: dict = Field(default={}, description="Additional metadata")
 
 
@@ -42,6 +47,55 @@ class ChatResponse(BaseModel):
         description="Retrieved knowledge chunks used"
     )
     confidence: float = Field(..., description="Response confidence score")
+    retrieval_path: Optional[str] = Field(
+        default=None,
+        description="Retrieval path: 'rewrite', 'raw', 'rewrite_fallback' or 'lexical'"
+    )
+    served_by: Optional[str] = Field(
+        default=None,
+        description="Answer source: 'generation', 'extractive' or 'extractive_fallback'"
+    )
+    degraded: List[str] = Field(
+        default=[],
+        description="Stages skipped or replaced to stay within the request budget: 'rewrite', 'generate'"
+    )
+    debug: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Span tree of the request, present when requested with 'debug'"
+    )
+
+
+class ChatBatchRequest(BaseModel):
+    """Request model for batch chat endpoint."""
+    messages: List[constr(strip_whitespace=True, min_length=1)] = Field(
+        ...,
+        min_length=1,
+        description="Independent user questions, none of them blank"
+    )
+
+
+class ChatBatchItem(BaseModel):
+    """Result of one question in a batch."""
+    answer: Optional[str] = Field(default=None, description="Generated answer, None on error")
+    retrieved_chunks: List[RetrievedChunk] = Field(
+        default=[],
+        description="Retrieved knowledge chunks used"
+    )
+    confidence: float = Field(default=0.0, description="Response confidence score")
+    retrieval_path: Optional[str] = Field(
+        default=None,
+        description="Retrieval path taken: 'rewrite', 'raw' or 'rewrite_fallback'"
+    )
+    served_by: Optional[str] = Field(
+        default=None,
+        description="Answer source: 'generation', 'extractive' or 'extractive_fallback'"
+    )
+    error: Optional[str] = Field(default=None, description="Error message if this item failed")
+
+
+class ChatBatchResponse(BaseModel):
+    """Response model for batch chat endpoint, in request order."""
+    results: List[ChatBatchItem] = Field(default=[], description="Per-question results")
 
 
 class HealthResponse(BaseModel):
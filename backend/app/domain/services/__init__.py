@@ -1,5 +1,6 @@
 """Domain services module."""
 
-from .rag_service import RAGService
+from .rag_service import BaseRAGService, RAGService
+from .async_rag_service import AsyncRAGService
 
-__all__ = ["RAGService"]
+__all__ = ["BaseRAGService", "RAGService", "AsyncRAGService"]
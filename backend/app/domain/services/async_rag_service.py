@@ -0,0 +1,732 @@
+"""Asynchronous RAG service used by the API so requests never block the event loop."""
+
+from functools import partial
+from typing import List, Dict, Tuple, AsyncIterator, Awaitable, Optional, TypeVar
+import asyncio
+import logging
+import time
+import numpy as np
+
+from ...core.deadline import (
+    deadline,
+    request_budget,
+    open_budget,
+    aiterate_in_context,
+    bounded_timeout,
+    degraded_stages,
+    timed_out
+)
+from ...core.interfaces import (
+    AsyncEmbeddingModelProtocol,
+    AsyncVectorStoreProtocol,
+    AsyncLLMClientProtocol,
+    AsyncQueryProcessorProtocol,
+    AsyncSingleFlightProtocol
+)
+from .rag_service import BaseRAGService
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncRAGService(BaseRAGService):
+    """Service orchestrating the complete RAG pipeline with async components."""
+
+    embedding_model: AsyncEmbeddingModelProtocol
+    vector_store: AsyncVectorStoreProtocol
+    query_processor: AsyncQueryProcessorProtocol
+    llm_client: AsyncLLMClientProtocol
+    single_flight: Optional[AsyncSingleFlightProtocol]
+
+    async def refresh_index_version(self) -> None:
+        """Poll the index version and drop state built from an older index.
+
+        Runs at most once per ``cache_version_check_interval``. A new version
+        clears the answer cache and reloads the lexical index snapshot the
+        indexer wrote alongside it.
+        """
+        if self.answer_cache is None and self.lexical_index is None:
+            return
+        if not self.version_check_due():
+            return
+        changed = self.apply_index_version(await self.vector_store.get_index_version())
+        if changed and self.lexical_index is not None:
+            await asyncio.to_thread(self.lexical_index.reload)
+
+    async def lookup_cached_answer(
+        self,
+        query: str,
+        top_k: int,
+        score_threshold: float
+    ) -> Tuple[Optional[Dict], Optional[np.ndarray]]:
+        """Look up a previously generated answer for a similar query.
+
+        Args:
+            query: User query
+            top_k: Number of documents to retrieve
+            score_threshold: Minimum similarity threshold
+
+        Returns:
+            Tuple of (cached result or None, original query embedding or None)
+        """
+        if self.answer_cache is None:
+            return None, None
+
+        with self.timed("embed", texts=1, chars=len(query.strip())):
+            query_embedding = (await self.embedding_model.encode([query.strip()]))[0]
+        cached = self.answer_cache.lookup(
+            query_embedding,
+            namespace=self.cache_namespace(top_k, score_threshold)
+        )
+        self.record_cache(cached is not None)
+        return cached, query_embedding
+
+    async def _search_text(
+        self,
+        text: str,
+        top_k: int,
+        score_threshold: float,
+        query_embedding: Optional[np.ndarray] = None
+    ) -> List[Dict]:
+        """Embed a text (unless already embedded) and search, fusing lexical hits.
+
+        Args:
+            text: Text to search for
+            top_k: Number of results to retrieve
+            score_threshold: Minimum similarity threshold
+            query_embedding: Precomputed embedding of ``text``
+
+        Returns:
+            Search results
+        """
+        if query_embedding is None:
+            with self.timed("embed", texts=1, chars=len(text)):
+                query_embedding = (await self.embedding_model.encode([text]))[0]
+
+        limit = self.candidate_limit(top_k)
+        with self.timed("search", top_k=top_k, candidates=limit, score_threshold=score_threshold) as span:
+            results = await self.vector_store.search(
+                query_embedding=query_embedding,
+                top_k=limit,
+                score_threshold=score_threshold
+            )
+            results = await self._merge_lexical(text, results, top_k, score_threshold)
+            span.set(**self.result_attributes(results))
+            return results
+
+    async def _merge_lexical(
+        self,
+        text: str,
+        dense: List[Dict],
+        top_k: int,
+        score_threshold: float
+    ) -> List[Dict]:
+        """Fuse dense results with lexical results on a worker thread.
+
+        BM25 scoring is CPU-bound, so it runs off the event loop; see
+        ``merge_lexical``.
+
+        Args:
+            text: Text that was searched
+            dense: Vector store results for ``text``
+            top_k: Number of results to return
+            score_threshold: Minimum similarity threshold
+
+        Returns:
+            Fused results in hybrid mode, otherwise ``dense`` unchanged
+        """
+        if not self.hybrid_enabled():
+            return dense
+        return await asyncio.to_thread(self.merge_lexical, text, dense, top_k, score_threshold)
+
+    async def _lexical_retrieval(self, query: str, top_k: int) -> Optional[List[Dict]]:
+        """Try the lexical fast path on a worker thread; see ``lexical_retrieval``.
+
+        Args:
+            query: User query
+            top_k: Number of results to retrieve
+
+        Returns:
+            Lexical results, or None if retrieval must go through the
+            vector store
+        """
+        if not self.lexical_fast_path_enabled():
+            return None
+        return await asyncio.to_thread(self.lexical_retrieval, query, top_k)
+
+    async def _call_within(self, timeout: Optional[float], awaitable: Awaitable[T]) -> T:
+        """Await a call, cancelling it after ``timeout`` seconds.
+
+        The request deadline seen by the call is narrowed to the same timeout.
+
+        Args:
+            timeout: Seconds allowed, None to wait without a limit
+            awaitable: Call to await
+
+        Returns:
+            Result of the call
+
+        Raises:
+            TimeoutError: If the call did not finish in time
+        """
+        if timeout is None:
+            return await awaitable
+        with deadline(timeout):
+            return await asyncio.wait_for(awaitable, timeout)
+
+    async def _rewrite(self, query: str) -> str:
+        """Rewrite a query, timed as the "rewrite" stage.
+
+        Within a request deadline, a rewrite that outlives its slice of the
+        budget is cancelled and the raw query is used instead.
+
+        Args:
+            query: User query
+
+        Returns:
+            Rewritten query, or the stripped raw query if the rewrite was
+            abandoned
+        """
+        with self.timed("rewrite", query_chars=len(query)) as span:
+            timeout = self.rewrite_timeout()
+            try:
+                rewritten = await self._call_within(timeout, self.query_processor.process_query(query))
+            except Exception as e:
+                if timeout is None or not timed_out(e):
+                    raise
+                logger.warning(f"Rewrite missed its {timeout:.2f}s budget, searching with the raw query")
+                self.degrade("rewrite")
+                span.set(degraded=True)
+                return query.strip()
+            span.set(rewritten_chars=len(rewritten))
+            return rewritten
+
+    async def retrieve_context(
+        self,
+        query: str,
+        top_k: int = 3,
+        score_threshold: float = 0.5,
+        query_embedding: Optional[np.ndarray] = None
+    ) -> Tuple[List[Dict], str, str]:
+        """Retrieve relevant context for a query according to ``rewrite_mode``.
+
+        Args:
+            query: User query
+            top_k: Number of results to retrieve
+            score_threshold: Minimum similarity threshold
+            query_embedding: Precomputed embedding of the raw query, reused
+                whenever the raw query is searched
+
+        Returns:
+            Tuple of (retrieved chunks, query used for retrieval, retrieval
+            path: "rewrite", "raw" or "rewrite_fallback")
+        """
+        start = time.perf_counter()
+        raw_query = query.strip()
+
+        if self.rewrite_mode == "always":
+            processed_query = await self._rewrite(query)
+            if processed_query != raw_query:
+                results = await self._search_text(processed_query, top_k, score_threshold)
+                path = "rewrite"
+            else:
+                results = await self._search_text(raw_query, top_k, score_threshold, query_embedding)
+                path = "raw"
+        elif self.rewrite_mode == "never":
+            processed_query = raw_query
+            results = await self._search_text(raw_query, top_k, score_threshold, query_embedding)
+            path = "raw"
+        else:
+            speculative = None
+            if self.rewrite_mode == "speculative":
+                speculative = asyncio.ensure_future(self._rewrite(query))
+                # Retrieve the outcome even when the rewrite is never awaited,
+                # so a failed speculation is not reported as unhandled.
+                speculative.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+            try:
+                results = await self._search_text(raw_query, top_k, score_threshold, query_embedding)
+                processed_query, path = raw_query, "raw"
+                if self.needs_rewrite(results):
+                    if speculative is not None:
+                        processed_query = await speculative
+                    else:
+                        processed_query = await self._rewrite(query)
+                    if processed_query != raw_query:
+                        rewritten = await self._search_text(processed_query, top_k, score_threshold)
+                        results, path = self.pick_results(results, rewritten), "rewrite_fallback"
+            finally:
+                if speculative is not None and not speculative.done():
+                    speculative.cancel()
+
+        self.record_retrieval(path, time.perf_counter() - start)
+        return results, processed_query, path
+
+    async def generate_response(
+        self,
+        query: str,
+        context: str,
+        conversation_history: List[Dict] = None
+    ) -> str:
+        """Generate response using LLM with retrieved context.
+
+        Args:
+            query: User query
+            context: Formatted context from retrieval
+            conversation_history: Previous conversation (unused in current version)
+
+        Returns:
+            Generated answer
+        """
+        full_prompt = self.build_prompt(query, context)
+        self.record_text("prompt", full_prompt)
+        self.annotate(prompt_chars=len(full_prompt))
+
+        response = await self.llm_client.generate(full_prompt)
+        self.record_text("completion", response)
+        self.annotate(completion_chars=len(response))
+        return response
+
+    async def answer_query(
+        self,
+        query: str,
+        retrieved_chunks: List[Dict],
+        conversation_history: List[Dict] = None
+    ) -> Tuple[str, str]:
+        """Produce the answer extractively or by generation, degrading on failure.
+
+        Generation is bounded by ``generation_timeout`` and by what is left
+        of the request budget.
+
+        Args:
+            query: User query
+            retrieved_chunks: Retrieved document chunks
+            conversation_history: Previous conversation
+
+        Returns:
+            Tuple of (answer, served_by: "generation", "extractive" or
+            "extractive_fallback")
+        """
+        if self.should_extract(retrieved_chunks):
+            return self.extractive_answer(retrieved_chunks), "extractive"
+
+        with self.timed("format", chunks=len(retrieved_chunks)) as span:
+            context = self.format_context(retrieved_chunks)
+            span.set(context_chars=len(context))
+        generation = self.generate_response(
+            query=query,
+            context=context,
+            conversation_history=conversation_history
+        )
+        try:
+            with self.timed("generate"):
+                answer = await self._call_within(bounded_timeout(self.generation_timeout), generation)
+            return answer, "generation"
+        except Exception as e:
+            fallback = self.fallback_answer(retrieved_chunks, e)
+            if fallback is None:
+                raise
+            return fallback, "extractive_fallback"
+
+    async def _stream_tokens(self, prompt: str) -> AsyncIterator[str]:
+        """Stream generated tokens, bounding the wait for the first one.
+
+        The first token must arrive within ``generation_timeout`` and what is
+        left of the request budget; once tokens flow they are not cut off.
+
+        Args:
+            prompt: Full prompt
+
+        Yields:
+            Generated tokens
+        """
+        timeout = bounded_timeout(self.generation_timeout)
+        stream = self.llm_client.generate_stream(prompt)
+        tokens = stream.__aiter__()
+        try:
+            first = True
+            while True:
+                try:
+                    if first and timeout is not None:
+                        token = await self._call_within(timeout, tokens.__anext__())
+                    else:
+                        token = await tokens.__anext__()
+                except StopAsyncIteration:
+                    return
+                first = False
+                yield token
+        finally:
+            close = getattr(stream, "aclose", None)
+            if close is not None:
+                await close()
+
+    async def chat(
+        self,
+        query: str,
+        conversation_history: List[Dict] = None,
+        top_k: int = 3,
+        score_threshold: float = 0.5
+    ) -> Dict:
+        """Main chat function combining retrieval and generation.
+
+        Args:
+            query: User query
+            conversation_history: Previous conversation
+            top_k: Number of documents to retrieve
+            score_threshold: Minimum similarity threshold
+
+        Returns:
+            Dictionary with answer, chunks, confidence, rewritten query and
+            degraded stages
+        """
+        with request_budget(self.request_timeout):
+            if self.single_flight is None:
+                return await self._run_chat(query, conversation_history, top_k, score_threshold)
+
+            key = self.single_flight_key(query, conversation_history, top_k, score_threshold)
+            result = await self.single_flight.do(
+                key,
+                lambda: self._run_chat(query, conversation_history, top_k, score_threshold)
+            )
+            return dict(result)
+
+    async def _run_chat(
+        self,
+        query: str,
+        conversation_history: Optional[List[Dict]],
+        top_k: int,
+        score_threshold: float
+    ) -> Dict:
+        """Run the full pipeline for one chat request.
+
+        Args:
+            query: User query
+            conversation_history: Previous conversation
+            top_k: Number of documents to retrieve
+            score_threshold: Minimum similarity threshold
+
+        Returns:
+            Dictionary with answer, chunks, confidence, and rewritten query
+        """
+        await self.refresh_index_version()
+        index_version = self._index_version
+        query_embedding = None
+        retrieved_chunks = await self._lexical_retrieval(query, top_k)
+        if retrieved_chunks is not None:
+            processed_query, retrieval_path = query.strip(), "lexical"
+        else:
+            cached, query_embedding = await self.lookup_cached_answer(query, top_k, score_threshold)
+            if cached is not None:
+                return cached
+
+            retrieved_chunks, processed_query, retrieval_path = await self.retrieve_context(
+                query=query,
+                top_k=top_k,
+                score_threshold=score_threshold,
+                query_embedding=query_embedding
+            )
+
+        answer, served_by = await self.answer_query(query, retrieved_chunks, conversation_history)
+
+        result = self.build_result(answer, retrieved_chunks, processed_query, retrieval_path, served_by)
+        self.store_cached_answer(query_embedding, result, top_k, score_threshold, index_version)
+        return result
+
+    async def chat_batch(
+        self,
+        queries: List[str],
+        top_k: int = 3,
+        score_threshold: float = 0.5,
+        rewrite_concurrency: int = 8,
+        generation_concurrency: int = 8,
+        embed_batch_size: int = 100,
+        embed_concurrency: int = 4
+    ) -> List[Dict]:
+        """Answer many independent questions with batched retrieval.
+
+        Queries are rewritten according to ``rewrite_mode``, embedded and
+        answered under concurrency caps. Embedding requests carry up to
+        ``embed_batch_size`` texts each, and retrieval is one batched vector
+        store call per pass: the first one and, in "adaptive" and
+        "speculative" mode, one more for the items whose raw results were too
+        weak. The answer cache is bypassed so batch runs always exercise the
+        full pipeline. A failure only affects its own item.
+
+        Args:
+            queries: User queries
+            top_k: Number of documents to retrieve per query
+            score_threshold: Minimum similarity threshold
+            rewrite_concurrency: Maximum concurrent query rewrites
+            generation_concurrency: Maximum concurrent LLM generations
+            embed_batch_size: Maximum texts per embedding request
+            embed_concurrency: Maximum concurrent embedding requests
+
+        Returns:
+            One result per query, in input order, each with an ``error`` field
+        """
+        results: List[Optional[Dict]] = [None] * len(queries)
+        raw = {i: query.strip() for i, query in enumerate(queries)}
+        rewrite_slots = asyncio.Semaphore(max(1, rewrite_concurrency))
+        embed_slots = asyncio.Semaphore(max(1, embed_concurrency))
+
+        async def rewrite(query: str) -> str:
+            async with rewrite_slots:
+                return await self._rewrite(query)
+
+        def start_rewrites(items: List[int]) -> Dict[int, asyncio.Future]:
+            tasks = {i: asyncio.ensure_future(rewrite(queries[i])) for i in items}
+            for task in tasks.values():
+                task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            return tasks
+
+        rewrites: Dict[int, asyncio.Future] = {}
+        try:
+            if self.rewrite_mode in ("always", "speculative"):
+                rewrites = start_rewrites(list(raw))
+
+            processed = dict(raw)
+            if self.rewrite_mode == "always":
+                processed = await self._collect_rewrites(rewrites, results)
+            retrieved = await self._retrieve_batch(
+                processed, top_k, score_threshold, embed_batch_size, embed_slots, results
+            )
+            paths = {
+                i: "rewrite" if self.rewrite_mode == "always" and processed[i] != raw[i] else "raw"
+                for i in retrieved
+            }
+
+            if self.rewrite_mode in ("adaptive", "speculative"):
+                weak = [i for i, chunks in retrieved.items() if self.needs_rewrite(chunks)]
+                if self.rewrite_mode == "adaptive":
+                    rewrites = start_rewrites(weak)
+                rewritten = {
+                    i: text
+                    for i, text in (await self._collect_rewrites({i: rewrites[i] for i in weak}, results)).items()
+                    if text != raw[i]
+                }
+                for i in weak:
+                    if results[i] is not None:
+                        del retrieved[i]
+                second = await self._retrieve_batch(
+                    rewritten, top_k, score_threshold, embed_batch_size, embed_slots, results
+                )
+                for i in rewritten:
+                    if i in second:
+                        retrieved[i] = self.pick_results(retrieved[i], second[i])
+                        processed[i], paths[i] = rewritten[i], "rewrite_fallback"
+                    else:
+                        del retrieved[i]
+        finally:
+            for task in rewrites.values():
+                if not task.done():
+                    task.cancel()
+
+        generation_slots = asyncio.Semaphore(max(1, generation_concurrency))
+
+        async def answer(i: int) -> None:
+            async with generation_slots:
+                try:
+                    response, served_by = await self.answer_query(queries[i], retrieved[i])
+                    results[i] = self.build_batch_item(response, retrieved[i], processed[i], paths[i], served_by)
+                except Exception as e:
+                    results[i] = self.build_batch_error(e, processed[i])
+
+        await asyncio.gather(*(answer(i) for i in retrieved))
+        return results
+
+    async def _collect_rewrites(
+        self,
+        rewrites: Dict[int, asyncio.Future],
+        results: List[Optional[Dict]]
+    ) -> Dict[int, str]:
+        """Await batch rewrites, recording failed items in ``results``.
+
+        Args:
+            rewrites: Pending rewrite per item index
+            results: Batch results, updated in place for failed items
+
+        Returns:
+            Rewritten query per item that succeeded
+        """
+        items = list(rewrites)
+        outcomes = await asyncio.gather(*(rewrites[i] for i in items), return_exceptions=True)
+        processed: Dict[int, str] = {}
+        for i, rewritten in zip(items, outcomes):
+            if isinstance(rewritten, Exception):
+                results[i] = self.build_batch_error(rewritten)
+            else:
+                processed[i] = rewritten
+        return processed
+
+    async def _retrieve_batch(
+        self,
+        texts: Dict[int, str],
+        top_k: int,
+        score_threshold: float,
+        embed_batch_size: int,
+        embed_slots: asyncio.Semaphore,
+        results: List[Optional[Dict]]
+    ) -> Dict[int, List[Dict]]:
+        """Embed and search many texts, recording failed items in ``results``.
+
+        Args:
+            texts: Text to search per item index
+            top_k: Number of documents to retrieve per text
+            score_threshold: Minimum similarity threshold
+            embed_batch_size: Maximum texts per embedding request
+            embed_slots: Semaphore capping concurrent embedding requests
+            results: Batch results, updated in place for failed items
+
+        Returns:
+            Retrieved chunks per item that succeeded
+        """
+        pending = list(texts)
+        batches = [pending[start:start + embed_batch_size] for start in range(0, len(pending), embed_batch_size)]
+
+        async def encode(batch: List[int]) -> np.ndarray:
+            batch_texts = [texts[i] for i in batch]
+            async with embed_slots:
+                with self.timed("embed", texts=len(batch_texts), chars=sum(map(len, batch_texts))):
+                    return await self.embedding_model.encode(batch_texts)
+
+        encoded = await asyncio.gather(*(encode(batch) for batch in batches), return_exceptions=True)
+        embeddings: Dict[int, np.ndarray] = {}
+        for batch, vectors in zip(batches, encoded):
+            if isinstance(vectors, Exception):
+                for i in batch:
+                    results[i] = self.build_batch_error(vectors, texts[i])
+            else:
+                embeddings.update(zip(batch, vectors))
+
+        retrieved: Dict[int, List[Dict]] = {}
+        if embeddings:
+            searched = list(embeddings)
+            try:
+                limit = self.candidate_limit(top_k)
+                with self.timed(
+                    "search", queries=len(searched), top_k=top_k, candidates=limit, score_threshold=score_threshold
+                ):
+                    hits = await self.vector_store.search_batch(
+                        np.stack([embeddings[i] for i in searched]),
+                        top_k=limit,
+                        score_threshold=score_threshold
+                    )
+                    dense_hits = dict(zip(searched, hits))
+                    retrieved = dense_hits
+                    if self.hybrid_enabled():
+                        # One worker thread fuses the whole batch off the event loop.
+                        retrieved = await asyncio.to_thread(lambda: {
+                            i: self.merge_lexical(texts[i], dense, top_k, score_threshold)
+                            for i, dense in dense_hits.items()
+                        })
+            except Exception as e:
+                for i in searched:
+                    results[i] = self.build_batch_error(e, texts[i])
+        return retrieved
+
+    def chat_stream(
+        self,
+        query: str,
+        conversation_history: List[Dict] = None,
+        top_k: int = 3,
+        score_threshold: float = 0.5
+    ) -> AsyncIterator[Dict]:
+        """Chat function yielding retrieval metadata first, then answer tokens.
+
+        The stream runs in a private context holding the request budget, so
+        it can be resumed or closed from any task.
+
+        Args:
+            query: User query
+            conversation_history: Previous conversation
+            top_k: Number of documents to retrieve
+            score_threshold: Minimum similarity threshold
+
+        Returns:
+            Async iterator of event dictionaries: one "metadata", then "token"
+            events, then "done" with the full answer, ``served_by`` and
+            ``degraded``
+        """
+        return aiterate_in_context(
+            self._run_chat_stream(query, conversation_history, top_k, score_threshold),
+            partial(open_budget, self.request_timeout)
+        )
+
+    async def _run_chat_stream(
+        self,
+        query: str,
+        conversation_history: Optional[List[Dict]],
+        top_k: int,
+        score_threshold: float
+    ) -> AsyncIterator[Dict]:
+        """Run the streaming pipeline for one chat request.
+
+        Args:
+            query: User query
+            conversation_history: Previous conversation
+            top_k: Number of documents to retrieve
+            score_threshold: Minimum similarity threshold
+
+        Yields:
+            Streaming events, see ``chat_stream``
+        """
+        await self.refresh_index_version()
+        index_version = self._index_version
+        query_embedding = None
+        retrieved_chunks = await self._lexical_retrieval(query, top_k)
+        if retrieved_chunks is not None:
+            processed_query, retrieval_path = query.strip(), "lexical"
+        else:
+            cached, query_embedding = await self.lookup_cached_answer(query, top_k, score_threshold)
+            if cached is not None:
+                for event in self.cached_stream_events(cached):
+                    yield event
+                return
+
+            retrieved_chunks, processed_query, retrieval_path = await self.retrieve_context(
+                query=query,
+                top_k=top_k,
+                score_threshold=score_threshold,
+                query_embedding=query_embedding
+            )
+
+        yield self.build_stream_metadata(retrieved_chunks, retrieval_path)
+
+        if self.should_extract(retrieved_chunks):
+            parts, served_by = [self.extractive_answer(retrieved_chunks)], "extractive"
+            yield {"event": "token", "data": {"text": parts[0]}}
+        else:
+            with self.timed("format", chunks=len(retrieved_chunks)) as span:
+                context = self.format_context(retrieved_chunks)
+                full_prompt = self.build_prompt(query, context)
+                span.set(context_chars=len(context))
+            self.record_text("prompt", full_prompt)
+
+            parts, served_by = [], "generation"
+            try:
+                with self.timed("generate", prompt_chars=len(full_prompt)) as span:
+                    async for token in self._stream_tokens(full_prompt):
+                        parts.append(token)
+                        yield {"event": "token", "data": {"text": token}}
+                    completion = "".join(parts)
+                    span.set(tokens=len(parts), completion_chars=len(completion))
+                self.record_text("completion", completion)
+            except Exception as e:
+                # Tokens already sent cannot be taken back, so only a stream
+                # that failed before its first token degrades.
+                fallback = None if parts else self.fallback_answer(retrieved_chunks, e)
+                if fallback is None:
+                    raise
+                parts, served_by = [fallback], "extractive_fallback"
+                yield {"event": "token", "data": {"text": fallback}}
+
+        answer = "".join(parts).strip()
+        self.store_cached_answer(
+            query_embedding,
+            self.build_result(answer, retrieved_chunks, processed_query, retrieval_path, served_by),
+            top_k,
+            score_threshold,
+            index_version
+        )
+        yield {"event": "done", "data": {"answer": answer, "served_by": served_by, "degraded": degraded_stages()}}
@@ -1,65 +1,578 @@
 """RAG (Retrieval-Augmented Generation) service with business logic."""
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Iterator, Optional, Hashable, Callable, Any, Union
+from concurrent.futures import ThreadPoolExecutor, Future
+from contextlib import contextmanager, ExitStack
+from functools import partial
+import contextvars
+import hashlib
+import json
+import logging
+import threading
+import time
 import numpy as np
 
+from ...core.deadline import (
+    deadline,
+    request_budget,
+    open_budget,
+    iterate_in_context,
+    bounded_timeout,
+    mark_degraded,
+    degraded_stages,
+    timed_out
+)
+from ...core.exceptions import DeadlineExceededError
 from ...core.interfaces import (
     EmbeddingModelProtocol,
     VectorStoreProtocol,
     LLMClientProtocol,
-    QueryProcessorProtocol
+    QueryProcessorProtocol,
+    AsyncEmbeddingModelProtocol,
+    AsyncVectorStoreProtocol,
+    AsyncLLMClientProtocol,
+    AsyncQueryProcessorProtocol,
+    SemanticCacheProtocol,
+    SingleFlightProtocol,
+    AsyncSingleFlightProtocol,
+    LexicalIndexProtocol,
+    PipelineMetricsProtocol,
+    TracerProtocol,
+    SpanProtocol,
+    NOOP_SPAN
 )
 
+logger = logging.getLogger(__name__)
+
+SYSTEM_PROMPT = """You are an AI assistant that answers questions about Perso.ai.
+
+Important rules:
+1. Use only the provided reference materials to answer.
+2. Do not guess or make up information not in the reference materials.
+3. If you cannot provide an accurate answer, say "The information is not available in the provided materials."
+4. Provide friendly and clear answers.
+5. Use the exact expressions from the reference materials when possible."""
+
+
+REWRITE_MODES = ("always", "adaptive", "speculative", "never")
+
+RETRIEVAL_MODES = ("dense", "hybrid")
+
+FUSION_METHODS = ("rrf", "weighted")
+
+# Candidates fetched from each retriever per requested result before fusion.
+HYBRID_CANDIDATE_FACTOR = 3
 
-class RAGService:
-    """Service orchestrating the complete RAG pipeline."""
+
+def top_dense_score(results: List[Dict]) -> float:
+    """Best dense similarity among results.
+
+    Lexical-only matches carry a ``lexical_score`` but no dense ``score`` and
+    are skipped, so cosine thresholds are never compared to lexical scores.
+
+    Args:
+        results: Search results
+
+    Returns:
+        Highest ``score``, or -inf if no result has one
+    """
+    return max((hit["score"] for hit in results if hit.get("score") is not None), default=float("-inf"))
+
+
+def submit_in_context(executor: ThreadPoolExecutor, fn: Callable, *args: Any) -> Future:
+    """Submit a call that runs in a copy of the caller's context.
+
+    Worker threads do not inherit context variables, so without this the
+    current trace span and request timings would be lost on the pool.
+
+    Args:
+        executor: Pool to run the call on
+        fn: Callable
+        *args: Positional arguments
+
+    Returns:
+        Future of the call
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+
+class BaseRAGService:
+    """Pipeline steps shared by the synchronous and asynchronous RAG services."""
 
     def __init__(
         self,
-        embedding_model: EmbeddingModelProtocol,
-        vector_store: VectorStoreProtocol,
-        query_processor: QueryProcessorProtocol,
-        llm_client: LLMClientProtocol
+        embedding_model: Union[EmbeddingModelProtocol, AsyncEmbeddingModelProtocol],
+        vector_store: Union[VectorStoreProtocol, AsyncVectorStoreProtocol],
+        query_processor: Union[QueryProcessorProtocol, AsyncQueryProcessorProtocol],
+        llm_client: Union[LLMClientProtocol, AsyncLLMClientProtocol],
+        answer_cache: Optional[SemanticCacheProtocol] = None,
+        cache_version_check_interval: float = 30.0,
+        single_flight: Optional[Union[SingleFlightProtocol, AsyncSingleFlightProtocol]] = None,
+        rewrite_mode: str = "always",
+        rewrite_score_threshold: float = 0.75,
+        lexical_index: Optional[LexicalIndexProtocol] = None,
+        retrieval_mode: str = "dense",
+        fusion: str = "rrf",
+        fusion_dense_weight: float = 0.5,
+        rrf_k: int = 60,
+        lexical_fast_path_threshold: float = 0.9,
+        lexical_score_threshold: float = 0.5,
+        extractive_threshold: float = 0.0,
+        extractive_template: str = "{answer}",
+        generation_timeout: float = 0.0,
+        generation_fallback: bool = True,
+        request_timeout: float = 0.0,
+        rewrite_budget_share: float = 0.3,
+        metrics: Optional[PipelineMetricsProtocol] = None,
+        tracer: Optional[TracerProtocol] = None
     ):
         """Initialize RAG service.
 
+        The synchronous service takes blocking components and the
+        asynchronous one their async counterparts.
+
         Args:
             embedding_model: Model for generating embeddings
             vector_store: Vector store for retrieval
             query_processor: Processor for query rewriting
             llm_client: LLM client for generation
+            answer_cache: Optional semantic cache for complete answers
+            cache_version_check_interval: Seconds between index version polls
+            single_flight: Optional group sharing identical in-flight chats
+            rewrite_mode: "always" rewrites before searching; "adaptive" searches
+                the raw query first and rewrites only if its top score is below
+                ``rewrite_score_threshold``; "speculative" also starts the
+                rewrite in parallel with the raw search (the synchronous
+                service cannot interrupt an unneeded one, which runs to
+                completion on its worker thread); "never" skips it
+            rewrite_score_threshold: Top raw score that makes a rewrite unnecessary
+            lexical_index: Optional BM25 index over the same chunks
+            retrieval_mode: "dense" searches vectors only; "hybrid" fuses
+                vector and lexical results (requires ``lexical_index``)
+            fusion: "rrf" (reciprocal rank fusion) or "weighted"
+            fusion_dense_weight: Dense share of the score in weighted fusion
+            rrf_k: Rank offset of reciprocal rank fusion
+            lexical_fast_path_threshold: Lexical score above which retrieval
+                skips the answer cache, embedding, rewriting and vector
+                search; 0 disables
+            lexical_score_threshold: Minimum lexical score of a result with
+                no dense score (fast path and lexical-only fused hits)
+            extractive_threshold: Top dense score at which the stored answer
+                is returned without calling the LLM; 0 disables
+            extractive_template: Format string for extractive answers, with
+                ``{answer}`` and ``{question}`` fields
+            generation_timeout: Seconds before a generation (or, when
+                streaming, its first token) counts as failed; 0 waits
+                indefinitely
+            generation_fallback: Serve the stored answer of the best chunk
+                when generation fails or times out
+            request_timeout: Seconds each chat request may take end to end;
+                the rewrite is skipped once it outlives its share, and
+                generation falls back to the stored answer when the rest
+                runs out; 0 sets no deadline
+            rewrite_budget_share: Fraction of ``request_timeout`` the query
+                rewrite may use
+            metrics: Optional recorder of stage latencies, errors, cache
+                lookups and LLM text volume
+            tracer: Optional recorder of a per-request span tree
+
+        Raises:
+            ValueError: If ``rewrite_mode``, ``retrieval_mode`` or ``fusion``
+                is not one of ``REWRITE_MODES``, ``RETRIEVAL_MODES`` or
+                ``FUSION_METHODS``
         """
+        if rewrite_mode not in REWRITE_MODES:
+            raise ValueError(f"Unknown rewrite_mode {rewrite_mode!r}, expected one of {REWRITE_MODES}")
+        if retrieval_mode not in RETRIEVAL_MODES:
+            raise ValueError(f"Unknown retrieval_mode {retrieval_mode!r}, expected one of {RETRIEVAL_MODES}")
+        if fusion not in FUSION_METHODS:
+            raise ValueError(f"Unknown fusion {fusion!r}, expected one of {FUSION_METHODS}")
+
         self.embedding_model = embedding_model
         self.vector_store = vector_store
         self.query_processor = query_processor
         self.llm_client = llm_client
+        self.answer_cache = answer_cache
+        self.cache_version_check_interval = cache_version_check_interval
+        self.single_flight = single_flight
+        self.rewrite_mode = rewrite_mode
+        self.rewrite_score_threshold = rewrite_score_threshold
+        self.lexical_index = lexical_index
+        self.retrieval_mode = retrieval_mode
+        self.fusion = fusion
+        self.fusion_dense_weight = fusion_dense_weight
+        self.rrf_k = rrf_k
+        self.lexical_fast_path_threshold = lexical_fast_path_threshold
+        self.lexical_score_threshold = lexical_score_threshold
+        self.extractive_threshold = extractive_threshold
+        self.extractive_template = extractive_template
+        self.generation_timeout = generation_timeout
+        self.generation_fallback = generation_fallback
+        self.request_timeout = request_timeout
+        self.rewrite_budget_share = rewrite_budget_share
+        self.metrics = metrics
+        self.tracer = tracer
+        self._last_version_check = float("-inf")
+        self._index_version: Optional[str] = None
+        self._retrieval_lock = threading.Lock()
+        self._retrieval_stats: Dict[str, Dict] = {}
 
-    def retrieve_context(
-        self,
-        query: str,
-        top_k: int = 3,
-        score_threshold: float = 0.5
-    ) -> Tuple[List[Dict], str]:
-        """Retrieve relevant context for a query.
+    def needs_rewrite(self, results: List[Dict]) -> bool:
+        """Decide whether first-pass results on the raw query are too weak.
+
+        Args:
+            results: Search results for the raw query
+
+        Returns:
+            True if the best dense score is below ``rewrite_score_threshold``
+        """
+        return top_dense_score(results) < self.rewrite_score_threshold
+
+    def pick_results(self, raw: List[Dict], rewritten: List[Dict]) -> List[Dict]:
+        """Keep whichever of the raw and rewritten searches matched better.
+
+        Args:
+            raw: Search results for the raw query
+            rewritten: Search results for the rewritten query
+
+        Returns:
+            Result list with the higher top dense score
+        """
+        return raw if top_dense_score(raw) > top_dense_score(rewritten) else rewritten
+
+    def hybrid_enabled(self) -> bool:
+        """Check whether dense results are fused with lexical results.
+
+        Returns:
+            True in "hybrid" retrieval mode with a lexical index configured
+        """
+        return self.retrieval_mode == "hybrid" and self.lexical_index is not None
+
+    def candidate_limit(self, top_k: int) -> int:
+        """Number of results to fetch from each retriever.
+
+        Args:
+            top_k: Number of results the caller wants
+
+        Returns:
+            ``top_k``, widened in hybrid mode so fusion can reorder candidates
+        """
+        return top_k * HYBRID_CANDIDATE_FACTOR if self.hybrid_enabled() else top_k
+
+    def lexical_fast_path_enabled(self) -> bool:
+        """Check whether retrieval first tries the lexical index alone.
+
+        Returns:
+            True with a lexical index and a positive
+            ``lexical_fast_path_threshold``
+        """
+        return self.lexical_index is not None and self.lexical_fast_path_threshold > 0
+
+    def lexical_fast_path(self, query: str, top_k: int) -> Optional[List[Dict]]:
+        """Answer retrieval from the lexical index alone for near-exact matches.
+
+        Args:
+            query: Raw user query
+            top_k: Number of results to retrieve
+
+        Returns:
+            Lexical results scoring at least ``lexical_score_threshold``, or
+            None if the best match is below ``lexical_fast_path_threshold`` or
+            the fast path is disabled
+        """
+        if not self.lexical_fast_path_enabled():
+            return None
+
+        hits = self.lexical_index.search(query, top_k * HYBRID_CANDIDATE_FACTOR)
+        hits = sorted(
+            (hit for hit in hits if hit["lexical_score"] >= self.lexical_score_threshold),
+            key=lambda hit: hit["lexical_score"],
+            reverse=True
+        )[:top_k]
+        if not hits or hits[0]["lexical_score"] < self.lexical_fast_path_threshold:
+            return None
+        return hits
+
+    def lexical_retrieval(self, query: str, top_k: int) -> Optional[List[Dict]]:
+        """Try the lexical fast path, timing it as a search stage.
+
+        Runs before the answer cache lookup and any embedding or rewrite
+        call, so a query that restates a stored question costs one
+        in-process index lookup.
 
         Args:
             query: User query
             top_k: Number of results to retrieve
+
+        Returns:
+            Lexical results, or None if retrieval must go through the
+            vector store
+        """
+        if not self.lexical_fast_path_enabled():
+            return None
+
+        start = time.perf_counter()
+        with self.timed("search", index="lexical", top_k=top_k) as span:
+            results = self.lexical_fast_path(query.strip(), top_k)
+            span.set(**self.result_attributes(results or []))
+        if results is not None:
+            self.record_retrieval("lexical", time.perf_counter() - start)
+        return results
+
+    def fuse_results(
+        self,
+        dense: List[Dict],
+        lexical: List[Dict],
+        top_k: int,
+        score_threshold: float
+    ) -> List[Dict]:
+        """Merge dense and lexical rankings of the same query.
+
+        "rrf" sums ``1 / (rrf_k + rank)`` over both rankings; "weighted"
+        mixes the dense cosine ``score`` and the normalized ``lexical_score``
+        with ``fusion_dense_weight``. Documents are matched on their content,
+        so fusion works whatever ids the vector store assigned. A document
+        found by both retrievers carries both scores; one found only
+        lexically has no ``score``. Results must clear ``score_threshold`` on
+        their dense score, or ``lexical_score_threshold`` when they have
+        none. The fused value is reported as ``fusion_score``.
+
+        Args:
+            dense: Vector store results, best first
+            lexical: Lexical index results, best first
+            top_k: Number of results to return
             score_threshold: Minimum similarity threshold
 
         Returns:
-            Tuple of (retrieved chunks, processed query)
+            Fused results ordered by fusion score
         """
-        processed_query = self.query_processor.process_query(query)
-        query_embedding = self.embedding_model.encode([processed_query])[0]
+        def key(hit: Dict) -> str:
+            return hit.get("content") or f"{hit.get('question', '')}\n{hit.get('answer', '')}"
+
+        def relevant(hit: Dict) -> bool:
+            if hit.get("score") is not None:
+                return hit["score"] >= score_threshold
+            return hit["lexical_score"] >= self.lexical_score_threshold
 
-        results = self.vector_store.search(
-            query_embedding=query_embedding,
-            top_k=top_k,
-            score_threshold=score_threshold
+        hits: Dict[str, Dict] = {}
+        fused: Dict[str, float] = {}
+        sources = (
+            (dense, "score", self.fusion_dense_weight),
+            (lexical, "lexical_score", 1.0 - self.fusion_dense_weight)
         )
+        for source, field, weight in sources:
+            for rank, hit in enumerate(source, 1):
+                doc = key(hit)
+                if self.fusion == "weighted":
+                    fused[doc] = fused.get(doc, 0.0) + weight * hit[field]
+                else:
+                    fused[doc] = fused.get(doc, 0.0) + 1.0 / (self.rrf_k + rank)
+                hits[doc] = {**hit, **hits.get(doc, {})}
+
+        ranked = sorted(fused, key=fused.get, reverse=True)
+        return [
+            {**hits[doc], "fusion_score": round(fused[doc], 6)}
+            for doc in ranked
+            if relevant(hits[doc])
+        ][:top_k]
 
-        return results, processed_query
+    def merge_lexical(
+        self,
+        text: str,
+        dense: List[Dict],
+        top_k: int,
+        score_threshold: float
+    ) -> List[Dict]:
+        """Fuse dense results with lexical results for the same text.
+
+        Args:
+            text: Text that was searched
+            dense: Vector store results for ``text``
+            top_k: Number of results to return
+            score_threshold: Minimum similarity threshold
+
+        Returns:
+            Fused results in hybrid mode, otherwise ``dense`` unchanged
+        """
+        if not self.hybrid_enabled():
+            return dense
+        lexical = self.lexical_index.search(text, self.candidate_limit(top_k))
+        return self.fuse_results(dense, lexical, top_k, score_threshold)
+
+    def should_extract(self, retrieved_chunks: List[Dict]) -> bool:
+        """Decide whether the stored answer can be returned without generation.
+
+        Args:
+            retrieved_chunks: Retrieved document chunks
+
+        Returns:
+            True if extraction is enabled and the best dense score is at least
+            ``extractive_threshold``; lexical-only matches never qualify
+        """
+        if self.extractive_threshold <= 0 or not retrieved_chunks:
+            return False
+        return top_dense_score(retrieved_chunks) >= self.extractive_threshold
+
+    def extractive_answer(self, retrieved_chunks: List[Dict]) -> str:
+        """Render the stored answer of the best chunk through ``extractive_template``.
+
+        The template may reference ``{answer}`` and ``{question}``; a template
+        that fails to render falls back to the bare answer.
+
+        Args:
+            retrieved_chunks: Retrieved document chunks, at least one
+
+        Returns:
+            Answer text
+        """
+        best = max(retrieved_chunks, key=lambda chunk: top_dense_score([chunk]))
+        answer = best.get("answer", "")
+        try:
+            return self.extractive_template.format(answer=answer, question=best.get("question", ""))
+        except (KeyError, IndexError, ValueError) as e:
+            logger.warning(f"Invalid extractive template, returning bare answer: {e}")
+            return answer
+
+    def fallback_answer(self, retrieved_chunks: List[Dict], error: Exception) -> Optional[str]:
+        """Degrade to the stored answer after a failed or slow generation.
+
+        Args:
+            retrieved_chunks: Retrieved document chunks
+            error: Exception raised by the generation call
+
+        Returns:
+            Extractive answer, or None if the fallback is disabled or there is
+            nothing to extract from
+        """
+        if not self.generation_fallback or not retrieved_chunks:
+            return None
+        logger.warning(f"Generation failed, serving stored answer instead: {error!r}")
+        self.degrade("generate")
+        return self.extractive_answer(retrieved_chunks)
+
+    def rewrite_timeout(self) -> Optional[float]:
+        """Time the query rewrite may take before retrieval goes ahead without it.
+
+        Returns:
+            ``rewrite_budget_share`` of ``request_timeout``, capped by what is
+            left of the request budget, or None outside a request deadline
+        """
+        return bounded_timeout(self.request_timeout * self.rewrite_budget_share)
+
+    def degrade(self, stage: str) -> None:
+        """Record that a stage fell back to keep the request answerable.
+
+        Args:
+            stage: "rewrite" (searched with the raw query) or "generate"
+                (served the stored answer)
+        """
+        mark_degraded(stage)
+        if self.metrics is not None:
+            self.metrics.record_degraded(stage)
+        self.annotate(degraded=degraded_stages())
+
+    @contextmanager
+    def timed(self, stage: str, **attributes) -> Iterator[SpanProtocol]:
+        """Time a pipeline stage when metrics are configured and trace it as a span.
+
+        Args:
+            stage: "rewrite", "embed", "search", "format" or "generate"
+            **attributes: Span attributes known before the stage runs
+
+        Yields:
+            Span to attach further attributes to
+        """
+        with ExitStack() as stack:
+            if self.metrics is not None:
+                stack.enter_context(self.metrics.stage(stage))
+            if self.tracer is not None:
+                yield stack.enter_context(self.tracer.span(stage, **attributes))
+            else:
+                yield NOOP_SPAN
+
+    def annotate(self, **attributes) -> None:
+        """Attach attributes to the current trace span, if tracing.
+
+        Args:
+            **attributes: JSON-serializable attribute values
+        """
+        if self.tracer is not None:
+            self.tracer.annotate(**attributes)
+
+    def record_text(self, kind: str, text: str) -> None:
+        """Count LLM prompt or completion volume when metrics are configured.
+
+        Args:
+            kind: "prompt" or "completion"
+            text: Text sent to or received from the LLM
+        """
+        if self.metrics is not None:
+            self.metrics.record_text(kind, text)
+
+    def record_cache(self, hit: bool) -> None:
+        """Count an answer cache lookup when metrics are configured.
+
+        Args:
+            hit: Whether a cached answer was found
+        """
+        if self.metrics is not None:
+            self.metrics.record_cache("answer", hit)
+        self.annotate(cache_hit=hit)
+
+    def record_retrieval(self, path: str, seconds: float) -> None:
+        """Count one retrieval and its latency under the path taken.
+
+        Args:
+            path: "rewrite", "raw", "rewrite_fallback" or "lexical"
+            seconds: Retrieval wall time
+        """
+        with self._retrieval_lock:
+            stats = self._retrieval_stats.setdefault(path, {"count": 0, "total_ms": 0.0})
+            stats["count"] += 1
+            stats["total_ms"] += seconds * 1000.0
+        self.annotate(retrieval_path=path)
+
+    def result_attributes(self, results: List[Dict]) -> Dict:
+        """Summarize search results as span attributes.
+
+        Args:
+            results: Search results, best first
+
+        Returns:
+            Dictionary with the result count and top dense and lexical scores
+        """
+        top_score = top_dense_score(results)
+        top_lexical = max((hit.get("lexical_score") or 0.0 for hit in results), default=0.0)
+        return {
+            "results": len(results),
+            "top_score": round(top_score, 4) if top_score > float("-inf") else None,
+            "top_lexical_score": round(top_lexical, 4) if top_lexical else None
+        }
+
+    def get_retrieval_stats(self) -> Dict:
+        """Get retrieval counters per path.
+
+        Returns:
+            Dictionary with the retrieval settings, lexical index size and
+            count/mean latency per path
+        """
+        with self._retrieval_lock:
+            return {
+                "rewrite_mode": self.rewrite_mode,
+                "rewrite_score_threshold": self.rewrite_score_threshold,
+                "retrieval_mode": self.retrieval_mode if self.lexical_index is not None else "dense",
+                "fusion": self.fusion,
+                "lexical_fast_path_threshold": self.lexical_fast_path_threshold,
+                "lexical_score_threshold": self.lexical_score_threshold,
+                "lexical_index": self.lexical_index.get_stats() if self.lexical_index is not None else None,
+                "paths": {
+                    path: {
+                        "count": stats["count"],
+                        "mean_ms": round(stats["total_ms"] / stats["count"], 2)
+                    }
+                    for path, stats in self._retrieval_stats.items()
+                }
+            }
 
     def format_context(self, retrieved_chunks: List[Dict]) -> str:
         """Format retrieved chunks into context string.
@@ -75,54 +588,43 @@ class RAGService:
 
         context_parts = []
         for i, chunk in enumerate(retrieved_chunks, 1):
+            if chunk.get("score") is not None:
+                relevance = f"유사도: {chunk['score']:.2f}"
+            else:
+                relevance = f"키워드 일치도: {chunk['lexical_score']:.2f}"
             context_parts.append(
                 f"[참고 자료 {i}]\n"
                 f"질문: {chunk['question']}\n"
                 f"답변: {chunk['answer']}\n"
-                f"(유사도: {chunk['score']:.2f})"
+                f"({relevance})"
             )
 
         return "\n\n".join(context_parts)
 
-    def generate_response(
-        self,
-        query: str,
-        context: str,
-        conversation_history: List[Dict] = None
-    ) -> str:
-        """Generate response using LLM with retrieved context.
+    def build_prompt(self, query: str, context: str) -> str:
+        """Build the generation prompt from the query and retrieved context.
 
         Args:
             query: User query
             context: Formatted context from retrieval
-            conversation_history: Previous conversation (unused in current version)
 
         Returns:
-            Generated answer
+            Full prompt for the LLM
         """
-        system_prompt = """You are an AI assistant that answers questions about Perso.ai.
-
-Important rules:
-1. Use only the provided reference materials to answer.
-2. Do not guess or make up information not in the reference materials.
-3. If you cannot provide an accurate answer, say "The information is not available in the provided materials."
-4. Provide friendly and clear answers.
-5. Use the exact expressions from the reference materials when possible."""
-
         user_prompt = f"""Question: {query}
 
 {context}
 
 Please answer the question based on the above reference materials."""
 
-        full_prompt = f"{system_prompt}\n\n{user_prompt}"
-
-        response = self.llm_client.generate(full_prompt)
-        return response
+        return f"{SYSTEM_PROMPT}\n\n{user_prompt}"
 
     def calculate_confidence(self, retrieved_chunks: List[Dict]) -> float:
         """Calculate confidence score based on retrieval quality.
 
+        Uses the dense similarity of the chunks that have one; results of
+        the lexical fast path have none and are rated by their lexical score.
+
         Args:
             retrieved_chunks: Retrieved document chunks
 
@@ -132,7 +634,9 @@ Please answer the question based on the above reference materials."""
         if not retrieved_chunks:
             return 0.0
 
-        scores = [chunk["score"] for chunk in retrieved_chunks]
+        scores = [chunk["score"] for chunk in retrieved_chunks if chunk.get("score") is not None]
+        if not scores:
+            scores = [chunk["lexical_score"] for chunk in retrieved_chunks]
         avg_score = sum(scores) / len(scores)
 
         num_relevant = len([s for s in scores if s > 0.7])
@@ -141,6 +645,549 @@ Please answer the question based on the above reference materials."""
         confidence = min(avg_score + relevance_boost, 1.0)
         return round(confidence, 2)
 
+    def serialize_chunks(self, retrieved_chunks: List[Dict]) -> List[Dict]:
+        """Convert raw search results into the API chunk representation.
+
+        Args:
+            retrieved_chunks: Retrieved document chunks
+
+        Returns:
+            List of chunk dictionaries with content, dense and lexical
+            scores and metadata
+        """
+        return [
+            {
+                "content": chunk["answer"],
+                "score": chunk.get("score"),
+                "lexical_score": chunk.get("lexical_score"),
+                "metadata": {
+                    "question": chunk.get("question", ""),
+                    "category": chunk.get("category", "")
+                }
+            }
+            for chunk in retrieved_chunks
+        ]
+
+    def build_result(
+        self,
+        answer: str,
+        retrieved_chunks: List[Dict],
+        processed_query: str,
+        retrieval_path: str = "rewrite",
+        served_by: str = "generation"
+    ) -> Dict:
+        """Assemble the chat result returned to the presentation layer.
+
+        Args:
+            answer: Generated answer
+            retrieved_chunks: Retrieved document chunks
+            processed_query: Query used for retrieval
+            retrieval_path: Whether retrieval used the raw or rewritten query
+            served_by: "generation", "extractive" or "extractive_fallback"
+
+        Returns:
+            Dictionary with answer, chunks, confidence, rewritten query and
+            the stages degraded so far in the request
+        """
+        return {
+            "answer": answer,
+            "retrieved_chunks": self.serialize_chunks(retrieved_chunks),
+            "confidence": self.calculate_confidence(retrieved_chunks),
+            "rewritten_query": processed_query,
+            "retrieval_path": retrieval_path,
+            "served_by": served_by,
+            "degraded": degraded_stages(),
+            "cached": False
+        }
+
+    def build_stream_metadata(self, retrieved_chunks: List[Dict], retrieval_path: str = "rewrite") -> Dict:
+        """Build the first streaming event sent before generation starts.
+
+        Args:
+            retrieved_chunks: Retrieved document chunks
+            retrieval_path: Whether retrieval used the raw or rewritten query
+
+        Returns:
+            Event dictionary carrying retrieval results and confidence
+        """
+        return {
+            "event": "metadata",
+            "data": {
+                "retrieved_chunks": self.serialize_chunks(retrieved_chunks),
+                "confidence": self.calculate_confidence(retrieved_chunks),
+                "retrieval_path": retrieval_path
+            }
+        }
+
+    def build_batch_error(self, error: Exception, processed_query: Optional[str] = None) -> Dict:
+        """Build the result of one failed batch item.
+
+        Args:
+            error: Exception raised while processing the item
+            processed_query: Rewritten query, if rewriting succeeded
+
+        Returns:
+            Result dictionary with an ``error`` message and no answer
+        """
+        return {
+            "answer": None,
+            "retrieved_chunks": [],
+            "confidence": 0.0,
+            "rewritten_query": processed_query,
+            "retrieval_path": None,
+            "served_by": None,
+            "cached": False,
+            "error": str(error)
+        }
+
+    def build_batch_item(
+        self,
+        answer: str,
+        retrieved_chunks: List[Dict],
+        processed_query: str,
+        retrieval_path: str = "rewrite",
+        served_by: str = "generation"
+    ) -> Dict:
+        """Build the result of one successful batch item.
+
+        Args:
+            answer: Generated answer
+            retrieved_chunks: Retrieved document chunks
+            processed_query: Rewritten query used for retrieval
+            retrieval_path: "rewrite", "raw" or "rewrite_fallback"
+            served_by: "generation", "extractive" or "extractive_fallback"
+
+        Returns:
+            Chat result with ``error`` set to None
+        """
+        return {
+            **self.build_result(answer, retrieved_chunks, processed_query, retrieval_path, served_by),
+            "error": None
+        }
+
+    def cache_namespace(self, top_k: int, score_threshold: float) -> Tuple[int, float]:
+        """Build the answer-cache partition key for retrieval settings.
+
+        Args:
+            top_k: Number of documents to retrieve
+            score_threshold: Minimum similarity threshold
+
+        Returns:
+            Hashable namespace so answers for different settings never mix
+        """
+        return (top_k, round(score_threshold, 4))
+
+    def single_flight_key(
+        self,
+        query: str,
+        conversation_history: Optional[List[Dict]],
+        top_k: int,
+        score_threshold: float
+    ) -> Hashable:
+        """Build the key under which identical in-flight chats are shared.
+
+        Args:
+            query: User query
+            conversation_history: Previous conversation
+            top_k: Number of documents to retrieve
+            score_threshold: Minimum similarity threshold
+
+        Returns:
+            Key of normalized query, retrieval settings and history digest
+        """
+        normalized = " ".join(query.split()).casefold()
+        history = json.dumps(conversation_history or [], ensure_ascii=False, sort_keys=True)
+        digest = hashlib.sha256(history.encode("utf-8")).hexdigest()
+        return (normalized, self.cache_namespace(top_k, score_threshold), digest)
+
+    def version_check_due(self) -> bool:
+        """Check whether the index version should be polled again.
+
+        Returns:
+            True at most once per ``cache_version_check_interval`` seconds
+        """
+        now = time.monotonic()
+        if now - self._last_version_check < self.cache_version_check_interval:
+            return False
+        self._last_version_check = now
+        return True
+
+    def apply_index_version(self, version: Optional[str]) -> bool:
+        """Record a freshly polled index version.
+
+        Answers cached under an older version are dropped.
+
+        Args:
+            version: Current vector index version, or None if unknown
+
+        Returns:
+            True if the version changed since the previous poll, in which
+            case the lexical index should be reloaded
+        """
+        previous, self._index_version = self._index_version, version
+        if self.answer_cache is not None:
+            self.answer_cache.sync_index_version(version)
+        return None not in (previous, version) and version != previous
+
+    def store_cached_answer(
+        self,
+        query_embedding: Optional[np.ndarray],
+        result: Dict,
+        top_k: int,
+        score_threshold: float,
+        index_version: Optional[str] = None
+    ) -> None:
+        """Store a generated answer in the semantic cache.
+
+        Answers generated without any retrieved context are not cached, since
+        an empty retrieval may come from a transient vector store error, and
+        neither are answers from a request with degraded stages.
+
+        Args:
+            query_embedding: Embedding of the original query
+            result: Chat result to cache
+            top_k: Number of documents retrieved
+            score_threshold: Minimum similarity threshold used
+            index_version: Index version observed when the request started,
+                so an answer computed across an index switch is not cached
+        """
+        if self.answer_cache is None or query_embedding is None:
+            return
+        if not result["retrieved_chunks"] or result.get("degraded"):
+            return
+        if result.get("served_by") == "extractive_fallback":
+            return
+        self.answer_cache.store(
+            query_embedding,
+            {**result, "cached": True},
+            namespace=self.cache_namespace(top_k, score_threshold),
+            index_version=index_version
+        )
+
+    def cached_stream_events(self, cached: Dict) -> List[Dict]:
+        """Replay a cached answer as streaming events.
+
+        Args:
+            cached: Cached chat result
+
+        Returns:
+            Metadata, single token and done events
+        """
+        return [
+            {
+                "event": "metadata",
+                "data": {
+                    "retrieved_chunks": cached["retrieved_chunks"],
+                    "confidence": cached["confidence"],
+                    "retrieval_path": cached.get("retrieval_path", "rewrite")
+                }
+            },
+            {"event": "token", "data": {"text": cached["answer"]}},
+            {
+                "event": "done",
+                "data": {
+                    "answer": cached["answer"],
+                    "served_by": cached.get("served_by", "generation"),
+                    "degraded": []
+                }
+            }
+        ]
+
+
+class RAGService(BaseRAGService):
+    """Service orchestrating the complete RAG pipeline."""
+
+    embedding_model: EmbeddingModelProtocol
+    vector_store: VectorStoreProtocol
+    query_processor: QueryProcessorProtocol
+    llm_client: LLMClientProtocol
+    single_flight: Optional[SingleFlightProtocol]
+
+    def refresh_index_version(self) -> None:
+        """Poll the index version and drop state built from an older index.
+
+        Runs at most once per ``cache_version_check_interval``. A new version
+        clears the answer cache and reloads the lexical index snapshot the
+        indexer wrote alongside it.
+        """
+        if self.answer_cache is None and self.lexical_index is None:
+            return
+        if not self.version_check_due():
+            return
+        changed = self.apply_index_version(self.vector_store.get_index_version())
+        if changed and self.lexical_index is not None:
+            self.lexical_index.reload()
+
+    def lookup_cached_answer(
+        self,
+        query: str,
+        top_k: int,
+        score_threshold: float
+    ) -> Tuple[Optional[Dict], Optional[np.ndarray]]:
+        """Look up a previously generated answer for a similar query.
+
+        Args:
+            query: User query
+            top_k: Number of documents to retrieve
+            score_threshold: Minimum similarity threshold
+
+        Returns:
+            Tuple of (cached result or None, original query embedding or None)
+        """
+        if self.answer_cache is None:
+            return None, None
+
+        with self.timed("embed", texts=1, chars=len(query.strip())):
+            query_embedding = self.embedding_model.encode([query.strip()])[0]
+        cached = self.answer_cache.lookup(
+            query_embedding,
+            namespace=self.cache_namespace(top_k, score_threshold)
+        )
+        self.record_cache(cached is not None)
+        return cached, query_embedding
+
+    def _search_text(
+        self,
+        text: str,
+        top_k: int,
+        score_threshold: float,
+        query_embedding: Optional[np.ndarray] = None
+    ) -> List[Dict]:
+        """Embed a text (unless already embedded) and search, fusing lexical hits.
+
+        Args:
+            text: Text to search for
+            top_k: Number of results to retrieve
+            score_threshold: Minimum similarity threshold
+            query_embedding: Precomputed embedding of ``text``
+
+        Returns:
+            Search results
+        """
+        if query_embedding is None:
+            with self.timed("embed", texts=1, chars=len(text)):
+                query_embedding = self.embedding_model.encode([text])[0]
+
+        limit = self.candidate_limit(top_k)
+        with self.timed("search", top_k=top_k, candidates=limit, score_threshold=score_threshold) as span:
+            results = self.vector_store.search(
+                query_embedding=query_embedding,
+                top_k=limit,
+                score_threshold=score_threshold
+            )
+            results = self.merge_lexical(text, results, top_k, score_threshold)
+            span.set(**self.result_attributes(results))
+            return results
+
+    def _call_within(self, timeout: Optional[float], fn: Callable, *args: Any) -> Any:
+        """Call a function, giving up after ``timeout`` seconds.
+
+        The request deadline seen by the call is narrowed to the same
+        timeout. A call that runs out of time keeps running on its worker
+        thread, since a blocking client call cannot be interrupted; its
+        result is discarded.
+
+        Args:
+            timeout: Seconds allowed, None to call inline without a limit
+            fn: Function to call
+            *args: Positional arguments for ``fn``
+
+        Returns:
+            Result of ``fn``
+
+        Raises:
+            TimeoutError: If the call did not finish in time
+        """
+        if timeout is None:
+            return fn(*args)
+        if timeout <= 0:
+            raise DeadlineExceededError("No time left in the request budget")
+
+        def bounded() -> Any:
+            with deadline(timeout):
+                return fn(*args)
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = submit_in_context(executor, bounded)
+        executor.shutdown(wait=False)
+        return future.result(timeout=timeout)
+
+    def _rewrite(self, query: str) -> str:
+        """Rewrite a query, timed as the "rewrite" stage.
+
+        Within a request deadline, a rewrite that outlives its slice of the
+        budget is abandoned and the raw query is used instead.
+
+        Args:
+            query: User query
+
+        Returns:
+            Rewritten query, or the stripped raw query if the rewrite was
+            abandoned
+        """
+        with self.timed("rewrite", query_chars=len(query)) as span:
+            timeout = self.rewrite_timeout()
+            try:
+                rewritten = self._call_within(timeout, self.query_processor.process_query, query)
+            except Exception as e:
+                if timeout is None or not timed_out(e):
+                    raise
+                logger.warning(f"Rewrite missed its {timeout:.2f}s budget, searching with the raw query")
+                self.degrade("rewrite")
+                span.set(degraded=True)
+                return query.strip()
+            span.set(rewritten_chars=len(rewritten))
+            return rewritten
+
+    def retrieve_context(
+        self,
+        query: str,
+        top_k: int = 3,
+        score_threshold: float = 0.5,
+        query_embedding: Optional[np.ndarray] = None
+    ) -> Tuple[List[Dict], str, str]:
+        """Retrieve relevant context for a query according to ``rewrite_mode``.
+
+        Args:
+            query: User query
+            top_k: Number of results to retrieve
+            score_threshold: Minimum similarity threshold
+            query_embedding: Precomputed embedding of the raw query, reused
+                whenever the raw query is searched
+
+        Returns:
+            Tuple of (retrieved chunks, query used for retrieval, retrieval
+            path: "rewrite", "raw" or "rewrite_fallback")
+        """
+        start = time.perf_counter()
+        raw_query = query.strip()
+
+        if self.rewrite_mode == "always":
+            processed_query = self._rewrite(query)
+            if processed_query != raw_query:
+                results = self._search_text(processed_query, top_k, score_threshold)
+                path = "rewrite"
+            else:
+                results = self._search_text(raw_query, top_k, score_threshold, query_embedding)
+                path = "raw"
+        elif self.rewrite_mode == "never":
+            processed_query = raw_query
+            results = self._search_text(raw_query, top_k, score_threshold, query_embedding)
+            path = "raw"
+        else:
+            speculative = None
+            if self.rewrite_mode == "speculative":
+                executor = ThreadPoolExecutor(max_workers=1)
+                speculative = submit_in_context(executor, self._rewrite, query)
+                executor.shutdown(wait=False)
+
+            results = self._search_text(raw_query, top_k, score_threshold, query_embedding)
+            processed_query, path = raw_query, "raw"
+            if self.needs_rewrite(results):
+                processed_query = speculative.result() if speculative else self._rewrite(query)
+                if processed_query != raw_query:
+                    rewritten = self._search_text(processed_query, top_k, score_threshold)
+                    results, path = self.pick_results(results, rewritten), "rewrite_fallback"
+            elif speculative is not None:
+                # Only a rewrite that has not started yet is dropped; a running
+                # one cannot be interrupted and finishes on its own worker
+                # thread with its result discarded.
+                speculative.cancel()
+
+        self.record_retrieval(path, time.perf_counter() - start)
+        return results, processed_query, path
+
+    def generate_response(
+        self,
+        query: str,
+        context: str,
+        conversation_history: List[Dict] = None
+    ) -> str:
+        """Generate response using LLM with retrieved context.
+
+        Args:
+            query: User query
+            context: Formatted context from retrieval
+            conversation_history: Previous conversation (unused in current version)
+
+        Returns:
+            Generated answer
+        """
+        full_prompt = self.build_prompt(query, context)
+        self.record_text("prompt", full_prompt)
+        self.annotate(prompt_chars=len(full_prompt))
+
+        response = self.llm_client.generate(full_prompt)
+        self.record_text("completion", response)
+        self.annotate(completion_chars=len(response))
+        return response
+
+    def answer_query(
+        self,
+        query: str,
+        retrieved_chunks: List[Dict],
+        conversation_history: List[Dict] = None
+    ) -> Tuple[str, str]:
+        """Produce the answer extractively or by generation, degrading on failure.
+
+        Generation is bounded by ``generation_timeout`` and by what is left
+        of the request budget.
+
+        Args:
+            query: User query
+            retrieved_chunks: Retrieved document chunks
+            conversation_history: Previous conversation
+
+        Returns:
+            Tuple of (answer, served_by: "generation", "extractive" or
+            "extractive_fallback")
+        """
+        if self.should_extract(retrieved_chunks):
+            return self.extractive_answer(retrieved_chunks), "extractive"
+
+        with self.timed("format", chunks=len(retrieved_chunks)) as span:
+            context = self.format_context(retrieved_chunks)
+            span.set(context_chars=len(context))
+        try:
+            with self.timed("generate"):
+                answer = self._call_within(
+                    bounded_timeout(self.generation_timeout),
+                    self.generate_response, query, context, conversation_history
+                )
+            return answer, "generation"
+        except Exception as e:
+            fallback = self.fallback_answer(retrieved_chunks, e)
+            if fallback is None:
+                raise
+            return fallback, "extractive_fallback"
+
+    def _stream_tokens(self, prompt: str) -> Iterator[str]:
+        """Stream generated tokens, bounding the wait for the first one.
+
+        Mirrors ``AsyncRAGService._stream_tokens``: the first token must
+        arrive within ``generation_timeout`` and what is left of the request
+        budget; once tokens flow they are not cut off. A first token that
+        misses the deadline leaves the blocking read running on its worker
+        thread, so the stream is only closed after a read has returned.
+
+        Args:
+            prompt: Full prompt
+
+        Yields:
+            Generated tokens
+        """
+        stream = iter(self.llm_client.generate_stream(prompt))
+        first = self._call_within(bounded_timeout(self.generation_timeout), next, stream, None)
+        try:
+            if first is None:
+                return
+            yield first
+            yield from stream
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+
     def chat(
         self,
         query: str,
@@ -150,6 +1197,36 @@ Please answer the question based on the above reference materials."""
     ) -> Dict:
         """Main chat function combining retrieval and generation.
 
+        Args:
+            query: User query
+            conversation_history: Previous conversation
+            top_k: Number of documents to retrieve
+            score_threshold: Minimum similarity threshold
+
+        Returns:
+            Dictionary with answer, chunks, confidence, rewritten query and
+            degraded stages
+        """
+        with request_budget(self.request_timeout):
+            if self.single_flight is None:
+                return self._run_chat(query, conversation_history, top_k, score_threshold)
+
+            key = self.single_flight_key(query, conversation_history, top_k, score_threshold)
+            result = self.single_flight.do(
+                key,
+                lambda: self._run_chat(query, conversation_history, top_k, score_threshold)
+            )
+            return dict(result)
+
+    def _run_chat(
+        self,
+        query: str,
+        conversation_history: Optional[List[Dict]],
+        top_k: int,
+        score_threshold: float
+    ) -> Dict:
+        """Run the full pipeline for one chat request.
+
         Args:
             query: User query
             conversation_history: Previous conversation
@@ -159,35 +1236,289 @@ Please answer the question based on the above reference materials."""
         Returns:
             Dictionary with answer, chunks, confidence, and rewritten query
         """
-        retrieved_chunks, processed_query = self.retrieve_context(
-            query=query,
-            top_k=top_k,
-            score_threshold=score_threshold
-        )
+        self.refresh_index_version()
+        index_version = self._index_version
+        query_embedding = None
+        retrieved_chunks = self.lexical_retrieval(query, top_k)
+        if retrieved_chunks is not None:
+            processed_query, retrieval_path = query.strip(), "lexical"
+        else:
+            cached, query_embedding = self.lookup_cached_answer(query, top_k, score_threshold)
+            if cached is not None:
+                return cached
 
-        context = self.format_context(retrieved_chunks)
+            retrieved_chunks, processed_query, retrieval_path = self.retrieve_context(
+                query=query,
+                top_k=top_k,
+                score_threshold=score_threshold,
+                query_embedding=query_embedding
+            )
 
-        answer = self.generate_response(
-            query=query,
-            context=context,
-            conversation_history=conversation_history
-        )
+        answer, served_by = self.answer_query(query, retrieved_chunks, conversation_history)
 
-        confidence = self.calculate_confidence(retrieved_chunks)
+        result = self.build_result(answer, retrieved_chunks, processed_query, retrieval_path, served_by)
+        self.store_cached_answer(query_embedding, result, top_k, score_threshold, index_version)
+        return result
 
-        return {
-            "answer": answer,
-            "retrieved_chunks": [
-                {
-                    "content": chunk["answer"],
-                    "score": chunk["score"],
-                    "metadata": {
-                        "question": chunk.get("question", ""),
-                        "category": chunk.get("category", "")
-                    }
+    def chat_batch(
+        self,
+        queries: List[str],
+        top_k: int = 3,
+        score_threshold: float = 0.5,
+        rewrite_concurrency: int = 8,
+        generation_concurrency: int = 8,
+        embed_batch_size: int = 100
+    ) -> List[Dict]:
+        """Answer many independent questions with batched retrieval.
+
+        Queries are rewritten according to ``rewrite_mode`` and answered on
+        bounded thread pools, embedded in chunks of ``embed_batch_size`` and
+        searched with batched vector store calls: one for the first pass and,
+        in "adaptive" and "speculative" mode, one more for the items whose
+        raw results were too weak. The answer cache is bypassed so batch runs
+        always exercise the full pipeline. A failure only affects its own item.
+
+        Args:
+            queries: User queries
+            top_k: Number of documents to retrieve per query
+            score_threshold: Minimum similarity threshold
+            rewrite_concurrency: Maximum concurrent query rewrites
+            generation_concurrency: Maximum concurrent LLM generations
+            embed_batch_size: Maximum texts per embedding request
+
+        Returns:
+            One result per query, in input order, each with an ``error`` field
+        """
+        results: List[Optional[Dict]] = [None] * len(queries)
+        raw = {i: query.strip() for i, query in enumerate(queries)}
+
+        rewrite_pool = ThreadPoolExecutor(max_workers=max(1, rewrite_concurrency))
+        try:
+            rewrites: Dict[int, Future] = {}
+            if self.rewrite_mode in ("always", "speculative"):
+                rewrites = {i: submit_in_context(rewrite_pool, self._rewrite, queries[i]) for i in raw}
+
+            processed = dict(raw)
+            if self.rewrite_mode == "always":
+                processed = self._collect_rewrites(rewrites, results)
+            retrieved = self._retrieve_batch(processed, top_k, score_threshold, embed_batch_size, results)
+            paths = {
+                i: "rewrite" if self.rewrite_mode == "always" and processed[i] != raw[i] else "raw"
+                for i in retrieved
+            }
+
+            if self.rewrite_mode in ("adaptive", "speculative"):
+                weak = [i for i, chunks in retrieved.items() if self.needs_rewrite(chunks)]
+                if self.rewrite_mode == "adaptive":
+                    rewrites = {i: submit_in_context(rewrite_pool, self._rewrite, queries[i]) for i in weak}
+                rewritten = {
+                    i: text
+                    for i, text in self._collect_rewrites({i: rewrites[i] for i in weak}, results).items()
+                    if text != raw[i]
                 }
-                for chunk in retrieved_chunks
-            ],
-            "confidence": confidence,
-            "rewritten_query": processed_query
-        }
+                for i in weak:
+                    if results[i] is not None:
+                        del retrieved[i]
+                second = self._retrieve_batch(rewritten, top_k, score_threshold, embed_batch_size, results)
+                for i in rewritten:
+                    if i in second:
+                        retrieved[i] = self.pick_results(retrieved[i], second[i])
+                        processed[i], paths[i] = rewritten[i], "rewrite_fallback"
+                    else:
+                        del retrieved[i]
+        finally:
+            # Unneeded speculative rewrites that have not started are dropped;
+            # running ones finish on their worker threads and are discarded.
+            rewrite_pool.shutdown(wait=False, cancel_futures=True)
+
+        with ThreadPoolExecutor(max_workers=max(1, generation_concurrency)) as pool:
+            futures = {
+                i: submit_in_context(pool, self.answer_query, queries[i], chunks)
+                for i, chunks in retrieved.items()
+            }
+            for i, future in futures.items():
+                try:
+                    answer, served_by = future.result()
+                    results[i] = self.build_batch_item(answer, retrieved[i], processed[i], paths[i], served_by)
+                except Exception as e:
+                    results[i] = self.build_batch_error(e, processed[i])
+
+        return results
+
+    def _collect_rewrites(self, rewrites: Dict[int, Future], results: List[Optional[Dict]]) -> Dict[int, str]:
+        """Wait for batch rewrites, recording failed items in ``results``.
+
+        Args:
+            rewrites: Pending rewrite per item index
+            results: Batch results, updated in place for failed items
+
+        Returns:
+            Rewritten query per item that succeeded
+        """
+        processed: Dict[int, str] = {}
+        for i, future in rewrites.items():
+            try:
+                processed[i] = future.result()
+            except Exception as e:
+                results[i] = self.build_batch_error(e)
+        return processed
+
+    def _retrieve_batch(
+        self,
+        texts: Dict[int, str],
+        top_k: int,
+        score_threshold: float,
+        embed_batch_size: int,
+        results: List[Optional[Dict]]
+    ) -> Dict[int, List[Dict]]:
+        """Embed and search many texts, recording failed items in ``results``.
+
+        Args:
+            texts: Text to search per item index
+            top_k: Number of documents to retrieve per text
+            score_threshold: Minimum similarity threshold
+            embed_batch_size: Maximum texts per embedding request
+            results: Batch results, updated in place for failed items
+
+        Returns:
+            Retrieved chunks per item that succeeded
+        """
+        embeddings: Dict[int, np.ndarray] = {}
+        pending = list(texts)
+        for start in range(0, len(pending), embed_batch_size):
+            batch = pending[start:start + embed_batch_size]
+            try:
+                batch_texts = [texts[i] for i in batch]
+                with self.timed("embed", texts=len(batch_texts), chars=sum(map(len, batch_texts))):
+                    vectors = self.embedding_model.encode(batch_texts)
+                embeddings.update(zip(batch, vectors))
+            except Exception as e:
+                for i in batch:
+                    results[i] = self.build_batch_error(e, texts[i])
+
+        retrieved: Dict[int, List[Dict]] = {}
+        if embeddings:
+            searched = list(embeddings)
+            try:
+                limit = self.candidate_limit(top_k)
+                with self.timed(
+                    "search", queries=len(searched), top_k=top_k, candidates=limit, score_threshold=score_threshold
+                ):
+                    hits = self.vector_store.search_batch(
+                        np.stack([embeddings[i] for i in searched]),
+                        top_k=limit,
+                        score_threshold=score_threshold
+                    )
+                    retrieved = {
+                        i: self.merge_lexical(texts[i], dense, top_k, score_threshold)
+                        for i, dense in zip(searched, hits)
+                    }
+            except Exception as e:
+                for i in searched:
+                    results[i] = self.build_batch_error(e, texts[i])
+        return retrieved
+
+    def chat_stream(
+        self,
+        query: str,
+        conversation_history: List[Dict] = None,
+        top_k: int = 3,
+        score_threshold: float = 0.5
+    ) -> Iterator[Dict]:
+        """Chat function yielding retrieval metadata first, then answer tokens.
+
+        The stream runs in a private context holding the request budget, so
+        it can be resumed or closed from any thread.
+
+        Args:
+            query: User query
+            conversation_history: Previous conversation
+            top_k: Number of documents to retrieve
+            score_threshold: Minimum similarity threshold
+
+        Returns:
+            Iterator of event dictionaries: one "metadata", then "token"
+            events, then "done" with the full answer, ``served_by`` and
+            ``degraded``
+        """
+        return iterate_in_context(
+            self._run_chat_stream(query, conversation_history, top_k, score_threshold),
+            partial(open_budget, self.request_timeout)
+        )
+
+    def _run_chat_stream(
+        self,
+        query: str,
+        conversation_history: Optional[List[Dict]],
+        top_k: int,
+        score_threshold: float
+    ) -> Iterator[Dict]:
+        """Run the streaming pipeline for one chat request.
+
+        Args:
+            query: User query
+            conversation_history: Previous conversation
+            top_k: Number of documents to retrieve
+            score_threshold: Minimum similarity threshold
+
+        Yields:
+            Streaming events, see ``chat_stream``
+        """
+        self.refresh_index_version()
+        index_version = self._index_version
+        query_embedding = None
+        retrieved_chunks = self.lexical_retrieval(query, top_k)
+        if retrieved_chunks is not None:
+            processed_query, retrieval_path = query.strip(), "lexical"
+        else:
+            cached, query_embedding = self.lookup_cached_answer(query, top_k, score_threshold)
+            if cached is not None:
+                yield from self.cached_stream_events(cached)
+                return
+
+            retrieved_chunks, processed_query, retrieval_path = self.retrieve_context(
+                query=query,
+                top_k=top_k,
+                score_threshold=score_threshold,
+                query_embedding=query_embedding
+            )
+
+        yield self.build_stream_metadata(retrieved_chunks, retrieval_path)
+
+        if self.should_extract(retrieved_chunks):
+            parts, served_by = [self.extractive_answer(retrieved_chunks)], "extractive"
+            yield {"event": "token", "data": {"text": parts[0]}}
+        else:
+            with self.timed("format", chunks=len(retrieved_chunks)) as span:
+                context = self.format_context(retrieved_chunks)
+                full_prompt = self.build_prompt(query, context)
+                span.set(context_chars=len(context))
+            self.record_text("prompt", full_prompt)
+
+            parts, served_by = [], "generation"
+            try:
+                with self.timed("generate", prompt_chars=len(full_prompt)) as span:
+                    for token in self._stream_tokens(full_prompt):
+                        parts.append(token)
+                        yield {"event": "token", "data": {"text": token}}
+                    completion = "".join(parts)
+                    span.set(tokens=len(parts), completion_chars=len(completion))
+                self.record_text("completion", completion)
+            except Exception as e:
+                # Tokens already sent cannot be taken back, so only a stream
+                # that failed before its first token degrades.
+                fallback = None if parts else self.fallback_answer(retrieved_chunks, e)
+                if fallback is None:
+                    raise
+                parts, served_by = [fallback], "extractive_fallback"
+                yield {"event": "token", "data": {"text": fallback}}
+
+        answer = "".join(parts).strip()
+        self.store_cached_answer(
+            query_embedding,
+            self.build_result(answer, retrieved_chunks, processed_query, retrieval_path, served_by),
+            top_k,
+            score_threshold,
+            index_version
+        )
+        yield {"event": "done", "data": {"answer": answer, "served_by": served_by, "degraded": degraded_stages()}}
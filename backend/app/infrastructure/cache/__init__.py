@@ -0,0 +1,8 @@
+"""Cache infrastructure module."""
+
+from .semantic import SemanticCache
+from .rewrite import RewriteCache
+from .embedding import EmbeddingCache
+from .single_flight import SingleFlight, AsyncSingleFlight
+
+__all__ = ["SemanticCache", "RewriteCache", "EmbeddingCache", "SingleFlight", "AsyncSingleFlight"]
@@ -0,0 +1,267 @@
+"""Content-addressed embedding cache backed by memory-mapped files."""
+
+from typing import Optional, List, Dict, Any
+import hashlib
+import json
+import logging
+import os
+import threading
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, the directory is not guarded
+    fcntl = None
+
+from ...core.interfaces import EmbeddingCacheProtocol
+
+logger = logging.getLogger(__name__)
+
+KEY_BYTES = 16
+
+
+class EmbeddingCache(EmbeddingCacheProtocol):
+    """Fixed-capacity ring of embeddings addressed by content hash.
+
+    Vectors are stored as float16 or float32 rows of a preallocated matrix
+    and keys as 16-byte digests in a parallel array. With ``cache_dir`` both
+    arrays are ``np.memmap`` files, so untouched rows cost no RSS and the
+    cache survives restarts; without it they live in anonymous memory.
+
+    Every read re-checks the digest stored next to the row, so a row that was
+    overwritten by ring wrap-around is reported as a miss instead of
+    returning a wrong vector.
+
+    Writes land in the page cache; rows, keys and the ring cursor are synced
+    to disk every ``flush_every`` new rows and on ``flush``, so a crash loses
+    at most that many entries. A cache directory belongs to one process at a
+    time: it is guarded by an exclusive lock, and a second process opening
+    it falls back to an in-memory cache.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        max_entries: int = 100000,
+        dtype: str = "float16",
+        cache_dir: Optional[str] = None,
+        flush_every: int = 1000
+    ):
+        """Initialize embedding cache.
+
+        Args:
+            dimension: Embedding dimension
+            max_entries: Number of rows before the oldest entries are overwritten
+            dtype: Storage precision, "float16" or "float32"
+            cache_dir: Optional directory for persistent memory-mapped storage
+            flush_every: Sync to disk after this many new rows
+        """
+        self.dimension = dimension
+        self.max_entries = max_entries
+        self.dtype = np.dtype(dtype)
+        self.cache_dir = cache_dir
+        self.flush_every = flush_every
+
+        self._lock = threading.Lock()
+        self._rows: Dict[bytes, int] = {}
+        self._count = 0
+        self._cursor = 0
+        self._dirty = 0
+        self._lock_file = None
+
+        self.hits = 0
+        self.misses = 0
+
+        if cache_dir and not self._acquire_directory():
+            logger.warning(f"Embedding cache {cache_dir} is in use by another process, caching in memory only")
+            self.cache_dir = None
+
+        if self.cache_dir:
+            self._open_files()
+        else:
+            self._vectors = np.zeros((max_entries, dimension), dtype=self.dtype)
+            self._keys = np.zeros((max_entries, KEY_BYTES), dtype=np.uint8)
+
+    @staticmethod
+    def make_key(model_name: str, dimension: int, task_type: str, text: str) -> bytes:
+        """Build the content address of one embedding.
+
+        Args:
+            model_name: Embedding model name
+            dimension: Output dimensionality
+            task_type: Embedding task type
+            text: Embedded text
+
+        Returns:
+            16-byte digest
+        """
+        raw = json.dumps([model_name, dimension, task_type, text], ensure_ascii=False)
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=KEY_BYTES).digest()
+
+    @property
+    def _meta_path(self) -> str:
+        return os.path.join(self.cache_dir, "meta.json")
+
+    def _acquire_directory(self) -> bool:
+        """Take the exclusive lock on ``cache_dir``.
+
+        Returns:
+            True if this process now owns the directory
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        if fcntl is None:
+            return True
+        lock_file = open(os.path.join(self.cache_dir, "lock"), "w")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        # Held open for the lifetime of the cache; closing it releases the lock.
+        self._lock_file = lock_file
+        return True
+
+    def _open_files(self) -> None:
+        """Open (or create) the memory-mapped vector and key files."""
+        vectors_path = os.path.join(self.cache_dir, "vectors.bin")
+        keys_path = os.path.join(self.cache_dir, "keys.bin")
+
+        meta = self._read_meta()
+        expected = {
+            "dimension": self.dimension,
+            "dtype": self.dtype.name,
+            "capacity": self.max_entries
+        }
+        compatible = meta is not None and all(meta.get(k) == v for k, v in expected.items())
+        if not compatible:
+            if meta is not None:
+                logger.warning(f"Embedding cache layout changed, resetting {self.cache_dir}")
+            for path in (vectors_path, keys_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+        mode = "r+" if compatible and os.path.exists(vectors_path) and os.path.exists(keys_path) else "w+"
+        self._vectors = np.memmap(vectors_path, dtype=self.dtype, mode=mode, shape=(self.max_entries, self.dimension))
+        self._keys = np.memmap(keys_path, dtype=np.uint8, mode=mode, shape=(self.max_entries, KEY_BYTES))
+
+        if mode == "r+":
+            self._count = int(meta.get("count", 0))
+            self._cursor = int(meta.get("cursor", 0))
+            for row in range(self._count):
+                self._rows[self._keys[row].tobytes()] = row
+            logger.info(f"Loaded {len(self._rows)} cached embeddings from {self.cache_dir}")
+
+        self._write_meta()
+
+    def _read_meta(self) -> Optional[Dict[str, Any]]:
+        """Read the cache layout metadata, if present."""
+        if not os.path.exists(self._meta_path):
+            return None
+        try:
+            with open(self._meta_path, encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Error reading embedding cache metadata: {e}")
+            return None
+
+    def _write_meta(self) -> None:
+        """Persist layout, row count and ring cursor."""
+        meta = {
+            "dimension": self.dimension,
+            "dtype": self.dtype.name,
+            "capacity": self.max_entries,
+            "count": self._count,
+            "cursor": self._cursor
+        }
+        tmp_path = f"{self._meta_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self._meta_path)
+
+    def get_many(self, keys: List[bytes]) -> List[Optional[np.ndarray]]:
+        """Look up embeddings by key.
+
+        Args:
+            keys: Content addresses built with ``make_key``
+
+        Returns:
+            float32 vector per key, or None for misses
+        """
+        results: List[Optional[np.ndarray]] = []
+        with self._lock:
+            for key in keys:
+                row = self._rows.get(key)
+                if row is not None and self._keys[row].tobytes() == key:
+                    results.append(np.asarray(self._vectors[row], dtype=np.float32))
+                    self.hits += 1
+                else:
+                    if row is not None:
+                        del self._rows[key]
+                    results.append(None)
+                    self.misses += 1
+        return results
+
+    def put_many(self, keys: List[bytes], vectors: np.ndarray) -> None:
+        """Store embeddings, overwriting the oldest rows when full.
+
+        Args:
+            keys: Content addresses built with ``make_key``
+            vectors: Embeddings aligned with ``keys``
+        """
+        vectors = np.asarray(vectors)
+        written = 0
+        with self._lock:
+            for key, vector in zip(keys, vectors):
+                if vector.shape[0] != self.dimension:
+                    continue
+                row = self._rows.get(key)
+                if row is None:
+                    row = self._cursor
+                    old_key = self._keys[row].tobytes()
+                    if self._rows.get(old_key) == row:
+                        del self._rows[old_key]
+                    self._cursor = (self._cursor + 1) % self.max_entries
+                    self._count = min(self._count + 1, self.max_entries)
+                self._vectors[row] = vector
+                self._keys[row] = np.frombuffer(key, dtype=np.uint8)
+                self._rows[key] = row
+                written += 1
+
+            self._dirty += written
+            should_flush = self.cache_dir and self._dirty >= self.flush_every
+
+        if should_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """Sync written rows, keys and the ring cursor to disk."""
+        if not self.cache_dir:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                return
+            self._vectors.flush()
+            self._keys.flush()
+            self._write_meta()
+            self._dirty = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters.
+
+        Returns:
+            Dictionary of hit/miss counters, size and storage footprint
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._rows),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "dtype": self.dtype.name,
+                "bytes_per_vector": self.dimension * self.dtype.itemsize,
+                "persistent": bool(self.cache_dir)
+            }
@@ -0,0 +1,164 @@
+"""LRU + TTL cache for query rewrites with optional on-disk persistence."""
+
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from ...core.interfaces import RewriteCacheProtocol
+
+logger = logging.getLogger(__name__)
+
+
+class RewriteCache(RewriteCacheProtocol):
+    """Bounded, thread-safe string cache with LRU eviction and TTL expiry.
+
+    No method awaits while holding the lock, so the cache is equally safe to
+    use from threads and from coroutines on the event loop. Expiry uses wall
+    clock time so entries persisted to disk keep their deadline across
+    restarts.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        ttl_seconds: float = 86400.0,
+        persist_path: Optional[str] = None,
+        persist_every: int = 50
+    ):
+        """Initialize rewrite cache.
+
+        Args:
+            max_entries: Maximum number of cached rewrites
+            ttl_seconds: Entry lifetime in seconds
+            persist_path: Optional JSON file to load from and save to
+            persist_every: Save to disk after this many new entries
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.persist_path = persist_path
+        self.persist_every = persist_every
+
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        if persist_path:
+            self._load()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached rewrite.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached rewrite, or None on a miss or expired entry
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        """Store a rewrite, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Rewritten query
+        """
+        with self._lock:
+            self._entries[key] = (value, time.time() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            self._dirty += 1
+            should_persist = self.persist_path and self._dirty >= self.persist_every
+
+        if should_persist:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write unexpired entries to ``persist_path`` atomically."""
+        if not self.persist_path:
+            return
+
+        now = time.time()
+        with self._lock:
+            snapshot = [
+                [key, value, expires_at]
+                for key, (value, expires_at) in self._entries.items()
+                if expires_at > now
+            ]
+            self._dirty = 0
+
+        directory = os.path.dirname(os.path.abspath(self.persist_path))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, self.persist_path)
+        except Exception as e:
+            logger.error(f"Error persisting rewrite cache: {e}")
+
+    def _load(self) -> None:
+        """Load unexpired entries from ``persist_path`` if it exists."""
+        if not os.path.exists(self.persist_path):
+            return
+
+        try:
+            with open(self.persist_path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading rewrite cache: {e}")
+            return
+
+        now = time.time()
+        for key, value, expires_at in snapshot[-self.max_entries:]:
+            if expires_at > now:
+                self._entries[key] = (value, expires_at)
+        logger.info(f"Loaded {len(self._entries)} cached rewrites from {self.persist_path}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters.
+
+        Returns:
+            Dictionary of hit/miss/eviction counters and size
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "ttl_seconds": self.ttl_seconds,
+                "persistent": bool(self.persist_path)
+            }
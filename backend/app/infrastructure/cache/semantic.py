@@ -0,0 +1,209 @@
+"""Semantic answer cache keyed on query-embedding similarity."""
+
+from typing import Optional, Dict, Any, Hashable, List
+import copy
+import logging
+import threading
+import time
+
+import numpy as np
+
+from ...core.interfaces import SemanticCacheProtocol
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache(SemanticCacheProtocol):
+    """Bounded LRU/TTL cache matched by cosine distance over a NumPy matrix.
+
+    Entries live in fixed slots of a preallocated float32 matrix of
+    normalized embeddings, so a lookup is a single matrix-vector product
+    over the occupied slots.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        max_distance: float = 0.05
+    ):
+        """Initialize semantic cache.
+
+        Args:
+            dimension: Embedding dimension
+            max_entries: Maximum number of cached entries
+            ttl_seconds: Entry lifetime in seconds
+            max_distance: Maximum cosine distance (1 - similarity) for a hit
+        """
+        self.dimension = dimension
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_distance = max_distance
+
+        self._vectors = np.zeros((max_entries, dimension), dtype=np.float32)
+        self._namespaces = np.zeros(max_entries, dtype=np.int64)
+        self._expires_at = np.full(max_entries, -np.inf)
+        self._last_used = np.zeros(max_entries)
+        self._values: List[Optional[Dict[str, Any]]] = [None] * max_entries
+        self._high_water = 0
+        self._index_version: Optional[str] = None
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> np.ndarray:
+        """L2-normalize an embedding as float32."""
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    @staticmethod
+    def _namespace_key(namespace: Hashable) -> int:
+        """Map a namespace to the int64 stored alongside each slot."""
+        return hash(namespace) & 0x7FFFFFFFFFFFFFFF
+
+    def lookup(
+        self,
+        query_embedding: np.ndarray,
+        namespace: Hashable = ""
+    ) -> Optional[Dict[str, Any]]:
+        """Find a cached value whose query embedding is close enough.
+
+        Args:
+            query_embedding: Embedding of the incoming query
+            namespace: Partition key, e.g. retrieval settings
+
+        Returns:
+            Deep copy of the cached value, or None on a miss
+        """
+        query = self._normalize(query_embedding)
+        ns = self._namespace_key(namespace)
+        now = time.monotonic()
+
+        with self._lock:
+            n = self._high_water
+            if n:
+                candidates = (self._expires_at[:n] > now) & (self._namespaces[:n] == ns)
+                if candidates.any():
+                    similarities = self._vectors[:n] @ query
+                    similarities[~candidates] = -np.inf
+                    best = int(np.argmax(similarities))
+                    if 1.0 - similarities[best] <= self.max_distance:
+                        self._last_used[best] = now
+                        self.hits += 1
+                        return copy.deepcopy(self._values[best])
+
+            self.misses += 1
+            return None
+
+    def store(
+        self,
+        query_embedding: np.ndarray,
+        value: Dict[str, Any],
+        namespace: Hashable = "",
+        index_version: Optional[str] = None
+    ) -> None:
+        """Store a value keyed on a query embedding.
+
+        Args:
+            query_embedding: Embedding of the query
+            value: Value to cache
+            namespace: Partition key, e.g. retrieval settings
+            index_version: Index version the value was computed against; the
+                value is dropped if the cache has moved to another version
+        """
+        vector = self._normalize(query_embedding)
+        if vector.shape[0] != self.dimension:
+            logger.warning(f"Skipping cache store: dimension {vector.shape[0]} != {self.dimension}")
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            if index_version is not None and index_version != self._index_version:
+                return
+            slot = self._free_slot(now)
+            self._vectors[slot] = vector
+            self._namespaces[slot] = self._namespace_key(namespace)
+            self._expires_at[slot] = now + self.ttl_seconds
+            self._last_used[slot] = now
+            self._values[slot] = copy.deepcopy(value)
+
+    def _free_slot(self, now: float) -> int:
+        """Pick a slot to write, evicting the least recently used entry if full.
+
+        Args:
+            now: Current monotonic time
+
+        Returns:
+            Slot index
+        """
+        if self._high_water < self.max_entries:
+            self._high_water += 1
+            return self._high_water - 1
+
+        expired = np.flatnonzero(self._expires_at <= now)
+        if expired.size:
+            return int(expired[0])
+
+        self.evictions += 1
+        return int(np.argmin(self._last_used))
+
+    def sync_index_version(self, version: Optional[str]) -> bool:
+        """Invalidate every entry if the index version changed.
+
+        Args:
+            version: Current index version, None if unknown
+
+        Returns:
+            True if the cache was invalidated
+        """
+        if version is None:
+            return False
+
+        with self._lock:
+            if self._index_version == version:
+                return False
+            previous = self._index_version
+            self._index_version = version
+
+        if previous is None:
+            return False
+
+        logger.info(f"Index version changed ({previous} -> {version}), invalidating answer cache")
+        self.invalidate()
+        return True
+
+    def invalidate(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._expires_at[:] = -np.inf
+            self._values = [None] * self.max_entries
+            self._high_water = 0
+            self.invalidations += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters.
+
+        Returns:
+            Dictionary of hit/miss/eviction counters and size
+        """
+        now = time.monotonic()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": int((self._expires_at[:self._high_water] > now).sum()),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "max_distance": self.max_distance,
+                "ttl_seconds": self.ttl_seconds,
+                "index_version": self._index_version
+            }
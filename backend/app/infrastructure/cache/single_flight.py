@@ -0,0 +1,164 @@
+"""Single-flight deduplication of identical concurrent computations."""
+
+from typing import Dict, Any, Hashable, Callable, Awaitable, Optional, TypeVar
+import asyncio
+import threading
+
+from ...core.deadline import bounded_timeout
+from ...core.exceptions import DeadlineExceededError
+from ...core.interfaces import SingleFlightProtocol, AsyncSingleFlightProtocol
+
+T = TypeVar("T")
+
+
+class _FlightStats:
+    """Counters and running calls shared by the synchronous and asynchronous variants."""
+
+    def __init__(self):
+        self._stats_lock = threading.Lock()
+        self._calls: Dict[Hashable, Any] = {}
+        self.executed = 0
+        self.shared = 0
+        self.errors = 0
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get deduplication counters.
+
+        Returns:
+            Dictionary with executed calls, calls saved by sharing, errors and
+            the number of computations currently running
+        """
+        with self._stats_lock:
+            total = self.executed + self.shared
+            return {
+                "executed": self.executed,
+                "shared": self.shared,
+                "saved_ratio": round(self.shared / total, 4) if total else 0.0,
+                "errors": self.errors,
+                "in_flight": len(self._calls)
+            }
+
+
+class _Call:
+    """One running computation and its outcome."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(_FlightStats, SingleFlightProtocol):
+    """Let concurrent threads with the same key share one computation.
+
+    The first caller runs ``fn``; callers arriving while it runs block until
+    it finishes and receive the same result or exception. The key is
+    released as soon as the call completes, so nothing is cached beyond the
+    lifetime of the computation. A waiting caller gives up when its own
+    request budget runs out, leaving the computation to the others.
+    """
+
+    def __init__(self):
+        """Initialize single-flight group."""
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless a call with the same key is already running.
+
+        Args:
+            key: Identity of the computation
+            fn: Computation to run
+
+        Returns:
+            Result of ``fn``, possibly computed for a concurrent caller
+
+        Raises:
+            DeadlineExceededError: If the request budget ran out while waiting
+                for a concurrent caller's computation
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            self._count("shared")
+            if not call.done.wait(bounded_timeout()):
+                raise DeadlineExceededError("Shared computation did not finish within the request budget")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        self._count("executed")
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            self._count("errors")
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight(_FlightStats, AsyncSingleFlightProtocol):
+    """Let concurrent coroutines with the same key share one computation.
+
+    The computation runs as its own task and every caller awaits it through
+    ``asyncio.shield``: cancelling one caller (for example a client that
+    disconnected) neither cancels the work nor the other callers waiting on
+    it. A caller also stops waiting when its own request budget runs out.
+    Exceptions propagate to every caller.
+    """
+
+    def __init__(self):
+        """Initialize async single-flight group."""
+        super().__init__()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn`` unless a call with the same key is already running.
+
+        Args:
+            key: Identity of the computation
+            fn: Coroutine function to run
+
+        Returns:
+            Result of ``fn``, possibly computed for a concurrent caller
+
+        Raises:
+            DeadlineExceededError: If the request budget ran out while waiting
+                for a concurrent caller's computation
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            self._count("shared")
+        else:
+            self._count("executed")
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), bounded_timeout())
+        except asyncio.TimeoutError:
+            if not task.done():
+                raise DeadlineExceededError("Shared computation did not finish within the request budget") from None
+            raise
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        """Release the key and mark the outcome as observed."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Retrieve the exception so a task whose callers all went away does
+        # not log "exception was never retrieved".
+        if not task.cancelled() and task.exception() is not None:
+            self._count("errors")
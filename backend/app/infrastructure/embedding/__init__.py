@@ -1,6 +1,17 @@
 """Embedding infrastructure module."""
 
-from .gemini import GeminiEmbedding
-from .factory import create_embedding_model
+from .gemini import GeminiEmbedding, AsyncGeminiEmbedding
+from .hashing import HashingEmbedding, AsyncHashingEmbedding
+from .coalescer import EmbeddingCoalescer, AsyncEmbeddingCoalescer
+from .factory import create_embedding_model, create_async_embedding_model
 
-__all__ = ["GeminiEmbedding", "create_embedding_model"]
+__all__ = [
+    "GeminiEmbedding",
+    "AsyncGeminiEmbedding",
+    "HashingEmbedding",
+    "AsyncHashingEmbedding",
+    "EmbeddingCoalescer",
+    "AsyncEmbeddingCoalescer",
+    "create_embedding_model",
+    "create_async_embedding_model",
+]
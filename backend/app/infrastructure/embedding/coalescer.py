@@ -0,0 +1,266 @@
+"""Micro-batching wrappers that merge concurrent single-text encode calls."""
+
+from typing import List, Dict, Any, Optional, Set, Tuple
+import asyncio
+import logging
+import threading
+import time
+
+import numpy as np
+
+from ...core.interfaces import EmbeddingModelProtocol, AsyncEmbeddingModelProtocol
+
+logger = logging.getLogger(__name__)
+
+
+class _CoalescerStats:
+    """Counters shared by the synchronous and asynchronous coalescers."""
+
+    def __init__(self, max_wait_ms: float, max_batch_size: int):
+        """Initialize coalescer settings and counters.
+
+        Args:
+            max_wait_ms: Longest time the first queued text waits for company
+            max_batch_size: Texts that trigger an immediate flush
+        """
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.passthrough_requests = 0
+        self.batches = 0
+        self.texts_sent = 0
+        self.size_flushes = 0
+        self.timer_flushes = 0
+        self.errors = 0
+
+    def _record_batch(self, requests: int, unique_texts: int, full: bool) -> None:
+        """Record one flushed batch."""
+        with self._stats_lock:
+            self.batches += 1
+            self.requests += requests
+            self.texts_sent += unique_texts
+            if full:
+                self.size_flushes += 1
+            else:
+                self.timer_flushes += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching counters.
+
+        Returns:
+            Dictionary with request/batch counts and the mean batch fill ratio
+        """
+        with self._stats_lock:
+            mean_batch = self.requests / self.batches if self.batches else 0.0
+            return {
+                "max_wait_ms": self.max_wait * 1000.0,
+                "max_batch_size": self.max_batch_size,
+                "requests": self.requests,
+                "passthrough_requests": self.passthrough_requests,
+                "batches": self.batches,
+                "texts_sent": self.texts_sent,
+                "mean_batch_size": round(mean_batch, 2),
+                "fill_ratio": round(mean_batch / self.max_batch_size, 4),
+                "size_flushes": self.size_flushes,
+                "timer_flushes": self.timer_flushes,
+                "errors": self.errors
+            }
+
+
+def _unique(texts: List[str]) -> Tuple[List[str], List[int]]:
+    """Deduplicate texts, returning unique texts and each input's position."""
+    positions: Dict[str, int] = {}
+    for text in texts:
+        positions.setdefault(text, len(positions))
+    return list(positions), [positions[text] for text in texts]
+
+
+class _Slot:
+    """One queued single-text call awaiting its batch."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.vector: Optional[np.ndarray] = None
+        self.error: Optional[Exception] = None
+        self.done = threading.Event()
+
+
+class EmbeddingCoalescer(_CoalescerStats):
+    """Merge concurrent single-text ``encode`` calls from worker threads.
+
+    The first caller to find the queue empty becomes the batch leader: it
+    waits up to ``max_wait_ms`` (or until ``max_batch_size`` texts queued),
+    sends every queued text in one ``encode`` call and hands each caller its
+    own row. Calls with several texts are already batched and pass through.
+    """
+
+    def __init__(
+        self,
+        model: EmbeddingModelProtocol,
+        max_wait_ms: float = 5.0,
+        max_batch_size: int = 64
+    ):
+        """Initialize coalescer.
+
+        Args:
+            model: Embedding model to wrap
+            max_wait_ms: Longest time the first queued text waits for company
+            max_batch_size: Texts that trigger an immediate flush
+        """
+        super().__init__(max_wait_ms, max_batch_size)
+        self.model = model
+        self._cond = threading.Condition()
+        self._pending: List[_Slot] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.model, name)
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """Encode texts, batching single-text calls with concurrent ones.
+
+        Args:
+            texts: List of texts to encode
+
+        Returns:
+            Array of embeddings
+        """
+        if len(texts) != 1:
+            with self._stats_lock:
+                self.passthrough_requests += 1
+            return self.model.encode(texts)
+
+        slot = _Slot(texts[0])
+        with self._cond:
+            self._pending.append(slot)
+            leader = len(self._pending) == 1
+            if len(self._pending) >= self.max_batch_size:
+                self._cond.notify_all()
+
+        if leader:
+            self._lead()
+
+        slot.done.wait()
+        if slot.error is not None:
+            raise slot.error
+        return slot.vector[np.newaxis, :]
+
+    def _lead(self) -> None:
+        """Wait for the batch to fill or time out, then flush it."""
+        deadline = time.monotonic() + self.max_wait
+        with self._cond:
+            while len(self._pending) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            batch, self._pending = self._pending, []
+
+        unique, positions = _unique([slot.text for slot in batch])
+        self._record_batch(len(batch), len(unique), len(batch) >= self.max_batch_size)
+        try:
+            vectors = np.concatenate([
+                self.model.encode(unique[start:start + self.max_batch_size])
+                for start in range(0, len(unique), self.max_batch_size)
+            ])
+            for slot, position in zip(batch, positions):
+                slot.vector = vectors[position]
+        except Exception as e:
+            with self._stats_lock:
+                self.errors += 1
+            for slot in batch:
+                slot.error = e
+        finally:
+            for slot in batch:
+                slot.done.set()
+
+
+class AsyncEmbeddingCoalescer(_CoalescerStats):
+    """Merge concurrent single-text ``encode`` calls on the event loop.
+
+    Each queued call gets a future; the queue is flushed as one ``encode``
+    call when ``max_batch_size`` texts are waiting or ``max_wait_ms`` after
+    the first one arrived. A caller cancelled while waiting simply drops its
+    future, and a failed batch raises its error in every waiting caller.
+    Calls with several texts are already batched and pass through.
+    """
+
+    def __init__(
+        self,
+        model: AsyncEmbeddingModelProtocol,
+        max_wait_ms: float = 5.0,
+        max_batch_size: int = 64
+    ):
+        """Initialize async coalescer.
+
+        Args:
+            model: Async embedding model to wrap
+            max_wait_ms: Longest time the first queued text waits for company
+            max_batch_size: Texts that trigger an immediate flush
+        """
+        super().__init__(max_wait_ms, max_batch_size)
+        self.model = model
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.model, name)
+
+    async def encode(self, texts: List[str]) -> np.ndarray:
+        """Encode texts, batching single-text calls with concurrent ones.
+
+        Args:
+            texts: List of texts to encode
+
+        Returns:
+            Array of embeddings
+        """
+        if len(texts) != 1:
+            with self._stats_lock:
+                self.passthrough_requests += 1
+            return await self.model.encode(texts)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((texts[0], future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush(full=True)
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        vector = await future
+        return vector[np.newaxis, :]
+
+    def _flush(self, full: bool = False) -> None:
+        """Hand the queued texts to a background encode task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._encode_batch(batch, full))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _encode_batch(self, batch: List[Tuple[str, asyncio.Future]], full: bool) -> None:
+        """Encode one batch and resolve every waiting caller."""
+        unique, positions = _unique([text for text, _ in batch])
+        self._record_batch(len(batch), len(unique), full)
+        try:
+            vectors = await self.model.encode(unique)
+        except Exception as e:
+            with self._stats_lock:
+                self.errors += 1
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), position in zip(batch, positions):
+            if not future.done():
+                future.set_result(vectors[position])
@@ -1,13 +1,31 @@
 """Factory for creating embedding models."""
 
-from ...core.interfaces import EmbeddingModelProtocol
-from .gemini import GeminiEmbedding
+from typing import Optional
+
+from ...core.interfaces import (
+    EmbeddingModelProtocol,
+    AsyncEmbeddingModelProtocol,
+    EmbeddingCacheProtocol,
+    PipelineMetricsProtocol
+)
+from ..resilience import ResiliencePolicy, ResilientEmbedding, AsyncResilientEmbedding
+from .gemini import GeminiEmbedding, AsyncGeminiEmbedding
+from .hashing import HashingEmbedding, AsyncHashingEmbedding
+from .coalescer import EmbeddingCoalescer, AsyncEmbeddingCoalescer
 
 
 def create_embedding_model(
     api_key: str,
     model_name: str = "gemini-embedding-001",
-    dimension: int = 768
+    dimension: int = 768,
+    cache: Optional[EmbeddingCacheProtocol] = None,
+    coalesce: bool = False,
+    coalesce_max_wait_ms: float = 5.0,
+    coalesce_max_batch_size: int = 64,
+    provider: str = "gemini",
+    fake_latency_ms: float = 0.0,
+    resilience: Optional[ResiliencePolicy] = None,
+    metrics: Optional[PipelineMetricsProtocol] = None
 ) -> EmbeddingModelProtocol:
     """Create an embedding model instance.
 
@@ -15,12 +33,80 @@ def create_embedding_model(
         api_key: API key for the embedding service
         model_name: Model name
         dimension: Embedding dimension
+        cache: Optional content-addressed embedding cache
+        coalesce: Merge concurrent single-text calls into batched requests
+        coalesce_max_wait_ms: Longest time a queued text waits for a batch
+        coalesce_max_batch_size: Queued texts that trigger an immediate flush
+        provider: Embedding provider, "gemini" or "hashing" (deterministic,
+            offline; ``model_name`` and ``cache`` are ignored)
+        fake_latency_ms: Simulated delay per call for the hashing provider
+        resilience: Optional timeout, retry, hedging and breaker policy for
+            calls that reach the provider
+        metrics: Optional recorder of resilience events
 
     Returns:
         Embedding model instance
     """
-    return GeminiEmbedding(
-        api_key=api_key,
-        model_name=model_name,
-        dimension=dimension
-    )
+    if provider == "hashing":
+        model = HashingEmbedding(dimension=dimension, latency_ms=fake_latency_ms)
+    else:
+        model = GeminiEmbedding(
+            api_key=api_key,
+            model_name=model_name,
+            dimension=dimension,
+            cache=cache
+        )
+    if resilience is not None:
+        model = ResilientEmbedding(model, resilience, metrics)
+    if coalesce:
+        return EmbeddingCoalescer(model, coalesce_max_wait_ms, coalesce_max_batch_size)
+    return model
+
+
+def create_async_embedding_model(
+    api_key: str,
+    model_name: str = "gemini-embedding-001",
+    dimension: int = 768,
+    cache: Optional[EmbeddingCacheProtocol] = None,
+    coalesce: bool = False,
+    coalesce_max_wait_ms: float = 5.0,
+    coalesce_max_batch_size: int = 64,
+    provider: str = "gemini",
+    fake_latency_ms: float = 0.0,
+    resilience: Optional[ResiliencePolicy] = None,
+    metrics: Optional[PipelineMetricsProtocol] = None
+) -> AsyncEmbeddingModelProtocol:
+    """Create an asynchronous embedding model instance.
+
+    Args:
+        api_key: API key for the embedding service
+        model_name: Model name
+        dimension: Embedding dimension
+        cache: Optional content-addressed embedding cache
+        coalesce: Merge concurrent single-text calls into batched requests
+        coalesce_max_wait_ms: Longest time a queued text waits for a batch
+        coalesce_max_batch_size: Queued texts that trigger an immediate flush
+        provider: Embedding provider, "gemini" or "hashing" (deterministic,
+            offline; ``model_name`` and ``cache`` are ignored)
+        fake_latency_ms: Simulated delay per call for the hashing provider
+        resilience: Optional timeout, retry, hedging and breaker policy for
+            calls that reach the provider
+        metrics: Optional recorder of resilience events
+
+    Returns:
+        Async embedding model instance
+    """
+    if provider == "hashing":
+        model = AsyncHashingEmbedding(dimension=dimension, latency_ms=fake_latency_ms)
+    else:
+        model = AsyncGeminiEmbedding(
+            api_key=api_key,
+            model_name=model_name,
+            dimension=dimension,
+            cache=cache
+        )
+    if resilience is not None:
+        model = AsyncResilientEmbedding(model, resilience, metrics)
+    if coalesce:
+        return AsyncEmbeddingCoalescer(model, coalesce_max_wait_ms, coalesce_max_batch_size)
+    return model
@@ -1,21 +1,25 @@
 """Gemini-based embedding model implementation."""
 
-from typing import List
+from typing import List, Optional, Tuple
 import numpy as np
 from google import genai
 from google.genai import types
 
+from ...core.interfaces import EmbeddingCacheProtocol
 from ...core.exceptions import EmbeddingError
+from ..cache import EmbeddingCache
 
 
-class GeminiEmbedding:
-    """Gemini API-based embedding model."""
+class _GeminiEmbeddingBase:
+    """Shared configuration for synchronous and asynchronous Gemini embeddings."""
 
     def __init__(
         self,
         api_key: str,
         model_name: str = "gemini-embedding-001",
-        dimension: int = 768
+        dimension: int = 768,
+        task_type: str = "RETRIEVAL_DOCUMENT",
+        cache: Optional[EmbeddingCacheProtocol] = None
     ):
         """Initialize Gemini embedding model.
 
@@ -23,17 +27,115 @@ class GeminiEmbedding:
             api_key: Google API key
             model_name: Gemini model name
             dimension: Embedding dimension
+            task_type: Gemini embedding task type
+            cache: Optional content-addressed embedding cache
         """
         try:
             self.client = genai.Client(api_key=api_key)
             self.model_name = model_name
             self._dimension = dimension
+            self.task_type = task_type
+            self.cache = cache
         except Exception as e:
             raise EmbeddingError(f"Failed to initialize Gemini client: {e}")
 
+    def _build_config(self) -> types.EmbedContentConfig:
+        """Build the embedding request config.
+
+        Returns:
+            Embedding config
+        """
+        return types.EmbedContentConfig(
+            task_type=self.task_type,
+            output_dimensionality=self._dimension
+        )
+
+    def _cache_keys(self, texts: List[str]) -> List[bytes]:
+        """Build cache keys for texts under the current model settings."""
+        return [
+            EmbeddingCache.make_key(self.model_name, self._dimension, self.task_type, text)
+            for text in texts
+        ]
+
+    def _plan_cached(
+        self,
+        texts: List[str]
+    ) -> Tuple[List[Optional[np.ndarray]], List[str]]:
+        """Split texts into cache hits and the unique texts still to embed.
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            Tuple of (cached vector or None per text, unique missing texts)
+        """
+        cached = self.cache.get_many(self._cache_keys(texts))
+        missing = list(dict.fromkeys(
+            text for text, vector in zip(texts, cached) if vector is None
+        ))
+        return cached, missing
+
+    def _stitch(
+        self,
+        texts: List[str],
+        cached: List[Optional[np.ndarray]],
+        missing: List[str],
+        fresh: np.ndarray
+    ) -> np.ndarray:
+        """Store freshly embedded texts and merge them with cache hits in order.
+
+        Args:
+            texts: Texts to encode, in request order
+            cached: Cached vector or None per text
+            missing: Unique texts that were sent to the API
+            fresh: Embeddings for ``missing``
+
+        Returns:
+            Array of embeddings aligned with ``texts``
+        """
+        if missing:
+            self.cache.put_many(self._cache_keys(missing), fresh)
+        fresh_by_text = dict(zip(missing, fresh))
+
+        embeddings = np.empty((len(texts), self._dimension), dtype=np.float32)
+        for i, (text, vector) in enumerate(zip(texts, cached)):
+            embeddings[i] = vector if vector is not None else fresh_by_text[text]
+        return embeddings
+
+    def get_dimension(self) -> int:
+        """Get embedding dimension.
+
+        Returns:
+            Embedding dimension
+        """
+        return self._dimension
+
+
+class GeminiEmbedding(_GeminiEmbeddingBase):
+    """Gemini API-based embedding model."""
+
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        """Call the Gemini API for texts.
+
+        Args:
+            texts: List of texts to encode
+
+        Returns:
+            Array of embeddings
+        """
+        result = self.client.models.embed_content(
+            model=self.model_name,
+            contents=texts,
+            config=self._build_config()
+        )
+        return np.array([np.array(e.values) for e in result.embeddings])
+
     def encode(self, texts: List[str]) -> np.ndarray:
         """Encode texts using Gemini API.
 
+        With a cache configured only texts without a cached vector are sent
+        to the API, and results are stitched back in request order.
+
         Args:
             texts: List of texts to encode
 
@@ -44,23 +146,56 @@ class GeminiEmbedding:
             EmbeddingError: If encoding fails
         """
         try:
-            result = self.client.models.embed_content(
-                model=self.model_name,
-                contents=texts,
-                config=types.EmbedContentConfig(
-                    task_type="RETRIEVAL_DOCUMENT",
-                    output_dimensionality=self._dimension
-                )
-            )
-            embeddings = np.array([np.array(e.values) for e in result.embeddings])
-            return embeddings
+            if self.cache is None:
+                return self._embed(texts)
+
+            cached, missing = self._plan_cached(texts)
+            fresh = self._embed(missing) if missing else np.empty((0, self._dimension))
+            return self._stitch(texts, cached, missing, fresh)
         except Exception as e:
             raise EmbeddingError(f"Failed to encode texts: {e}")
 
-    def get_dimension(self) -> int:
-        """Get embedding dimension.
+
+class AsyncGeminiEmbedding(_GeminiEmbeddingBase):
+    """Gemini API-based embedding model using the non-blocking genai client."""
+
+    async def _embed(self, texts: List[str]) -> np.ndarray:
+        """Call the Gemini API for texts.
+
+        Args:
+            texts: List of texts to encode
 
         Returns:
-            Embedding dimension
+            Array of embeddings
         """
-        return self._dimension
+        result = await self.client.aio.models.embed_content(
+            model=self.model_name,
+            contents=texts,
+            config=self._build_config()
+        )
+        return np.array([np.array(e.values) for e in result.embeddings])
+
+    async def encode(self, texts: List[str]) -> np.ndarray:
+        """Encode texts using Gemini API.
+
+        With a cache configured only texts without a cached vector are sent
+        to the API, and results are stitched back in request order.
+
+        Args:
+            texts: List of texts to encode
+
+        Returns:
+            Array of embeddings
+
+        Raises:
+            EmbeddingError: If encoding fails
+        """
+        try:
+            if self.cache is None:
+                return await self._embed(texts)
+
+            cached, missing = self._plan_cached(texts)
+            fresh = await self._embed(missing) if missing else np.empty((0, self._dimension))
+            return self._stitch(texts, cached, missing, fresh)
+        except Exception as e:
+            raise EmbeddingError(f"Failed to encode texts: {e}")
@@ -0,0 +1,112 @@
+"""Deterministic feature-hashing embeddings for offline testing and benchmarking."""
+
+from typing import List
+import asyncio
+import hashlib
+import re
+import time
+import numpy as np
+
+_WORD = re.compile(r"\w+")
+
+
+class _HashingEmbeddingBase:
+    """Bag of hashed words and character trigrams, shared by both clients.
+
+    Texts with overlapping words or syllables get similar vectors, so
+    retrieval over a real dataset behaves plausibly, and the same text always
+    maps to the same vector without any model or network call.
+    """
+
+    def __init__(self, dimension: int = 768, latency_ms: float = 0.0, ngram: int = 3):
+        """Initialize hashing embedding model.
+
+        Args:
+            dimension: Embedding dimension
+            latency_ms: Simulated delay per ``encode`` call
+            ngram: Character n-gram length hashed besides whole words
+        """
+        self._dimension = dimension
+        self.latency = latency_ms / 1000.0
+        self.ngram = ngram
+
+    def _features(self, text: str) -> List[str]:
+        """Split a text into hashed features.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Words and the character n-grams of each word
+        """
+        features = []
+        for word in _WORD.findall(text.lower()):
+            features.append(word)
+            padded = f"<{word}>"
+            features.extend(
+                padded[i:i + self.ngram]
+                for i in range(max(1, len(padded) - self.ngram + 1))
+            )
+        return features
+
+    def _vectorize(self, texts: List[str]) -> np.ndarray:
+        """Hash texts into L2-normalized vectors.
+
+        Args:
+            texts: List of texts to encode
+
+        Returns:
+            Array of shape (len(texts), dimension)
+        """
+        embeddings = np.zeros((len(texts), self._dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+                sign = 1.0 if digest & 1 else -1.0
+                embeddings[row, (digest >> 1) % self._dimension] += sign
+            norm = np.linalg.norm(embeddings[row])
+            if norm > 0:
+                embeddings[row] /= norm
+        return embeddings
+
+    def get_dimension(self) -> int:
+        """Get embedding dimension.
+
+        Returns:
+            Embedding dimension
+        """
+        return self._dimension
+
+
+class HashingEmbedding(_HashingEmbeddingBase):
+    """Blocking hashing embedding model with simulated latency."""
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """Encode texts by feature hashing.
+
+        Args:
+            texts: List of texts to encode
+
+        Returns:
+            Array of embeddings
+        """
+        if self.latency > 0:
+            time.sleep(self.latency)
+        return self._vectorize(texts)
+
+
+class AsyncHashingEmbedding(_HashingEmbeddingBase):
+    """Non-blocking hashing embedding model with simulated latency."""
+
+    async def encode(self, texts: List[str]) -> np.ndarray:
+        """Encode texts by feature hashing.
+
+        Args:
+            texts: List of texts to encode
+
+        Returns:
+            Array of embeddings
+        """
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        return self._vectorize(texts)
@@ -0,0 +1,5 @@
+"""Lexical index infrastructure module."""
+
+from .bm25 import BM25Index, tokenize
+
+__all__ = ["BM25Index", "tokenize"]
@@ -0,0 +1,311 @@
+"""In-process BM25 index over character n-grams."""
+
+from collections import Counter
+from typing import List, Dict, Any, Iterable, Optional, Tuple, NamedTuple
+import json
+import logging
+import math
+import os
+import re
+import tempfile
+import threading
+import unicodedata
+
+import numpy as np
+
+from ...core.interfaces import LexicalIndexProtocol
+
+logger = logging.getLogger(__name__)
+
+DOCUMENT_FIELDS = ("question", "answer", "category", "content")
+
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text: str, ngram_range: Tuple[int, int] = (2, 3)) -> List[str]:
+    """Split text into character n-grams of each word.
+
+    Korean attaches particles and endings to words ("요금제는", "요금제를"),
+    so whole-word matching misses most hits; overlapping character n-grams
+    match the shared stem instead. Words shorter than the smallest n are
+    kept whole so short names and numbers still match.
+
+    Args:
+        text: Text to tokenize
+        ngram_range: Smallest and largest n-gram length
+
+    Returns:
+        List of n-grams, with repeats
+    """
+    low, high = ngram_range
+    grams = []
+    for word in _WORD.findall(unicodedata.normalize("NFKC", text).casefold()):
+        if len(word) < low:
+            grams.append(word)
+            continue
+        for n in range(low, min(high, len(word)) + 1):
+            grams.extend(word[i:i + n] for i in range(len(word) - n + 1))
+    return grams
+
+
+class _IndexState(NamedTuple):
+    """One immutable generation of the index, swapped in atomically."""
+    documents: List[Dict[str, str]]
+    vocabulary: Dict[str, int]
+    idf: np.ndarray
+    offsets: np.ndarray
+    postings: np.ndarray
+    frequencies: np.ndarray
+    length_norms: np.ndarray
+
+
+def _empty_state() -> _IndexState:
+    return _IndexState(
+        documents=[],
+        vocabulary={},
+        idf=np.zeros(0, dtype=np.float32),
+        offsets=np.zeros(1, dtype=np.int64),
+        postings=np.zeros(0, dtype=np.int32),
+        frequencies=np.zeros(0, dtype=np.float32),
+        length_norms=np.zeros(0, dtype=np.float32)
+    )
+
+
+class BM25Index(LexicalIndexProtocol):
+    """Okapi BM25 over character n-grams of question and answer text.
+
+    Postings are stored as flat CSR arrays (one slice of document ids and
+    term frequencies per n-gram), so a query costs one vectorized update per
+    distinct query n-gram. Rebuilding publishes a new generation atomically;
+    searches never take a lock.
+
+    BM25 scores are unbounded, so each hit also carries a ``lexical_score``
+    in [0, 1]: the IDF-weighted Dice overlap between the query's n-grams and
+    the document question's n-grams. It is 1.0 when the query is the stored
+    question (up to spacing, case and punctuation) and is what callers
+    compare against lexical thresholds. It is not a cosine similarity and is
+    kept apart from the dense ``score`` of vector store results.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Optional[str] = None,
+        ngram_range: Tuple[int, int] = (2, 3),
+        k1: float = 1.2,
+        b: float = 0.75
+    ):
+        """Initialize BM25 index.
+
+        Args:
+            snapshot_path: Optional JSON file of indexed documents, loaded if
+                present and rewritten after every indexing call
+            ngram_range: Smallest and largest character n-gram length
+            k1: Term frequency saturation
+            b: Document length normalization strength
+        """
+        self.snapshot_path = snapshot_path
+        self.ngram_range = ngram_range
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+        self._state = _empty_state()
+
+        if snapshot_path and os.path.exists(snapshot_path):
+            self.load_snapshot(snapshot_path)
+
+    def _build(self, documents: List[Dict[str, str]]) -> _IndexState:
+        """Build postings for a list of documents.
+
+        Args:
+            documents: Documents with question and answer fields
+
+        Returns:
+            New index generation
+        """
+        if not documents:
+            return _empty_state()
+
+        vocabulary: Dict[str, int] = {}
+        term_ids, doc_ids, counts = [], [], []
+        lengths = np.zeros(len(documents), dtype=np.float32)
+        for doc_id, document in enumerate(documents):
+            grams = Counter(tokenize(f"{document['question']}\n{document['answer']}", self.ngram_range))
+            lengths[doc_id] = sum(grams.values())
+            for gram, count in grams.items():
+                term_ids.append(vocabulary.setdefault(gram, len(vocabulary)))
+                doc_ids.append(doc_id)
+                counts.append(count)
+
+        term_ids = np.asarray(term_ids, dtype=np.int64)
+        order = np.argsort(term_ids, kind="stable")
+        document_frequency = np.bincount(term_ids, minlength=len(vocabulary))
+
+        n = len(documents)
+        idf = np.log1p((n - document_frequency + 0.5) / (document_frequency + 0.5)).astype(np.float32)
+        average_length = max(float(lengths.mean()), 1.0)
+
+        return _IndexState(
+            documents=documents,
+            vocabulary=vocabulary,
+            idf=idf,
+            offsets=np.concatenate([[0], np.cumsum(document_frequency)]).astype(np.int64),
+            postings=np.asarray(doc_ids, dtype=np.int32)[order],
+            frequencies=np.asarray(counts, dtype=np.float32)[order],
+            length_norms=self.k1 * (1.0 - self.b + self.b * lengths / average_length)
+        )
+
+    def index_documents(self, chunks: Iterable[Dict[str, Any]]) -> bool:
+        """Replace the indexed documents and persist them.
+
+        Args:
+            chunks: Document chunks with question, answer and content,
+                consumed once
+
+        Returns:
+            True if successful
+        """
+        try:
+            documents = [
+                {field: str(chunk.get(field, "") or "") for field in DOCUMENT_FIELDS}
+                for chunk in chunks
+            ]
+            state = self._build(documents)
+            with self._lock:
+                self._state = state
+            logger.info(f"Indexed {len(documents)} documents with {len(state.vocabulary)} n-grams")
+
+            if self.snapshot_path:
+                self.save_snapshot(self.snapshot_path)
+            return True
+        except Exception as e:
+            logger.error(f"Error building lexical index: {e}")
+            return False
+
+    def _weight(self, state: _IndexState, gram: str) -> float:
+        """IDF of an n-gram, treating unseen n-grams as the rarest."""
+        term = state.vocabulary.get(gram)
+        if term is None:
+            return math.log1p((len(state.documents) + 0.5) / 0.5)
+        return float(state.idf[term])
+
+    def _question_overlap(self, state: _IndexState, query_grams: set, question: str) -> float:
+        """IDF-weighted Dice overlap between query and question n-grams."""
+        question_grams = set(tokenize(question, self.ngram_range))
+        total = sum(self._weight(state, g) for g in query_grams) + sum(
+            self._weight(state, g) for g in question_grams
+        )
+        if total == 0:
+            return 0.0
+        shared = sum(self._weight(state, g) for g in query_grams & question_grams)
+        return 2.0 * shared / total
+
+    def search(self, query: str, top_k: int = 10) -> List[Dict[str, Any]]:
+        """Rank documents by BM25 over the query's n-grams.
+
+        Args:
+            query: Query text
+            top_k: Number of results to return
+
+        Returns:
+            Results ordered by BM25, each with ``bm25`` and a normalized
+            ``lexical_score`` (question overlap in [0, 1])
+        """
+        state = self._state
+        n = len(state.documents)
+        query_grams = set(tokenize(query, self.ngram_range))
+        if n == 0 or not query_grams or top_k <= 0:
+            return []
+
+        scores = np.zeros(n, dtype=np.float32)
+        for gram in query_grams:
+            term = state.vocabulary.get(gram)
+            if term is None:
+                continue
+            start, end = state.offsets[term], state.offsets[term + 1]
+            docs = state.postings[start:end]
+            tf = state.frequencies[start:end]
+            scores[docs] += state.idf[term] * tf * (self.k1 + 1.0) / (tf + state.length_norms[docs])
+
+        matched = np.flatnonzero(scores > 0)
+        if len(matched) > top_k:
+            matched = matched[np.argpartition(-scores[matched], top_k - 1)[:top_k]]
+        order = matched[np.argsort(-scores[matched], kind="stable")]
+
+        results = []
+        for doc_id in order:
+            document = state.documents[doc_id]
+            results.append({
+                "id": str(doc_id),
+                "lexical_score": round(self._question_overlap(state, query_grams, document["question"]), 4),
+                "bm25": float(scores[doc_id]),
+                **document
+            })
+        return results
+
+    def reload(self) -> bool:
+        """Reload the documents from ``snapshot_path``.
+
+        Returns:
+            True if a snapshot was loaded
+        """
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return False
+        return self.load_snapshot(self.snapshot_path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index size information.
+
+        Returns:
+            Dictionary with document, vocabulary and posting counts
+        """
+        state = self._state
+        return {
+            "documents": len(state.documents),
+            "vocabulary": len(state.vocabulary),
+            "postings": len(state.postings),
+            "ngram_range": list(self.ngram_range),
+            "snapshot_path": self.snapshot_path
+        }
+
+    def save_snapshot(self, path: str) -> None:
+        """Write the indexed documents to a JSON file atomically.
+
+        Postings are rebuilt on load, which is fast next to parsing the
+        source spreadsheet and keeps the file independent of tokenizer
+        settings.
+
+        Args:
+            path: Destination file
+        """
+        documents = self._state.documents
+        directory = os.path.dirname(os.path.abspath(path))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(documents, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.error(f"Error saving lexical index: {e}")
+
+    def load_snapshot(self, path: str) -> bool:
+        """Load documents from a JSON file and rebuild the postings.
+
+        Args:
+            path: Snapshot file written by ``save_snapshot``
+
+        Returns:
+            True if successful
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                documents = json.load(f)
+            state = self._build(documents)
+        except Exception as e:
+            logger.error(f"Error loading lexical index: {e}")
+            return False
+
+        with self._lock:
+            self._state = state
+        logger.info(f"Loaded lexical index with {len(documents)} documents from {path}")
+        return True
@@ -1,6 +1,14 @@
 """LLM infrastructure module."""
 
-from .gemini import GeminiLLMClient
-from .factory import create_llm_client
+from .gemini import GeminiLLMClient, AsyncGeminiLLMClient
+from .fake import FakeLLMClient, AsyncFakeLLMClient
+from .factory import create_llm_client, create_async_llm_client
 
-__all__ = ["GeminiLLMClient", "create_llm_client"]
+__all__ = [
+    "GeminiLLMClient",
+    "AsyncGeminiLLMClient",
+    "FakeLLMClient",
+    "AsyncFakeLLMClient",
+    "create_llm_client",
+    "create_async_llm_client",
+]
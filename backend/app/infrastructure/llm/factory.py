@@ -1,14 +1,24 @@
 """Factory for creating LLM clients."""
 
-from ...core.interfaces import LLMClientProtocol
-from .gemini import GeminiLLMClient
+from typing import Optional
+
+from ...core.interfaces import LLMClientProtocol, AsyncLLMClientProtocol, PipelineMetricsProtocol
+from ..resilience import ResiliencePolicy, ResilientLLMClient, AsyncResilientLLMClient
+from .gemini import GeminiLLMClient, AsyncGeminiLLMClient
+from .fake import FakeLLMClient, AsyncFakeLLMClient
 
 
 def create_llm_client(
     api_key: str,
     model_name: str = "gemini-2.0-flash",
     temperature: float = 0.1,
-    max_tokens: int = 512
+    max_tokens: int = 512,
+    provider: str = "gemini",
+    fake_first_token_ms: float = 200.0,
+    fake_token_ms: float = 20.0,
+    fake_jitter: float = 0.0,
+    resilience: Optional[ResiliencePolicy] = None,
+    metrics: Optional[PipelineMetricsProtocol] = None
 ) -> LLMClientProtocol:
     """Create an LLM client instance.
 
@@ -17,13 +27,82 @@ def create_llm_client(
         model_name: Model name
         temperature: Sampling temperature
         max_tokens: Maximum tokens to generate
+        provider: LLM provider, "gemini" or "fake"
+        fake_first_token_ms: Simulated time to first token for the fake provider
+        fake_token_ms: Simulated inter-token latency for the fake provider
+        fake_jitter: Relative spread of the fake provider's delays
+        resilience: Optional timeout, retry, hedging and breaker policy
+        metrics: Optional recorder of resilience events
 
     Returns:
         LLM client instance
     """
-    return GeminiLLMClient(
-        api_key=api_key,
-        model_name=model_name,
-        default_temperature=temperature,
-        default_max_tokens=max_tokens
-    )
+    if provider == "fake":
+        client = FakeLLMClient(
+            model_name=model_name,
+            default_temperature=temperature,
+            default_max_tokens=max_tokens,
+            first_token_latency_ms=fake_first_token_ms,
+            token_latency_ms=fake_token_ms,
+            latency_jitter=fake_jitter
+        )
+    else:
+        client = GeminiLLMClient(
+            api_key=api_key,
+            model_name=model_name,
+            default_temperature=temperature,
+            default_max_tokens=max_tokens
+        )
+    if resilience is not None:
+        return ResilientLLMClient(client, resilience, metrics)
+    return client
+
+
+def create_async_llm_client(
+    api_key: str,
+    model_name: str = "gemini-2.0-flash",
+    temperature: float = 0.1,
+    max_tokens: int = 512,
+    provider: str = "gemini",
+    fake_first_token_ms: float = 200.0,
+    fake_token_ms: float = 20.0,
+    fake_jitter: float = 0.0,
+    resilience: Optional[ResiliencePolicy] = None,
+    metrics: Optional[PipelineMetricsProtocol] = None
+) -> AsyncLLMClientProtocol:
+    """Create an asynchronous LLM client instance.
+
+    Args:
+        api_key: API key for the LLM service
+        model_name: Model name
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate
+        provider: LLM provider, "gemini" or "fake"
+        fake_first_token_ms: Simulated time to first token for the fake provider
+        fake_token_ms: Simulated inter-token latency for the fake provider
+        fake_jitter: Relative spread of the fake provider's delays
+        resilience: Optional timeout, retry, hedging and breaker policy
+        metrics: Optional recorder of resilience events
+
+    Returns:
+        Async LLM client instance
+    """
+    if provider == "fake":
+        client = AsyncFakeLLMClient(
+            model_name=model_name,
+            default_temperature=temperature,
+            default_max_tokens=max_tokens,
+            first_token_latency_ms=fake_first_token_ms,
+            token_latency_ms=fake_token_ms,
+            latency_jitter=fake_jitter
+        )
+    else:
+        client = AsyncGeminiLLMClient(
+            api_key=api_key,
+            model_name=model_name,
+            default_temperature=temperature,
+            default_max_tokens=max_tokens
+        )
+    if resilience is not None:
+        return AsyncResilientLLMClient(client, resilience, metrics)
+    return client
@@ -0,0 +1,176 @@
+"""Local fake LLM clients for offline testing and latency benchmarking."""
+
+from typing import Optional, Iterator, AsyncIterator, List
+import asyncio
+import random
+import re
+import time
+
+
+def _extract_question(prompt: str) -> str:
+    """Extract the last ``Question:`` line from a prompt.
+
+    Args:
+        prompt: Input prompt
+
+    Returns:
+        Question text, or the last prompt line if none is present
+    """
+    matches = re.findall(r"^Question:\s*(.+)$", prompt, re.MULTILINE)
+    if matches:
+        return matches[-1].strip()
+    lines = [line for line in prompt.strip().splitlines() if line.strip()]
+    return lines[-1].strip() if lines else ""
+
+
+class _FakeLLMBase:
+    """Deterministic token source shared by the fake LLM clients."""
+
+    def __init__(
+        self,
+        model_name: str = "fake-llm",
+        default_temperature: float = 0.1,
+        default_max_tokens: int = 512,
+        first_token_latency_ms: float = 200.0,
+        token_latency_ms: float = 20.0,
+        response_tokens: int = 32,
+        latency_jitter: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        """Initialize fake LLM client.
+
+        Args:
+            model_name: Name reported for the fake model
+            default_temperature: Accepted for interface parity, ignored
+            default_max_tokens: Default maximum tokens
+            first_token_latency_ms: Delay before the first token is produced
+            token_latency_ms: Delay between subsequent tokens
+            response_tokens: Number of tokens in every response
+            latency_jitter: Relative spread of each delay; every delay is
+                scaled by a uniform factor in ``[1 - jitter, 1 + jitter]``
+            seed: Seed of the jitter generator, for reproducible runs
+        """
+        self.model_name = model_name
+        self.default_temperature = default_temperature
+        self.default_max_tokens = default_max_tokens
+        self.first_token_latency = first_token_latency_ms / 1000.0
+        self.token_latency = token_latency_ms / 1000.0
+        self.response_tokens = response_tokens
+        self.latency_jitter = latency_jitter
+        self._random = random.Random(seed)
+
+    def _tokens(self, prompt: str, max_tokens: Optional[int]) -> List[str]:
+        """Build the deterministic token sequence for a prompt.
+
+        Args:
+            prompt: Input prompt
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            List of tokens, each including its trailing separator
+        """
+        limit = max_tokens if max_tokens is not None else self.default_max_tokens
+        words = f"Simulated answer to: {_extract_question(prompt)}".split()
+        while len(words) < self.response_tokens:
+            words.append("lorem")
+        words = words[:max(1, min(limit, self.response_tokens))]
+        return [f"{word} " for word in words]
+
+    def _delay(self, index: int) -> float:
+        """Get the delay before emitting the token at ``index``.
+
+        Args:
+            index: Token position
+
+        Returns:
+            Delay in seconds
+        """
+        delay = self.first_token_latency if index == 0 else self.token_latency
+        if self.latency_jitter > 0:
+            delay *= max(0.0, self._random.uniform(1 - self.latency_jitter, 1 + self.latency_jitter))
+        return delay
+
+
+class FakeLLMClient(_FakeLLMBase):
+    """Blocking fake LLM client with simulated latency."""
+
+    def generate(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate a deterministic response after the full simulated latency.
+
+        Args:
+            prompt: Input prompt
+            temperature: Ignored
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Generated text
+        """
+        return "".join(self.generate_stream(prompt, temperature, max_tokens)).strip()
+
+    def generate_stream(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Yield deterministic tokens with simulated per-token latency.
+
+        Args:
+            prompt: Input prompt
+            temperature: Ignored
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Generated text fragments
+        """
+        for i, token in enumerate(self._tokens(prompt, max_tokens)):
+            time.sleep(self._delay(i))
+            yield token
+
+
+class AsyncFakeLLMClient(_FakeLLMBase):
+    """Non-blocking fake LLM client with simulated latency."""
+
+    async def generate(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate a deterministic response after the full simulated latency.
+
+        Args:
+            prompt: Input prompt
+            temperature: Ignored
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Generated text
+        """
+        parts = [token async for token in self.generate_stream(prompt, temperature, max_tokens)]
+        return "".join(parts).strip()
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """Yield deterministic tokens with simulated per-token latency.
+
+        Args:
+            prompt: Input prompt
+            temperature: Ignored
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Generated text fragments
+        """
+        for i, token in enumerate(self._tokens(prompt, max_tokens)):
+            await asyncio.sleep(self._delay(i))
+            yield token
@@ -1,14 +1,14 @@
 """Gemini-based LLM client implementation."""
 
-from typing import Optional
+from typing import Optional, Iterator, AsyncIterator
 from google import genai
 from google.genai import types
 
 from ...core.exceptions import LLMError
 
 
-class GeminiLLMClient:
-    """Gemini API-based LLM client."""
+class _GeminiLLMBase:
+    """Shared configuration for synchronous and asynchronous Gemini clients."""
 
     def __init__(
         self,
@@ -33,6 +33,29 @@ class GeminiLLMClient:
         except Exception as e:
             raise LLMError(f"Failed to initialize Gemini client: {e}")
 
+    def _build_config(
+        self,
+        temperature: Optional[float],
+        max_tokens: Optional[int]
+    ) -> types.GenerateContentConfig:
+        """Build generation config, falling back to client defaults.
+
+        Args:
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Generation config
+        """
+        return types.GenerateContentConfig(
+            temperature=temperature if temperature is not None else self.default_temperature,
+            max_output_tokens=max_tokens if max_tokens is not None else self.default_max_tokens,
+        )
+
+
+class GeminiLLMClient(_GeminiLLMBase):
+    """Gemini API-based LLM client."""
+
     def generate(
         self,
         prompt: str,
@@ -53,18 +76,114 @@ class GeminiLLMClient:
             LLMError: If generation fails
         """
         try:
-            config = types.GenerateContentConfig(
-                temperature=temperature if temperature is not None else self.default_temperature,
-                max_output_tokens=max_tokens if max_tokens is not None else self.default_max_tokens,
+            response = self.client.models.generate_content(
+                model=self.model_name,
+                contents=prompt,
+                config=self._build_config(temperature, max_tokens)
             )
 
-            response = self.client.models.generate_content(
+            return response.text.strip()
+
+        except Exception as e:
+            raise LLMError(f"Text generation failed: {e}")
+
+    def generate_stream(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Stream generated text from Gemini API as it is produced.
+
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Generated text fragments
+
+        Raises:
+            LLMError: If generation fails
+        """
+        try:
+            stream = self.client.models.generate_content_stream(
                 model=self.model_name,
                 contents=prompt,
-                config=config
+                config=self._build_config(temperature, max_tokens)
+            )
+
+            for chunk in stream:
+                if chunk.text:
+                    yield chunk.text
+
+        except Exception as e:
+            raise LLMError(f"Streaming generation failed: {e}")
+
+
+class AsyncGeminiLLMClient(_GeminiLLMBase):
+    """Gemini API-based LLM client using the non-blocking genai client."""
+
+    async def generate(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate text using Gemini API.
+
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Generated text
+
+        Raises:
+            LLMError: If generation fails
+        """
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=self.model_name,
+                contents=prompt,
+                config=self._build_config(temperature, max_tokens)
             )
 
             return response.text.strip()
 
         except Exception as e:
             raise LLMError(f"Text generation failed: {e}")
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """Stream generated text from Gemini API as it is produced.
+
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Generated text fragments
+
+        Raises:
+            LLMError: If generation fails
+        """
+        try:
+            stream = await self.client.aio.models.generate_content_stream(
+                model=self.model_name,
+                contents=prompt,
+                config=self._build_config(temperature, max_tokens)
+            )
+
+            async for chunk in stream:
+                if chunk.text:
+                    yield chunk.text
+
+        except Exception as e:
+            raise LLMError(f"Streaming generation failed: {e}")
@@ -0,0 +1,27 @@
+"""Observability infrastructure module."""
+
+from .metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    PipelineMetrics,
+    estimate_tokens
+)
+from .timing import begin_request_timing, record_timing, format_server_timing
+from .tracing import Span, Tracer, SlowRequestLog
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "PipelineMetrics",
+    "estimate_tokens",
+    "begin_request_timing",
+    "record_timing",
+    "format_server_timing",
+    "Span",
+    "Tracer",
+    "SlowRequestLog",
+]
@@ -0,0 +1,393 @@
+"""In-process metrics exported in the Prometheus text format."""
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+import math
+import threading
+import time
+
+from ...core.interfaces import PipelineMetricsProtocol
+from .timing import record_timing
+
+# Numeric circuit breaker states for the ``rag_circuit_state`` gauge.
+CIRCUIT_STATES = {"closed": 0, "half_open": 1, "open": 2}
+
+# Prometheus' default latency buckets, extended for slow LLM generations.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the LLM tokens of a text.
+
+    About four UTF-8 bytes per token: ~4 characters of English and
+    ~1.3 characters of Korean, close enough for capacity trends without
+    calling a tokenizer on every request.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    return math.ceil(len(text.encode("utf-8")) / 4)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric(ABC):
+    """Named metric family with a fixed set of label names."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    @abstractmethod
+    def _samples(self) -> Iterator[str]:
+        """Yield sample lines; called with ``_lock`` held."""
+
+    def render(self) -> List[str]:
+        """Render the family as exposition lines.
+
+        Returns:
+            HELP, TYPE and sample lines
+        """
+        with self._lock:
+            samples = list(self._samples())
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *samples
+        ]
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter.
+
+        Args:
+            amount: Non-negative increment
+            **labels: Label values
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def _samples(self) -> Iterator[str]:
+        for key, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+
+
+class Gauge(_Metric):
+    """Value per label set that can go up and down."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the gauge.
+
+        Args:
+            amount: Increment, negative to decrease
+            **labels: Label values
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge.
+
+        Args:
+            value: New value
+            **labels: Label values
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrease the gauge.
+
+        Args:
+            amount: Decrement
+            **labels: Label values
+        """
+        self.inc(-amount, **labels)
+
+    def _samples(self) -> Iterator[str]:
+        for key, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    """Cumulative bucket counts, sum and count per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation.
+
+        Args:
+            value: Observed value, e.g. seconds
+            **labels: Label values
+        """
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * len(self.buckets))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def _samples(self) -> Iterator[str]:
+        for key, counts in sorted(self._counts.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.label_names, key, le)} {cumulative}"
+            labels = _format_labels(self.label_names, key)
+            yield f"{self.name}_sum{labels} {_format_value(self._sums[key])}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    """Ordered collection of metric families rendered together."""
+
+    def __init__(self):
+        """Initialize empty registry."""
+        self._metrics: List[_Metric] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Add a metric family.
+
+        Args:
+            metric: Metric to expose
+
+        Returns:
+            The metric, for assignment
+        """
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Render every family in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text ending with a newline
+        """
+        with self._lock:
+            metrics = list(self._metrics)
+        lines = [line for metric in metrics for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+
+class PipelineMetrics(PipelineMetricsProtocol):
+    """Stage latencies, upstream errors, cache lookups and LLM text volume.
+
+    Besides feeding the histograms, every timed stage is appended to the
+    current request's timing list, which the API turns into a
+    ``Server-Timing`` header. HTTP-level counters live here too so a single
+    registry backs ``/metrics``.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        """Initialize pipeline metrics.
+
+        Args:
+            registry: Registry to add the metric families to, a new one if omitted
+        """
+        self.registry = registry or MetricsRegistry()
+        add = self.registry.register
+
+        self.stage_seconds = add(Histogram(
+            "rag_stage_duration_seconds", "Latency of one RAG pipeline stage.", ["stage"]
+        ))
+        self.upstream_errors = add(Counter(
+            "rag_upstream_errors_total", "Pipeline stages that raised.", ["stage", "error"]
+        ))
+        self.cache_requests = add(Counter(
+            "rag_cache_requests_total", "Cache lookups by result.", ["cache", "result"]
+        ))
+        self.text_chars = add(Counter(
+            "rag_llm_characters_total", "Characters sent to or received from the LLM.", ["kind"]
+        ))
+        self.text_tokens = add(Counter(
+            "rag_llm_estimated_tokens_total", "Estimated LLM tokens (4 UTF-8 bytes per token).", ["kind"]
+        ))
+        self.degraded_stages = add(Counter(
+            "rag_degraded_stages_total", "Stages skipped or replaced with a fallback.", ["stage"]
+        ))
+        self.upstream_events = add(Counter(
+            "rag_upstream_events_total",
+            "Upstream call attempts, retries, timeouts, hedges, hedges that won and circuit rejections.",
+            ["upstream", "event"]
+        ))
+        self.circuit_state = add(Gauge(
+            "rag_circuit_state", "Circuit breaker state: 0 closed, 1 half-open, 2 open.", ["upstream"]
+        ))
+        self.http_requests = add(Counter(
+            "http_requests_total", "HTTP requests by route and status.", ["method", "route", "status"]
+        ))
+        self.http_seconds = add(Histogram(
+            "http_request_duration_seconds", "HTTP request latency until response start.", ["route"]
+        ))
+        self.http_in_flight = add(Gauge(
+            "http_requests_in_flight", "HTTP requests currently being handled."
+        ))
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time one pipeline stage, counting it as an upstream error if it raises.
+
+        Args:
+            name: Stage name
+
+        Yields:
+            None
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            # Cancellation (a speculative rewrite that lost, a client that
+            # disconnected) is not an upstream failure.
+            self.upstream_errors.inc(stage=name, error=type(e).__name__)
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stage_seconds.observe(elapsed, stage=name)
+            record_timing(name, elapsed)
+
+    def record_cache(self, cache: str, hit: bool) -> None:
+        """Count one cache lookup.
+
+        Args:
+            cache: Cache name
+            hit: Whether the lookup was a hit
+        """
+        self.cache_requests.inc(cache=cache, result="hit" if hit else "miss")
+
+    def record_text(self, kind: str, text: str) -> None:
+        """Count characters and estimated tokens of LLM input or output.
+
+        Args:
+            kind: "prompt" or "completion"
+            text: Text sent to or received from the LLM
+        """
+        self.text_chars.inc(len(text), kind=kind)
+        self.text_tokens.inc(estimate_tokens(text), kind=kind)
+
+    def record_degraded(self, stage: str) -> None:
+        """Count one stage that fell back (rewrite skipped, stored answer served).
+
+        Args:
+            stage: "rewrite" or "generate"
+        """
+        self.degraded_stages.inc(stage=stage)
+
+    def record_http(self, method: str, route: str, status: int, seconds: float) -> None:
+        """Count one HTTP request and its latency.
+
+        Args:
+            method: HTTP method
+            route: Route template, so path parameters do not explode cardinality
+            status: Response status code
+            seconds: Time until the response started
+        """
+        self.http_requests.inc(method=method, route=route, status=str(status))
+        self.http_seconds.observe(seconds, route=route)
+
+    def record_upstream(self, upstream: str, event: str) -> None:
+        """Count one resilience event of an upstream dependency.
+
+        ``hedge_won / hedge`` is the share of hedged calls that the
+        duplicate request answered first.
+
+        Args:
+            upstream: Upstream name
+            event: "attempt", "retry", "timeout", "deadline", "hedge",
+                "hedge_won" or "rejected"
+        """
+        self.upstream_events.inc(upstream=upstream, event=event)
+
+    def set_circuit_state(self, upstream: str, state: str) -> None:
+        """Publish the circuit breaker state of an upstream dependency.
+
+        Args:
+            upstream: Upstream name
+            state: "closed", "half_open" or "open"
+        """
+        self.circuit_state.set(CIRCUIT_STATES[state], upstream=upstream)
+
+    @contextmanager
+    def in_flight(self) -> Iterator[None]:
+        """Track a request as in flight while the context is open.
+
+        Yields:
+            None
+        """
+        self.http_in_flight.inc()
+        try:
+            yield
+        finally:
+            self.http_in_flight.dec()
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text
+        """
+        return self.registry.render()
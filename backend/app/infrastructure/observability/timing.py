@@ -0,0 +1,57 @@
+"""Per-request stage timings for the ``Server-Timing`` response header."""
+
+from contextvars import ContextVar
+from typing import List, Optional, Tuple, Dict
+import re
+
+_timings: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar("request_timings", default=None)
+
+_TOKEN = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def begin_request_timing() -> List[Tuple[str, float]]:
+    """Start collecting stage timings for the current request.
+
+    The list is shared, not copied, with tasks spawned from this context,
+    so stages timed inside the endpoint land in it.
+
+    Returns:
+        List that ``record_timing`` appends (stage, seconds) pairs to
+    """
+    timings: List[Tuple[str, float]] = []
+    _timings.set(timings)
+    return timings
+
+
+def record_timing(name: str, seconds: float) -> None:
+    """Add a stage duration to the current request, if one is being timed.
+
+    Args:
+        name: Stage name
+        seconds: Stage duration
+    """
+    timings = _timings.get()
+    if timings is not None:
+        timings.append((name, seconds))
+
+
+def format_server_timing(timings: List[Tuple[str, float]], total: Optional[float] = None) -> str:
+    """Render stage timings as a ``Server-Timing`` header value.
+
+    Repeated stages (e.g. two embeddings on the rewrite fallback path) are
+    summed and keep the position of their first occurrence.
+
+    Args:
+        timings: (stage, seconds) pairs
+        total: Optional whole-request duration, added as ``total``
+
+    Returns:
+        Header value such as ``embed;dur=41.2, search;dur=3.9``
+    """
+    summed: Dict[str, float] = {}
+    for name, seconds in timings:
+        name = _TOKEN.sub("_", name)
+        summed[name] = summed.get(name, 0.0) + seconds
+    if total is not None:
+        summed["total"] = total
+    return ", ".join(f"{name};dur={seconds * 1000:.1f}" for name, seconds in summed.items())
@@ -0,0 +1,231 @@
+"""Per-request span trees with a rotating slow-request log."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import RotatingFileHandler
+from typing import Any, Dict, Iterator, List, Optional
+import json
+import logging
+import os
+import random
+import threading
+import time
+
+from ...core.interfaces import TracerProtocol, SpanProtocol, NOOP_SPAN
+
+logger = logging.getLogger(__name__)
+
+_current: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class Span(SpanProtocol):
+    """One timed operation with attributes and child spans."""
+
+    def __init__(self, name: str, parent: Optional["Span"] = None, **attributes: Any):
+        """Start a span.
+
+        Args:
+            name: Operation name
+            parent: Enclosing span, None for the root
+            **attributes: Initial attributes
+        """
+        self.name = name
+        self.attributes: Dict[str, Any] = dict(attributes)
+        self.children: List[Span] = []
+        self.error: Optional[str] = None
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.root: Span = parent.root if parent is not None else self
+        if parent is not None:
+            # Concurrent tasks (batch items, speculative rewrites) may add
+            # children to the same parent.
+            with self.root._lock:
+                parent.children.append(self)
+        else:
+            self._lock = threading.Lock()
+
+    def set(self, **attributes: Any) -> None:
+        """Attach attributes to the span.
+
+        Args:
+            **attributes: JSON-serializable attribute values
+        """
+        self.attributes.update(attributes)
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """Stop the span's clock.
+
+        Args:
+            error: Exception that ended the span, if any
+        """
+        self.end = time.perf_counter()
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+
+    @property
+    def duration_ms(self) -> float:
+        """Span duration so far, in milliseconds."""
+        end = self.end if self.end is not None else time.perf_counter()
+        return (end - self.start) * 1000.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the span and its children.
+
+        Offsets are relative to the start of the root span, so a child
+        tree reads as a timeline.
+
+        Returns:
+            Dictionary with name, offset, duration, attributes and child spans
+        """
+        with self.root._lock:
+            children = list(self.children)
+        data: Dict[str, Any] = {
+            "name": self.name,
+            "offset_ms": round((self.start - self.root.start) * 1000.0, 2),
+            "duration_ms": round(self.duration_ms, 2)
+        }
+        if self.attributes:
+            data["attributes"] = self.attributes
+        if self.error:
+            data["error"] = self.error
+        if children:
+            data["spans"] = [child.to_dict() for child in children]
+        return data
+
+
+class SlowRequestLog:
+    """Append slow traces as JSON lines to a size-rotated file."""
+
+    def __init__(self, path: str, max_bytes: int = 10 * 1024 * 1024, backups: int = 5):
+        """Initialize slow request log.
+
+        Args:
+            path: Log file; rotated copies get ``.1``, ``.2``, ... suffixes
+            max_bytes: Size at which the file is rotated
+            backups: Rotated files kept
+        """
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self._logger = logging.getLogger(f"{__name__}.slow.{os.path.abspath(path)}")
+        self._logger.handlers = [handler]
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Append one trace.
+
+        Args:
+            record: JSON-serializable trace
+        """
+        self._logger.info(json.dumps(record, ensure_ascii=False, default=str))
+
+
+class Tracer(TracerProtocol):
+    """Record a span tree per request and log the slow ones.
+
+    The current span lives in a context variable, so spans opened anywhere
+    below ``trace`` (including in tasks spawned from it) attach to the right
+    request without passing anything around. Requests outside the sample
+    create no spans at all.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        slow_threshold_ms: float = 2000.0,
+        slow_log: Optional[SlowRequestLog] = None
+    ):
+        """Initialize tracer.
+
+        Args:
+            sample_rate: Fraction of requests traced, 0 to 1
+            slow_threshold_ms: Traced requests at least this slow are written
+                to ``slow_log``
+            slow_log: Optional destination for slow traces
+        """
+        self.sample_rate = sample_rate
+        self.slow_threshold_ms = slow_threshold_ms
+        self.slow_log = slow_log
+
+    @contextmanager
+    def trace(self, name: str, force: bool = False, **attributes: Any) -> Iterator[Optional[Span]]:
+        """Start the root span of a request, subject to sampling.
+
+        Args:
+            name: Request name, e.g. the endpoint
+            force: Trace regardless of the sample rate
+            **attributes: Attributes of the root span
+
+        Yields:
+            Root span, or None if the request is not sampled
+        """
+        if not force and random.random() >= self.sample_rate:
+            yield None
+            return
+
+        root = Span(name, **attributes)
+        token = _current.set(root)
+        error = None
+        try:
+            yield root
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            _current.reset(token)
+            root.finish(error)
+            self._maybe_log(root)
+
+    def _maybe_log(self, root: Span) -> None:
+        """Write a finished trace to the slow log if it crossed the threshold."""
+        if self.slow_log is None or root.duration_ms < self.slow_threshold_ms:
+            return
+        try:
+            self.slow_log.write({
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                **root.to_dict()
+            })
+        except Exception as e:
+            logger.warning(f"Could not write slow request log: {e}")
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[SpanProtocol]:
+        """Open a child of the current span; a no-op outside a trace.
+
+        Args:
+            name: Operation name
+            **attributes: Attributes of the span
+
+        Yields:
+            The span
+        """
+        parent = _current.get()
+        if parent is None:
+            yield NOOP_SPAN
+            return
+
+        span = Span(name, parent, **attributes)
+        token = _current.set(span)
+        error = None
+        try:
+            yield span
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            _current.reset(token)
+            span.finish(error)
+
+    def annotate(self, **attributes: Any) -> None:
+        """Attach attributes to the current span, if any.
+
+        Args:
+            **attributes: JSON-serializable attribute values
+        """
+        span = _current.get()
+        if span is not None:
+            span.set(**attributes)
@@ -1,6 +1,11 @@
 """Query processor infrastructure module."""
 
-from .rewriter import QueryRewriter
-from .factory import create_query_processor
+from .rewriter import QueryRewriter, AsyncQueryRewriter
+from .factory import create_query_processor, create_async_query_processor
 
-__all__ = ["QueryRewriter", "create_query_processor"]
+__all__ = [
+    "QueryRewriter",
+    "AsyncQueryRewriter",
+    "create_query_processor",
+    "create_async_query_processor",
+]
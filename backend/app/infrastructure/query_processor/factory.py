@@ -2,19 +2,43 @@
 
 from typing import Optional
 
-from ...core.interfaces import QueryProcessorProtocol, LLMClientProtocol
-from .rewriter import QueryRewriter
+from ...core.interfaces import (
+    QueryProcessorProtocol,
+    LLMClientProtocol,
+    AsyncQueryProcessorProtocol,
+    AsyncLLMClientProtocol,
+    RewriteCacheProtocol
+)
+from .rewriter import QueryRewriter, AsyncQueryRewriter
 
 
 def create_query_processor(
-    llm_client: Optional[LLMClientProtocol] = None
+    llm_client: Optional[LLMClientProtocol] = None,
+    cache: Optional[RewriteCacheProtocol] = None
 ) -> QueryProcessorProtocol:
     """Create a query processor instance.
 
     Args:
         llm_client: Optional LLM client for query rewriting
+        cache: Optional cache of previous rewrites
 
     Returns:
         Query processor instance
     """
-    return QueryRewriter(llm_client=llm_client)
+    return QueryRewriter(llm_client=llm_client, cache=cache)
+
+
+def create_async_query_processor(
+    llm_client: Optional[AsyncLLMClientProtocol] = None,
+    cache: Optional[RewriteCacheProtocol] = None
+) -> AsyncQueryProcessorProtocol:
+    """Create an asynchronous query processor instance.
+
+    Args:
+        llm_client: Optional async LLM client for query rewriting
+        cache: Optional cache of previous rewrites
+
+    Returns:
+        Async query processor instance
+    """
+    return AsyncQueryRewriter(llm_client=llm_client, cache=cache)
@@ -1,21 +1,69 @@
 """Query rewriter implementation."""
 
-from typing import Optional
+from typing import Optional, Union
+import hashlib
+import json
 
-from ...core.interfaces import LLMClientProtocol
+from ...core.interfaces import LLMClientProtocol, AsyncLLMClientProtocol, RewriteCacheProtocol
 from ...core.exceptions import QueryProcessingError
 
 
+def _build_rewrite_prompt(query: str) -> str:
+    """Build the prompt asking the LLM to rewrite a query.
+
+    Args:
+        query: Original user query
+
+    Returns:
+        Rewrite prompt
+    """
+    return f"""Rewrite this question to be more search-friendly by expanding with synonyms and related terms. Keep it concise.
+
+Question: {query}
+
+Return only the rewritten query, nothing else."""
+
+
+def _rewrite_cache_key(
+    llm_client: Union[LLMClientProtocol, AsyncLLMClientProtocol],
+    query: str
+) -> str:
+    """Build the rewrite cache key from the normalized query and LLM settings.
+
+    Args:
+        llm_client: LLM client performing the rewrite
+        query: Original user query
+
+    Returns:
+        Hex digest identifying this (model, settings, query) combination
+    """
+    normalized = " ".join(query.split()).casefold()
+    parts = [
+        getattr(llm_client, "model_name", type(llm_client).__name__),
+        getattr(llm_client, "default_temperature", None),
+        getattr(llm_client, "default_max_tokens", None),
+        normalized
+    ]
+    raw = json.dumps(parts, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
 class QueryRewriter:
     """Query rewriter using LLM for query expansion."""
 
-    def __init__(self, llm_client: Optional[LLMClientProtocol] = None):
+    def __init__(
+        self,
+        llm_client: Optional[LLMClientProtocol] = None,
+        cache: Optional[RewriteCacheProtocol] = None
+    ):
         """Initialize query rewriter.
 
         Args:
             llm_client: Optional LLM client for query expansion
+            cache: Optional cache of previous rewrites
         """
         self.llm_client = llm_client
+        self.cache = cache
 
     def process_query(self, query: str) -> str:
         """Process and potentially rewrite the query.
@@ -29,15 +77,70 @@ class QueryRewriter:
         if not self.llm_client:
             return query.strip()
 
-        prompt = f"""Rewrite this question to be more search-friendly by expanding with synonyms and related terms. Keep it concise.
+        cache_key = _rewrite_cache_key(self.llm_client, query) if self.cache is not None else None
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-Question: {query}
-
-Return only the rewritten query, nothing else."""
+        prompt = _build_rewrite_prompt(query)
 
         try:
             rewritten = self.llm_client.generate(prompt)
-            return rewritten if rewritten else query.strip()
+            if not rewritten:
+                return query.strip()
+            if cache_key:
+                self.cache.put(cache_key, rewritten)
+            return rewritten
+
+        except Exception as e:
+            raise QueryProcessingError(f"Query rewriting failed: {e}")
+
+
+class AsyncQueryRewriter:
+    """Query rewriter awaiting an asynchronous LLM client."""
+
+    def __init__(
+        self,
+        llm_client: Optional[AsyncLLMClientProtocol] = None,
+        cache: Optional[RewriteCacheProtocol] = None
+    ):
+        """Initialize async query rewriter.
+
+        Args:
+            llm_client: Optional async LLM client for query expansion
+            cache: Optional cache of previous rewrites
+        """
+        self.llm_client = llm_client
+        self.cache = cache
+
+    async def process_query(self, query: str) -> str:
+        """Process and potentially rewrite the query.
+
+        Args:
+            query: Original user query
+
+        Returns:
+            Processed query
+        """
+        if not self.llm_client:
+            return query.strip()
+
+        cache_key = _rewrite_cache_key(self.llm_client, query) if self.cache is not None else None
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        prompt = _build_rewrite_prompt(query)
+
+        try:
+            rewritten = await self.llm_client.generate(prompt)
+            if not rewritten:
+                return query.strip()
+            if cache_key:
+                self.cache.put(cache_key, rewritten)
+            return rewritten
 
         except Exception as e:
             raise QueryProcessingError(f"Query rewriting failed: {e}")
@@ -0,0 +1,24 @@
+"""Resilience infrastructure module."""
+
+from .policy import ResiliencePolicy, LatencyTracker, CircuitBreaker, is_retryable, backoff_delay
+from .caller import ResilientCaller, AsyncResilientCaller
+from .wrappers import (
+    ResilientLLMClient,
+    AsyncResilientLLMClient,
+    ResilientEmbedding,
+    AsyncResilientEmbedding
+)
+
+__all__ = [
+    "ResiliencePolicy",
+    "LatencyTracker",
+    "CircuitBreaker",
+    "is_retryable",
+    "backoff_delay",
+    "ResilientCaller",
+    "AsyncResilientCaller",
+    "ResilientLLMClient",
+    "AsyncResilientLLMClient",
+    "ResilientEmbedding",
+    "AsyncResilientEmbedding",
+]
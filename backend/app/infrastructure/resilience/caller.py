@@ -0,0 +1,419 @@
+"""Deadline, retry, hedging and circuit breaking around upstream calls."""
+
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple, TypeVar
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+
+from ...core.deadline import remaining
+from ...core.exceptions import CircuitOpenError, DeadlineExceededError
+from ...core.interfaces import PipelineMetricsProtocol
+from .policy import ResiliencePolicy, LatencyTracker, CircuitBreaker, is_retryable, backoff_delay
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _ResilienceBase:
+    """Policy, breaker, latency window and counters shared by both callers."""
+
+    def __init__(self, policy: ResiliencePolicy, metrics: Optional[PipelineMetricsProtocol] = None):
+        """Initialize resilient caller.
+
+        Args:
+            policy: Timeouts, retries, hedging and breaker settings
+            metrics: Optional recorder of attempts, retries, timeouts,
+                hedges and breaker state
+        """
+        self.policy = policy
+        self.metrics = metrics
+        self.latency = LatencyTracker()
+        self.breaker = CircuitBreaker(
+            failure_threshold=policy.failure_threshold,
+            reset_timeout=policy.reset_timeout,
+            on_state_change=self._on_state_change
+        )
+        self._counts: Dict[str, int] = {}
+        self._counts_lock = threading.Lock()
+        if metrics is not None:
+            metrics.set_circuit_state(policy.name, "closed")
+
+    def _event(self, event: str) -> None:
+        """Count a resilience event locally and in metrics."""
+        with self._counts_lock:
+            self._counts[event] = self._counts.get(event, 0) + 1
+        if self.metrics is not None:
+            self.metrics.record_upstream(self.policy.name, event)
+
+    def _on_state_change(self, state: str) -> None:
+        """Log and publish a breaker transition."""
+        log = logger.warning if state == "open" else logger.info
+        log(f"Circuit for {self.policy.name} is now {state}")
+        if self.metrics is not None:
+            self.metrics.set_circuit_state(self.policy.name, state)
+
+    def hedge_delay(self) -> Optional[float]:
+        """Wait before sending a duplicate request.
+
+        Returns:
+            The ``hedge_quantile`` of recent latencies (at least
+            ``hedge_min_delay``), or None if hedging is off or there are too
+            few samples yet
+        """
+        if not self.policy.hedge:
+            return None
+        quantile = self.latency.quantile(self.policy.hedge_quantile, self.policy.hedge_min_samples)
+        return None if quantile is None else max(self.policy.hedge_min_delay, quantile)
+
+    def _admit(self) -> None:
+        """Reject the call up front if the circuit is open.
+
+        Raises:
+            CircuitOpenError: If the breaker does not allow the call
+        """
+        if not self.breaker.allow():
+            self._event("rejected")
+            raise CircuitOpenError(f"{self.policy.name} upstream is unavailable (circuit open)")
+
+    def _settle(self, error: Optional[BaseException]) -> None:
+        """Report a finished call to the breaker.
+
+        Args:
+            error: Final error, None on success
+        """
+        if error is None:
+            self.breaker.record_success()
+        elif isinstance(error, DeadlineExceededError):
+            # Running out of the caller's budget says nothing about the upstream.
+            self.breaker.release()
+        elif isinstance(error, Exception) and is_retryable(error):
+            self.breaker.record_failure()
+        else:
+            self.breaker.release()
+
+    def _attempt_window(self) -> Tuple[Optional[float], Optional[float]]:
+        """Per-attempt timeout and absolute request deadline for the next attempt.
+
+        Returns:
+            Tuple of (policy timeout or None, ``time.perf_counter()`` value
+            of the request deadline or None)
+
+        Raises:
+            DeadlineExceededError: If the request deadline has already passed
+        """
+        timeout = self.policy.timeout if self.policy.timeout > 0 else None
+        left = remaining()
+        if left is None:
+            return timeout, None
+        if left <= 0:
+            self._event("deadline")
+            raise DeadlineExceededError(f"No time left in the request budget to call {self.policy.name}")
+        return timeout, time.perf_counter() + left
+
+    def _expiry(self, started: float, timeout: Optional[float], deadline_at: Optional[float]) -> Optional[float]:
+        """When an attempt started at ``started`` gives up, if ever."""
+        ends = [deadline_at] if deadline_at is not None else []
+        if timeout is not None:
+            ends.append(started + timeout)
+        return min(ends) if ends else None
+
+    def _timeout_error(self, expiry: float, deadline_at: Optional[float]) -> TimeoutError:
+        """Build the error for an attempt that ran out of time.
+
+        Args:
+            expiry: When the attempt gave up
+            deadline_at: Request deadline, if any
+
+        Returns:
+            ``DeadlineExceededError`` if the request deadline cut the attempt
+            short, otherwise a plain ``TimeoutError``
+        """
+        if deadline_at is not None and expiry >= deadline_at:
+            self._event("deadline")
+            return DeadlineExceededError(f"{self.policy.name} did not answer within the request budget")
+        self._event("timeout")
+        return TimeoutError(f"{self.policy.name} did not answer within {self.policy.timeout:.2f}s")
+
+    def _should_retry(self, error: Exception, attempt: int) -> Optional[float]:
+        """Decide whether to retry after a failed attempt.
+
+        Args:
+            error: Error of the failed attempt
+            attempt: Zero-based number of the failed attempt
+
+        Returns:
+            Seconds to back off before retrying, or None to give up
+        """
+        if attempt == self.policy.max_retries or isinstance(error, DeadlineExceededError) or not is_retryable(error):
+            return None
+        delay = backoff_delay(self.policy, attempt)
+        left = remaining()
+        if left is not None and delay >= left:
+            return None
+        self._event("retry")
+        return delay
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get breaker state, latency estimates and event counts.
+
+        Returns:
+            Dictionary of resilience statistics
+        """
+        def ms(seconds: Optional[float]) -> Optional[float]:
+            return round(seconds * 1000, 1) if seconds is not None else None
+
+        with self._counts_lock:
+            events = dict(self._counts)
+        return {
+            "upstream": self.policy.name,
+            "circuit": self.breaker.state,
+            "latency_p50_ms": ms(self.latency.quantile(0.5)),
+            "latency_p95_ms": ms(self.latency.quantile(0.95)),
+            "hedge_delay_ms": ms(self.hedge_delay()),
+            "events": events
+        }
+
+
+class ResilientCaller(_ResilienceBase):
+    """Run blocking upstream calls with deadlines, retries, hedging and a breaker.
+
+    Attempts are bounded by the policy timeout and by the remaining request
+    budget (see ``core.deadline``), and are not retried once that budget is
+    spent. Attempts that need a deadline or a hedge run on a thread pool; a
+    blocking call cannot be interrupted, so a timed-out or losing attempt
+    finishes in the background and its result is discarded.
+    """
+
+    def __init__(
+        self,
+        policy: ResiliencePolicy,
+        metrics: Optional[PipelineMetricsProtocol] = None,
+        max_workers: int = 32
+    ):
+        """Initialize resilient caller.
+
+        Args:
+            policy: Timeouts, retries, hedging and breaker settings
+            metrics: Optional recorder of resilience events
+            max_workers: Threads available for attempts
+        """
+        super().__init__(policy, metrics)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{policy.name}-call")
+
+    def call(self, fn: Callable[[], T], hedge: bool = True) -> T:
+        """Call an upstream function under the policy.
+
+        Args:
+            fn: Zero-argument callable making one upstream request
+            hedge: Allow duplicate requests; off for non-idempotent calls
+
+        Returns:
+            Result of the first successful attempt
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            DeadlineExceededError: If the request budget runs out
+            Exception: The last attempt's error once retries are exhausted
+        """
+        self._admit()
+        error = None
+        try:
+            for attempt in range(self.policy.max_retries + 1):
+                try:
+                    return self._race(fn, hedge)
+                except Exception as e:
+                    delay = self._should_retry(e, attempt)
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._settle(error)
+
+    def _race(self, fn: Callable[[], T], hedge: bool) -> T:
+        """Run one attempt, plus a hedge if it is slower than the hedge delay.
+
+        Args:
+            fn: Upstream call
+            hedge: Allow a duplicate request
+
+        Returns:
+            Result of whichever attempt succeeds first
+        """
+        timeout, deadline_at = self._attempt_window()
+        delay = self.hedge_delay() if hedge else None
+
+        self._event("attempt")
+        if timeout is None and deadline_at is None and delay is None:
+            start = time.perf_counter()
+            result = fn()
+            self.latency.record(time.perf_counter() - start)
+            return result
+
+        started: Dict[Future, float] = {}
+
+        def launch() -> Future:
+            future = self._executor.submit(contextvars.copy_context().run, fn)
+            started[future] = time.perf_counter()
+            return future
+
+        primary = launch()
+        pending: Set[Future] = {primary}
+        hedged = delay is None
+        last_error: Optional[BaseException] = None
+        try:
+            while pending:
+                now = time.perf_counter()
+                waits = []
+                if not hedged:
+                    waits.append(started[primary] + delay - now)
+                expiries = [e for e in (self._expiry(started[f], timeout, deadline_at) for f in pending) if e is not None]
+                if expiries:
+                    waits.append(min(expiries) - now)
+                done, pending = wait(
+                    pending,
+                    timeout=max(0.0, min(waits)) if waits else None,
+                    return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    error = future.exception()
+                    if error is None:
+                        self.latency.record(time.perf_counter() - started[future])
+                        if future is not primary:
+                            self._event("hedge_won")
+                        return future.result()
+                    last_error = error
+
+                now = time.perf_counter()
+                for future in list(pending):
+                    expiry = self._expiry(started[future], timeout, deadline_at)
+                    if expiry is not None and now >= expiry:
+                        pending.discard(future)
+                        last_error = self._timeout_error(expiry, deadline_at)
+                if not hedged and pending and now - started[primary] >= delay:
+                    hedged = True
+                    self._event("hedge")
+                    self._event("attempt")
+                    pending.add(launch())
+            raise last_error
+        finally:
+            for future in started:
+                future.cancel()
+
+
+class AsyncResilientCaller(_ResilienceBase):
+    """Run async upstream calls with deadlines, retries, hedging and a breaker.
+
+    Attempts are bounded like ``ResilientCaller``'s; timed-out and losing
+    attempts are cancelled.
+    """
+
+    async def call(self, fn: Callable[[], Awaitable[T]], hedge: bool = True) -> T:
+        """Call an upstream coroutine function under the policy.
+
+        Args:
+            fn: Zero-argument callable returning a coroutine for one request
+            hedge: Allow duplicate requests; off for non-idempotent calls
+
+        Returns:
+            Result of the first successful attempt
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            DeadlineExceededError: If the request budget runs out
+            Exception: The last attempt's error once retries are exhausted
+        """
+        self._admit()
+        error = None
+        try:
+            for attempt in range(self.policy.max_retries + 1):
+                try:
+                    return await self._race(fn, hedge)
+                except Exception as e:
+                    delay = self._should_retry(e, attempt)
+                    if delay is None:
+                        raise
+                    await asyncio.sleep(delay)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._settle(error)
+
+    async def _race(self, fn: Callable[[], Awaitable[T]], hedge: bool) -> T:
+        """Run one attempt, plus a hedge if it is slower than the hedge delay.
+
+        Args:
+            fn: Upstream call
+            hedge: Allow a duplicate request
+
+        Returns:
+            Result of whichever attempt succeeds first
+        """
+        timeout, deadline_at = self._attempt_window()
+        delay = self.hedge_delay() if hedge else None
+
+        self._event("attempt")
+        if timeout is None and deadline_at is None and delay is None:
+            start = time.perf_counter()
+            result = await fn()
+            self.latency.record(time.perf_counter() - start)
+            return result
+
+        started: Dict[asyncio.Task, float] = {}
+
+        def launch() -> asyncio.Task:
+            task = asyncio.ensure_future(fn())
+            started[task] = time.perf_counter()
+            return task
+
+        primary = launch()
+        pending: Set[asyncio.Task] = {primary}
+        hedged = delay is None
+        last_error: Optional[BaseException] = None
+        try:
+            while pending:
+                now = time.perf_counter()
+                waits = []
+                if not hedged:
+                    waits.append(started[primary] + delay - now)
+                expiries = [e for e in (self._expiry(started[t], timeout, deadline_at) for t in pending) if e is not None]
+                if expiries:
+                    waits.append(min(expiries) - now)
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=max(0.0, min(waits)) if waits else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        self.latency.record(time.perf_counter() - started[task])
+                        if task is not primary:
+                            self._event("hedge_won")
+                        return task.result()
+                    last_error = error
+
+                now = time.perf_counter()
+                for task in list(pending):
+                    expiry = self._expiry(started[task], timeout, deadline_at)
+                    if expiry is not None and now >= expiry:
+                        pending.discard(task)
+                        task.cancel()
+                        last_error = self._timeout_error(expiry, deadline_at)
+                if not hedged and pending and now - started[primary] >= delay:
+                    hedged = True
+                    self._event("hedge")
+                    self._event("attempt")
+                    pending.add(launch())
+            raise last_error
+        finally:
+            for task in started:
+                if not task.done():
+                    task.cancel()
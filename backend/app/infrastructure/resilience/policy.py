@@ -0,0 +1,192 @@
+"""Retry classification, backoff, latency tracking and circuit breaking."""
+
+from collections import deque
+from typing import Callable, Deque, NamedTuple, Optional
+import random
+import threading
+import time
+
+import numpy as np
+
+# HTTP statuses worth retrying: timeouts, rate limits and server errors.
+RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+CIRCUIT_STATES = ("closed", "half_open", "open")
+
+
+class ResiliencePolicy(NamedTuple):
+    """How calls to one upstream are bounded, retried, hedged and broken."""
+
+    name: str = "upstream"
+    timeout: float = 0.0
+    max_retries: int = 2
+    backoff_base: float = 0.2
+    backoff_max: float = 2.0
+    hedge: bool = True
+    hedge_quantile: float = 0.95
+    hedge_min_samples: int = 20
+    hedge_min_delay: float = 0.05
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Check whether an error is transient, following wrapped causes.
+
+    Provider clients wrap SDK errors (e.g. ``LLMError`` raised while handling
+    a Gemini ``APIError``), so the whole cause/context chain is inspected.
+
+    Args:
+        error: Raised exception
+
+    Returns:
+        True for timeouts, connection errors and retryable HTTP statuses
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, (TimeoutError, ConnectionError)):
+            return True
+        code = getattr(error, "code", None) or getattr(error, "status_code", None)
+        if isinstance(code, int) and code in RETRYABLE_STATUS:
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def backoff_delay(policy: ResiliencePolicy, attempt: int) -> float:
+    """Delay before a retry, exponential with full jitter.
+
+    Args:
+        policy: Resilience policy
+        attempt: Zero-based number of the attempt that failed
+
+    Returns:
+        Seconds to sleep, uniform in ``[0, min(backoff_max, base * 2**attempt)]``
+    """
+    return random.uniform(0.0, min(policy.backoff_max, policy.backoff_base * (2 ** attempt)))
+
+
+class LatencyTracker:
+    """Sliding window of successful call latencies."""
+
+    def __init__(self, window: int = 500):
+        """Initialize latency tracker.
+
+        Args:
+            window: Most recent samples kept
+        """
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """Add one latency sample.
+
+        Args:
+            seconds: Call duration
+        """
+        with self._lock:
+            self._samples.append(seconds)
+
+    def quantile(self, q: float, min_samples: int = 1) -> Optional[float]:
+        """Latency quantile over the window.
+
+        Args:
+            q: Quantile between 0 and 1
+            min_samples: Samples required for an estimate
+
+        Returns:
+            Quantile in seconds, or None with too few samples
+        """
+        with self._lock:
+            if len(self._samples) < max(1, min_samples):
+                return None
+            samples = list(self._samples)
+        return float(np.quantile(samples, q))
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe.
+
+    After ``failure_threshold`` transient failures in a row the circuit
+    opens and calls are rejected without reaching the upstream. Once
+    ``reset_timeout`` has passed one probe call is let through; its success
+    closes the circuit, its failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        on_state_change: Optional[Callable[[str], None]] = None
+    ):
+        """Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit;
+                0 never opens it
+            reset_timeout: Seconds the circuit stays open before a probe
+            on_state_change: Called with the new state on every transition
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.on_state_change = on_state_change
+        self._state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "half_open" or "open"."""
+        return self._state
+
+    def _transition(self, state: str) -> None:
+        """Change state and notify; called with the lock held."""
+        if state == self._state:
+            return
+        self._state = state
+        if state == "open":
+            self._opened_at = time.monotonic()
+        if self.on_state_change is not None:
+            self.on_state_change(state)
+
+    def allow(self) -> bool:
+        """Check whether a call may proceed, reserving the probe if half-open.
+
+        Returns:
+            False if the call should be rejected
+        """
+        with self._lock:
+            if self._state == "open":
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._transition("half_open")
+            if self._state == "half_open":
+                if self._probing:
+                    return False
+                self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        """Record a call that the upstream answered."""
+        with self._lock:
+            self._failures = 0
+            self._probing = False
+            self._transition("closed")
+
+    def record_failure(self) -> None:
+        """Record a transient failure (timeout, outage, overload)."""
+        with self._lock:
+            self._probing = False
+            self._failures += 1
+            if self._state == "half_open" or (
+                self.failure_threshold > 0 and self._failures >= self.failure_threshold
+            ):
+                self._transition("open")
+
+    def release(self) -> None:
+        """End a call that says nothing about upstream health (cancelled, bad request)."""
+        with self._lock:
+            self._probing = False
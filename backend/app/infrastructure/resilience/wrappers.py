@@ -0,0 +1,253 @@
+"""Resilient wrappers for any LLM client or embedding model."""
+
+from typing import Any, AsyncIterator, Iterator, List, Optional
+import numpy as np
+
+from ...core.interfaces import (
+    LLMClientProtocol,
+    AsyncLLMClientProtocol,
+    EmbeddingModelProtocol,
+    AsyncEmbeddingModelProtocol,
+    PipelineMetricsProtocol
+)
+from .policy import ResiliencePolicy
+from .caller import ResilientCaller, AsyncResilientCaller
+
+
+class ResilientLLMClient(LLMClientProtocol):
+    """LLM client whose calls are bounded, retried, hedged and circuit-broken.
+
+    Streams are retried only until their first token, since tokens already
+    handed out cannot be replayed, and are never hedged.
+    """
+
+    def __init__(
+        self,
+        client: LLMClientProtocol,
+        policy: ResiliencePolicy,
+        metrics: Optional[PipelineMetricsProtocol] = None
+    ):
+        """Initialize resilient LLM client.
+
+        Args:
+            client: Client making the upstream calls
+            policy: Timeouts, retries, hedging and breaker settings
+            metrics: Optional recorder of resilience events
+        """
+        self.client = client
+        self.caller = ResilientCaller(policy, metrics)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+    def generate(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate text under the resilience policy.
+
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Generated text
+        """
+        return self.caller.call(lambda: self.client.generate(prompt, temperature, max_tokens))
+
+    def generate_stream(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Stream generated text, retrying until the first token arrives.
+
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Generated text fragments
+        """
+        def open_stream():
+            tokens = iter(self.client.generate_stream(prompt, temperature, max_tokens))
+            return next(tokens, None), tokens
+
+        first, tokens = self.caller.call(open_stream, hedge=False)
+        try:
+            if first is None:
+                return
+            yield first
+            yield from tokens
+        finally:
+            close = getattr(tokens, "close", None)
+            if close is not None:
+                close()
+
+
+class AsyncResilientLLMClient(AsyncLLMClientProtocol):
+    """Async LLM client whose calls are bounded, retried, hedged and circuit-broken.
+
+    Streams are retried only until their first token and are never hedged.
+    """
+
+    def __init__(
+        self,
+        client: AsyncLLMClientProtocol,
+        policy: ResiliencePolicy,
+        metrics: Optional[PipelineMetricsProtocol] = None
+    ):
+        """Initialize async resilient LLM client.
+
+        Args:
+            client: Client making the upstream calls
+            policy: Timeouts, retries, hedging and breaker settings
+            metrics: Optional recorder of resilience events
+        """
+        self.client = client
+        self.caller = AsyncResilientCaller(policy, metrics)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+    async def generate(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate text under the resilience policy.
+
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Generated text
+        """
+        return await self.caller.call(lambda: self.client.generate(prompt, temperature, max_tokens))
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """Stream generated text, retrying until the first token arrives.
+
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Generated text fragments
+        """
+        async def open_stream():
+            tokens = self.client.generate_stream(prompt, temperature, max_tokens).__aiter__()
+            try:
+                return await tokens.__anext__(), tokens
+            except StopAsyncIteration:
+                return None, tokens
+
+        first, tokens = await self.caller.call(open_stream, hedge=False)
+        try:
+            if first is None:
+                return
+            yield first
+            async for token in tokens:
+                yield token
+        finally:
+            close = getattr(tokens, "aclose", None)
+            if close is not None:
+                await close()
+
+
+class ResilientEmbedding(EmbeddingModelProtocol):
+    """Embedding model whose calls are bounded, retried, hedged and circuit-broken."""
+
+    def __init__(
+        self,
+        model: EmbeddingModelProtocol,
+        policy: ResiliencePolicy,
+        metrics: Optional[PipelineMetricsProtocol] = None
+    ):
+        """Initialize resilient embedding model.
+
+        Args:
+            model: Model making the upstream calls
+            policy: Timeouts, retries, hedging and breaker settings
+            metrics: Optional recorder of resilience events
+        """
+        self.model = model
+        self.caller = ResilientCaller(policy, metrics)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.model, name)
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """Encode texts under the resilience policy.
+
+        Args:
+            texts: List of texts to encode
+
+        Returns:
+            Array of embeddings
+        """
+        return self.caller.call(lambda: self.model.encode(texts))
+
+    def get_dimension(self) -> int:
+        """Get embedding dimension.
+
+        Returns:
+            Embedding dimension
+        """
+        return self.model.get_dimension()
+
+
+class AsyncResilientEmbedding(AsyncEmbeddingModelProtocol):
+    """Async embedding model whose calls are bounded, retried, hedged and circuit-broken."""
+
+    def __init__(
+        self,
+        model: AsyncEmbeddingModelProtocol,
+        policy: ResiliencePolicy,
+        metrics: Optional[PipelineMetricsProtocol] = None
+    ):
+        """Initialize async resilient embedding model.
+
+        Args:
+            model: Model making the upstream calls
+            policy: Timeouts, retries, hedging and breaker settings
+            metrics: Optional recorder of resilience events
+        """
+        self.model = model
+        self.caller = AsyncResilientCaller(policy, metrics)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.model, name)
+
+    async def encode(self, texts: List[str]) -> np.ndarray:
+        """Encode texts under the resilience policy.
+
+        Args:
+            texts: List of texts to encode
+
+        Returns:
+            Array of embeddings
+        """
+        return await self.caller.call(lambda: self.model.encode(texts))
+
+    def get_dimension(self) -> int:
+        """Get embedding dimension.
+
+        Returns:
+            Embedding dimension
+        """
+        return self.model.get_dimension()
@@ -1,6 +1,24 @@
 """Vector store infrastructure module."""
 
-from .qdrant import QdrantVectorStore
-from .factory import create_vector_store
+from .qdrant import QdrantVectorStore, AsyncQdrantVectorStore
+from .numpy_store import NumpyVectorStore
+from .ivf_store import IVFVectorStore
+from .adapter import AsyncVectorStoreAdapter
+from .aliases import QdrantCollectionVersions, alias_target, async_alias_target
+from .ids import content_point_id, point_ids_digest
+from .factory import create_vector_store, create_async_vector_store
 
-__all__ = ["QdrantVectorStore", "create_vector_store"]
+__all__ = [
+    "QdrantVectorStore",
+    "AsyncQdrantVectorStore",
+    "NumpyVectorStore",
+    "IVFVectorStore",
+    "AsyncVectorStoreAdapter",
+    "QdrantCollectionVersions",
+    "alias_target",
+    "async_alias_target",
+    "content_point_id",
+    "point_ids_digest",
+    "create_vector_store",
+    "create_async_vector_store",
+]
@@ -0,0 +1,134 @@
+"""Adapter exposing a synchronous in-process vector store through the async protocol."""
+
+from typing import List, Dict, Any, Optional
+import asyncio
+
+import numpy as np
+
+from ...core.interfaces import VectorStoreProtocol, AsyncVectorStoreProtocol
+
+
+class AsyncVectorStoreAdapter(AsyncVectorStoreProtocol):
+    """Run a synchronous, CPU-bound vector store in worker threads.
+
+    In-process stores do no network I/O, but a matmul over a large matrix
+    still holds the caller for milliseconds; running it in a thread keeps
+    the event loop responsive while NumPy releases the GIL.
+    """
+
+    def __init__(self, store: VectorStoreProtocol):
+        """Initialize adapter.
+
+        Args:
+            store: Synchronous vector store to wrap
+        """
+        self.store = store
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.store, name)
+
+    async def create_collection(self, recreate: bool = False) -> bool:
+        """Create a new collection.
+
+        Args:
+            recreate: Whether to recreate if exists
+
+        Returns:
+            True if successful
+        """
+        return await asyncio.to_thread(self.store.create_collection, recreate)
+
+    async def index_documents(
+        self,
+        embeddings: np.ndarray,
+        chunks: List[Dict[str, Any]]
+    ) -> bool:
+        """Index documents into the vector store.
+
+        Args:
+            embeddings: Document embeddings
+            chunks: Document chunks with metadata
+
+        Returns:
+            True if successful
+        """
+        return await asyncio.to_thread(self.store.index_documents, embeddings, chunks)
+
+    async def get_point_ids(self) -> List[str]:
+        """List the IDs of every indexed point.
+
+        Returns:
+            Point IDs
+        """
+        return await asyncio.to_thread(self.store.get_point_ids)
+
+    async def delete_points(self, point_ids: List[str]) -> bool:
+        """Delete points by ID.
+
+        Args:
+            point_ids: IDs of the points to delete
+
+        Returns:
+            True if successful
+        """
+        return await asyncio.to_thread(self.store.delete_points, point_ids)
+
+    async def search(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = 5,
+        score_threshold: float = 0.0
+    ) -> List[Dict[str, Any]]:
+        """Search for similar documents.
+
+        Args:
+            query_embedding: Query embedding vector
+            top_k: Number of results to return
+            score_threshold: Minimum similarity score
+
+        Returns:
+            List of search results with scores
+        """
+        return await asyncio.to_thread(self.store.search, query_embedding, top_k, score_threshold)
+
+    async def search_batch(
+        self,
+        query_embeddings: np.ndarray,
+        top_k: int = 5,
+        score_threshold: float = 0.0
+    ) -> List[List[Dict[str, Any]]]:
+        """Search for similar documents for several queries at once.
+
+        Args:
+            query_embeddings: Query embedding vectors, one per row
+            top_k: Number of results to return per query
+            score_threshold: Minimum similarity score
+
+        Returns:
+            List of search results per query, in input order
+        """
+        return await asyncio.to_thread(self.store.search_batch, query_embeddings, top_k, score_threshold)
+
+    async def get_collection_info(self) -> Dict[str, Any]:
+        """Get information about the collection.
+
+        Returns:
+            Collection metadata
+        """
+        return self.store.get_collection_info()
+
+    async def health_check(self) -> bool:
+        """Check if the vector store is accessible.
+
+        Returns:
+            True if healthy
+        """
+        return self.store.health_check()
+
+    async def get_index_version(self) -> Optional[str]:
+        """Get a fingerprint that changes whenever the collection is modified.
+
+        Returns:
+            Index version string, or None if it cannot be determined
+        """
+        return self.store.get_index_version()
@@ -0,0 +1,164 @@
+"""Versioned Qdrant collections published through an alias."""
+
+from typing import List, Optional, Tuple, Any
+import logging
+import re
+
+from qdrant_client.models import (
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation
+)
+
+logger = logging.getLogger(__name__)
+
+
+def alias_target(client: Any, alias: str) -> Optional[str]:
+    """Resolve the collection an alias currently points to.
+
+    Args:
+        client: QdrantClient instance
+        alias: Alias name
+
+    Returns:
+        Collection name, or None if ``alias`` is not an alias
+    """
+    for description in client.get_aliases().aliases:
+        if description.alias_name == alias:
+            return description.collection_name
+    return None
+
+
+async def async_alias_target(client: Any, alias: str) -> Optional[str]:
+    """Resolve the collection an alias currently points to.
+
+    Args:
+        client: AsyncQdrantClient instance
+        alias: Alias name
+
+    Returns:
+        Collection name, or None if ``alias`` is not an alias
+    """
+    for description in (await client.get_aliases()).aliases:
+        if description.alias_name == alias:
+            return description.collection_name
+    return None
+
+
+class QdrantCollectionVersions:
+    """Blue/green versions ``{alias}_v{n}`` of one logical collection.
+
+    Readers query the alias; a rebuild fills the next version while the
+    current one keeps serving, then repoints the alias in one atomic
+    ``update_collection_aliases`` call. Retired versions are kept for
+    rollback until ``garbage_collect`` removes them.
+    """
+
+    def __init__(self, client: Any, alias: str):
+        """Initialize version manager.
+
+        Args:
+            client: QdrantClient instance
+            alias: Name readers query, e.g. the configured collection name
+        """
+        self.client = client
+        self.alias = alias
+        self._pattern = re.compile(rf"^{re.escape(alias)}_v(\d+)$")
+
+    def versions(self) -> List[Tuple[int, str]]:
+        """List existing versioned collections.
+
+        Returns:
+            Tuples of (version number, collection name), oldest first
+        """
+        versions = []
+        for collection in self.client.get_collections().collections:
+            match = self._pattern.match(collection.name)
+            if match:
+                versions.append((int(match.group(1)), collection.name))
+        return sorted(versions)
+
+    def current(self) -> Optional[str]:
+        """Get the collection the alias points to.
+
+        Returns:
+            Collection name, or None if the alias does not exist yet
+        """
+        return alias_target(self.client, self.alias)
+
+    def next_name(self) -> str:
+        """Name for the next version, one above the highest existing one.
+
+        Returns:
+            Collection name
+        """
+        versions = self.versions()
+        return f"{self.alias}_v{versions[-1][0] + 1 if versions else 1}"
+
+    def switch(self, collection: str) -> Optional[str]:
+        """Atomically point the alias at ``collection``.
+
+        A plain collection named like the alias (from before versioning)
+        has to be dropped before the alias can take its name; that one-time
+        migration leaves a gap of a single request.
+
+        Args:
+            collection: Collection to publish
+
+        Returns:
+            Collection the alias pointed to before, if any
+        """
+        previous = self.current()
+        operations = []
+        if previous is not None:
+            operations.append(DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=self.alias)))
+        elif any(c.name == self.alias for c in self.client.get_collections().collections):
+            logger.warning(f"Replacing unversioned collection '{self.alias}' with an alias")
+            self.client.delete_collection(collection_name=self.alias)
+
+        operations.append(CreateAliasOperation(
+            create_alias=CreateAlias(collection_name=collection, alias_name=self.alias)
+        ))
+        self.client.update_collection_aliases(change_aliases_operations=operations)
+        logger.info(f"Alias '{self.alias}' now points to {collection} (was {previous})")
+        return previous
+
+    def drop(self, collection: str) -> None:
+        """Delete an unpublished version, e.g. after a failed rebuild.
+
+        Args:
+            collection: Collection to delete
+
+        Raises:
+            ValueError: If the alias currently points to ``collection``
+        """
+        if collection == self.current():
+            raise ValueError(f"Refusing to drop published collection {collection}")
+        self.client.delete_collection(collection_name=collection)
+        logger.info(f"Dropped collection {collection}")
+
+    def garbage_collect(self, keep: int = 1) -> List[str]:
+        """Delete retired versions beyond the ``keep`` most recent ones.
+
+        The published version and any version newer than it (a rebuild in
+        progress) are never deleted.
+
+        Args:
+            keep: Retired versions to keep for rollback
+
+        Returns:
+            Names of deleted collections
+        """
+        current = self.current()
+        versions = self.versions()
+        names = [name for _, name in versions]
+        if current not in names:
+            return []
+
+        retired = names[:names.index(current)]
+        doomed = retired[:max(0, len(retired) - keep)]
+        for name in doomed:
+            self.client.delete_collection(collection_name=name)
+            logger.info(f"Deleted retired collection {name}")
+        return doomed
@@ -2,8 +2,26 @@
 
 from typing import Optional
 
-from ...core.interfaces import VectorStoreProtocol
-from .qdrant import QdrantVectorStore
+from ...core.interfaces import VectorStoreProtocol, AsyncVectorStoreProtocol
+from .qdrant import QdrantVectorStore, AsyncQdrantVectorStore
+from .numpy_store import NumpyVectorStore
+from .ivf_store import IVFVectorStore
+from .adapter import AsyncVectorStoreAdapter
+
+PROVIDERS = ("qdrant", "numpy", "ivf")
+
+
+def _check_provider(provider: str) -> None:
+    """Reject vector store backends this factory does not know.
+
+    Args:
+        provider: Requested backend
+
+    Raises:
+        ValueError: If ``provider`` is not one of ``PROVIDERS``
+    """
+    if provider not in PROVIDERS:
+        raise ValueError(f"Unknown vector store provider {provider!r}, expected one of {PROVIDERS}")
 
 
 def create_vector_store(
@@ -11,7 +29,18 @@ def create_vector_store(
     port: int,
     collection_name: str,
     embedding_dimension: int,
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    provider: str = "qdrant",
+    snapshot_path: Optional[str] = None,
+    mmap: bool = True,
+    ann_nlist: int = 0,
+    ann_nprobe: int = 16,
+    ann_min_train_size: int = 10000,
+    quantization: str = "none",
+    oversampling: float = 2.0,
+    rescore: bool = True,
+    upsert_batch_size: int = 256,
+    upsert_parallel: int = 1
 ) -> VectorStoreProtocol:
     """Create a vector store instance.
 
@@ -21,14 +50,138 @@ def create_vector_store(
         collection_name: Name of the collection
         embedding_dimension: Dimension of embedding vectors
         api_key: Optional API key for cloud services
+        provider: Vector store backend, "qdrant", "numpy" (exact, in-process)
+            or "ivf" (approximate, in-process)
+        snapshot_path: Snapshot directory for the in-process backends
+        mmap: Memory-map snapshot vectors for the in-process backends
+        ann_nlist: IVF list count, 0 for ``sqrt(points)``
+        ann_nprobe: IVF lists scanned per query
+        ann_min_train_size: Points required before the IVF index is built
+        quantization: "none", "int8" or "binary" vector quantization
+        oversampling: Candidates rescored per requested result when quantized
+        rescore: Rescore quantized candidates with full-precision vectors
+        upsert_batch_size: Points per Qdrant upsert request
+        upsert_parallel: Qdrant upsert requests in flight at once
 
     Returns:
         Vector store instance
+
+    Raises:
+        ValueError: If ``provider`` is unknown
     """
+    _check_provider(provider)
+    if provider == "ivf":
+        return IVFVectorStore(
+            collection_name=collection_name,
+            embedding_dimension=embedding_dimension,
+            snapshot_path=snapshot_path,
+            mmap=mmap,
+            nlist=ann_nlist,
+            nprobe=ann_nprobe,
+            min_train_size=ann_min_train_size,
+            quantization=quantization,
+            oversampling=oversampling,
+            rescore=rescore
+        )
+
+    if provider == "numpy":
+        return NumpyVectorStore(
+            collection_name=collection_name,
+            embedding_dimension=embedding_dimension,
+            snapshot_path=snapshot_path,
+            mmap=mmap,
+            quantization=quantization,
+            oversampling=oversampling,
+            rescore=rescore
+        )
+
     return QdrantVectorStore(
         host=host,
         port=port,
         collection_name=collection_name,
         embedding_dimension=embedding_dimension,
-        api_key=api_key
+        api_key=api_key,
+        quantization=quantization,
+        oversampling=oversampling,
+        rescore=rescore,
+        upsert_batch_size=upsert_batch_size,
+        upsert_parallel=upsert_parallel
+    )
+
+
+def create_async_vector_store(
+    host: str,
+    port: int,
+    collection_name: str,
+    embedding_dimension: int,
+    api_key: Optional[str] = None,
+    provider: str = "qdrant",
+    snapshot_path: Optional[str] = None,
+    mmap: bool = True,
+    ann_nlist: int = 0,
+    ann_nprobe: int = 16,
+    ann_min_train_size: int = 10000,
+    quantization: str = "none",
+    oversampling: float = 2.0,
+    rescore: bool = True,
+    upsert_batch_size: int = 256,
+    upsert_parallel: int = 1
+) -> AsyncVectorStoreProtocol:
+    """Create an asynchronous vector store instance.
+
+    Args:
+        host: Vector store host
+        port: Vector store port
+        collection_name: Name of the collection
+        embedding_dimension: Dimension of embedding vectors
+        api_key: Optional API key for cloud services
+        provider: Vector store backend, "qdrant", "numpy" (exact, in-process)
+            or "ivf" (approximate, in-process)
+        snapshot_path: Snapshot directory for the in-process backends
+        mmap: Memory-map snapshot vectors for the in-process backends
+        ann_nlist: IVF list count, 0 for ``sqrt(points)``
+        ann_nprobe: IVF lists scanned per query
+        ann_min_train_size: Points required before the IVF index is built
+        quantization: "none", "int8" or "binary" vector quantization
+        oversampling: Candidates rescored per requested result when quantized
+        rescore: Rescore quantized candidates with full-precision vectors
+        upsert_batch_size: Points per Qdrant upsert request
+        upsert_parallel: Qdrant upsert requests in flight at once
+
+    Returns:
+        Async vector store instance
+
+    Raises:
+        ValueError: If ``provider`` is unknown
+    """
+    _check_provider(provider)
+    if provider != "qdrant":
+        return AsyncVectorStoreAdapter(create_vector_store(
+            host=host,
+            port=port,
+            collection_name=collection_name,
+            embedding_dimension=embedding_dimension,
+            api_key=api_key,
+            provider=provider,
+            snapshot_path=snapshot_path,
+            mmap=mmap,
+            ann_nlist=ann_nlist,
+            ann_nprobe=ann_nprobe,
+            ann_min_train_size=ann_min_train_size,
+            quantization=quantization,
+            oversampling=oversampling,
+            rescore=rescore
+        ))
+
+    return AsyncQdrantVectorStore(
+        host=host,
+        port=port,
+        collection_name=collection_name,
+        embedding_dimension=embedding_dimension,
+        api_key=api_key,
+        quantization=quantization,
+        oversampling=oversampling,
+        rescore=rescore,
+        upsert_batch_size=upsert_batch_size,
+        upsert_parallel=upsert_parallel
     )
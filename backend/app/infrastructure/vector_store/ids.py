@@ -0,0 +1,42 @@
+"""Deterministic point IDs derived from chunk content."""
+
+from typing import Dict, Any, Iterable
+import hashlib
+import json
+import uuid
+
+PAYLOAD_FIELDS = ("question", "answer", "category", "content")
+
+POINT_ID_NAMESPACE = uuid.UUID("6f1f7a52-3c1e-4b8e-9a57-2d0c5e4b9f10")
+
+
+def content_point_id(chunk: Dict[str, Any]) -> str:
+    """Derive a point ID from the fields stored in a chunk's payload.
+
+    Identical content always maps to the same ID, so re-indexing unchanged
+    rows overwrites them in place, and an edited row gets a new ID while
+    its old point becomes stale.
+
+    Args:
+        chunk: Document chunk
+
+    Returns:
+        UUID string accepted by every vector store provider
+    """
+    key = json.dumps([str(chunk.get(field, "") or "") for field in PAYLOAD_FIELDS], ensure_ascii=False)
+    return str(uuid.uuid5(POINT_ID_NAMESPACE, key))
+
+
+def point_ids_digest(point_ids: Iterable[str]) -> str:
+    """Fingerprint a set of content-derived point IDs.
+
+    Args:
+        point_ids: Point IDs in any order
+
+    Returns:
+        Short hex digest that changes whenever any indexed content changes
+    """
+    digest = hashlib.sha256()
+    for point_id in sorted(str(point_id) for point_id in point_ids):
+        digest.update(point_id.encode("ascii"))
+    return digest.hexdigest()[:16]
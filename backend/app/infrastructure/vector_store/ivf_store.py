@@ -0,0 +1,391 @@
+"""In-process approximate vector store using an inverted-file (IVF) index."""
+
+from typing import List, Optional, Dict, Any, Tuple, NamedTuple
+import logging
+import os
+
+import numpy as np
+
+from .numpy_store import NumpyVectorStore, StoreState, _normalize_rows
+
+logger = logging.getLogger(__name__)
+
+ASSIGN_CHUNK_ROWS = 16384
+
+
+class IVFIndex(NamedTuple):
+    """Coarse quantizer and list layout of one store generation.
+
+    Rows ``[0, sorted_count)`` of the store matrix are grouped by list, list
+    ``c`` occupying ``[offsets[c], offsets[c + 1])``. Rows appended since the
+    last (re)build form an unsorted tail whose lists are in ``tail_lists``.
+    """
+    centroids: np.ndarray
+    offsets: np.ndarray
+    sorted_count: int
+    tail_lists: np.ndarray
+    trained_on: int
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Assign normalized rows to their most similar centroid.
+
+    Args:
+        vectors: Normalized rows
+        centroids: Normalized centroids
+
+    Returns:
+        List index per row
+    """
+    assignments = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), ASSIGN_CHUNK_ROWS):
+        chunk = np.asarray(vectors[start:start + ASSIGN_CHUNK_ROWS])
+        assignments[start:start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+    return assignments
+
+
+def _train_centroids(
+    vectors: np.ndarray,
+    nlist: int,
+    iterations: int,
+    sample_size: int,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """Train a spherical k-means coarse quantizer on a sample of rows.
+
+    Args:
+        vectors: Normalized rows
+        nlist: Number of centroids
+        iterations: Lloyd iterations
+        sample_size: Maximum number of training rows
+        rng: Random generator
+
+    Returns:
+        Normalized centroid matrix of shape (nlist, dimension)
+    """
+    n = len(vectors)
+    sample_rows = np.sort(rng.choice(n, size=min(n, sample_size), replace=False))
+    sample = np.ascontiguousarray(vectors[sample_rows], dtype=np.float32)
+    centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+
+    for _ in range(iterations):
+        assignments = _assign(sample, centroids)
+        order = np.argsort(assignments, kind="stable")
+        counts = np.bincount(assignments, minlength=nlist)
+        occupied = np.flatnonzero(counts)
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])[occupied]
+        centroids[occupied] = np.add.reduceat(sample[order], starts, axis=0)
+
+        # Reseed empty lists from random samples so every list stays usable.
+        empty = np.flatnonzero(counts == 0)
+        if len(empty):
+            centroids[empty] = sample[rng.choice(len(sample), size=len(empty), replace=False)]
+        centroids = _normalize_rows(centroids)
+
+    return centroids
+
+
+class IVFVectorStore(NumpyVectorStore):
+    """Approximate cosine vector store with an IVF-Flat index.
+
+    A k-means coarse quantizer splits the collection into ``nlist`` lists and
+    the store matrix is kept physically grouped by list, so a query scores
+    its ``nprobe`` closest lists as contiguous slices instead of the whole
+    matrix. New points are assigned to their list on insert and kept in an
+    unsorted tail that is merged once it grows past ``compact_ratio``; the
+    quantizer is retrained when the collection quadruples.
+
+    Collections smaller than ``min_train_size`` are searched exactly.
+    """
+
+    def __init__(
+        self,
+        collection_name: str,
+        embedding_dimension: int,
+        snapshot_path: Optional[str] = None,
+        mmap: bool = True,
+        nlist: int = 0,
+        nprobe: int = 16,
+        min_train_size: int = 10000,
+        kmeans_iterations: int = 10,
+        train_samples_per_list: int = 64,
+        compact_ratio: float = 0.1,
+        seed: int = 0,
+        quantization: str = "none",
+        oversampling: float = 2.0,
+        rescore: bool = True
+    ):
+        """Initialize IVF vector store.
+
+        Args:
+            collection_name: Name reported for the collection
+            embedding_dimension: Dimension of embedding vectors
+            snapshot_path: Optional snapshot directory, loaded if present and
+                rewritten by ``flush``
+            mmap: Memory-map snapshot vectors instead of reading them into RAM
+            nlist: Number of inverted lists, 0 for ``sqrt(points)``
+            nprobe: Lists scanned per query; higher trades latency for recall
+            min_train_size: Points required before the index is built
+            kmeans_iterations: Lloyd iterations when training the quantizer
+            train_samples_per_list: Training rows sampled per list
+            compact_ratio: Unsorted tail fraction that triggers a merge
+            seed: Seed for training sample and centroid initialization
+            quantization: "none", "int8" or "binary" codes for list scans
+            oversampling: Candidates rescored per requested result
+            rescore: Rescore quantized candidates with full-precision vectors
+        """
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.min_train_size = min_train_size
+        self.kmeans_iterations = kmeans_iterations
+        self.train_samples_per_list = train_samples_per_list
+        self.compact_ratio = compact_ratio
+        self.seed = seed
+        super().__init__(
+            collection_name,
+            embedding_dimension,
+            snapshot_path=snapshot_path,
+            mmap=mmap,
+            quantization=quantization,
+            oversampling=oversampling,
+            rescore=rescore
+        )
+
+    def _target_nlist(self, n: int) -> int:
+        """Number of lists to train for ``n`` points."""
+        nlist = self.nlist or int(round(np.sqrt(n)))
+        return max(1, min(nlist, n))
+
+    def _build(self, state: StoreState) -> StoreState:
+        """Train the quantizer and regroup every row by list.
+
+        Args:
+            state: Generation to index
+
+        Returns:
+            Indexed generation
+        """
+        n = len(state.vectors)
+        nlist = self._target_nlist(n)
+        centroids = _train_centroids(
+            state.vectors,
+            nlist,
+            self.kmeans_iterations,
+            nlist * self.train_samples_per_list,
+            np.random.default_rng(self.seed)
+        )
+        assignments = _assign(state.vectors, centroids)
+        logger.info(f"Built IVF index over {n} vectors with {nlist} lists")
+        return self._regroup(state, centroids, assignments, trained_on=n)
+
+    def _regroup(
+        self,
+        state: StoreState,
+        centroids: np.ndarray,
+        assignments: np.ndarray,
+        trained_on: int
+    ) -> StoreState:
+        """Reorder rows and payloads so each list is one contiguous slice.
+
+        Args:
+            state: Generation to reorder
+            centroids: Trained centroids
+            assignments: List index per row
+            trained_on: Collection size the centroids were trained on
+
+        Returns:
+            Reordered generation with a fully sorted index
+        """
+        order = np.argsort(assignments, kind="stable")
+        counts = np.bincount(assignments, minlength=len(centroids))
+        index = IVFIndex(
+            centroids=centroids,
+            offsets=np.concatenate([[0], np.cumsum(counts)]).astype(np.int64),
+            sorted_count=len(order),
+            tail_lists=np.zeros(0, dtype=np.int32),
+            trained_on=trained_on
+        )
+        return state._replace(
+            vectors=np.ascontiguousarray(state.vectors[order]),
+            ids=state.ids.take(order),
+            columns={field: column.take(order) for field, column in state.columns.items()},
+            index=index,
+            codes=state.codes[order] if state.codes is not None else None
+        )
+
+    def _update_index(self, previous: StoreState, state: StoreState) -> StoreState:
+        """Assign appended rows to lists, merging or retraining when due.
+
+        Args:
+            previous: Generation before the append
+            state: Generation including the appended rows
+
+        Returns:
+            Generation to publish
+        """
+        n = len(state.vectors)
+        index = state.index
+        if index is None:
+            return self._build(state) if n >= self.min_train_size else state
+        if n >= 4 * index.trained_on:
+            return self._build(state)
+
+        new_lists = _assign(state.vectors[len(previous.vectors):], index.centroids)
+        tail_lists = np.concatenate([index.tail_lists, new_lists])
+        if len(tail_lists) > self.compact_ratio * index.sorted_count:
+            sorted_lists = np.repeat(
+                np.arange(len(index.centroids), dtype=np.int32),
+                np.diff(index.offsets)
+            )
+            return self._regroup(
+                state,
+                index.centroids,
+                np.concatenate([sorted_lists, tail_lists]),
+                trained_on=index.trained_on
+            )
+        return state._replace(index=index._replace(tail_lists=tail_lists))
+
+    def _filter_index(self, state: StoreState, keep: np.ndarray) -> Optional[IVFIndex]:
+        """Shrink list offsets and the tail after rows are removed.
+
+        Removal preserves row order, so every list stays contiguous and only
+        the offsets change.
+
+        Args:
+            state: Generation before the removal
+            keep: Boolean mask of rows to keep
+
+        Returns:
+            Adjusted index, or None if the store was not indexed
+        """
+        index = state.index
+        if index is None:
+            return None
+
+        nlist = len(index.centroids)
+        sorted_lists = np.repeat(np.arange(nlist, dtype=np.int32), np.diff(index.offsets))
+        sorted_keep = keep[:index.sorted_count]
+        counts = np.bincount(sorted_lists[sorted_keep], minlength=nlist)
+        return index._replace(
+            offsets=np.concatenate([[0], np.cumsum(counts)]).astype(np.int64),
+            sorted_count=int(sorted_keep.sum()),
+            tail_lists=index.tail_lists[keep[index.sorted_count:]]
+        )
+
+    def build_index(self) -> None:
+        """Retrain the quantizer over the current collection and persist it."""
+        with self._lock:
+            if len(self._state.vectors):
+                self._state = self._build(self._state)
+                self._dirty = True
+        self.flush()
+
+    def _candidates(self, state: StoreState, query: np.ndarray) -> Tuple[Optional[np.ndarray], np.ndarray]:
+        """Score rows of the ``nprobe`` lists closest to the query.
+
+        Args:
+            state: Generation to search
+            query: Normalized query vector
+
+        Returns:
+            Tuple of (candidate row indices, scores)
+        """
+        index = state.index
+        if index is None:
+            return super()._candidates(state, query)
+
+        nlist = len(index.centroids)
+        nprobe = max(1, min(self.nprobe, nlist))
+        centroid_scores = index.centroids @ query
+        if nprobe < nlist:
+            probes = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+        else:
+            probes = np.arange(nlist)
+
+        rows, scores = [], []
+        for list_id in probes:
+            start, end = index.offsets[list_id], index.offsets[list_id + 1]
+            if end > start:
+                rows.append(np.arange(start, end))
+                scores.append(self._score_range(state, query, start, end))
+
+        if len(index.tail_lists):
+            tail_rows = index.sorted_count + np.flatnonzero(np.isin(index.tail_lists, probes))
+            if len(tail_rows):
+                rows.append(tail_rows)
+                scores.append(self._score_rows(state, query, tail_rows))
+
+        if not rows:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        return np.concatenate(rows), np.concatenate(scores)
+
+    def get_collection_info(self) -> Dict[str, Any]:
+        """Get information about the collection and its index.
+
+        Returns:
+            Collection metadata
+        """
+        info = super().get_collection_info()
+        index = self._state.index
+        info["index"] = {
+            "type": "ivf_flat",
+            "trained": index is not None,
+            "nlist": len(index.centroids) if index is not None else 0,
+            "nprobe": self.nprobe,
+            "unsorted_points": len(index.tail_lists) if index is not None else 0
+        }
+        return info
+
+    def _save_index(self, state: StoreState, path: str) -> List[str]:
+        """Write the quantizer and list layout as ``ivf.npz``.
+
+        Args:
+            state: Generation being saved
+            path: Snapshot directory
+
+        Returns:
+            Final file names written
+        """
+        index = state.index
+        if index is None:
+            stale = os.path.join(path, "ivf.npz")
+            if os.path.exists(stale):
+                os.remove(stale)
+            return []
+
+        np.savez(
+            os.path.join(path, "ivf.tmp.npz"),
+            centroids=index.centroids,
+            offsets=index.offsets,
+            sorted_count=index.sorted_count,
+            tail_lists=index.tail_lists,
+            trained_on=index.trained_on
+        )
+        return ["ivf.npz"]
+
+    def _load_index(self, state: StoreState, path: str) -> StoreState:
+        """Restore ``ivf.npz``, rebuilding the index if missing or stale.
+
+        Args:
+            state: Generation loaded from the base snapshot files
+            path: Snapshot directory
+
+        Returns:
+            Generation to publish
+        """
+        n = len(state.vectors)
+        index_path = os.path.join(path, "ivf.npz")
+        if os.path.exists(index_path):
+            with np.load(index_path) as saved:
+                index = IVFIndex(
+                    centroids=saved["centroids"],
+                    offsets=saved["offsets"],
+                    sorted_count=int(saved["sorted_count"]),
+                    tail_lists=saved["tail_lists"],
+                    trained_on=int(saved["trained_on"])
+                )
+            if index.sorted_count + len(index.tail_lists) == n and index.centroids.shape[1] == self.embedding_dimension:
+                return state._replace(index=index)
+            logger.warning(f"IVF index in {path} does not match snapshot, rebuilding")
+
+        return self._build(state) if n >= self.min_train_size else state
@@ -0,0 +1,953 @@
+"""In-process vector store backed by a contiguous NumPy matrix."""
+
+from typing import List, Optional, Dict, Any, Iterable, Tuple, NamedTuple
+import json
+import logging
+import os
+import tempfile
+import threading
+import uuid
+
+import numpy as np
+
+from ...core.interfaces import VectorStoreProtocol
+from .quantization import (
+    check_quantization,
+    fit_quantizer,
+    quantizer_from_dict,
+    sample_rows,
+    SCORE_CHUNK_ROWS
+)
+from .ids import content_point_id, PAYLOAD_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# Query-by-row scores materialized at once by ``search_batch`` (64 MiB of float32).
+BATCH_SCORE_ELEMENTS = 1 << 24
+
+
+class _RowBuffer:
+    """Preallocated rows with spare capacity that doubles when exhausted.
+
+    Appending to the view returned last writes into the spare rows and
+    returns a longer view of the same buffer, so each row is copied O(1)
+    times amortized. Rows of views handed out earlier are never touched, so
+    concurrent readers keep a consistent generation.
+    """
+
+    def __init__(self, file_dir: Optional[str] = None):
+        """Initialize row buffer.
+
+        Args:
+            file_dir: Back the buffer with an unlinked temporary file in this
+                directory instead of anonymous memory, so rows stay pageable
+                like a memory-mapped snapshot
+        """
+        self.file_dir = file_dir
+        self._buffer: Optional[np.ndarray] = None
+        self._view: Optional[np.ndarray] = None
+
+    def append(self, current: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Return ``current`` followed by ``rows``.
+
+        Args:
+            current: Rows so far
+            rows: Rows to append
+
+        Returns:
+            View over the buffer holding both
+        """
+        n, m = len(current), len(rows)
+        if self._view is not current or n + m > len(self._buffer):
+            buffer = self._allocate(max(n + m, 2 * n), rows)
+            buffer[:n] = current
+            self._buffer = buffer
+        self._buffer[n:n + m] = rows
+        self._view = self._buffer[:n + m]
+        return self._view
+
+    def _allocate(self, capacity: int, like: np.ndarray) -> np.ndarray:
+        """Allocate an uninitialized buffer for ``capacity`` rows shaped like ``like``."""
+        shape = (capacity,) + like.shape[1:]
+        if self.file_dir is None:
+            return np.empty(shape, dtype=like.dtype)
+        os.makedirs(self.file_dir, exist_ok=True)
+        with tempfile.TemporaryFile(dir=self.file_dir) as f:
+            # The mapping keeps its own handle, so the file can close (and
+            # disappear) right away.
+            return np.memmap(f, dtype=like.dtype, mode="w+", shape=shape)
+
+
+class StringColumn:
+    """Append-only UTF-8 string column stored as one byte buffer plus offsets.
+
+    Avoids one Python object per cell, so payloads of large collections stay
+    a few flat arrays.
+    """
+
+    def __init__(self, data: Optional[np.ndarray] = None, offsets: Optional[np.ndarray] = None):
+        """Initialize string column.
+
+        Args:
+            data: Concatenated UTF-8 bytes
+            offsets: Start offset of each value, with a trailing end offset
+        """
+        self.data = data if data is not None else np.zeros(0, dtype=np.uint8)
+        self.offsets = offsets if offsets is not None else np.zeros(1, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.data[start:end].tobytes().decode("utf-8")
+
+    def to_list(self) -> List[str]:
+        """Decode every value.
+
+        Returns:
+            Values in row order
+        """
+        data = self.data.tobytes()
+        offsets = self.offsets.tolist()
+        return [data[start:end].decode("utf-8") for start, end in zip(offsets[:-1], offsets[1:])]
+
+    def take(self, order: np.ndarray) -> "StringColumn":
+        """Return a new column with values reordered by ``order``.
+
+        Args:
+            order: Row indices in the desired order
+
+        Returns:
+            Reordered column, gathered without decoding any string
+        """
+        starts = self.offsets[:-1][order]
+        lengths = (self.offsets[1:] - self.offsets[:-1])[order]
+        new_offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        gather = np.repeat(starts - new_offsets[:-1], lengths) + np.arange(new_offsets[-1])
+        return StringColumn(self.data[gather], new_offsets)
+
+    def extended(
+        self,
+        values: List[str],
+        buffers: Optional[Tuple[_RowBuffer, _RowBuffer]] = None
+    ) -> "StringColumn":
+        """Return a new column with values appended.
+
+        Args:
+            values: Strings to append
+            buffers: Optional growable buffers for the data and offsets, so
+                repeated appends do not copy the whole column
+
+        Returns:
+            New column; the original is left untouched for concurrent readers
+        """
+        encoded = [str(v).encode("utf-8") for v in values]
+        lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64, count=len(encoded))
+        new_offsets = self.offsets[-1] + np.cumsum(lengths)
+        new_data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        if buffers is None:
+            return StringColumn(
+                np.concatenate([self.data, new_data]),
+                np.concatenate([self.offsets, new_offsets])
+            )
+        data_buffer, offsets_buffer = buffers
+        return StringColumn(
+            data_buffer.append(self.data, new_data),
+            offsets_buffer.append(self.offsets, new_offsets)
+        )
+
+
+class StoreState(NamedTuple):
+    """One immutable generation of store contents, swapped in atomically."""
+    vectors: np.ndarray
+    ids: StringColumn
+    columns: Dict[str, StringColumn]
+    version: str
+    index: Any = None
+    quantizer: Any = None
+    codes: Optional[np.ndarray] = None
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize rows into a contiguous float32 matrix."""
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class NumpyVectorStore(VectorStoreProtocol):
+    """Brute-force cosine vector store living entirely in process memory.
+
+    Vectors are kept normalized in a contiguous float32 matrix (optionally
+    memory-mapped from a ``.npy`` snapshot), so top-k is a single matmul
+    plus ``argpartition``. Mutations build a new ``StoreState`` and swap it
+    in, so searches running concurrently always see one consistent generation.
+    Appended rows go into buffers with spare capacity, so an upsert costs
+    time proportional to its own size rather than to the collection.
+
+    With ``quantization`` set, int8 or binary codes are kept next to the
+    vectors and scanned instead; the best ``top_k * oversampling`` candidates
+    are then rescored against the full-precision rows. Paired with a
+    memory-mapped snapshot only the codes need to stay resident.
+
+    Writes only change memory; ``flush`` persists the snapshot, so a sync
+    of many batches rewrites it once.
+    """
+
+    def __init__(
+        self,
+        collection_name: str,
+        embedding_dimension: int,
+        snapshot_path: Optional[str] = None,
+        mmap: bool = True,
+        quantization: str = "none",
+        oversampling: float = 2.0,
+        rescore: bool = True
+    ):
+        """Initialize NumPy vector store.
+
+        Args:
+            collection_name: Name reported for the collection
+            embedding_dimension: Dimension of embedding vectors
+            snapshot_path: Optional snapshot directory, loaded if present and
+                rewritten by ``flush``
+            mmap: Memory-map snapshot vectors instead of reading them into RAM
+            quantization: "none", "int8" or "binary"
+            oversampling: Candidates rescored per requested result
+            rescore: Rescore quantized candidates with full-precision vectors
+
+        Raises:
+            ValueError: If ``quantization`` is unknown
+        """
+        check_quantization(quantization)
+        self.collection_name = collection_name
+        self.embedding_dimension = embedding_dimension
+        self.snapshot_path = snapshot_path
+        self.mmap = mmap
+        self.quantization = quantization
+        self.oversampling = oversampling
+        self.rescore = rescore
+
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._buffers = {
+            "vectors": _RowBuffer(snapshot_path if snapshot_path and mmap else None),
+            "codes": _RowBuffer(),
+            "ids": (_RowBuffer(), _RowBuffer()),
+            **{field: (_RowBuffer(), _RowBuffer()) for field in PAYLOAD_FIELDS}
+        }
+        self._reset()
+
+        if snapshot_path and os.path.exists(os.path.join(snapshot_path, "vectors.npy")):
+            self.load_snapshot(snapshot_path, mmap=mmap)
+
+    def _reset(self) -> None:
+        """Drop all points and start a new index generation."""
+        self._state = StoreState(
+            vectors=np.zeros((0, self.embedding_dimension), dtype=np.float32),
+            ids=StringColumn(),
+            columns={field: StringColumn() for field in PAYLOAD_FIELDS},
+            version=uuid.uuid4().hex
+        )
+        self._rows: Dict[str, int] = {}
+        self._rows_ids = self._state.ids
+
+    def _row_map(self, state: StoreState) -> Dict[str, int]:
+        """Map point IDs to their rows in ``state``.
+
+        The map is updated in place by appends and deletions and rebuilt
+        from the ID column only when rows were reordered or loaded from a
+        snapshot. Callers must hold ``_lock``.
+
+        Args:
+            state: Current generation
+
+        Returns:
+            Row index per point ID
+        """
+        if self._rows_ids is not state.ids:
+            self._rows = {point_id: row for row, point_id in enumerate(state.ids.to_list())}
+            self._rows_ids = state.ids
+        return self._rows
+
+    def _drop_rows(self, state: StoreState, keep: np.ndarray) -> StoreState:
+        """Filter rows out of the current generation and remap the row map.
+
+        Args:
+            state: Current generation
+            keep: Boolean mask of rows to keep
+
+        Returns:
+            Filtered generation
+        """
+        rows = self._row_map(state)
+        filtered = self._filter_rows(state, keep)
+        kept = keep.tolist()
+        new_rows = (np.cumsum(keep) - 1).tolist()
+        self._rows = {point_id: new_rows[row] for point_id, row in rows.items() if kept[row]}
+        self._rows_ids = filtered.ids
+        return filtered
+
+    def _append(
+        self,
+        vectors: np.ndarray,
+        ids: List[str],
+        payloads: List[Dict[str, Any]]
+    ) -> None:
+        """Append normalized vectors and payloads as a new generation.
+
+        Existing points with the same IDs are replaced, so appending is an
+        upsert.
+
+        Args:
+            vectors: Raw embeddings
+            ids: Point IDs
+            payloads: Payload dictionaries
+        """
+        normalized = _normalize_rows(vectors)
+        with self._lock:
+            state = self._state
+            rows = self._row_map(state)
+            replaced = [rows[point_id] for point_id in set(ids) if point_id in rows]
+            if replaced:
+                keep = np.ones(len(state.vectors), dtype=bool)
+                keep[replaced] = False
+                state = self._drop_rows(state, keep)
+            vectors = self._buffers["vectors"].append(state.vectors, normalized)
+            quantizer, codes = state.quantizer, state.codes
+            if quantizer is None or quantizer.needs_refit(len(vectors)):
+                # Fit on a sample of the whole store, not just this batch,
+                # and re-encode every row with the new parameters.
+                quantizer, codes = self._encode_rows(vectors)
+            else:
+                codes = self._buffers["codes"].append(codes, quantizer.encode(normalized))
+
+            appended = StoreState(
+                vectors=vectors,
+                ids=state.ids.extended(ids, self._buffers["ids"]),
+                columns={
+                    field: state.columns[field].extended([p.get(field, "") for p in payloads], self._buffers[field])
+                    for field in PAYLOAD_FIELDS
+                },
+                version=uuid.uuid4().hex,
+                index=state.index,
+                quantizer=quantizer,
+                codes=codes
+            )
+            self._state = self._update_index(state, appended)
+            self._dirty = True
+            if self._state.ids is appended.ids:
+                # Rows were appended in place; extend the map instead of
+                # rebuilding it.
+                self._rows.update((point_id, len(state.vectors) + i) for i, point_id in enumerate(ids))
+                self._rows_ids = appended.ids
+
+    def _filter_rows(self, state: StoreState, keep: np.ndarray) -> StoreState:
+        """Drop rows from a generation, preserving the order of the rest.
+
+        Args:
+            state: Generation to filter
+            keep: Boolean mask of rows to keep
+
+        Returns:
+            New generation without the dropped rows
+        """
+        rows = np.flatnonzero(keep)
+        return state._replace(
+            vectors=np.ascontiguousarray(state.vectors[rows]),
+            ids=state.ids.take(rows),
+            columns={field: column.take(rows) for field, column in state.columns.items()},
+            version=uuid.uuid4().hex,
+            index=self._filter_index(state, keep),
+            codes=state.codes[rows] if state.codes is not None else None
+        )
+
+    def _filter_index(self, state: StoreState, keep: np.ndarray) -> Any:
+        """Hook for subclasses adjusting their index when rows are removed.
+
+        Args:
+            state: Generation before the removal
+            keep: Boolean mask of rows to keep
+
+        Returns:
+            Index for the filtered generation
+        """
+        return state.index
+
+    def _update_index(self, previous: StoreState, state: StoreState) -> StoreState:
+        """Hook for subclasses maintaining an index over appended rows.
+
+        Args:
+            previous: Generation before the append
+            state: Generation including the appended rows
+
+        Returns:
+            Generation to publish
+        """
+        return state
+
+    def create_collection(self, recreate: bool = False) -> bool:
+        """Create a new collection.
+
+        Args:
+            recreate: Whether to drop existing points
+
+        Returns:
+            True if successful
+        """
+        if recreate or not len(self._state.vectors):
+            with self._lock:
+                self._reset()
+                self._dirty = True
+            logger.info(f"Collection created: {self.collection_name}")
+        else:
+            logger.info(f"Collection already exists: {self.collection_name}")
+        return True
+
+    def index_documents(
+        self,
+        embeddings: np.ndarray,
+        chunks: List[Dict[str, Any]]
+    ) -> bool:
+        """Upsert documents under content-derived IDs.
+
+        Args:
+            embeddings: Document embeddings
+            chunks: Document chunks with metadata
+
+        Returns:
+            True if successful
+        """
+        try:
+            if len(embeddings) != len(chunks):
+                logger.error("Mismatch between embeddings and chunks count")
+                return False
+
+            # Identical chunks share an ID; keep the last of each.
+            rows = {content_point_id(chunk): row for row, chunk in enumerate(chunks)}
+            rows = list(rows.values())
+            self._append(
+                np.asarray(embeddings)[rows],
+                [content_point_id(chunks[row]) for row in rows],
+                [chunks[row] for row in rows]
+            )
+            logger.info(f"Indexed {len(chunks)} documents to {self.collection_name}")
+            return True
+        except Exception as e:
+            logger.error(f"Error indexing documents: {e}")
+            return False
+
+    def search(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = 5,
+        score_threshold: float = 0.0
+    ) -> List[Dict[str, Any]]:
+        """Search for similar documents with one matmul and argpartition.
+
+        Args:
+            query_embedding: Query embedding vector
+            top_k: Number of results to return
+            score_threshold: Minimum similarity score
+
+        Returns:
+            List of search results with scores
+        """
+        try:
+            state = self._state
+            if len(state.vectors) == 0 or top_k <= 0:
+                return []
+
+            query = _normalize_rows(np.asarray(query_embedding))[0]
+            results = self._search_state(state, query, top_k, score_threshold)
+
+            logger.info(f"Found {len(results)} similar documents")
+            return results
+        except Exception as e:
+            logger.error(f"Error searching documents: {e}")
+            return []
+
+    def _search_state(
+        self,
+        state: StoreState,
+        query: np.ndarray,
+        top_k: int,
+        score_threshold: float
+    ) -> List[Dict[str, Any]]:
+        """Search one generation for a normalized query.
+
+        Args:
+            state: Generation to search
+            query: Normalized query vector
+            top_k: Number of results to return
+            score_threshold: Minimum similarity score
+
+        Returns:
+            List of search results with scores
+        """
+        rows, scores = self._candidates(state, query)
+        if state.codes is not None and self.rescore:
+            rows, scores = self._rescore(state, query, rows, scores, top_k)
+        return self._top_k(state, rows, scores, top_k, score_threshold)
+
+    def search_batch(
+        self,
+        query_embeddings: np.ndarray,
+        top_k: int = 5,
+        score_threshold: float = 0.0
+    ) -> List[List[Dict[str, Any]]]:
+        """Search for similar documents for several queries at once.
+
+        Without quantization or an ANN index, a block of queries is scored
+        against every row with one matmul and a row-wise ``argpartition``;
+        blocks are sized so at most ``BATCH_SCORE_ELEMENTS`` scores exist at
+        a time. Other configurations search query by query.
+
+        Args:
+            query_embeddings: Query embedding vectors, one per row
+            top_k: Number of results to return per query
+            score_threshold: Minimum similarity score
+
+        Returns:
+            List of search results per query, in input order
+        """
+        try:
+            state = self._state
+            n = len(state.vectors)
+            if n == 0 or top_k <= 0:
+                return [[] for _ in query_embeddings]
+
+            queries = _normalize_rows(np.asarray(query_embeddings))
+            if state.codes is not None or state.index is not None:
+                return [self._search_state(state, query, top_k, score_threshold) for query in queries]
+
+            k = min(top_k, n)
+            block_size = max(1, BATCH_SCORE_ELEMENTS // n)
+            results = []
+            for start in range(0, len(queries), block_size):
+                scores = queries[start:start + block_size] @ state.vectors.T
+                if k < n:
+                    candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                else:
+                    candidates = np.broadcast_to(np.arange(n), scores.shape)
+                for row_scores, rows in zip(scores, candidates):
+                    results.append(self._top_k(state, rows, row_scores[rows], top_k, score_threshold))
+
+            logger.info(f"Searched {len(queries)} queries in one batch")
+            return results
+        except Exception as e:
+            logger.error(f"Error searching documents: {e}")
+            return [[] for _ in query_embeddings]
+
+    def _candidates(self, state: StoreState, query: np.ndarray) -> Tuple[Optional[np.ndarray], np.ndarray]:
+        """Score candidate rows for a normalized query.
+
+        Args:
+            state: Generation to search
+            query: Normalized query vector
+
+        Returns:
+            Tuple of (candidate row indices or None for all rows, scores)
+        """
+        return None, self._score_range(state, query, 0, len(state.vectors))
+
+    def _score_range(self, state: StoreState, query: np.ndarray, start: int, end: int) -> np.ndarray:
+        """Score a contiguous row range, using codes when quantized.
+
+        Args:
+            state: Generation to search
+            query: Normalized query vector
+            start: First row
+            end: Row after the last
+
+        Returns:
+            Scores of rows ``[start, end)``
+        """
+        if state.codes is not None:
+            return state.quantizer.score(state.codes[start:end], query)
+        return state.vectors[start:end] @ query
+
+    def _score_rows(self, state: StoreState, query: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Score arbitrary rows, using codes when quantized.
+
+        Args:
+            state: Generation to search
+            query: Normalized query vector
+            rows: Row indices
+
+        Returns:
+            Scores aligned with ``rows``
+        """
+        if state.codes is not None:
+            return state.quantizer.score(state.codes[rows], query)
+        return state.vectors[rows] @ query
+
+    def _rescore(
+        self,
+        state: StoreState,
+        query: np.ndarray,
+        rows: Optional[np.ndarray],
+        scores: np.ndarray,
+        top_k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Rescore the best quantized candidates with full-precision vectors.
+
+        Args:
+            state: Generation being searched
+            query: Normalized query vector
+            rows: Row index per score, or None if scores cover every row
+            scores: Quantized candidate scores
+            top_k: Number of results requested
+
+        Returns:
+            Tuple of (rescored row indices, exact scores)
+        """
+        keep = min(len(scores), max(top_k, int(np.ceil(top_k * self.oversampling))))
+        if keep == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        selected = np.argpartition(-scores, keep - 1)[:keep] if keep < len(scores) else np.arange(len(scores))
+        # Sorted row order keeps reads from a memory-mapped matrix sequential.
+        candidates = np.sort(rows[selected] if rows is not None else selected)
+        return candidates, state.vectors[candidates] @ query
+
+    def _top_k(
+        self,
+        state: StoreState,
+        rows: Optional[np.ndarray],
+        scores: np.ndarray,
+        top_k: int,
+        score_threshold: float
+    ) -> List[Dict[str, Any]]:
+        """Select the best candidates and materialize their payloads.
+
+        Args:
+            state: Generation being searched
+            rows: Row index per score, or None if scores cover every row
+            scores: Candidate similarity scores
+            top_k: Number of results to return
+            score_threshold: Minimum similarity score
+
+        Returns:
+            List of search results with scores
+        """
+        n = len(scores)
+        k = min(top_k, n)
+        if k == 0:
+            return []
+        if k < n:
+            candidates = np.argpartition(-scores, k - 1)[:k]
+        else:
+            candidates = np.arange(n)
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        results = []
+        for idx in order:
+            score = float(scores[idx])
+            if score < score_threshold:
+                break
+            row = int(rows[idx]) if rows is not None else int(idx)
+            results.append({
+                "id": state.ids[row],
+                "score": score,
+                **{field: state.columns[field][row] for field in PAYLOAD_FIELDS}
+            })
+        return results
+
+    def get_collection_info(self) -> Dict[str, Any]:
+        """Get information about the collection.
+
+        Returns:
+            Collection metadata
+        """
+        state = self._state
+        vectors = state.vectors
+        info = {
+            "name": self.collection_name,
+            "vectors_count": len(vectors),
+            "points_count": len(vectors),
+            "status": "green",
+            "memory_mapped": isinstance(vectors, np.memmap)
+        }
+        if state.quantizer is not None:
+            info["quantization"] = {
+                "type": state.quantizer.kind,
+                "bytes_per_vector": state.quantizer.bytes_per_vector(self.embedding_dimension),
+                "oversampling": self.oversampling,
+                "rescore": self.rescore
+            }
+        return info
+
+    def health_check(self) -> bool:
+        """Check if the vector store is accessible.
+
+        Returns:
+            Always True for the in-process store
+        """
+        return True
+
+    def get_point_ids(self) -> List[str]:
+        """List the IDs of every indexed point.
+
+        Returns:
+            Point IDs in row order
+        """
+        return self._state.ids.to_list()
+
+    def delete_points(self, point_ids: List[str]) -> bool:
+        """Delete points by ID.
+
+        Args:
+            point_ids: IDs of the points to delete
+
+        Returns:
+            True if successful
+        """
+        try:
+            with self._lock:
+                state = self._state
+                rows = self._row_map(state)
+                doomed = [rows[point_id] for point_id in set(point_ids) if point_id in rows]
+                if not doomed:
+                    return True
+                keep = np.ones(len(state.vectors), dtype=bool)
+                keep[doomed] = False
+                self._state = self._drop_rows(state, keep)
+                self._dirty = True
+            logger.info(f"Deleted {len(doomed)} points from {self.collection_name}")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting points: {e}")
+            return False
+
+    def flush(self) -> None:
+        """Write the snapshot if the store changed since the last flush."""
+        if not (self._dirty and self.snapshot_path):
+            return
+        self.save_snapshot(self.snapshot_path)
+        self._dirty = False
+
+    def get_index_version(self) -> Optional[str]:
+        """Get a fingerprint that changes whenever the collection is modified.
+
+        Returns:
+            Index version string
+        """
+        state = self._state
+        return f"{self.collection_name}:{len(state.vectors)}:{state.version}"
+
+    def save_snapshot(self, path: str) -> None:
+        """Write vectors (``.npy``), payload columns and metadata to a directory.
+
+        Args:
+            path: Snapshot directory
+        """
+        state = self._state
+        vectors = state.vectors
+
+        os.makedirs(path, exist_ok=True)
+        arrays = {"ids_data": state.ids.data, "ids_offsets": state.ids.offsets}
+        for field, column in state.columns.items():
+            arrays[f"{field}_data"] = column.data
+            arrays[f"{field}_offsets"] = column.offsets
+
+        # Write to temporary names first so a crash never leaves a torn snapshot.
+        np.save(os.path.join(path, "vectors.tmp.npy"), np.asarray(vectors))
+        np.savez(os.path.join(path, "payload.tmp.npz"), **arrays)
+        with open(os.path.join(path, "meta.tmp.json"), "w", encoding="utf-8") as f:
+            json.dump({
+                "collection_name": self.collection_name,
+                "dimension": self.embedding_dimension,
+                "points_count": len(vectors),
+                "version": state.version,
+                "quantizer": state.quantizer.to_dict() if state.quantizer is not None else None
+            }, f)
+        names = ["vectors.npy", "payload.npz", "meta.json"]
+        if state.codes is not None:
+            np.save(os.path.join(path, "codes.tmp.npy"), state.codes)
+            names.append("codes.npy")
+        names += self._save_index(state, path)
+        for name in names:
+            stem, ext = name.split(".")
+            os.replace(os.path.join(path, f"{stem}.tmp.{ext}"), os.path.join(path, name))
+        logger.info(f"Saved {len(vectors)} vectors to snapshot {path}")
+
+    def _save_index(self, state: StoreState, path: str) -> List[str]:
+        """Hook for subclasses writing index files next to the snapshot.
+
+        Files must be written as ``<stem>.tmp.<ext>``; they are renamed
+        together with the base snapshot files.
+
+        Args:
+            state: Generation being saved
+            path: Snapshot directory
+
+        Returns:
+            Final file names written
+        """
+        return []
+
+    def _load_index(self, state: StoreState, path: str) -> StoreState:
+        """Hook for subclasses restoring index files saved with a snapshot.
+
+        Args:
+            state: Generation loaded from the base snapshot files
+            path: Snapshot directory
+
+        Returns:
+            Generation to publish
+        """
+        return state
+
+    def load_snapshot(self, path: str, mmap: bool = True) -> None:
+        """Replace the store contents with a saved snapshot.
+
+        Args:
+            path: Snapshot directory
+            mmap: Memory-map vectors instead of reading them into RAM
+        """
+        vectors = np.load(os.path.join(path, "vectors.npy"), mmap_mode="r" if mmap else None)
+        if vectors.shape[1] != self.embedding_dimension:
+            raise ValueError(
+                f"Snapshot dimension {vectors.shape[1]} != {self.embedding_dimension}"
+            )
+
+        with np.load(os.path.join(path, "payload.npz")) as payload:
+            ids = StringColumn(payload["ids_data"], payload["ids_offsets"])
+            columns = {
+                field: StringColumn(payload[f"{field}_data"], payload[f"{field}_offsets"])
+                for field in PAYLOAD_FIELDS
+            }
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+
+        quantizer, codes = self._load_codes(vectors, meta, path)
+        state = StoreState(
+            vectors=vectors,
+            ids=ids,
+            columns=columns,
+            version=meta.get("version", uuid.uuid4().hex),
+            quantizer=quantizer,
+            codes=codes
+        )
+        with self._lock:
+            self._state = self._load_index(state, path)
+        logger.info(f"Loaded {len(vectors)} vectors from snapshot {path}")
+
+    def _load_codes(
+        self,
+        vectors: np.ndarray,
+        meta: Dict[str, Any],
+        path: str
+    ) -> Tuple[Optional[Any], Optional[np.ndarray]]:
+        """Load saved quantized codes, re-encoding if the setting changed
+        or the snapshot outgrew the sample the quantizer was fitted on.
+
+        Args:
+            vectors: Snapshot vectors
+            meta: Snapshot metadata
+            path: Snapshot directory
+
+        Returns:
+            Tuple of (quantizer, codes), both None when quantization is off
+        """
+        saved = quantizer_from_dict(meta.get("quantizer") or {})
+        codes_path = os.path.join(path, "codes.npy")
+        if saved is not None and saved.kind == self.quantization and os.path.exists(codes_path):
+            codes = np.load(codes_path)
+            if len(codes) == len(vectors) and not saved.needs_refit(len(vectors)):
+                return saved, codes
+        return self._encode_rows(vectors)
+
+    def _encode_rows(self, vectors: np.ndarray) -> Tuple[Optional[Any], Optional[np.ndarray]]:
+        """Fit the configured quantizer on a sample of rows and encode them all.
+
+        Args:
+            vectors: Normalized rows, possibly memory-mapped
+
+        Returns:
+            Tuple of (quantizer, codes), both None when quantization is off
+        """
+        if self.quantization == "none" or not len(vectors):
+            return None, None
+        quantizer = fit_quantizer(self.quantization, sample_rows(vectors), fitted_rows=len(vectors))
+        if quantizer is None:
+            return None, None
+        codes = np.concatenate([
+            quantizer.encode(np.asarray(vectors[start:start + SCORE_CHUNK_ROWS]))
+            for start in range(0, len(vectors), SCORE_CHUNK_ROWS)
+        ])
+        logger.info(f"Encoded {len(codes)} vectors with {quantizer.kind} quantization")
+        return quantizer, codes
+
+    def import_points(self, points: Iterable[Tuple[Any, List[float], Dict[str, Any]]]) -> int:
+        """Append points given as ``(id, vector, payload)`` records.
+
+        Args:
+            points: Records, e.g. from a Qdrant scroll
+
+        Returns:
+            Number of imported points
+        """
+        ids, vectors, payloads = [], [], []
+        for point_id, vector, payload in points:
+            ids.append(str(point_id))
+            vectors.append(vector)
+            payloads.append(payload or {})
+
+        if vectors:
+            self._append(np.asarray(vectors, dtype=np.float32), ids, payloads)
+        return len(ids)
+
+    def load_qdrant_export(self, path: str) -> int:
+        """Load a JSONL Qdrant scroll export with ``id``, ``vector`` and ``payload``.
+
+        Args:
+            path: Path to the JSONL export
+
+        Returns:
+            Number of imported points
+        """
+        def records():
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        yield record["id"], record["vector"], record.get("payload", {})
+
+        count = self.import_points(records())
+        logger.info(f"Imported {count} points from Qdrant export {path}")
+        return count
+
+    def load_from_qdrant(self, client: Any, collection_name: str, batch_size: int = 1000) -> int:
+        """Scroll every point of a live Qdrant collection into the store.
+
+        Args:
+            client: QdrantClient instance
+            collection_name: Source collection name
+            batch_size: Points per scroll request
+
+        Returns:
+            Number of imported points
+        """
+        def records():
+            offset = None
+            while True:
+                points, offset = client.scroll(
+                    collection_name=collection_name,
+                    limit=batch_size,
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=True
+                )
+                for point in points:
+                    yield point.id, point.vector, point.payload
+                if offset is None:
+                    break
+
+        count = self.import_points(records())
+        logger.info(f"Imported {count} points from Qdrant collection {collection_name}")
+        return count
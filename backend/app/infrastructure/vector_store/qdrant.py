@@ -1,17 +1,226 @@
 """Vector store implementation using Qdrant."""
 
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Tuple
+import asyncio
 import logging
-import numpy as np
+import math
+import time
 import uuid
+import numpy as np
 
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
+from qdrant_client import QdrantClient, AsyncQdrantClient
+from qdrant_client.models import (
+    Distance,
+    VectorParams,
+    PointStruct,
+    ScoredPoint,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    SearchParams,
+    QuantizationSearchParams,
+    QueryRequest,
+    PointIdsList
+)
 
-from ...core.interfaces import VectorStoreProtocol
+from ...core.deadline import remaining
+from ...core.interfaces import VectorStoreProtocol, AsyncVectorStoreProtocol
+from .ids import content_point_id
+from .quantization import check_quantization
+from .aliases import alias_target, async_alias_target
 
 logger = logging.getLogger(__name__)
 
+SCROLL_BATCH_SIZE = 1000
+INDEX_VERSION_KEY = "index_version"
+
+
+def _client_kwargs(host: str, port: int, api_key: Optional[str]) -> Dict[str, Any]:
+    """Build Qdrant client connection arguments.
+
+    Args:
+        host: Qdrant server host
+        port: Qdrant server port
+        api_key: Optional API key for Qdrant Cloud
+
+    Returns:
+        Keyword arguments for QdrantClient / AsyncQdrantClient
+    """
+    # Remove port from host if it's already included
+    if ":" in host:
+        host = host.split(":")[0]
+
+    if api_key:
+        return {"url": f"https://{host}:{port}", "api_key": api_key}
+    return {"host": host, "port": port}
+
+
+def _index_marker() -> Dict[str, str]:
+    """Build collection metadata carrying a fresh index version marker."""
+    return {INDEX_VERSION_KEY: uuid.uuid4().hex}
+
+
+def _format_version(collection: str, info) -> str:
+    """Format the index version of a collection from its info.
+
+    Args:
+        collection: Concrete collection name (alias already resolved)
+        info: ``get_collection`` result
+
+    Returns:
+        Index version string
+    """
+    metadata = getattr(info.config, "metadata", None) or {}
+    return f"{collection}:{info.points_count}:{metadata.get(INDEX_VERSION_KEY, '')}"
+
+
+def _quantization_config(quantization: str):
+    """Build the collection quantization config.
+
+    Quantized codes are pinned in RAM while the original vectors may live
+    on disk, where Qdrant reads them only to rescore.
+
+    Args:
+        quantization: "none", "int8" or "binary"
+
+    Returns:
+        Qdrant quantization config, or None when disabled
+
+    Raises:
+        ValueError: If ``quantization`` is unknown
+    """
+    check_quantization(quantization)
+    if quantization == "int8":
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+        )
+    if quantization == "binary":
+        return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+    return None
+
+
+def _search_params(quantization: str, oversampling: float, rescore: bool) -> Optional[SearchParams]:
+    """Build per-query search params for quantized collections.
+
+    Args:
+        quantization: "none", "int8" or "binary"
+        oversampling: Candidates fetched per requested result before rescoring
+        rescore: Rescore candidates with the original vectors
+
+    Returns:
+        Search params, or None when quantization is disabled
+    """
+    if _quantization_config(quantization) is None:
+        return None
+    return SearchParams(
+        quantization=QuantizationSearchParams(rescore=rescore, oversampling=oversampling)
+    )
+
+
+def _iter_points(
+    pairs: Iterable[Tuple[np.ndarray, Dict[str, Any]]]
+) -> Iterator[PointStruct]:
+    """Convert (embedding, chunk) pairs into Qdrant points with content-derived IDs.
+
+    Args:
+        pairs: Document embeddings with their chunks
+
+    Yields:
+        Points ready for upsert, built one at a time
+    """
+    for embedding, chunk in pairs:
+        yield PointStruct(
+            id=content_point_id(chunk),
+            vector=embedding.tolist() if isinstance(embedding, np.ndarray) else embedding,
+            payload={
+                "question": chunk.get("question", ""),
+                "answer": chunk.get("answer", ""),
+                "category": chunk.get("category", ""),
+                "content": chunk.get("content", "")
+            }
+        )
+
+
+def _batched(points: Iterator[PointStruct], size: int) -> Iterator[List[PointStruct]]:
+    """Group points into lists of at most ``size``."""
+    while True:
+        batch = list(islice(points, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _log_batch(number: int, count: int, started: float) -> None:
+    """Log the throughput of one upserted batch."""
+    elapsed = time.perf_counter() - started
+    logger.info(
+        f"Upserted batch {number} ({count} points) in {elapsed * 1000:.0f}ms, "
+        f"{count / elapsed if elapsed > 0 else 0:.0f} points/s"
+    )
+
+
+def _build_query_requests(
+    query_embeddings: np.ndarray,
+    top_k: int,
+    score_threshold: float,
+    search_params: Optional[SearchParams]
+) -> List[QueryRequest]:
+    """Build one batched query request per embedding.
+
+    Args:
+        query_embeddings: Query embedding vectors, one per row
+        top_k: Number of results to return per query
+        score_threshold: Minimum similarity score
+        search_params: Optional per-query search params
+
+    Returns:
+        Requests for ``query_batch_points``
+    """
+    return [
+        QueryRequest(
+            query=embedding.tolist() if isinstance(embedding, np.ndarray) else embedding,
+            limit=top_k,
+            score_threshold=score_threshold,
+            params=search_params,
+            with_payload=True
+        )
+        for embedding in query_embeddings
+    ]
+
+
+def _search_timeout() -> Optional[int]:
+    """Server-side search timeout from the remaining request budget.
+
+    Returns:
+        Whole seconds (Qdrant's granularity, at least 1), or None outside a
+        request deadline
+    """
+    left = remaining()
+    return None if left is None else max(1, math.ceil(left))
+
+
+def _to_result(scored_point: ScoredPoint) -> Dict[str, Any]:
+    """Convert a scored point into a search result dictionary.
+
+    Args:
+        scored_point: Point returned by Qdrant
+
+    Returns:
+        Search result with score and payload fields
+    """
+    return {
+        "id": scored_point.id,
+        "score": scored_point.score,
+        "question": scored_point.payload.get("question", ""),
+        "answer": scored_point.payload.get("answer", ""),
+        "category": scored_point.payload.get("category", ""),
+        "content": scored_point.payload.get("content", "")
+    }
+
 
 class QdrantVectorStore(VectorStoreProtocol):
     """Qdrant vector store implementation."""
@@ -22,7 +231,12 @@ class QdrantVectorStore(VectorStoreProtocol):
         port: int,
         collection_name: str,
         embedding_dimension: int,
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        quantization: str = "none",
+        oversampling: float = 2.0,
+        rescore: bool = True,
+        upsert_batch_size: int = 256,
+        upsert_parallel: int = 1
     ):
         """Initialize Qdrant vector store.
 
@@ -32,19 +246,21 @@ class QdrantVectorStore(VectorStoreProtocol):
             collection_name: Name of the collection
             embedding_dimension: Dimension of embedding vectors
             api_key: Optional API key for Qdrant Cloud
+            quantization: "none", "int8" or "binary" collection quantization
+            oversampling: Candidates fetched per requested result before rescoring
+            rescore: Rescore quantized candidates with the original vectors
+            upsert_batch_size: Points sent per upsert request
+            upsert_parallel: Upsert requests in flight at once
         """
         self.collection_name = collection_name
         self.embedding_dimension = embedding_dimension
-
-        # Remove port from host if it's already included
-        if ":" in host:
-            host = host.split(":")[0]
+        self.quantization = quantization
+        self.search_params = _search_params(quantization, oversampling, rescore)
+        self.upsert_batch_size = upsert_batch_size
+        self.upsert_parallel = max(upsert_parallel, 1)
 
         try:
-            if api_key:
-                self.client = QdrantClient(url=f"https://{host}:{port}", api_key=api_key)
-            else:
-                self.client = QdrantClient(host=host, port=port)
+            self.client = QdrantClient(**_client_kwargs(host, port, api_key))
             logger.info(f"Qdrant client initialized: {host}:{port}")
         except Exception as e:
             logger.error(f"Error initializing Qdrant client: {e}")
@@ -60,6 +276,13 @@ class QdrantVectorStore(VectorStoreProtocol):
             True if successful
         """
         try:
+            if alias_target(self.client, self.collection_name) is not None:
+                if recreate:
+                    logger.error(f"{self.collection_name} is an alias; rebuild it as a new version instead")
+                    return False
+                logger.info(f"Collection already exists: {self.collection_name} (alias)")
+                return True
+
             collections = self.client.get_collections().collections
             collection_names = [col.name for col in collections]
 
@@ -76,8 +299,10 @@ class QdrantVectorStore(VectorStoreProtocol):
                 collection_name=self.collection_name,
                 vectors_config=VectorParams(
                     size=self.embedding_dimension,
-                    distance=Distance.COSINE
-                )
+                    distance=Distance.COSINE,
+                    on_disk=self.search_params is not None
+                ),
+                quantization_config=_quantization_config(self.quantization)
             )
             logger.info(f"Collection created: {self.collection_name}")
             return True
@@ -99,33 +324,65 @@ class QdrantVectorStore(VectorStoreProtocol):
         Returns:
             True if successful
         """
+        if len(embeddings) != len(chunks):
+            logger.error("Mismatch between embeddings and chunks count")
+            return False
+        return self.index_stream(zip(embeddings, chunks))
+
+    def _upsert_batch(self, number: int, batch: List[PointStruct], wait: bool) -> int:
+        """Send one batch and log its throughput.
+
+        Returns:
+            Number of points sent
+        """
+        started = time.perf_counter()
+        self.client.upsert(collection_name=self.collection_name, points=batch, wait=wait)
+        _log_batch(number, len(batch), started)
+        return len(batch)
+
+    def index_stream(self, pairs: Iterable[Tuple[np.ndarray, Dict[str, Any]]]) -> bool:
+        """Upsert (embedding, chunk) pairs in fixed-size batches.
+
+        Points are built lazily and at most ``2 * upsert_parallel`` batches
+        are held at once, so memory stays flat however large the input is.
+        Batches are sent with ``wait=False`` (point IDs are content-derived,
+        so a resent batch is harmless) on up to ``upsert_parallel`` threads.
+        The last batch is held back and sent with ``wait=True`` once all
+        others were acknowledged; Qdrant applies updates in order, so its
+        return confirms the whole stream is searchable.
+
+        Args:
+            pairs: Document embeddings with their chunks
+
+        Returns:
+            True if successful
+        """
+        started = time.perf_counter()
+        total = 0
         try:
-            if len(embeddings) != len(chunks):
-                logger.error("Mismatch between embeddings and chunks count")
-                return False
-
-            points = []
-            for i, (embedding, chunk) in enumerate(zip(embeddings, chunks)):
-                point = PointStruct(
-                    id=str(uuid.uuid4()),
-                    vector=embedding.tolist() if isinstance(embedding, np.ndarray) else embedding,
-                    payload={
-                        "question": chunk.get("question", ""),
-                        "answer": chunk.get("answer", ""),
-                        "category": chunk.get("category", ""),
-                        "content": chunk.get("content", "")
-                    }
-                )
-                points.append(point)
+            batches = _batched(_iter_points(pairs), self.upsert_batch_size)
+            last = next(batches, None)
+            number = 1
+            pending = []
+            with ThreadPoolExecutor(max_workers=self.upsert_parallel) as pool:
+                for batch in batches:
+                    if len(pending) >= 2 * self.upsert_parallel:
+                        total += pending.pop(0).result()
+                    pending.append(pool.submit(self._upsert_batch, number, last, False))
+                    last, number = batch, number + 1
+                for future in pending:
+                    total += future.result()
+            if last:
+                total += self._upsert_batch(number, last, True)
 
-            self.client.upsert(
-                collection_name=self.collection_name,
-                points=points
+            elapsed = time.perf_counter() - started
+            logger.info(
+                f"Indexed {total} documents to {self.collection_name} in {elapsed:.2f}s"
             )
-            logger.info(f"Indexed {len(points)} documents to {self.collection_name}")
+            self._mark_modified()
             return True
         except Exception as e:
-            logger.error(f"Error indexing documents: {e}")
+            logger.error(f"Error indexing documents after {total} points: {e}")
             return False
 
     def search(
@@ -147,24 +404,16 @@ class QdrantVectorStore(VectorStoreProtocol):
         try:
             query_vector = query_embedding.tolist() if isinstance(query_embedding, np.ndarray) else query_embedding
 
-            search_result = self.client.search(
+            response = self.client.query_points(
                 collection_name=self.collection_name,
-                query_vector=query_vector,
+                query=query_vector,
                 limit=top_k,
-                score_threshold=score_threshold
+                score_threshold=score_threshold,
+                search_params=self.search_params,
+                timeout=_search_timeout()
             )
 
-            results = []
-            for scored_point in search_result:
-                result = {
-                    "id": scored_point.id,
-                    "score": scored_point.score,
-                    "question": scored_point.payload.get("question", ""),
-                    "answer": scored_point.payload.get("answer", ""),
-                    "category": scored_point.payload.get("category", ""),
-                    "content": scored_point.payload.get("content", "")
-                }
-                results.append(result)
+            results = [_to_result(scored_point) for scored_point in response.points]
 
             logger.info(f"Found {len(results)} similar documents")
             return results
@@ -172,6 +421,39 @@ class QdrantVectorStore(VectorStoreProtocol):
             logger.error(f"Error searching documents: {e}")
             return []
 
+    def search_batch(
+        self,
+        query_embeddings: np.ndarray,
+        top_k: int = 5,
+        score_threshold: float = 0.0
+    ) -> List[List[Dict[str, Any]]]:
+        """Search for similar documents for several queries in one request.
+
+        Args:
+            query_embeddings: Query embedding vectors, one per row
+            top_k: Number of results to return per query
+            score_threshold: Minimum similarity score
+
+        Returns:
+            List of search results per query, in input order
+        """
+        try:
+            responses = self.client.query_batch_points(
+                collection_name=self.collection_name,
+                requests=_build_query_requests(
+                    query_embeddings, top_k, score_threshold, self.search_params
+                ),
+                timeout=_search_timeout()
+            )
+
+            results = [[_to_result(point) for point in response.points] for response in responses]
+
+            logger.info(f"Batch search returned results for {len(results)} queries")
+            return results
+        except Exception as e:
+            logger.error(f"Error batch searching documents: {e}")
+            return [[] for _ in query_embeddings]
+
     def get_collection_info(self) -> Dict[str, Any]:
         """Get information about the collection.
 
@@ -182,7 +464,7 @@ class QdrantVectorStore(VectorStoreProtocol):
             info = self.client.get_collection(collection_name=self.collection_name)
             return {
                 "name": self.collection_name,
-                "vectors_count": info.vectors_count,
+                "vectors_count": getattr(info, "vectors_count", None),
                 "points_count": info.points_count,
                 "status": str(info.status)
             }
@@ -202,3 +484,438 @@ class QdrantVectorStore(VectorStoreProtocol):
         except Exception as e:
             logger.error(f"Health check failed: {e}")
             return False
+
+    def flush(self) -> None:
+        """No-op: Qdrant persists every write on the server."""
+
+    def get_point_ids(self) -> List[str]:
+        """List the IDs of every indexed point.
+
+        Returns:
+            Point IDs, or an empty list if the collection cannot be read
+        """
+        try:
+            return self._scroll_ids(self.collection_name)
+        except Exception as e:
+            logger.error(f"Error listing point IDs: {e}")
+            return []
+
+    def _scroll_ids(self, collection_name: str) -> List[str]:
+        """Scroll every point ID of a collection.
+
+        Args:
+            collection_name: Collection or alias to scroll
+
+        Returns:
+            Point IDs
+        """
+        point_ids = []
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=collection_name,
+                limit=SCROLL_BATCH_SIZE,
+                offset=offset,
+                with_payload=False,
+                with_vectors=False
+            )
+            point_ids.extend(str(point.id) for point in points)
+            if offset is None:
+                return point_ids
+
+    def delete_points(self, point_ids: List[str]) -> bool:
+        """Delete points by ID.
+
+        Args:
+            point_ids: IDs of the points to delete
+
+        Returns:
+            True if successful
+        """
+        try:
+            for start in range(0, len(point_ids), SCROLL_BATCH_SIZE):
+                self.client.delete(
+                    collection_name=self.collection_name,
+                    points_selector=PointIdsList(points=point_ids[start:start + SCROLL_BATCH_SIZE])
+                )
+            logger.info(f"Deleted {len(point_ids)} points from {self.collection_name}")
+            self._mark_modified()
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting points: {e}")
+            return False
+
+    def _mark_modified(self) -> None:
+        """Store a fresh index version marker in the collection metadata.
+
+        Failures are logged only: readers then still see the point count
+        change, just not same-size content edits.
+        """
+        try:
+            collection = alias_target(self.client, self.collection_name) or self.collection_name
+            self.client.update_collection(collection_name=collection, metadata=_index_marker())
+        except Exception as e:
+            logger.warning(f"Could not record index version marker: {e}")
+
+    def get_index_version(self) -> Optional[str]:
+        """Get a fingerprint that changes whenever the collection is reindexed.
+
+        Combines the concrete collection behind the alias, its point count
+        and the marker that every successful write stores in the collection
+        metadata, so a check costs two small requests regardless of size.
+
+        Returns:
+            Index version string, or None if it cannot be determined
+        """
+        try:
+            collection = alias_target(self.client, self.collection_name) or self.collection_name
+            info = self.client.get_collection(collection_name=collection)
+            return _format_version(collection, info)
+        except Exception as e:
+            logger.error(f"Error getting index version: {e}")
+            return None
+
+
+class AsyncQdrantVectorStore(AsyncVectorStoreProtocol):
+    """Qdrant vector store implementation backed by AsyncQdrantClient."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        collection_name: str,
+        embedding_dimension: int,
+        api_key: Optional[str] = None,
+        quantization: str = "none",
+        oversampling: float = 2.0,
+        rescore: bool = True,
+        upsert_batch_size: int = 256,
+        upsert_parallel: int = 1
+    ):
+        """Initialize async Qdrant vector store.
+
+        Args:
+            host: Qdrant server host
+            port: Qdrant server port
+            collection_name: Name of the collection
+            embedding_dimension: Dimension of embedding vectors
+            api_key: Optional API key for Qdrant Cloud
+            quantization: "none", "int8" or "binary" collection quantization
+            oversampling: Candidates fetched per requested result before rescoring
+            rescore: Rescore quantized candidates with the original vectors
+            upsert_batch_size: Points sent per upsert request
+            upsert_parallel: Upsert requests in flight at once
+        """
+        self.collection_name = collection_name
+        self.embedding_dimension = embedding_dimension
+        self.quantization = quantization
+        self.search_params = _search_params(quantization, oversampling, rescore)
+        self.upsert_batch_size = upsert_batch_size
+        self.upsert_parallel = max(upsert_parallel, 1)
+
+        try:
+            self.client = AsyncQdrantClient(**_client_kwargs(host, port, api_key))
+            logger.info(f"Async Qdrant client initialized: {host}:{port}")
+        except Exception as e:
+            logger.error(f"Error initializing async Qdrant client: {e}")
+            raise
+
+    async def create_collection(self, recreate: bool = False) -> bool:
+        """Create a new collection.
+
+        Args:
+            recreate: Whether to recreate if exists
+
+        Returns:
+            True if successful
+        """
+        try:
+            if await async_alias_target(self.client, self.collection_name) is not None:
+                if recreate:
+                    logger.error(f"{self.collection_name} is an alias; rebuild it as a new version instead")
+                    return False
+                logger.info(f"Collection already exists: {self.collection_name} (alias)")
+                return True
+
+            collections = (await self.client.get_collections()).collections
+            collection_names = [col.name for col in collections]
+
+            if self.collection_name in collection_names:
+                if recreate:
+                    logger.info(f"Deleting existing collection: {self.collection_name}")
+                    await self.client.delete_collection(collection_name=self.collection_name)
+                else:
+                    logger.info(f"Collection already exists: {self.collection_name}")
+                    return True
+
+            logger.info(f"Creating collection: {self.collection_name}")
+            await self.client.create_collection(
+                collection_name=self.collection_name,
+                vectors_config=VectorParams(
+                    size=self.embedding_dimension,
+                    distance=Distance.COSINE,
+                    on_disk=self.search_params is not None
+                ),
+                quantization_config=_quantization_config(self.quantization)
+            )
+            logger.info(f"Collection created: {self.collection_name}")
+            return True
+        except Exception as e:
+            logger.error(f"Error creating collection: {e}")
+            return False
+
+    async def index_documents(
+        self,
+        embeddings: np.ndarray,
+        chunks: List[Dict[str, Any]]
+    ) -> bool:
+        """Index documents into the vector store.
+
+        Args:
+            embeddings: Document embeddings
+            chunks: Document chunks with metadata
+
+        Returns:
+            True if successful
+        """
+        if len(embeddings) != len(chunks):
+            logger.error("Mismatch between embeddings and chunks count")
+            return False
+        return await self.index_stream(zip(embeddings, chunks))
+
+    async def _upsert_batch(self, number: int, batch: List[PointStruct], wait: bool) -> int:
+        """Send one batch and log its throughput.
+
+        Returns:
+            Number of points sent
+        """
+        started = time.perf_counter()
+        await self.client.upsert(collection_name=self.collection_name, points=batch, wait=wait)
+        _log_batch(number, len(batch), started)
+        return len(batch)
+
+    async def index_stream(self, pairs: Iterable[Tuple[np.ndarray, Dict[str, Any]]]) -> bool:
+        """Upsert (embedding, chunk) pairs in fixed-size batches.
+
+        Same batching as ``QdrantVectorStore.index_stream``, with up to
+        ``upsert_parallel`` concurrent requests on the event loop.
+
+        Args:
+            pairs: Document embeddings with their chunks
+
+        Returns:
+            True if successful
+        """
+        started = time.perf_counter()
+        total = 0
+        pending = set()
+        try:
+            batches = _batched(_iter_points(pairs), self.upsert_batch_size)
+            last = next(batches, None)
+            number = 1
+            for batch in batches:
+                if len(pending) >= self.upsert_parallel:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    total += sum(task.result() for task in done)
+                pending.add(asyncio.ensure_future(self._upsert_batch(number, last, False)))
+                last, number = batch, number + 1
+            if pending:
+                total += sum(await asyncio.gather(*pending))
+                pending = set()
+            if last:
+                total += await self._upsert_batch(number, last, True)
+
+            elapsed = time.perf_counter() - started
+            logger.info(
+                f"Indexed {total} documents to {self.collection_name} in {elapsed:.2f}s"
+            )
+            await self._mark_modified()
+            return True
+        except Exception as e:
+            for task in pending:
+                task.cancel()
+            logger.error(f"Error indexing documents after {total} points: {e}")
+            return False
+
+    async def search(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = 5,
+        score_threshold: float = 0.0
+    ) -> List[Dict[str, Any]]:
+        """Search for similar documents.
+
+        Args:
+            query_embedding: Query embedding vector
+            top_k: Number of results to return
+            score_threshold: Minimum similarity score
+
+        Returns:
+            List of search results with scores
+        """
+        try:
+            query_vector = query_embedding.tolist() if isinstance(query_embedding, np.ndarray) else query_embedding
+
+            response = await self.client.query_points(
+                collection_name=self.collection_name,
+                query=query_vector,
+                limit=top_k,
+                score_threshold=score_threshold,
+                search_params=self.search_params,
+                timeout=_search_timeout()
+            )
+
+            results = [_to_result(scored_point) for scored_point in response.points]
+
+            logger.info(f"Found {len(results)} similar documents")
+            return results
+        except Exception as e:
+            logger.error(f"Error searching documents: {e}")
+            return []
+
+    async def search_batch(
+        self,
+        query_embeddings: np.ndarray,
+        top_k: int = 5,
+        score_threshold: float = 0.0
+    ) -> List[List[Dict[str, Any]]]:
+        """Search for similar documents for several queries in one request.
+
+        Args:
+            query_embeddings: Query embedding vectors, one per row
+            top_k: Number of results to return per query
+            score_threshold: Minimum similarity score
+
+        Returns:
+            List of search results per query, in input order
+        """
+        try:
+            responses = await self.client.query_batch_points(
+                collection_name=self.collection_name,
+                requests=_build_query_requests(
+                    query_embeddings, top_k, score_threshold, self.search_params
+                ),
+                timeout=_search_timeout()
+            )
+
+            results = [[_to_result(point) for point in response.points] for response in responses]
+
+            logger.info(f"Batch search returned results for {len(results)} queries")
+            return results
+        except Exception as e:
+            logger.error(f"Error batch searching documents: {e}")
+            return [[] for _ in query_embeddings]
+
+    async def get_collection_info(self) -> Dict[str, Any]:
+        """Get information about the collection.
+
+        Returns:
+            Collection metadata
+        """
+        try:
+            info = await self.client.get_collection(collection_name=self.collection_name)
+            return {
+                "name": self.collection_name,
+                "vectors_count": getattr(info, "vectors_count", None),
+                "points_count": info.points_count,
+                "status": str(info.status)
+            }
+        except Exception as e:
+            logger.error(f"Error getting collection info: {e}")
+            return {}
+
+    async def health_check(self) -> bool:
+        """Check if the vector store is accessible.
+
+        Returns:
+            True if healthy
+        """
+        try:
+            await self.client.get_collections()
+            return True
+        except Exception as e:
+            logger.error(f"Health check failed: {e}")
+            return False
+
+    async def get_point_ids(self) -> List[str]:
+        """List the IDs of every indexed point.
+
+        Returns:
+            Point IDs, or an empty list if the collection cannot be read
+        """
+        try:
+            return await self._scroll_ids(self.collection_name)
+        except Exception as e:
+            logger.error(f"Error listing point IDs: {e}")
+            return []
+
+    async def _scroll_ids(self, collection_name: str) -> List[str]:
+        """Scroll every point ID of a collection.
+
+        Args:
+            collection_name: Collection or alias to scroll
+
+        Returns:
+            Point IDs
+        """
+        point_ids = []
+        offset = None
+        while True:
+            points, offset = await self.client.scroll(
+                collection_name=collection_name,
+                limit=SCROLL_BATCH_SIZE,
+                offset=offset,
+                with_payload=False,
+                with_vectors=False
+            )
+            point_ids.extend(str(point.id) for point in points)
+            if offset is None:
+                return point_ids
+
+    async def delete_points(self, point_ids: List[str]) -> bool:
+        """Delete points by ID.
+
+        Args:
+            point_ids: IDs of the points to delete
+
+        Returns:
+            True if successful
+        """
+        try:
+            for start in range(0, len(point_ids), SCROLL_BATCH_SIZE):
+                await self.client.delete(
+                    collection_name=self.collection_name,
+                    points_selector=PointIdsList(points=point_ids[start:start + SCROLL_BATCH_SIZE])
+                )
+            logger.info(f"Deleted {len(point_ids)} points from {self.collection_name}")
+            await self._mark_modified()
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting points: {e}")
+            return False
+
+    async def _mark_modified(self) -> None:
+        """Store a fresh index version marker in the collection metadata."""
+        try:
+            collection = await async_alias_target(self.client, self.collection_name) or self.collection_name
+            await self.client.update_collection(collection_name=collection, metadata=_index_marker())
+        except Exception as e:
+            logger.warning(f"Could not record index version marker: {e}")
+
+    async def get_index_version(self) -> Optional[str]:
+        """Get a fingerprint that changes whenever the collection is reindexed.
+
+        Combines the concrete collection behind the alias, its point count
+        and the marker that every successful write stores in the collection
+        metadata, so a check costs two small requests regardless of size.
+
+        Returns:
+            Index version string, or None if it cannot be determined
+        """
+        try:
+            collection = await async_alias_target(self.client, self.collection_name) or self.collection_name
+            info = await self.client.get_collection(collection_name=collection)
+            return _format_version(collection, info)
+        except Exception as e:
+            logger.error(f"Error getting index version: {e}")
+            return None
@@ -0,0 +1,195 @@
+"""Vector quantizers for memory-bound in-process search."""
+
+from typing import Dict, Any, Optional
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SCORE_CHUNK_ROWS = 16384
+
+QUANTIZATIONS = ("none", "int8", "binary")
+
+# A fitted quantizer is refitted once the store holds this many times the
+# rows it was fitted on.
+REFIT_GROWTH = 2
+
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+class ScalarInt8Quantizer:
+    """Symmetric int8 scalar quantization of normalized vectors.
+
+    Components are divided by one global scale (a high quantile of their
+    absolute values, as Qdrant does) and rounded to ``[-127, 127]``, cutting
+    memory 4x versus float32. Scores approximate the cosine similarity.
+    """
+
+    kind = "int8"
+
+    def __init__(self, scale: float, fitted_rows: int = 0):
+        """Initialize int8 quantizer.
+
+        Args:
+            scale: Absolute component value mapped to 127
+            fitted_rows: Store size the scale was fitted for
+        """
+        self.scale = scale
+        self.fitted_rows = fitted_rows
+
+    @classmethod
+    def fit(
+        cls,
+        vectors: np.ndarray,
+        quantile: float = 0.99,
+        fitted_rows: Optional[int] = None
+    ) -> "ScalarInt8Quantizer":
+        """Choose the scale from a sample of normalized vectors.
+
+        Args:
+            vectors: Normalized rows
+            quantile: Quantile of absolute component values to map to 127
+            fitted_rows: Store size the sample was drawn from, defaults to
+                the sample size
+
+        Returns:
+            Fitted quantizer
+        """
+        scale = float(np.quantile(np.abs(vectors), quantile)) if len(vectors) else 1.0
+        return cls(scale or 1.0, len(vectors) if fitted_rows is None else fitted_rows)
+
+    def needs_refit(self, rows: int) -> bool:
+        """Whether the store outgrew the sample the scale was fitted on."""
+        return rows >= REFIT_GROWTH * max(self.fitted_rows, 1)
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        """Quantize normalized rows to int8 codes."""
+        return np.clip(np.rint(vectors * (127.0 / self.scale)), -127, 127).astype(np.int8)
+
+    def score(self, codes: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """Approximate cosine similarity between codes and a normalized query."""
+        weights = query * np.float32(self.scale / 127.0)
+        scores = np.empty(len(codes), dtype=np.float32)
+        for start in range(0, len(codes), SCORE_CHUNK_ROWS):
+            chunk = codes[start:start + SCORE_CHUNK_ROWS].astype(np.float32)
+            scores[start:start + len(chunk)] = chunk @ weights
+        return scores
+
+    def bytes_per_vector(self, dimension: int) -> int:
+        """Code size of one vector."""
+        return dimension
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize quantizer parameters."""
+        return {"kind": self.kind, "scale": self.scale, "fitted_rows": self.fitted_rows}
+
+
+class BinaryQuantizer:
+    """One-bit sign quantization of normalized vectors.
+
+    Each component keeps only its sign, packed eight per byte (32x smaller
+    than float32). Scores are ``1 - 2 * hamming / dimension``, a coarse
+    proxy for cosine similarity that needs oversampling and rescoring.
+    """
+
+    kind = "binary"
+
+    def __init__(self, dimension: int):
+        """Initialize binary quantizer.
+
+        Args:
+            dimension: Embedding dimension
+        """
+        self.dimension = dimension
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        """Pack the sign bits of normalized rows."""
+        return np.packbits(vectors > 0, axis=1)
+
+    def needs_refit(self, rows: int) -> bool:
+        """Sign codes have no fitted parameters."""
+        return False
+
+    def score(self, codes: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """Hamming similarity between codes and a normalized query."""
+        query_bits = np.packbits(query > 0)
+        scores = np.empty(len(codes), dtype=np.float32)
+        for start in range(0, len(codes), SCORE_CHUNK_ROWS):
+            chunk = np.bitwise_xor(codes[start:start + SCORE_CHUNK_ROWS], query_bits)
+            distance = _POPCOUNT[chunk].sum(axis=1, dtype=np.int32)
+            scores[start:start + len(chunk)] = 1.0 - 2.0 * distance / self.dimension
+        return scores
+
+    def bytes_per_vector(self, dimension: int) -> int:
+        """Code size of one vector."""
+        return (dimension + 7) // 8
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize quantizer parameters."""
+        return {"kind": self.kind, "dimension": self.dimension}
+
+
+def check_quantization(kind: str) -> None:
+    """Reject unknown quantization settings.
+
+    Args:
+        kind: Configured quantization
+
+    Raises:
+        ValueError: If ``kind`` is not one of ``QUANTIZATIONS``
+    """
+    if kind not in QUANTIZATIONS:
+        raise ValueError(f"Unknown vector_quantization {kind!r}, expected one of {QUANTIZATIONS}")
+
+
+def sample_rows(vectors: np.ndarray, limit: int = SCORE_CHUNK_ROWS) -> np.ndarray:
+    """Take up to ``limit`` rows evenly spread over the whole matrix.
+
+    Args:
+        vectors: Rows, possibly memory-mapped
+        limit: Maximum sample size
+
+    Returns:
+        In-memory sample
+    """
+    step = max(1, -(-len(vectors) // limit))
+    return np.asarray(vectors[::step])
+
+
+def fit_quantizer(kind: str, vectors: np.ndarray, fitted_rows: Optional[int] = None) -> Optional[Any]:
+    """Create a quantizer of the given kind fitted to normalized vectors.
+
+    Args:
+        kind: "none", "int8" or "binary"
+        vectors: Normalized rows used to fit the quantizer
+        fitted_rows: Store size ``vectors`` were sampled from
+
+    Returns:
+        Quantizer, or None when quantization is disabled
+
+    Raises:
+        ValueError: If ``kind`` is unknown
+    """
+    check_quantization(kind)
+    if kind == "int8":
+        return ScalarInt8Quantizer.fit(vectors, fitted_rows=fitted_rows)
+    if kind == "binary":
+        return BinaryQuantizer(vectors.shape[1])
+    return None
+
+
+def quantizer_from_dict(params: Dict[str, Any]) -> Optional[Any]:
+    """Restore a quantizer serialized with ``to_dict``.
+
+    Args:
+        params: Serialized parameters
+
+    Returns:
+        Quantizer, or None for unknown kinds
+    """
+    if params.get("kind") == "int8":
+        return ScalarInt8Quantizer(float(params["scale"]), int(params.get("fitted_rows", 0)))
+    if params.get("kind") == "binary":
+        return BinaryQuantizer(int(params["dimension"]))
+    return None
@@ -1,11 +1,23 @@
 """FastAPI main application."""
 
-from fastapi import FastAPI
+from contextlib import ExitStack
+from typing import AsyncIterator
+import asyncio
+import time
+
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from .core.config import settings
 from .domain.models import HealthResponse
-from .application.dependencies import get_vector_store
+from .application.dependencies import (
+    get_async_vector_store,
+    get_embedding_cache,
+    get_lexical_index,
+    get_rewrite_cache,
+    get_metrics
+)
+from .infrastructure.observability import begin_request_timing, format_server_timing
 from .presentation.routers import chat_router
 
 app = FastAPI(
@@ -25,6 +37,69 @@ app.add_middleware(
 app.include_router(chat_router, prefix=settings.api_prefix)
 
 
+async def _close_after(body: AsyncIterator[bytes], stack: ExitStack) -> AsyncIterator[bytes]:
+    """Pass a response body through and close ``stack`` once it is sent.
+
+    Args:
+        body: Response body iterator
+        stack: Contexts to close when the body finishes or is abandoned
+
+    Yields:
+        Body chunks
+    """
+    try:
+        async for chunk in body:
+            yield chunk
+    finally:
+        stack.close()
+
+
+@app.middleware("http")
+async def observe_request(request: Request, call_next) -> Response:
+    """Count requests and attach the per-stage ``Server-Timing`` header.
+
+    Streaming responses start before generation, so their header only
+    covers the stages that ran before the first byte. A request stays in
+    flight until its body has been sent.
+    """
+    metrics = get_metrics()
+    timings = begin_request_timing()
+    start = time.perf_counter()
+    stack = ExitStack()
+    if metrics is not None:
+        stack.enter_context(metrics.in_flight())
+    try:
+        response = await call_next(request)
+    except BaseException:
+        stack.close()
+        raise
+    response.body_iterator = _close_after(response.body_iterator, stack)
+
+    elapsed = time.perf_counter() - start
+    if metrics is not None:
+        route = getattr(request.scope.get("route"), "path", "unmatched")
+        metrics.record_http(request.method, route, response.status_code, elapsed)
+    if settings.server_timing_enabled:
+        response.headers["Server-Timing"] = format_server_timing(timings, elapsed)
+    return response
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint() -> Response:
+    """Prometheus scrape endpoint.
+
+    Returns:
+        Metrics in the Prometheus text exposition format
+    """
+    metrics = get_metrics()
+    if metrics is None:
+        return Response(status_code=404)
+    return Response(
+        content=metrics.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 @app.get("/")
 async def root():
     """Root endpoint.
@@ -47,8 +122,8 @@ async def health_check():
         Health status response
     """
     try:
-        vector_store = get_vector_store()
-        qdrant_connected = vector_store.health_check()
+        vector_store = get_async_vector_store()
+        qdrant_connected = await vector_store.health_check()
 
         return HealthResponse(
             status="healthy" if qdrant_connected else "degraded",
@@ -71,10 +146,10 @@ async def startup_event():
     print(f"Collection: {settings.qdrant_collection_name}")
     
     try:
-        vector_store = get_vector_store()
-        if vector_store.health_check():
+        vector_store = get_async_vector_store()
+        if await vector_store.health_check():
             print("Qdrant connection successful")
-            info = vector_store.get_collection_info()
+            info = await vector_store.get_collection_info()
             if info:
                 print(f"Collection: {info.get('name')} | Points: {info.get('points_count')}")
         else:
@@ -82,8 +157,20 @@ async def startup_event():
     except Exception as e:
         print(f"Error connecting to Qdrant: {e}")
 
+    lexical_index = await asyncio.to_thread(get_lexical_index)
+    if lexical_index is not None:
+        print(f"Lexical index: {lexical_index.get_stats()['documents']} documents")
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run on application shutdown."""
     print(f"Shutting down {settings.app_name}")
+
+    rewrite_cache = get_rewrite_cache()
+    if rewrite_cache is not None:
+        rewrite_cache.flush()
+
+    embedding_cache = get_embedding_cache()
+    if embedding_cache is not None:
+        embedding_cache.flush()
@@ -1,50 +1,119 @@
 """Chat API router."""
 
+import json
+from contextlib import nullcontext
 from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict
+from fastapi.responses import StreamingResponse
+from typing import Dict, AsyncIterator, Optional, ContextManager
 
-from ...domain.models import ChatRequest, ChatResponse, RetrievedChunk
-from ...domain.services import RAGService
-from ...application.dependencies import get_rag_service
+from ...domain.models import (
+    ChatRequest,
+    ChatResponse,
+    RetrievedChunk,
+    ChatBatchRequest,
+    ChatBatchItem,
+    ChatBatchResponse
+)
+from ...domain.services import AsyncRAGService
+from ...application.dependencies import (
+    get_async_rag_service,
+    get_rewrite_cache,
+    get_embedding_cache,
+    get_tracer
+)
 from ...core.config import settings
+from ...core.deadline import aiterate_in_context
+from ...core.exceptions import DeadlineExceededError
+from ...core.interfaces import (
+    RewriteCacheProtocol,
+    EmbeddingCacheProtocol,
+    TracerProtocol,
+    SpanProtocol
+)
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
 
+def _format_sse(event: str, data: Dict) -> str:
+    """Serialize one Server-Sent Event.
+
+    Args:
+        event: Event name
+        data: JSON-serializable event payload
+
+    Returns:
+        SSE-formatted message
+    """
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _debug(request: ChatRequest) -> bool:
+    """Whether a request may force a trace and receive its span tree.
+
+    Args:
+        request: Chat request
+
+    Returns:
+        True if the request asks for ``debug`` and debug traces are enabled
+    """
+    return request.debug and settings.debug_traces_enabled
+
+
+def _trace(tracer: Optional[TracerProtocol], name: str, debug: bool = False) -> ContextManager[Optional[SpanProtocol]]:
+    """Trace one request, always when the client asked for the breakdown.
+
+    Args:
+        tracer: Request tracer, None if not configured
+        name: Endpoint name of the root span
+        debug: Whether the request may force a trace, see ``_debug``
+
+    Returns:
+        Context manager yielding the root span, or None if not traced
+    """
+    return tracer.trace(name, force=debug) if tracer is not None else nullcontext()
+
+
 @router.post("/", response_model=ChatResponse)
 async def chat(
     request: ChatRequest,
-    rag_service: RAGService = Depends(get_rag_service)
+    rag_service: AsyncRAGService = Depends(get_async_rag_service),
+    tracer: Optional[TracerProtocol] = Depends(get_tracer)
 ) -> ChatResponse:
     """Chat endpoint for question answering.
 
     Args:
         request: Chat request with message and history
         rag_service: RAG service dependency
+        tracer: Request tracer dependency
 
     Returns:
-        Chat response with answer and retrieved chunks
+        Chat response with answer and retrieved chunks, plus the span tree
+        in ``debug`` if requested and debug traces are enabled
 
     Raises:
-        HTTPException: If request processing fails
+        HTTPException: 504 if the request budget ran out before an answer
+            could be produced, 500 if request processing fails
     """
+    debug = _debug(request)
     try:
         conversation_history = [
             {"role": msg.role, "content": msg.content}
             for msg in request.conversation_history
         ]
 
-        result = rag_service.chat(
-            query=request.message,
-            conversation_history=conversation_history,
-            top_k=settings.top_k_retrieval,
-            score_threshold=settings.similarity_threshold
-        )
+        with _trace(tracer, "chat", debug) as root:
+            result = await rag_service.chat(
+                query=request.message,
+                conversation_history=conversation_history,
+                top_k=settings.top_k_retrieval,
+                score_threshold=settings.similarity_threshold
+            )
 
         retrieved_chunks = [
             RetrievedChunk(
                 content=chunk["content"],
-                score=chunk["score"],
+                score=chunk.get("score"),
+                lexical_score=chunk.get("lexical_score"),
                 metadata=chunk["metadata"]
             )
             for chunk in result["retrieved_chunks"]
@@ -53,11 +122,20 @@ async def chat(
         response = ChatResponse(
             answer=result["answer"],
             retrieved_chunks=retrieved_chunks,
-            confidence=result["confidence"]
+            confidence=result["confidence"],
+            retrieval_path=result.get("retrieval_path"),
+            served_by=result.get("served_by"),
+            degraded=result.get("degraded", []),
+            debug=root.to_dict() if debug and root is not None else None
         )
 
         return response
 
+    except DeadlineExceededError as e:
+        raise HTTPException(
+            status_code=504,
+            detail=f"Chat request exceeded its time budget: {str(e)}"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -65,9 +143,135 @@ async def chat(
         )
 
 
+@router.post("/batch", response_model=ChatBatchResponse)
+async def chat_batch(
+    request: ChatBatchRequest,
+    rag_service: AsyncRAGService = Depends(get_async_rag_service),
+    tracer: Optional[TracerProtocol] = Depends(get_tracer)
+) -> ChatBatchResponse:
+    """Batch chat endpoint answering many independent questions.
+
+    Results come back in request order; a failed question carries an
+    ``error`` message instead of failing the whole batch.
+
+    Args:
+        request: Batch request with questions
+        rag_service: RAG service dependency
+        tracer: Request tracer dependency
+
+    Returns:
+        Batch response with one result per question
+
+    Raises:
+        HTTPException: If the batch is too large or processing fails
+    """
+    if len(request.messages) > settings.batch_max_queries:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch exceeds {settings.batch_max_queries} messages"
+        )
+
+    try:
+        with _trace(tracer, "chat_batch"):
+            results = await rag_service.chat_batch(
+                queries=request.messages,
+                top_k=settings.top_k_retrieval,
+                score_threshold=settings.similarity_threshold,
+                rewrite_concurrency=settings.batch_rewrite_concurrency,
+                generation_concurrency=settings.batch_generation_concurrency,
+                embed_batch_size=settings.batch_embed_size,
+                embed_concurrency=settings.embedding_max_concurrency
+            )
+
+        return ChatBatchResponse(results=[
+            ChatBatchItem(
+                answer=result["answer"],
+                retrieved_chunks=[
+                    RetrievedChunk(
+                        content=chunk["content"],
+                        score=chunk.get("score"),
+                        lexical_score=chunk.get("lexical_score"),
+                        metadata=chunk["metadata"]
+                    )
+                    for chunk in result["retrieved_chunks"]
+                ],
+                confidence=result["confidence"],
+                retrieval_path=result.get("retrieval_path"),
+                served_by=result.get("served_by"),
+                error=result["error"]
+            )
+            for result in results
+        ])
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error processing batch chat request: {str(e)}"
+        )
+
+
+@router.post("/stream")
+async def chat_stream(
+    request: ChatRequest,
+    rag_service: AsyncRAGService = Depends(get_async_rag_service),
+    tracer: Optional[TracerProtocol] = Depends(get_tracer)
+) -> StreamingResponse:
+    """Streaming chat endpoint emitting Server-Sent Events.
+
+    The first ``metadata`` event carries ``retrieved_chunks`` and ``confidence``
+    as soon as retrieval finishes, followed by ``token`` events as the LLM
+    produces them and a final ``done`` event with the full answer and
+    ``served_by`` ("generation", "extractive" or "extractive_fallback") and
+    ``degraded`` stages.
+    With ``debug`` set and debug traces enabled, a ``trace`` event with the
+    span tree comes last.
+
+    Args:
+        request: Chat request with message and history
+        rag_service: RAG service dependency
+        tracer: Request tracer dependency
+
+    Returns:
+        Event stream response
+    """
+    conversation_history = [
+        {"role": msg.role, "content": msg.content}
+        for msg in request.conversation_history
+    ]
+    debug = _debug(request)
+
+    async def event_source() -> AsyncIterator[str]:
+        # Traced inside the generator: the response body is produced after
+        # the endpoint has returned, so it is driven in a private context
+        # that keeps the span's context variable pairing intact.
+        root = None
+        try:
+            with _trace(tracer, "chat_stream", debug) as root:
+                async for event in rag_service.chat_stream(
+                    query=request.message,
+                    conversation_history=conversation_history,
+                    top_k=settings.top_k_retrieval,
+                    score_threshold=settings.similarity_threshold
+                ):
+                    yield _format_sse(event["event"], event["data"])
+        except Exception as e:
+            yield _format_sse(
+                "error",
+                {"detail": f"Error processing chat request: {str(e)}"}
+            )
+        if debug and root is not None:
+            yield _format_sse("trace", root.to_dict())
+
+    return StreamingResponse(
+        aiterate_in_context(event_source()),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/health")
 async def health_check(
-    rag_service: RAGService = Depends(get_rag_service)
+    rag_service: AsyncRAGService = Depends(get_async_rag_service)
 ) -> Dict:
     """Health check endpoint for chat service.
 
@@ -78,7 +282,7 @@ async def health_check(
         Health status dictionary
     """
     try:
-        is_healthy = rag_service.vector_store.health_check()
+        is_healthy = await rag_service.vector_store.health_check()
 
         return {
             "status": "healthy" if is_healthy else "degraded",
@@ -90,3 +294,61 @@ async def health_check(
             "status": "unhealthy",
             "error": str(e)
         }
+
+
+@router.get("/retrieval/stats")
+async def retrieval_stats(
+    rag_service: AsyncRAGService = Depends(get_async_rag_service)
+) -> Dict:
+    """Retrieval path counters for comparing rewrite modes.
+
+    Args:
+        rag_service: RAG service dependency
+
+    Returns:
+        Count and mean latency per retrieval path
+    """
+    return rag_service.get_retrieval_stats()
+
+
+@router.get("/embedding/stats")
+async def embedding_stats(
+    rag_service: AsyncRAGService = Depends(get_async_rag_service)
+) -> Dict:
+    """Embedding request coalescing counters, including batch fill ratio.
+
+    Args:
+        rag_service: RAG service dependency
+
+    Returns:
+        Coalescer statistics dictionary
+    """
+    get_stats = getattr(rag_service.embedding_model, "get_stats", None)
+    return {"coalescer": get_stats() if get_stats else {"enabled": False}}
+
+
+@router.get("/cache/stats")
+async def cache_stats(
+    rag_service: AsyncRAGService = Depends(get_async_rag_service),
+    rewrite_cache: Optional[RewriteCacheProtocol] = Depends(get_rewrite_cache),
+    embedding_cache: Optional[EmbeddingCacheProtocol] = Depends(get_embedding_cache)
+) -> Dict:
+    """Answer, rewrite and embedding cache and in-flight deduplication counters.
+
+    Args:
+        rag_service: RAG service dependency
+        rewrite_cache: Query rewrite cache dependency
+        embedding_cache: Embedding cache dependency
+
+    Returns:
+        Cache statistics dictionary
+    """
+    answer_cache = rag_service.answer_cache
+    single_flight = rag_service.single_flight
+
+    return {
+        "answer": answer_cache.get_stats() if answer_cache else {"enabled": False},
+        "single_flight": single_flight.get_stats() if single_flight else {"enabled": False},
+        "rewrite": rewrite_cache.get_stats() if rewrite_cache else {"enabled": False},
+        "embedding": embedding_cache.get_stats() if embedding_cache else {"enabled": False}
+    }
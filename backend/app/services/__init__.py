@@ -1,5 +1,14 @@
 """Services module for utility services."""
 
 from .preprocessing import PreprocessingService
+from .indexing import IndexSyncService, SyncPlan, BlueGreenIndexer
+from .bulk_embedding import BulkEmbedder, TokenBucket
 
-__all__ = ["PreprocessingService"]
+__all__ = [
+    "PreprocessingService",
+    "IndexSyncService",
+    "SyncPlan",
+    "BlueGreenIndexer",
+    "BulkEmbedder",
+    "TokenBucket",
+]
@@ -0,0 +1,287 @@
+"""Parallel, rate-limited and resumable embedding of large chunk sets."""
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, wait
+from typing import List, Dict, Any, Optional, Callable
+import hashlib
+import json
+import logging
+import os
+import random
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+from ..core.interfaces import EmbeddingModelProtocol
+from ..core.exceptions import EmbeddingError
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting how often requests start.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``;
+    ``acquire`` blocks until a token is available. A full bucket allows a
+    burst of ``capacity`` requests, after which requests are spaced evenly.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Largest burst, defaults to one second of tokens
+        """
+        self.rate = rate
+        self.capacity = max(capacity if capacity is not None else rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens, sleeping until enough have accumulated.
+
+        Args:
+            tokens: Tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class BulkEmbedder:
+    """Embed many texts in API-sized batches with bounded concurrency.
+
+    Wraps an embedding model and satisfies the same protocol, so it can be
+    handed to the indexing services as-is. Each ``encode`` call is split
+    into batches of ``batch_size`` texts, run on up to ``max_concurrency``
+    threads; every request first takes a token from the rate limiter and
+    failed requests are retried with jittered exponential backoff.
+
+    With ``checkpoint_dir`` each finished batch is written to a ``.npy``
+    file named after a hash of its texts. A rerun after a crash or an
+    exhausted retry budget loads those files instead of calling the API
+    again, so only the unfinished batches are re-embedded.
+    """
+
+    def __init__(
+        self,
+        embedding_model: EmbeddingModelProtocol,
+        batch_size: int = 100,
+        max_concurrency: int = 4,
+        requests_per_minute: float = 0.0,
+        max_retries: int = 3,
+        retry_base_delay: float = 1.0,
+        checkpoint_dir: Optional[str] = None,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        """Initialize bulk embedder.
+
+        Args:
+            embedding_model: Model that embeds one batch per call
+            batch_size: Texts per API request
+            max_concurrency: Requests in flight at once
+            requests_per_minute: Request rate limit, 0 for unlimited
+            max_retries: Retries per batch before giving up
+            retry_base_delay: First retry delay in seconds, doubled per retry
+            checkpoint_dir: Optional directory for finished batches
+            on_progress: Called with progress stats after every batch
+        """
+        self.embedding_model = embedding_model
+        # Checkpoints are keyed like the embedding cache, so switching the
+        # model or task type never resumes from another model's vectors.
+        self.model_name = getattr(embedding_model, "model_name", type(embedding_model).__name__)
+        self.task_type = getattr(embedding_model, "task_type", "")
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.checkpoint_dir = checkpoint_dir
+        self.on_progress = on_progress
+        self._limiter = TokenBucket(requests_per_minute / 60.0) if requests_per_minute > 0 else None
+
+        self._lock = threading.Lock()
+        self._expected = 0
+        self._done = 0
+        self._resumed = 0
+        self._retries = 0
+        self._started: Optional[float] = None
+
+        if checkpoint_dir:
+            os.makedirs(checkpoint_dir, exist_ok=True)
+
+    def get_dimension(self) -> int:
+        """Get embedding dimension.
+
+        Returns:
+            Embedding dimension
+        """
+        return self.embedding_model.get_dimension()
+
+    def expect(self, total: int) -> None:
+        """Announce how many texts will be encoded across all calls.
+
+        Progress and ETA are reported against this total; without it each
+        ``encode`` call counts as the whole job.
+
+        Args:
+            total: Texts to be encoded
+        """
+        with self._lock:
+            self._expected = total
+            self._done = 0
+            self._resumed = 0
+            self._retries = 0
+            self._started = time.perf_counter()
+
+    def _checkpoint_path(self, texts: List[str]) -> Optional[str]:
+        """Content-addressed checkpoint file of one batch."""
+        if not self.checkpoint_dir:
+            return None
+        raw = json.dumps(
+            [self.model_name, self.get_dimension(), self.task_type, texts], ensure_ascii=False
+        )
+        digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.checkpoint_dir, f"{digest}.npy")
+
+    def _load_checkpoint(self, path: Optional[str], size: int) -> Optional[np.ndarray]:
+        """Load a finished batch, ignoring missing or truncated files."""
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            embeddings = np.load(path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+            return None
+        return embeddings if embeddings.shape == (size, self.get_dimension()) else None
+
+    def _save_checkpoint(self, path: Optional[str], embeddings: np.ndarray) -> None:
+        """Write a finished batch atomically."""
+        if path is None:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.checkpoint_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, embeddings)
+        os.replace(tmp_path, path)
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Embed one batch, retrying with jittered exponential backoff.
+
+        Raises:
+            EmbeddingError: If every attempt fails
+        """
+        path = self._checkpoint_path(texts)
+        embeddings = self._load_checkpoint(path, len(texts))
+        if embeddings is not None:
+            self._report(len(texts), resumed=True)
+            return embeddings
+
+        for attempt in range(self.max_retries + 1):
+            if self._limiter is not None:
+                self._limiter.acquire()
+            try:
+                embeddings = np.asarray(self.embedding_model.encode(texts), dtype=np.float32)
+                break
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise EmbeddingError(f"Batch failed after {attempt + 1} attempts: {e}")
+                delay = self.retry_base_delay * 2 ** attempt * random.uniform(0.5, 1.5)
+                logger.warning(f"Embedding batch failed ({e}), retrying in {delay:.1f}s")
+                with self._lock:
+                    self._retries += 1
+                time.sleep(delay)
+
+        self._save_checkpoint(path, embeddings)
+        self._report(len(texts))
+        return embeddings
+
+    def _report(self, count: int, resumed: bool = False) -> None:
+        """Update counters and publish throughput and ETA."""
+        with self._lock:
+            self._done += count
+            if resumed:
+                self._resumed += count
+            stats = self.get_progress()
+        if self.on_progress is not None:
+            self.on_progress(stats)
+
+    def get_progress(self) -> Dict[str, Any]:
+        """Get progress of the current job.
+
+        Throughput counts only texts sent to the API, so batches loaded
+        from checkpoints do not inflate it or shorten the ETA unduly.
+
+        Returns:
+            Dictionary with done/total texts, resumed texts, retries,
+            texts per second and the estimated seconds remaining
+        """
+        elapsed = time.perf_counter() - self._started if self._started else 0.0
+        embedded = self._done - self._resumed
+        rate = embedded / elapsed if elapsed > 0 else 0.0
+        remaining = max(self._expected - self._done, 0)
+        return {
+            "done": self._done,
+            "total": self._expected,
+            "resumed": self._resumed,
+            "retries": self._retries,
+            "texts_per_second": round(rate, 1),
+            "eta_seconds": round(remaining / rate, 1) if rate > 0 else None
+        }
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """Encode texts in parallel batches.
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            Array of embeddings aligned with ``texts``
+
+        Raises:
+            EmbeddingError: If a batch still fails after its retries
+        """
+        if self._started is None or self._done >= self._expected:
+            self.expect(len(texts))
+        if not texts:
+            return np.empty((0, self.get_dimension()), dtype=np.float32)
+
+        batches = [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            futures = [pool.submit(self._embed_batch, batch) for batch in batches]
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            failed = [future for future in done if future.exception() is not None]
+            if failed:
+                for future in futures:
+                    future.cancel()
+                raise failed[0].exception()
+
+        return np.concatenate([future.result() for future in futures])
+
+    def clear_checkpoints(self) -> int:
+        """Delete checkpoint files once the job has been indexed.
+
+        Returns:
+            Number of files deleted
+        """
+        if not self.checkpoint_dir or not os.path.isdir(self.checkpoint_dir):
+            return 0
+        removed = 0
+        for name in os.listdir(self.checkpoint_dir):
+            if name.endswith(".npy"):
+                os.remove(os.path.join(self.checkpoint_dir, name))
+                removed += 1
+        return removed
@@ -0,0 +1,273 @@
+"""Synchronization and rebuilds of the vector store from source chunks."""
+
+from itertools import chain, islice
+from typing import List, Dict, Any, NamedTuple, Callable, Iterable, Iterator, Set
+import logging
+import time
+
+from ..core.interfaces import EmbeddingModelProtocol, VectorStoreProtocol
+from ..infrastructure.vector_store import content_point_id, QdrantCollectionVersions
+
+logger = logging.getLogger(__name__)
+
+# Near-duplicate chunks can outrank the probe itself, so it only has to
+# appear among the first few hits.
+PROBE_TOP_K = 5
+
+
+def iter_batches(chunks: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Split a chunk stream into lists of at most ``size`` chunks.
+
+    Args:
+        chunks: Chunk iterable, consumed lazily
+        size: Chunks per batch
+
+    Yields:
+        Chunk batches
+    """
+    chunks = iter(chunks)
+    while True:
+        batch = list(islice(chunks, size))
+        if not batch:
+            return
+        yield batch
+
+
+class SyncPlan(NamedTuple):
+    """Difference between the source chunks and the indexed points."""
+    to_upsert: List[Dict[str, Any]]
+    to_delete: List[str]
+    unchanged: int
+    duplicates: int
+
+
+class IndexSyncService:
+    """Bring the vector store in line with the source chunks.
+
+    Point IDs are derived from chunk content, so the indexed ID set alone
+    tells which chunks are already present: only new or edited chunks are
+    embedded and upserted, and points whose content no longer exists in
+    the source are deleted. An edited row therefore shows up as one upsert
+    plus one deletion. Upserts run before deletions so an edited answer is
+    never missing from the index mid-sync.
+    """
+
+    def __init__(
+        self,
+        embedding_model: EmbeddingModelProtocol,
+        vector_store: VectorStoreProtocol,
+        batch_size: int = 100
+    ):
+        """Initialize index sync service.
+
+        Args:
+            embedding_model: Model used to embed new or edited chunks
+            vector_store: Vector store to synchronize
+            batch_size: Chunks embedded and upserted per request
+        """
+        self.embedding_model = embedding_model
+        self.vector_store = vector_store
+        self.batch_size = batch_size
+
+    def plan(self, chunks: Iterable[Dict[str, Any]]) -> SyncPlan:
+        """Diff the source chunks against the indexed point IDs.
+
+        Chunks are consumed as a stream: only the source ID set and the
+        chunks that need upserting are kept, so unchanged chunks are dropped
+        as soon as they are seen. Of duplicate chunks the first is kept.
+
+        Args:
+            chunks: Source chunks
+
+        Returns:
+            Chunks to upsert, point IDs to delete and unchanged/duplicate counts
+        """
+        indexed = set(self.vector_store.get_point_ids())
+        source: Set[str] = set()
+        to_upsert: List[Dict[str, Any]] = []
+        total = 0
+        for chunk in chunks:
+            total += 1
+            point_id = content_point_id(chunk)
+            if point_id in source:
+                continue
+            source.add(point_id)
+            if point_id not in indexed:
+                to_upsert.append(chunk)
+
+        return SyncPlan(
+            to_upsert=to_upsert,
+            to_delete=sorted(indexed - source),
+            unchanged=len(indexed & source),
+            duplicates=total - len(source)
+        )
+
+    def apply(self, plan: SyncPlan) -> Dict[str, Any]:
+        """Embed and upsert new chunks, delete stale points, then flush the store.
+
+        Args:
+            plan: Plan returned by ``plan``
+
+        Returns:
+            Change summary with upserted, deleted and unchanged counts
+
+        Raises:
+            RuntimeError: If the vector store rejects an upsert or deletion
+        """
+        start = time.perf_counter()
+
+        for offset in range(0, len(plan.to_upsert), self.batch_size):
+            batch = plan.to_upsert[offset:offset + self.batch_size]
+            embeddings = self.embedding_model.encode([chunk["content"] for chunk in batch])
+            if not self.vector_store.index_documents(embeddings, batch):
+                raise RuntimeError(f"Upserting chunks {offset}-{offset + len(batch)} failed")
+            logger.info(f"Upserted {offset + len(batch)}/{len(plan.to_upsert)} chunks")
+
+        if plan.to_delete and not self.vector_store.delete_points(plan.to_delete):
+            raise RuntimeError(f"Deleting {len(plan.to_delete)} stale points failed")
+        self.vector_store.flush()
+
+        return {
+            "upserted": len(plan.to_upsert),
+            "deleted": len(plan.to_delete),
+            "unchanged": plan.unchanged,
+            "duplicates": plan.duplicates,
+            "seconds": round(time.perf_counter() - start, 2)
+        }
+
+    def sync(self, chunks: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Plan and apply a sync in one call.
+
+        Args:
+            chunks: Source chunks
+
+        Returns:
+            Change summary
+        """
+        return self.apply(self.plan(chunks))
+
+
+class BlueGreenIndexer:
+    """Rebuild a Qdrant collection behind an alias without downtime.
+
+    Each rebuild fills a fresh ``{alias}_v{n}`` collection while the
+    published one keeps serving, verifies it, and only then repoints the
+    alias. Readers therefore see either the old or the new index, never a
+    partially filled one, and a failed rebuild leaves the alias untouched.
+    """
+
+    def __init__(
+        self,
+        embedding_model: EmbeddingModelProtocol,
+        versions: QdrantCollectionVersions,
+        store_factory: Callable[[str], VectorStoreProtocol],
+        batch_size: int = 100
+    ):
+        """Initialize blue/green indexer.
+
+        Args:
+            embedding_model: Model used to embed the chunks
+            versions: Version manager of the alias readers query
+            store_factory: Builds a vector store for a physical collection name
+            batch_size: Chunks embedded and indexed per request
+        """
+        self.embedding_model = embedding_model
+        self.versions = versions
+        self.store_factory = store_factory
+        self.batch_size = batch_size
+
+    def _fill(self, store: VectorStoreProtocol, chunks: Iterable[Dict[str, Any]]) -> Set[str]:
+        """Embed and index chunks into a new collection in batches.
+
+        Returns:
+            Point IDs of the indexed chunks
+        """
+        expected: Set[str] = set()
+        offset = 0
+        for batch in iter_batches(chunks, self.batch_size):
+            embeddings = self.embedding_model.encode([chunk["content"] for chunk in batch])
+            if not store.index_documents(embeddings, batch):
+                raise RuntimeError(f"Indexing chunks {offset}-{offset + len(batch)} failed")
+            expected.update(content_point_id(chunk) for chunk in batch)
+            offset += len(batch)
+            logger.info(f"Indexed {offset} chunks")
+        store.flush()
+        return expected
+
+    def _verify(self, store: VectorStoreProtocol, expected: Set[str], probe: Dict[str, Any]) -> None:
+        """Check the new collection is complete and answers queries.
+
+        The probe search also loads the collection's segments before the
+        first real query reaches it.
+
+        Args:
+            store: Newly filled store
+            expected: Point IDs that must be indexed
+            probe: Source chunk searched for by its own content
+
+        Raises:
+            RuntimeError: If a point is missing or the probe misses its chunk
+        """
+        indexed = set(store.get_point_ids())
+        if indexed != expected:
+            raise RuntimeError(
+                f"Collection holds {len(indexed)} points, expected {len(expected)}"
+            )
+
+        embedding = self.embedding_model.encode([probe["content"]])[0]
+        hits = store.search(embedding, top_k=PROBE_TOP_K, score_threshold=0.0)
+        if content_point_id(probe) not in {str(hit["id"]) for hit in hits}:
+            raise RuntimeError("Probe search did not return the probed chunk")
+
+    def rebuild(
+        self,
+        chunks: Iterable[Dict[str, Any]],
+        grace_seconds: float = 30.0,
+        keep_versions: int = 1
+    ) -> Dict[str, Any]:
+        """Build, verify and publish a new collection version.
+
+        Args:
+            chunks: Source chunks, consumed as a stream
+            grace_seconds: Wait after the switch before deleting retired
+                versions, so in-flight searches on them can finish
+            keep_versions: Retired versions kept for rollback
+
+        Returns:
+            Summary with the published and previous collections, indexed
+            point count and deleted collections
+
+        Raises:
+            RuntimeError: If the new collection cannot be built or verified
+        """
+        chunks = iter(chunks)
+        probe = next(chunks, None)
+        if probe is None:
+            raise RuntimeError("Refusing to publish an empty collection")
+
+        start = time.perf_counter()
+        name = self.versions.next_name()
+        store = self.store_factory(name)
+        if not store.create_collection(recreate=True):
+            raise RuntimeError(f"Creating collection {name} failed")
+
+        try:
+            expected = self._fill(store, chain([probe], chunks))
+            self._verify(store, expected, probe)
+        except Exception:
+            logger.error(f"Rebuild into {name} failed, dropping it")
+            self.versions.drop(name)
+            raise
+
+        previous = self.versions.switch(name)
+        if grace_seconds > 0:
+            time.sleep(grace_seconds)
+        deleted = self.versions.garbage_collect(keep_versions)
+
+        return {
+            "collection": name,
+            "previous": previous,
+            "points": store.get_collection_info().get("points_count"),
+            "deleted": deleted,
+            "seconds": round(time.perf_counter() - start, 2)
+        }
@@ -1,20 +1,82 @@
 """Data preprocessing service for Q&A dataset."""
 
-import pandas as pd
-from typing import List, Dict
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence
+import csv
+import json
+import os
 import re
 
+import pandas as pd
+from openpyxl import load_workbook
+
+SOURCE_EXTENSIONS = (".xlsx", ".xlsm", ".csv", ".jsonl")
+
+_QUESTION = re.compile(r'Q\.\s*(.+?)(?=A\.|$)', re.DOTALL)
+_ANSWER = re.compile(r'A\.\s*(.+?)$', re.DOTALL)
+
+
+def iter_rows(file_path: str) -> Iterator[Sequence[Any]]:
+    """Stream the data rows of a source file as sequences of cell values.
+
+    Spreadsheets and CSV files treat their first row as a header, like
+    ``pd.read_excel`` did; JSONL files yield the values of each object.
+    Only one row is held in memory at a time.
+
+    Args:
+        file_path: Path to an .xlsx, .xlsm, .csv or .jsonl file
+
+    Yields:
+        Cell values of each data row
+
+    Raises:
+        ValueError: If the file extension is not supported
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+
+    if extension in (".xlsx", ".xlsm"):
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            next(rows, None)
+            yield from rows
+        finally:
+            workbook.close()
+    elif extension == ".csv":
+        with open(file_path, newline="", encoding="utf-8-sig") as f:
+            rows = csv.reader(f)
+            next(rows, None)
+            yield from rows
+    elif extension == ".jsonl":
+        with open(file_path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    yield list(record.values()) if isinstance(record, dict) else record
+    else:
+        raise ValueError(f"Unsupported source file: {file_path}")
+
+
+def _file_chunks(file_path: str) -> List[Dict[str, Any]]:
+    """Chunk one file in a worker process."""
+    return list(PreprocessingService(file_path).iter_chunks())
+
 
 class PreprocessingService:
-    """Service for preprocessing Q&A data from Excel files."""
+    """Service for preprocessing Q&A data from Excel, CSV or JSONL files."""
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, max_workers: Optional[int] = None):
         """Initialize preprocessing service.
 
         Args:
-            file_path: Path to Excel file
+            file_path: Path to a source file, or a directory of source files
+            max_workers: Processes used to chunk a directory, defaults to the
+                CPU count
         """
         self.file_path = file_path
+        self.max_workers = max_workers
 
     def load_data(self) -> pd.DataFrame:
         """Load Q&A data from Excel file.
@@ -25,6 +87,20 @@ class PreprocessingService:
         df = pd.read_excel(self.file_path)
         return df
 
+    def source_files(self) -> List[str]:
+        """List the source files under ``file_path``.
+
+        Returns:
+            Sorted paths of supported files, or ``[file_path]`` for a file
+        """
+        if not os.path.isdir(self.file_path):
+            return [self.file_path]
+        return sorted(
+            os.path.join(self.file_path, name)
+            for name in os.listdir(self.file_path)
+            if name.lower().endswith(SOURCE_EXTENSIONS) and not name.startswith("~$")
+        )
+
     def parse_qa_content(self, content: str) -> Dict[str, str]:
         """Parse Q&A content from a single cell.
 
@@ -34,8 +110,8 @@ class PreprocessingService:
         Returns:
             Dictionary with question and answer
         """
-        question_match = re.search(r'Q\.\s*(.+?)(?=A\.|$)', content, re.DOTALL)
-        answer_match = re.search(r'A\.\s*(.+?)$', content, re.DOTALL)
+        question_match = _QUESTION.search(content)
+        answer_match = _ANSWER.search(content)
 
         question = question_match.group(1).strip() if question_match else ""
         answer = answer_match.group(1).strip() if answer_match else ""
@@ -45,22 +121,26 @@ class PreprocessingService:
             "answer": answer
         }
 
-    def create_chunks(self) -> List[Dict[str, any]]:
-        """Create structured chunks from Q&A data.
+    def iter_chunks(self) -> Iterator[Dict[str, Any]]:
+        """Stream structured chunks from a single source file.
 
-        Returns:
-            List of chunk dictionaries
-        """
-        df = self.load_data()
-        chunks = []
+        A row holding both "Q." and "A." is one chunk; a "Q." row is held
+        until the next "A." row and stitched to it. Memory stays constant
+        regardless of file size.
 
+        Yields:
+            Chunk dictionaries, ids numbered from 1
+        """
+        source = os.path.basename(self.file_path)
         current_question_part = None
         chunk_counter = 1
 
-        for idx, row in df.iterrows():
+        for idx, row in enumerate(iter_rows(self.file_path)):
             content = ""
-            for col in df.columns:
-                val = str(row[col])
+            for val in row:
+                if val is None:
+                    continue
+                val = str(val)
                 if "Q." in val or "A." in val:
                     content = val
                     break
@@ -68,20 +148,18 @@ class PreprocessingService:
             if not content:
                 continue
 
-            full_text = ""
+            has_question = "Q." in content
+            has_answer = "A." in content
 
-            if "Q." in content and "A." in content:
+            if has_question and has_answer:
                 full_text = content
                 current_question_part = None
-            elif "Q." in content:
+            elif has_question:
                 current_question_part = content
                 continue
-            elif "A." in content:
-                if current_question_part:
-                    full_text = f"{current_question_part}\n{content}"
-                    current_question_part = None
-                else:
-                    continue
+            elif current_question_part:
+                full_text = f"{current_question_part}\n{content}"
+                current_question_part = None
             else:
                 continue
 
@@ -90,28 +168,69 @@ class PreprocessingService:
             if not qa_data["question"] or not qa_data["answer"]:
                 continue
 
-            chunk = {
+            yield {
                 "id": str(chunk_counter),
                 "question": qa_data["question"],
                 "answer": qa_data["answer"],
                 "content": f"질문: {qa_data['question']}\n답변: {qa_data['answer']}",
                 "metadata": {
-                    "source": "Q&A.xlsx",
-                    "row_number": int(idx + 1),
+                    "source": source,
+                    "row_number": idx + 1,
                     "category": "perso_ai"
                 }
             }
-
-            chunks.append(chunk)
             chunk_counter += 1
 
-        return chunks
+    def iter_all_chunks(self) -> Iterator[Dict[str, Any]]:
+        """Stream chunks from ``file_path`` or every file in its directory.
+
+        Directory files are chunked in parallel across a process pool and
+        yielded in file-name order. At most one file per worker is submitted
+        or finished but not yet consumed, so the parent never buffers more
+        than that many files' chunks however large the directory is. Ids are
+        renumbered so they stay unique across files.
+
+        Yields:
+            Chunk dictionaries
+        """
+        files = self.source_files()
+        if len(files) == 1:
+            yield from PreprocessingService(files[0]).iter_chunks()
+            return
+
+        window = self.max_workers or os.cpu_count() or 1
+        remaining = iter(files)
+        chunk_counter = 1
+        with ProcessPoolExecutor(max_workers=window) as pool:
+            pending = deque(pool.submit(_file_chunks, path) for path in islice(remaining, window))
+            while pending:
+                file_chunks = pending.popleft().result()
+                # Refill the window before yielding so workers stay busy
+                # while the consumer handles this file.
+                for path in islice(remaining, 1):
+                    pending.append(pool.submit(_file_chunks, path))
+                for chunk in file_chunks:
+                    chunk["id"] = str(chunk_counter)
+                    chunk_counter += 1
+                    yield chunk
+                del file_chunks
+
+    def create_chunks(self) -> List[Dict[str, Any]]:
+        """Create structured chunks from Q&A data.
+
+        Holds every chunk in memory; prefer ``iter_all_chunks`` for large
+        sources.
+
+        Returns:
+            List of chunk dictionaries
+        """
+        return list(self.iter_all_chunks())
 
-    def validate_chunks(self, chunks: List[Dict[str, any]]) -> bool:
+    def validate_chunks(self, chunks: Iterable[Dict[str, Any]]) -> bool:
         """Validate that all chunks have required fields.
 
         Args:
-            chunks: List of chunks to validate
+            chunks: Chunks to validate
 
         Returns:
             True if all chunks are valid
@@ -0,0 +1,163 @@
+"""Recall/latency benchmark: IVF approximate search vs. exact NumPy search.
+
+Indexes the same points into ``NumpyVectorStore`` (ground truth) and
+``IVFVectorStore``, then sweeps ``nprobe`` and reports recall@k and search
+latency percentiles, including the smallest ``nprobe`` that still finds
+the exact top-k for every query.
+
+Synthetic data defaults to overlapping clusters (noise larger than the
+spread of the centers); ``--clusters 0`` draws isotropic Gaussian vectors,
+the worst case for a coarse quantizer. Queries are fresh draws from the same
+distribution, not perturbed copies of indexed points. With ``--snapshot`` the
+queries are held-out rows of the snapshot, which are not indexed.
+
+Usage:
+    python scripts/benchmark_ann.py --points 200000 --nprobe 4 8 16 32
+    python scripts/benchmark_ann.py --clusters 0 --nprobe 16 64 256
+    python scripts/benchmark_ann.py --snapshot data/vector_snapshot --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.infrastructure.vector_store import NumpyVectorStore, IVFVectorStore
+
+
+def synthetic_vectors(points, dimension, clusters, noise, rng):
+    """Generate vectors around random cluster centers, or isotropic ones."""
+    samples = rng.standard_normal((points, dimension)).astype(np.float32)
+    if clusters <= 0:
+        return samples
+    centers = rng.standard_normal((clusters, dimension)).astype(np.float32)
+    labels = rng.integers(0, clusters, size=points)
+    return centers[labels] + noise * samples
+
+
+def percentile_ms(samples, q):
+    """Percentile of latency samples in milliseconds."""
+    return round(float(np.percentile(samples, q)) * 1000, 3)
+
+
+def timed_search(store, queries, top_k):
+    """Search every query, returning result id lists and per-query latency."""
+    results, latencies = [], []
+    for query in queries:
+        start = time.perf_counter()
+        hits = store.search(query, top_k=top_k, score_threshold=-1.0)
+        latencies.append(time.perf_counter() - start)
+        results.append([hit["id"] for hit in hits])
+    return results, latencies
+
+
+def recall_at_k(truth, approx, k):
+    """Mean fraction of the exact top-k found by the approximate search."""
+    found = [len(set(t[:k]) & set(a[:k])) / max(1, len(t[:k])) for t, a in zip(truth, approx)]
+    return round(float(np.mean(found)), 4)
+
+
+def run(args):
+    """Run the benchmark and return a report dictionary."""
+    rng = np.random.default_rng(args.seed)
+
+    if args.snapshot:
+        vectors = np.load(os.path.join(args.snapshot, "vectors.npy"))
+        held_out = np.zeros(len(vectors), dtype=bool)
+        held_out[rng.choice(len(vectors), size=args.queries, replace=False)] = True
+        queries, vectors = vectors[held_out], vectors[~held_out]
+    else:
+        sample = synthetic_vectors(
+            args.points + args.queries, args.dimension, args.clusters, args.noise, rng
+        )
+        queries, vectors = sample[:args.queries], sample[args.queries:]
+    points = [(str(i), vector, {}) for i, vector in enumerate(vectors)]
+
+    exact = NumpyVectorStore("exact", vectors.shape[1])
+    exact.import_points(points)
+
+    start = time.perf_counter()
+    ivf = IVFVectorStore("ivf", vectors.shape[1], nlist=args.nlist, min_train_size=1)
+    ivf.import_points(points)
+    build_seconds = time.perf_counter() - start
+
+    truth, exact_latency = timed_search(exact, queries, args.top_k)
+    report = {
+        "points": len(vectors),
+        "dimension": int(vectors.shape[1]),
+        "queries": len(queries),
+        "data": "snapshot" if args.snapshot else (
+            f"{args.clusters} clusters, noise {args.noise}" if args.clusters > 0 else "isotropic"
+        ),
+        "top_k": args.top_k,
+        "nlist": ivf.get_collection_info()["index"]["nlist"],
+        "build_seconds": round(build_seconds, 2),
+        "exact": {
+            "p50_ms": percentile_ms(exact_latency, 50),
+            "p99_ms": percentile_ms(exact_latency, 99)
+        },
+        "ivf": []
+    }
+
+    for nprobe in args.nprobe:
+        ivf.nprobe = nprobe
+        approx, latency = timed_search(ivf, queries, args.top_k)
+        report["ivf"].append({
+            "nprobe": nprobe,
+            f"recall@{args.top_k}": recall_at_k(truth, approx, args.top_k),
+            "recall@1": recall_at_k(truth, approx, 1),
+            "p50_ms": percentile_ms(latency, 50),
+            "p99_ms": percentile_ms(latency, 99)
+        })
+    report["full_recall_nprobe"] = next(
+        (row["nprobe"] for row in report["ivf"] if row[f"recall@{args.top_k}"] >= 1.0), None
+    )
+    return report
+
+
+def main():
+    """Parse arguments, run the benchmark and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=100000)
+    parser.add_argument("--dimension", type=int, default=768)
+    parser.add_argument("--clusters", type=int, default=200, help="Synthetic cluster count, 0 for isotropic")
+    parser.add_argument("--noise", type=float, default=2.0, help="Synthetic noise relative to center spread")
+    parser.add_argument("--snapshot", help="Benchmark the vectors of this snapshot instead")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--nlist", type=int, default=0, help="0 uses sqrt(points)")
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16, 32, 64])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON only")
+    args = parser.parse_args()
+
+    report = run(args)
+
+    if args.json:
+        print(json.dumps(report))
+        return
+
+    print("=" * 60)
+    print(f"ANN benchmark: {report['points']} x {report['dimension']} ({report['data']}), nlist={report['nlist']}")
+    print("=" * 60)
+    print(f"IVF build: {report['build_seconds']}s")
+    print(f"exact      p50={report['exact']['p50_ms']:8.3f}ms  p99={report['exact']['p99_ms']:8.3f}ms")
+    recall_key = f"recall@{report['top_k']}"
+    for row in report["ivf"]:
+        print(
+            f"nprobe={row['nprobe']:<4d} {recall_key}={row[recall_key]:.4f}  recall@1={row['recall@1']:.4f}  "
+            f"p50={row['p50_ms']:8.3f}ms  p99={row['p99_ms']:8.3f}ms"
+        )
+    if report["full_recall_nprobe"] is None:
+        print(f"{recall_key} stays below 1 for every nprobe tested")
+    else:
+        print(f"{recall_key} reaches 1 at nprobe={report['full_recall_nprobe']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""Offline load test of the chat API with local stand-ins for Gemini and Qdrant.
+
+Configures the app through its settings so the regular factories and
+``application/dependencies.py`` build a deterministic hashing embedding
+model, a fake LLM with jittered latency and an in-process NumPy vector
+store. The Q&A data (or a synthetic set when no data file exists) is
+indexed into that store, then ``POST /api/v1/chat/`` is driven in-process
+at a fixed concurrency. The JSON report (throughput, latency percentiles,
+per-stage ``Server-Timing`` percentiles, status, ``served_by`` and
+degraded-stage counts, the commit and the full settings) can be saved and
+compared across commits.
+
+Usage:
+    python scripts/benchmark_load.py --requests 500 --concurrency 32 --output load.json
+    python scripts/benchmark_load.py --set rewrite_mode=never --set semantic_cache_enabled=true
+    python scripts/benchmark_load.py --compare load.json --max-regression 0.1
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+
+import numpy as np
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+TOPICS = ["요금제", "더빙", "번역", "음성 복제", "립싱크", "API", "팀 플랜", "결제", "영상 길이", "지원 언어"]
+ASPECTS = ["가격", "사용 방법", "제한", "지원 범위", "처리 시간", "품질", "환불", "계정 설정"]
+
+
+def write_synthetic_data(path, rows, seed):
+    """Write a Q&A CSV in the dataset's "Q. ... A. ..." cell format."""
+    rng = random.Random(seed)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["content"])
+        for i in range(rows):
+            topic, aspect = rng.choice(TOPICS), rng.choice(ASPECTS)
+            writer.writerow([
+                f"Q. Perso.ai {topic}의 {aspect}은(는) 어떻게 되나요? (#{i})\n"
+                f"A. {topic} {aspect} 안내 #{i}: 대시보드의 {topic} 메뉴에서 {aspect}을(를) 확인할 수 있습니다."
+            ])
+
+
+def configure(args, data_file):
+    """Point the app's settings at the offline providers.
+
+    Must run before ``app`` is imported, since settings are read at import.
+    """
+    os.environ.update({
+        "GEMINI_API_KEY": "offline-benchmark",
+        "EMBEDDING_PROVIDER": "hashing",
+        "FAKE_EMBEDDING_LATENCY_MS": str(args.embed_ms),
+        "LLM_PROVIDER": "fake",
+        "FAKE_LLM_FIRST_TOKEN_MS": str(args.first_token_ms),
+        "FAKE_LLM_TOKEN_MS": str(args.token_ms),
+        "FAKE_LLM_JITTER": str(args.jitter),
+        "VECTOR_STORE_PROVIDER": "numpy",
+        "VECTOR_SNAPSHOT_PATH": "",
+        "EMBEDDING_CACHE_DIR": "",
+        "LEXICAL_INDEX_PATH": "",
+        "SLOW_REQUEST_MS": "0",
+        "DATA_FILE": data_file
+    })
+    for assignment in args.set:
+        name, _, value = assignment.partition("=")
+        os.environ[name.upper()] = value
+
+
+def git_commit():
+    """Short hash of the checked-out commit, or None outside a git tree."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def summarize(samples_ms):
+    """Latency percentiles of samples in milliseconds."""
+    if not samples_ms:
+        return {}
+    values = np.asarray(samples_ms)
+    return {
+        "p50": round(float(np.percentile(values, 50)), 2),
+        "p90": round(float(np.percentile(values, 90)), 2),
+        "p99": round(float(np.percentile(values, 99)), 2),
+        "max": round(float(values.max()), 2),
+        "mean": round(float(values.mean()), 2)
+    }
+
+
+def parse_server_timing(header):
+    """Parse a ``Server-Timing`` header into stage durations in milliseconds."""
+    stages = {}
+    for entry in filter(None, (part.strip() for part in header.split(","))):
+        name, _, params = entry.partition(";")
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "dur":
+                stages[name.strip()] = float(value)
+    return stages
+
+
+async def run(args):
+    """Index the data, drive the chat endpoint and return a report dictionary."""
+    workdir = tempfile.mkdtemp(prefix="load-test-")
+    data_file = args.data
+    if not data_file or not os.path.exists(data_file):
+        data_file = os.path.join(workdir, "synthetic_qa.csv")
+        write_synthetic_data(data_file, args.synthetic_rows, args.seed)
+    configure(args, data_file)
+
+    import httpx
+    from app.main import app
+    from app.core.config import settings
+    from app.application import dependencies
+    from app.services.preprocessing import PreprocessingService
+
+    chunks = PreprocessingService(settings.data_file).create_chunks()
+    embeddings = dependencies.get_embedding_model().encode([chunk["content"] for chunk in chunks])
+    await dependencies.get_async_vector_store().index_documents(embeddings, chunks)
+
+    questions = [chunk["question"] for chunk in chunks]
+    rng = random.Random(args.seed)
+    queries = [rng.choice(questions) for _ in range(args.requests)]
+
+    url = f"{settings.api_prefix}/chat/"
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=None) as client:
+        for query in questions[:args.warmup]:
+            await client.post(url, json={"message": query})
+
+        pending = asyncio.Queue()
+        for query in queries:
+            pending.put_nowait(query)
+        latencies, stages, statuses, served_by, paths, degraded = [], {}, Counter(), Counter(), Counter(), Counter()
+
+        async def worker():
+            while not pending.empty():
+                query = pending.get_nowait()
+                start = time.perf_counter()
+                response = await client.post(url, json={"message": query})
+                latencies.append((time.perf_counter() - start) * 1000)
+                statuses[str(response.status_code)] += 1
+                for name, ms in parse_server_timing(response.headers.get("server-timing", "")).items():
+                    stages.setdefault(name, []).append(ms)
+                if response.status_code == 200:
+                    body = response.json()
+                    served_by[body.get("served_by") or "unknown"] += 1
+                    paths[body.get("retrieval_path") or "unknown"] += 1
+                    degraded.update(body.get("degraded", []))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "load": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "documents": len(chunks),
+            "data_file": args.data if data_file == args.data else "synthetic",
+            "embed_ms": args.embed_ms,
+            "first_token_ms": args.first_token_ms,
+            "token_ms": args.token_ms,
+            "jitter": args.jitter,
+            "seed": args.seed
+        },
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(args.requests / elapsed, 2),
+        "errors": sum(count for status, count in statuses.items() if status != "200"),
+        "status": dict(statuses),
+        "served_by": dict(served_by),
+        "retrieval_path": dict(paths),
+        "degraded": dict(degraded),
+        "latency_ms": summarize(latencies),
+        "stages_ms": {name: summarize(samples) for name, samples in stages.items()},
+        "settings": settings.model_dump(exclude={"gemini_api_key", "qdrant_api_key"})
+    }
+
+
+def compare(report, baseline, max_regression):
+    """Relative change of the headline numbers against a baseline report.
+
+    Returns:
+        (rows of name, baseline, current, change; True if any regression
+        exceeds ``max_regression``)
+    """
+    rows, regressed = [], False
+    checks = [("throughput_rps", report["throughput_rps"], baseline["throughput_rps"], -1)]
+    for key in ("p50", "p90", "p99"):
+        checks.append((f"latency_{key}_ms", report["latency_ms"][key], baseline["latency_ms"][key], 1))
+
+    for name, current, previous, direction in checks:
+        change = (current - previous) / previous if previous else 0.0
+        rows.append((name, previous, current, change))
+        if max_regression is not None and change * direction > max_regression:
+            regressed = True
+    return rows, regressed
+
+
+def main():
+    """Parse arguments, run the load test and print or save the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=10, help="Sequential requests before measuring")
+    parser.add_argument("--data", default=os.path.join(BACKEND_DIR, "data", "Q&A.xlsx"),
+                        help="Q&A source file or directory; synthetic data is used if missing")
+    parser.add_argument("--synthetic-rows", type=int, default=500)
+    parser.add_argument("--embed-ms", type=float, default=40.0, help="Simulated embedding call latency")
+    parser.add_argument("--first-token-ms", type=float, default=300.0, help="Simulated LLM time to first token")
+    parser.add_argument("--token-ms", type=float, default=10.0, help="Simulated LLM inter-token latency")
+    parser.add_argument("--jitter", type=float, default=0.3, help="Relative spread of simulated LLM delays")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                        help="Override an app setting, e.g. rewrite_mode=never (repeatable)")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--compare", help="Baseline JSON report to compare against")
+    parser.add_argument("--max-regression", type=float, default=None,
+                        help="Exit with status 1 if throughput or latency regresses by more than this fraction")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON only")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    rows, regressed = [], False
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows, regressed = compare(report, baseline, args.max_regression)
+        report["comparison"] = {
+            "baseline_commit": baseline.get("commit"),
+            "changes": {name: round(change, 4) for name, _, _, change in rows},
+            "regressed": regressed
+        }
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False))
+    else:
+        latency = report["latency_ms"]
+        print("=" * 60)
+        print(f"Load test @ {report['commit']} (hashing embedding, fake LLM, numpy store)")
+        print("=" * 60)
+        print(f"requests={args.requests} concurrency={args.concurrency} documents={report['load']['documents']}")
+        print(f"throughput  {report['throughput_rps']:.1f} req/s   errors={report['errors']}")
+        print(f"latency     p50={latency['p50']:.1f}ms  p90={latency['p90']:.1f}ms  "
+              f"p99={latency['p99']:.1f}ms  max={latency['max']:.1f}ms")
+        for name, stats in report["stages_ms"].items():
+            print(f"  {name:10s} p50={stats['p50']:8.1f}ms  p99={stats['p99']:8.1f}ms")
+        print(f"served_by   {report['served_by']}")
+        if report["degraded"]:
+            print(f"degraded    {report['degraded']}")
+        for name, previous, current, change in rows:
+            print(f"{name:18s} {previous:10.2f} -> {current:10.2f}  ({change:+.1%})")
+        if regressed:
+            print(f"Regression above {args.max_regression:.0%}")
+
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
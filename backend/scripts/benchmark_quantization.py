@@ -0,0 +1,164 @@
+"""Memory/recall/latency report for int8 and binary vector quantization.
+
+Indexes the Q&A embeddings of a vector snapshot (written by
+``preprocess_data.py`` with the numpy/ivf provider or by
+``export_vector_snapshot.py``) into exact and quantized ``NumpyVectorStore``
+instances, then reports resident bytes per point, recall@k against exact
+search and search latency for each oversampling factor. Falls back to
+synthetic clustered vectors when no snapshot exists.
+
+Usage:
+    python scripts/benchmark_quantization.py --snapshot data/vector_snapshot
+    python scripts/benchmark_quantization.py --points 100000 --oversampling 1 2 4 8 --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.infrastructure.vector_store import NumpyVectorStore
+
+
+def synthetic_vectors(points, dimension, clusters, rng):
+    """Generate vectors drawn around random cluster centers."""
+    centers = rng.standard_normal((clusters, dimension)).astype(np.float32)
+    labels = rng.integers(0, clusters, size=points)
+    noise = rng.standard_normal((points, dimension)).astype(np.float32)
+    return centers[labels] + 0.6 * noise
+
+
+def percentile_ms(samples, q):
+    """Percentile of latency samples in milliseconds."""
+    return round(float(np.percentile(samples, q)) * 1000, 3)
+
+
+def timed_search(store, queries, top_k):
+    """Search every query, returning result id lists and per-query latency."""
+    results, latencies = [], []
+    for query in queries:
+        start = time.perf_counter()
+        hits = store.search(query, top_k=top_k, score_threshold=-1.0)
+        latencies.append(time.perf_counter() - start)
+        results.append([hit["id"] for hit in hits])
+    return results, latencies
+
+
+def recall_at_k(truth, approx, k):
+    """Mean fraction of the exact top-k found by the approximate search."""
+    found = [len(set(t[:k]) & set(a[:k])) / max(1, len(t[:k])) for t, a in zip(truth, approx)]
+    return round(float(np.mean(found)), 4)
+
+
+def run(args):
+    """Run the benchmark and return a report dictionary."""
+    rng = np.random.default_rng(args.seed)
+
+    snapshot_vectors = os.path.join(args.snapshot, "vectors.npy")
+    if os.path.exists(snapshot_vectors):
+        vectors = np.load(snapshot_vectors)
+        source = args.snapshot
+    else:
+        vectors = synthetic_vectors(args.points, args.dimension, args.clusters, rng)
+        source = "synthetic"
+    dimension = vectors.shape[1]
+    points = [(str(i), vector, {}) for i, vector in enumerate(vectors)]
+
+    queries_count = min(args.queries, len(vectors))
+    picks = rng.choice(len(vectors), size=queries_count, replace=False)
+    queries = vectors[picks] + args.query_noise * rng.standard_normal((queries_count, dimension)).astype(np.float32)
+    top_k = min(args.top_k, len(vectors))
+
+    exact = NumpyVectorStore("exact", dimension)
+    exact.import_points(points)
+    truth, exact_latency = timed_search(exact, queries, top_k)
+
+    report = {
+        "source": source,
+        "points": len(vectors),
+        "dimension": dimension,
+        "queries": queries_count,
+        "top_k": top_k,
+        "modes": [{
+            "quantization": "none",
+            "bytes_per_point": dimension * 4,
+            "oversampling": None,
+            f"recall@{top_k}": 1.0,
+            "p50_ms": percentile_ms(exact_latency, 50),
+            "p99_ms": percentile_ms(exact_latency, 99)
+        }]
+    }
+
+    for quantization in ("int8", "binary"):
+        store = NumpyVectorStore(quantization, dimension, quantization=quantization)
+        store.import_points(points)
+        bytes_per_point = store.get_collection_info()["quantization"]["bytes_per_vector"]
+
+        store.rescore = False
+        approx, latency = timed_search(store, queries, top_k)
+        report["modes"].append({
+            "quantization": quantization,
+            "bytes_per_point": bytes_per_point,
+            "oversampling": None,
+            f"recall@{top_k}": recall_at_k(truth, approx, top_k),
+            "p50_ms": percentile_ms(latency, 50),
+            "p99_ms": percentile_ms(latency, 99)
+        })
+
+        store.rescore = True
+        for oversampling in args.oversampling:
+            store.oversampling = oversampling
+            approx, latency = timed_search(store, queries, top_k)
+            report["modes"].append({
+                "quantization": quantization,
+                "bytes_per_point": bytes_per_point,
+                "oversampling": oversampling,
+                f"recall@{top_k}": recall_at_k(truth, approx, top_k),
+                "p50_ms": percentile_ms(latency, 50),
+                "p99_ms": percentile_ms(latency, 99)
+            })
+    return report
+
+
+def main():
+    """Parse arguments, run the benchmark and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--snapshot", default="data/vector_snapshot", help="Snapshot with Q&A embeddings")
+    parser.add_argument("--points", type=int, default=50000, help="Synthetic points without a snapshot")
+    parser.add_argument("--dimension", type=int, default=768, help="Synthetic dimension without a snapshot")
+    parser.add_argument("--clusters", type=int, default=200, help="Synthetic cluster count")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--query-noise", type=float, default=0.3, help="Noise added to sampled query vectors")
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--oversampling", type=float, nargs="+", default=[1.0, 2.0, 4.0, 8.0])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON only")
+    args = parser.parse_args()
+
+    report = run(args)
+
+    if args.json:
+        print(json.dumps(report))
+        return
+
+    print("=" * 72)
+    print(f"Quantization report: {report['points']} x {report['dimension']} ({report['source']})")
+    print("=" * 72)
+    recall_key = f"recall@{report['top_k']}"
+    for row in report["modes"]:
+        rescore = "no rescore" if row["oversampling"] is None else f"rescore x{row['oversampling']:g}"
+        if row["quantization"] == "none":
+            rescore = "exact"
+        print(
+            f"{row['quantization']:7s} {rescore:13s} {row['bytes_per_point']:5d} B/point  "
+            f"{recall_key}={row[recall_key]:.4f}  p50={row['p50_ms']:8.3f}ms  p99={row['p99_ms']:8.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
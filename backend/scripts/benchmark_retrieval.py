@@ -0,0 +1,368 @@
+"""Retrieval quality vs. latency over a grid of retrieval configurations.
+
+Builds an eval set from ``PreprocessingService.create_chunks``: every
+sampled stored question plus LLM-generated paraphrases of it, each with the
+point ID of its source chunk as the target. Each configuration of the grid
+(top_k, similarity threshold, rewriter on/off, quantization, embedding
+dimension) is scored with recall@1, recall@k and MRR, next to per-stage
+latency percentiles for rewrite, embed and search.
+
+Everything expensive is cached under ``--cache-dir``: the eval set, query
+rewrites, query and corpus embeddings, and each configuration's result, so
+a re-run only computes configurations it has not seen. ``--offline`` uses
+the hashing embedding and fake LLM instead of Gemini.
+
+Usage:
+    python scripts/benchmark_retrieval.py --top-k 1 3 5 --thresholds 0 0.5 --rewrite off on
+    python scripts/benchmark_retrieval.py --dimensions 768 256 --quantization none int8 binary --json
+    python scripts/benchmark_retrieval.py --offline --data data/Q&A.xlsx --paraphrases 2
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+PARAPHRASE_PROMPT = """Write {count} different paraphrases of the question below.
+Keep the language and the meaning; vary wording and word order.
+Output one paraphrase per line, without numbering or quotes.
+
+Question: {question}"""
+
+
+def configure(args):
+    """Switch the app's settings to offline providers; must run before importing ``app``."""
+    if args.offline:
+        os.environ.update({
+            "GEMINI_API_KEY": os.environ.get("GEMINI_API_KEY", "offline-benchmark"),
+            "EMBEDDING_PROVIDER": "hashing",
+            "LLM_PROVIDER": "fake"
+        })
+        os.environ.setdefault("FAKE_LLM_FIRST_TOKEN_MS", "0")
+        os.environ.setdefault("FAKE_LLM_TOKEN_MS", "0")
+
+
+def fingerprint(*parts):
+    """Short stable digest of JSON-serializable parts."""
+    return hashlib.sha256(json.dumps(parts, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def load_json(path):
+    """Read a JSON cache file, or None if absent."""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_json(path, data):
+    """Write a JSON cache file atomically."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=1)
+    os.replace(tmp, path)
+
+
+def perturb(question, rng):
+    """Rule-based paraphrase used with the fake LLM: drop, swap or reword."""
+    words = question.rstrip("?？ ").split()
+    if len(words) > 3 and rng.random() < 0.5:
+        del words[rng.randrange(len(words))]
+    if len(words) > 2:
+        i = rng.randrange(len(words) - 1)
+        words[i], words[i + 1] = words[i + 1], words[i]
+    return " ".join(words) + rng.choice(["?", " 알려주세요", " 궁금합니다"])
+
+
+def timed_ms(fn, *args):
+    """Call ``fn`` and return (result, elapsed milliseconds)."""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def summarize(samples_ms):
+    """Latency percentiles of samples in milliseconds."""
+    values = np.asarray(samples_ms, dtype=np.float64)
+    if values.size == 0:
+        return {}
+    return {
+        "p50": round(float(np.percentile(values, 50)), 3),
+        "p99": round(float(np.percentile(values, 99)), 3),
+        "mean": round(float(values.mean()), 3)
+    }
+
+
+class Benchmark:
+    """Lazily computed, disk-cached artifacts shared by the configurations."""
+
+    def __init__(self, args):
+        from app.core.config import settings
+        from app.application import dependencies
+        from app.infrastructure.vector_store import content_point_id
+        from app.services.preprocessing import PreprocessingService
+
+        self.args = args
+        self.settings = settings
+        self.dependencies = dependencies
+        os.makedirs(args.cache_dir, exist_ok=True)
+
+        self.chunks = PreprocessingService(args.data or settings.data_file).create_chunks()
+        self.point_ids = [content_point_id(chunk) for chunk in self.chunks]
+        self.llm_identity = [settings.llm_provider, settings.query_rewriter_model]
+        self.embedding_identity = [settings.embedding_provider, settings.embedding_model]
+        self.evalset = self._evalset()
+        self.evalset_key = fingerprint(self.evalset)
+
+        self._models = {}
+        self._stores = {}
+        self._queries = {}
+        self._rewrites = None
+
+    def _path(self, name):
+        return os.path.join(self.args.cache_dir, name)
+
+    def _evalset(self):
+        """Sampled stored questions plus paraphrases, each with its target point ID."""
+        key = fingerprint(sorted(self.point_ids), self.args.questions, self.args.paraphrases,
+                          self.args.seed, self.llm_identity)
+        path = self._path(f"evalset-{key}.json")
+        cached = load_json(path)
+        if cached is not None:
+            return cached
+
+        rng = random.Random(self.args.seed)
+        indices = list(range(len(self.chunks)))
+        rng.shuffle(indices)
+        indices = sorted(indices[:self.args.questions]) if self.args.questions else indices
+
+        llm = self.dependencies.get_query_processor_llm() if self.args.paraphrases else None
+        evalset = []
+        for i in indices:
+            question, target = self.chunks[i]["question"], self.point_ids[i]
+            evalset.append({"query": question, "target": target, "kind": "original"})
+            if not self.args.paraphrases:
+                continue
+            if self.settings.llm_provider == "fake":
+                paraphrases = [perturb(question, rng) for _ in range(self.args.paraphrases)]
+            else:
+                response = llm.generate(PARAPHRASE_PROMPT.format(count=self.args.paraphrases, question=question))
+                paraphrases = [line.strip(" -\"'") for line in response.splitlines() if line.strip()]
+            for paraphrase in paraphrases[:self.args.paraphrases]:
+                evalset.append({"query": paraphrase, "target": target, "kind": "paraphrase"})
+
+        save_json(path, evalset)
+        return evalset
+
+    def model(self, dimension):
+        """Embedding model at ``dimension``, without the embedding cache so latency is real."""
+        from app.infrastructure.embedding import create_embedding_model
+
+        if dimension not in self._models:
+            self._models[dimension] = create_embedding_model(
+                api_key=self.settings.gemini_api_key,
+                model_name=self.settings.embedding_model,
+                dimension=dimension,
+                provider=self.settings.embedding_provider,
+                fake_latency_ms=self.settings.fake_embedding_latency_ms
+            )
+        return self._models[dimension]
+
+    def rewrites(self):
+        """Rewritten eval queries and the latency of each rewrite."""
+        from app.infrastructure.query_processor import create_query_processor
+
+        if self._rewrites is None:
+            path = self._path(f"rewrites-{fingerprint(self.evalset_key, self.llm_identity)}.json")
+            self._rewrites = load_json(path)
+            if self._rewrites is None:
+                processor = create_query_processor(self.dependencies.get_query_processor_llm())
+                texts, latencies = [], []
+                for item in self.evalset:
+                    text, ms = timed_ms(processor.process_query, item["query"])
+                    texts.append(text)
+                    latencies.append(ms)
+                self._rewrites = {"texts": texts, "ms": latencies}
+                save_json(path, self._rewrites)
+        return self._rewrites
+
+    def queries(self, dimension, rewrite):
+        """Query embeddings at ``dimension`` and the latency of each embedding call."""
+        key = (dimension, rewrite)
+        if key not in self._queries:
+            path = self._path(
+                f"queries-{fingerprint(self.evalset_key, self.embedding_identity, self.llm_identity, dimension, rewrite)}.npz"
+            )
+            if os.path.exists(path):
+                data = np.load(path)
+                self._queries[key] = (data["vectors"], data["ms"])
+            else:
+                texts = self.rewrites()["texts"] if rewrite else [item["query"] for item in self.evalset]
+                model = self.model(dimension)
+                vectors, latencies = [], []
+                for text in texts:
+                    vector, ms = timed_ms(model.encode, [text])
+                    vectors.append(vector[0])
+                    latencies.append(ms)
+                self._queries[key] = (np.asarray(vectors, dtype=np.float32), np.asarray(latencies))
+                np.savez(path, vectors=self._queries[key][0], ms=self._queries[key][1])
+        return self._queries[key]
+
+    def store(self, dimension, quantization):
+        """In-process store over the corpus, embedded once per dimension with checkpoints."""
+        from app.infrastructure.vector_store import NumpyVectorStore
+        from app.services import BulkEmbedder
+
+        key = (dimension, quantization)
+        if key not in self._stores:
+            embedder = BulkEmbedder(
+                self.model(dimension),
+                batch_size=self.settings.embedding_batch_size,
+                max_concurrency=self.settings.embedding_max_concurrency,
+                requests_per_minute=self.settings.embedding_requests_per_minute,
+                checkpoint_dir=self._path(f"corpus-{fingerprint(self.embedding_identity)}")
+            )
+            embeddings = embedder.encode([chunk["content"] for chunk in self.chunks])
+            store = NumpyVectorStore(
+                "benchmark",
+                dimension,
+                quantization=quantization,
+                oversampling=self.settings.quantization_oversampling,
+                rescore=self.settings.quantization_rescore
+            )
+            store.index_documents(embeddings, self.chunks)
+            self._stores[key] = store
+        return self._stores[key]
+
+    def evaluate(self, config):
+        """Score one configuration."""
+        store = self.store(config["dimension"], config["quantization"])
+        vectors, embed_ms = self.queries(config["dimension"], config["rewrite"])
+        rewrite_ms = np.asarray(self.rewrites()["ms"]) if config["rewrite"] else np.zeros(len(vectors))
+
+        hits_at_1, hits_at_k, reciprocal_ranks, search_ms = [], [], [], []
+        for item, vector in zip(self.evalset, vectors):
+            results, ms = timed_ms(store.search, vector, config["top_k"], config["threshold"])
+            search_ms.append(ms)
+            ids = [result["id"] for result in results]
+            rank = ids.index(item["target"]) + 1 if item["target"] in ids else None
+            hits_at_1.append(rank == 1)
+            hits_at_k.append(rank is not None)
+            reciprocal_ranks.append(1.0 / rank if rank else 0.0)
+
+        total_ms = rewrite_ms + embed_ms + np.asarray(search_ms)
+        by_kind = {}
+        for kind in ("original", "paraphrase"):
+            mask = [item["kind"] == kind for item in self.evalset]
+            if any(mask):
+                by_kind[kind] = round(float(np.mean(np.asarray(hits_at_k)[mask])), 4)
+
+        latency = {"embed": summarize(embed_ms), "search": summarize(search_ms), "total": summarize(total_ms)}
+        if config["rewrite"]:
+            latency["rewrite"] = summarize(rewrite_ms)
+        return {
+            **config,
+            "queries": len(self.evalset),
+            "recall@1": round(float(np.mean(hits_at_1)), 4),
+            "recall@k": round(float(np.mean(hits_at_k)), 4),
+            "recall@k_by_kind": by_kind,
+            "mrr": round(float(np.mean(reciprocal_ranks)), 4),
+            "latency_ms": latency
+        }
+
+
+def run(args):
+    """Evaluate every configuration of the grid, reusing cached results."""
+    configure(args)
+    benchmark = Benchmark(args)
+
+    results_path = os.path.join(args.cache_dir, "results.json")
+    cache = load_json(results_path) or {}
+    identity = [benchmark.evalset_key, benchmark.embedding_identity, benchmark.llm_identity,
+                benchmark.settings.quantization_oversampling, benchmark.settings.quantization_rescore]
+
+    grid = itertools.product(args.dimensions, args.quantization, args.rewrite, args.top_k, args.thresholds)
+    results, computed = [], 0
+    for dimension, quantization, rewrite, top_k, threshold in grid:
+        config = {
+            "dimension": dimension,
+            "quantization": quantization,
+            "rewrite": rewrite == "on",
+            "top_k": top_k,
+            "threshold": threshold
+        }
+        key = fingerprint(identity, config)
+        if args.force or key not in cache:
+            cache[key] = benchmark.evaluate(config)
+            computed += 1
+            save_json(results_path, cache)
+        results.append(cache[key])
+
+    return {
+        "documents": len(benchmark.chunks),
+        "queries": len(benchmark.evalset),
+        "embedding": benchmark.embedding_identity,
+        "rewriter": benchmark.llm_identity,
+        "computed": computed,
+        "cached": len(results) - computed,
+        "results": results
+    }
+
+
+def main():
+    """Parse arguments, run the grid and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", help="Q&A source file or directory, defaults to data_file")
+    parser.add_argument("--questions", type=int, default=200, help="Stored questions sampled, 0 for all")
+    parser.add_argument("--paraphrases", type=int, default=2, help="Generated paraphrases per question")
+    parser.add_argument("--top-k", type=int, nargs="+", default=[1, 3, 5])
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.0, 0.5])
+    parser.add_argument("--rewrite", choices=["off", "on"], nargs="+", default=["off", "on"])
+    parser.add_argument("--quantization", choices=["none", "int8", "binary"], nargs="+", default=["none"])
+    parser.add_argument("--dimensions", type=int, nargs="+", default=None,
+                        help="Embedding dimensions, defaults to embedding_dimension")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cache-dir", default=os.path.join(BACKEND_DIR, "cache", "benchmark_retrieval"))
+    parser.add_argument("--force", action="store_true", help="Recompute configurations already cached")
+    parser.add_argument("--offline", action="store_true", help="Use the hashing embedding and fake LLM")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON only")
+    args = parser.parse_args()
+
+    if args.dimensions is None:
+        configure(args)
+        from app.core.config import settings
+        args.dimensions = [settings.embedding_dimension]
+
+    report = run(args)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False))
+        return
+
+    print("=" * 96)
+    print(f"Retrieval benchmark: {report['documents']} documents, {report['queries']} queries "
+          f"({report['computed']} computed, {report['cached']} cached)")
+    print("=" * 96)
+    print(f"{'dim':>5} {'quant':>6} {'rewrite':>7} {'k':>3} {'thr':>5} {'R@1':>7} {'R@k':>7} {'MRR':>7} "
+          f"{'rewrite p50':>12} {'embed p50':>10} {'search p50':>11} {'total p99':>10}")
+    for r in report["results"]:
+        latency = r["latency_ms"]
+        print(
+            f"{r['dimension']:>5} {r['quantization']:>6} {'on' if r['rewrite'] else 'off':>7} {r['top_k']:>3} "
+            f"{r['threshold']:>5.2f} {r['recall@1']:>7.3f} {r['recall@k']:>7.3f} {r['mrr']:>7.3f} "
+            f"{latency.get('rewrite', {}).get('p50', 0.0):>10.1f}ms {latency['embed']['p50']:>8.1f}ms "
+            f"{latency['search']['p50']:>9.3f}ms {latency['total']['p99']:>8.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Offline time-to-first-byte benchmark: blocking chat vs. streaming chat.
+
+Runs the async RAG pipeline with the fake streaming LLM and static retrieval
+stand-ins, so no Gemini quota or Qdrant instance is needed.
+
+Usage:
+    python scripts/benchmark_streaming.py --requests 20 --first-token-ms 300
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GEMINI_API_KEY", "offline-benchmark")
+
+from app.domain.services import AsyncRAGService
+from app.infrastructure.llm import AsyncFakeLLMClient
+from app.infrastructure.query_processor import AsyncQueryRewriter
+
+
+class StaticEmbedding:
+    """Embedding stand-in returning a constant vector after a fixed delay."""
+
+    def __init__(self, latency_ms: float, dimension: int = 8):
+        self.latency = latency_ms / 1000.0
+        self.dimension = dimension
+
+    async def encode(self, texts):
+        await asyncio.sleep(self.latency)
+        return np.ones((len(texts), self.dimension), dtype=np.float32)
+
+    def get_dimension(self) -> int:
+        return self.dimension
+
+
+class StaticVectorStore:
+    """Vector store stand-in returning fixed results after a fixed delay."""
+
+    def __init__(self, latency_ms: float):
+        self.latency = latency_ms / 1000.0
+
+    async def search(self, query_embedding, top_k=5, score_threshold=0.0):
+        await asyncio.sleep(self.latency)
+        return [
+            {
+                "id": str(i),
+                "score": 0.9 - i * 0.05,
+                "question": f"Sample question {i}",
+                "answer": f"Sample answer {i}",
+                "category": "perso_ai",
+                "content": f"질문: Sample question {i}\n답변: Sample answer {i}"
+            }
+            for i in range(top_k)
+        ]
+
+    async def health_check(self) -> bool:
+        return True
+
+
+def summarize(samples):
+    """Summarize latency samples in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1000, 1),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 1),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 1)
+    }
+
+
+async def run(args):
+    """Run the benchmark and return a report dictionary."""
+    rewriter_llm = AsyncFakeLLMClient(
+        first_token_latency_ms=args.rewrite_ms,
+        token_latency_ms=0,
+        response_tokens=12
+    )
+    generator_llm = AsyncFakeLLMClient(
+        first_token_latency_ms=args.first_token_ms,
+        token_latency_ms=args.token_ms,
+        response_tokens=args.tokens
+    )
+    service = AsyncRAGService(
+        embedding_model=StaticEmbedding(args.embed_ms),
+        vector_store=StaticVectorStore(args.search_ms),
+        query_processor=AsyncQueryRewriter(llm_client=rewriter_llm),
+        llm_client=generator_llm
+    )
+
+    blocking, metadata, first_token, streaming_total = [], [], [], []
+    for i in range(args.requests):
+        query = f"Perso.ai 요금제는 어떻게 되나요? #{i}"
+
+        start = time.perf_counter()
+        await service.chat(query)
+        blocking.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        seen_token = False
+        async for event in service.chat_stream(query):
+            elapsed = time.perf_counter() - start
+            if event["event"] == "metadata":
+                metadata.append(elapsed)
+            elif event["event"] == "token" and not seen_token:
+                first_token.append(elapsed)
+                seen_token = True
+        streaming_total.append(time.perf_counter() - start)
+
+    return {
+        "requests": args.requests,
+        "blocking_chat_ttfb": summarize(blocking),
+        "stream_metadata_ttfb": summarize(metadata),
+        "stream_first_token": summarize(first_token),
+        "stream_total": summarize(streaming_total)
+    }
+
+
+def main():
+    """Parse arguments, run the benchmark and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--rewrite-ms", type=float, default=300.0)
+    parser.add_argument("--embed-ms", type=float, default=80.0)
+    parser.add_argument("--search-ms", type=float, default=20.0)
+    parser.add_argument("--first-token-ms", type=float, default=400.0)
+    parser.add_argument("--token-ms", type=float, default=15.0)
+    parser.add_argument("--tokens", type=int, default=60)
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON only")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    if args.json:
+        print(json.dumps(report))
+        return
+
+    print("=" * 60)
+    print("Streaming TTFB benchmark (fake LLM, static retrieval)")
+    print("=" * 60)
+    for name, stats in report.items():
+        if isinstance(stats, dict):
+            print(f"{name:24s} p50={stats['p50_ms']:8.1f}ms  p95={stats['p95_ms']:8.1f}ms  mean={stats['mean_ms']:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
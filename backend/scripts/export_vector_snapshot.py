@@ -0,0 +1,56 @@
+"""Export a Qdrant collection into a NumPy snapshot for the in-process store.
+
+Replicas started with ``vector_store_provider=numpy`` load the snapshot from
+``vector_snapshot_path`` and need no external vector database.
+
+Usage:
+    python scripts/export_vector_snapshot.py                  # scroll live Qdrant
+    python scripts/export_vector_snapshot.py --from-jsonl export.jsonl
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.infrastructure.vector_store import NumpyVectorStore, QdrantVectorStore
+
+
+def main():
+    """Build and save the snapshot."""
+    parser = argparse.ArgumentParser(description="Export vectors to a NumPy snapshot")
+    parser.add_argument("--output", default=settings.vector_snapshot_path, help="Snapshot directory")
+    parser.add_argument("--from-jsonl", help="JSONL scroll export with id, vector and payload per line")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Points per scroll request")
+    args = parser.parse_args()
+
+    store = NumpyVectorStore(
+        collection_name=settings.qdrant_collection_name,
+        embedding_dimension=settings.embedding_dimension
+    )
+
+    if args.from_jsonl:
+        print(f"Importing {args.from_jsonl}...")
+        count = store.load_qdrant_export(args.from_jsonl)
+    else:
+        print(f"Scrolling Qdrant collection '{settings.qdrant_collection_name}'...")
+        qdrant = QdrantVectorStore(
+            host=settings.qdrant_host,
+            port=settings.qdrant_port,
+            collection_name=settings.qdrant_collection_name,
+            embedding_dimension=settings.embedding_dimension,
+            api_key=settings.qdrant_api_key
+        )
+        if not qdrant.health_check():
+            print("Error: Cannot connect to Qdrant")
+            return
+        count = store.load_from_qdrant(qdrant.client, settings.qdrant_collection_name, args.batch_size)
+
+    store.save_snapshot(args.output)
+    print(f"Saved {count} points to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
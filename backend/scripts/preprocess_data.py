@@ -1,5 +1,28 @@
-"""Data preprocessing and indexing script."""
+"""Data preprocessing and indexing script.
 
+By default the collection is synchronized incrementally: point IDs are
+derived from chunk content, so only new or edited rows are embedded and
+upserted and rows removed from the source are deleted. ``--rebuild``
+re-embeds everything: with Qdrant it fills a new ``{collection}_v{n}``
+collection, verifies it and atomically repoints the ``{collection}`` alias
+the API queries, so serving never sees a partial index; other backends
+re-create the collection in place.
+
+Embeddings are requested in parallel batches under the configured rate
+limit, and every finished batch is checkpointed; rerunning after a failure
+only embeds the batches that did not finish.
+
+Chunks are streamed from the source files on every pass instead of being
+held in one list, so memory does not grow with the size of the source.
+
+Usage:
+    python scripts/preprocess_data.py              # incremental sync
+    python scripts/preprocess_data.py --dry-run    # print the change summary only
+    python scripts/preprocess_data.py --rebuild    # full re-embed into a new collection
+    python scripts/preprocess_data.py --rebuild --yes  # no confirmation prompt
+"""
+
+import argparse
 import sys
 import os
 
@@ -7,27 +30,76 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.core.config import settings
 from app.services.preprocessing import PreprocessingService
+from app.services.indexing import IndexSyncService, BlueGreenIndexer, iter_batches
+from app.services.bulk_embedding import BulkEmbedder
 from app.infrastructure.embedding import create_embedding_model
-from app.infrastructure.vector_store import create_vector_store
+from app.infrastructure.vector_store import create_vector_store, QdrantCollectionVersions
+from app.infrastructure.cache import EmbeddingCache
+from app.infrastructure.lexical import BM25Index
+
+
+def print_progress(stats):
+    """Print embedding progress on one line."""
+    eta = f"{stats['eta_seconds']:.0f}s" if stats["eta_seconds"] is not None else "-"
+    print(
+        f"\r  Embedded {stats['done']}/{stats['total']} "
+        f"({stats['resumed']} from checkpoints, {stats['retries']} retries) "
+        f"{stats['texts_per_second']} texts/s, ETA {eta}   ",
+        end="",
+        flush=True
+    )
+    if stats["done"] >= stats["total"]:
+        print()
 
 
 def main():
     """Main preprocessing and indexing function."""
+    parser = argparse.ArgumentParser(description="Preprocess Q&A data and index it")
+    parser.add_argument("--rebuild", action="store_true", help="Re-embed everything into a new collection")
+    parser.add_argument("--dry-run", action="store_true", help="Print the sync plan without changing anything")
+    parser.add_argument("--yes", "-y", action="store_true", help="Do not ask for confirmation")
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.embedding_batch_size,
+        help="Texts per embedding request"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=settings.embedding_max_concurrency,
+        help="Embedding requests in flight at once"
+    )
+    parser.add_argument(
+        "--requests-per-minute", type=float, default=settings.embedding_requests_per_minute,
+        help="Embedding request rate limit, 0 for unlimited"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Processes used to chunk a directory of source files (default: CPU count)"
+    )
+    parser.add_argument(
+        "--grace-seconds", type=float, default=settings.collection_gc_grace_seconds,
+        help="Wait after switching the alias before deleting retired collections"
+    )
+    parser.add_argument(
+        "--keep-versions", type=int, default=settings.collection_keep_versions,
+        help="Retired collection versions kept for rollback"
+    )
+    args = parser.parse_args()
+
     print("="  * 60)
     print("Perso.ai Chatbot - Data Preprocessing & Indexing")
     print("=" * 60)
     
     # Step 1: Load and preprocess data
     print("\n[Step 1] Loading Q&A data...")
-    preprocessor = PreprocessingService(settings.data_file)
+    preprocessor = PreprocessingService(settings.data_file, max_workers=args.workers)
     
     try:
-        chunks = preprocessor.create_chunks()
-        print(f"Created {len(chunks)} chunks from data")
-        
-        if not preprocessor.validate_chunks(chunks):
-            print("Error: Chunk validation failed")
-            return
+        chunk_count = 0
+        for chunk in preprocessor.iter_all_chunks():
+            if not preprocessor.validate_chunks([chunk]):
+                print(f"Error: Chunk validation failed at {chunk.get('metadata')}")
+                return
+            chunk_count += 1
+        print(f"Created {chunk_count} chunks from data")
         print("Chunk validation passed")
         
     except Exception as e:
@@ -37,11 +109,35 @@ def main():
     # Step 2: Initialize embedding model
     print("\n[Step 2] Initializing embedding model...")
     try:
+        embedding_cache = None
+        if settings.embedding_cache_enabled:
+            embedding_cache = EmbeddingCache(
+                dimension=settings.embedding_dimension,
+                max_entries=settings.embedding_cache_max_entries,
+                dtype=settings.embedding_cache_dtype,
+                cache_dir=settings.embedding_cache_dir or None,
+                flush_every=settings.embedding_cache_flush_every
+            )
+
         embedding_model = create_embedding_model(
             api_key=settings.gemini_api_key,
             model_name=settings.embedding_model,
-            dimension=settings.embedding_dimension
+            dimension=settings.embedding_dimension,
+            cache=embedding_cache,
+            provider=settings.embedding_provider,
+            fake_latency_ms=settings.fake_embedding_latency_ms
+        )
+        bulk_embedder = BulkEmbedder(
+            embedding_model,
+            batch_size=args.batch_size,
+            max_concurrency=args.concurrency,
+            requests_per_minute=args.requests_per_minute,
+            max_retries=settings.embedding_max_retries,
+            checkpoint_dir=settings.embedding_checkpoint_dir or None,
+            on_progress=print_progress
         )
+        # One indexing round keeps every embedding worker busy once
+        index_batch_size = args.batch_size * args.concurrency
         print(f"Loaded embedding model: {settings.embedding_model}")
         print(f"Embedding dimension: {embedding_model.get_dimension()}")
         
@@ -49,27 +145,26 @@ def main():
         print(f"Error loading embedding model: {e}")
         return
     
-    # Step 3: Generate embeddings
-    print("\n[Step 3] Generating embeddings...")
-    try:
-        contents = [chunk["content"] for chunk in chunks]
-        embeddings = embedding_model.encode(contents)
-        print(f"Generated {len(embeddings)} embeddings")
-        print(f"Embedding shape: {embeddings.shape}")
-        
-    except Exception as e:
-        print(f"Error generating embeddings: {e}")
-        return
-    
-    # Step 4: Initialize Qdrant
-    print("\n[Step 4] Connecting to Qdrant...")
+    # Step 3: Initialize Qdrant
+    print("\n[Step 3] Connecting to Qdrant...")
+    store_kwargs = dict(
+        host=settings.qdrant_host,
+        port=settings.qdrant_port,
+        embedding_dimension=settings.embedding_dimension,
+        api_key=settings.qdrant_api_key,
+        provider=settings.vector_store_provider,
+        snapshot_path=settings.vector_snapshot_path,
+        mmap=settings.vector_snapshot_mmap,
+        quantization=settings.vector_quantization,
+        oversampling=settings.quantization_oversampling,
+        rescore=settings.quantization_rescore,
+        upsert_batch_size=settings.qdrant_upsert_batch_size,
+        upsert_parallel=settings.qdrant_upsert_parallel
+    )
     try:
         vector_store = create_vector_store(
-            host=settings.qdrant_host,
-            port=settings.qdrant_port,
             collection_name=settings.qdrant_collection_name,
-            embedding_dimension=settings.embedding_dimension,
-            api_key=settings.qdrant_api_key
+            **store_kwargs
         )
         
         if not vector_store.health_check():
@@ -83,45 +178,127 @@ def main():
         print(f"Error connecting to Qdrant: {e}")
         return
     
-    # Step 5: Create collection
-    print("\n[Step 5] Creating Qdrant collection...")
-    try:
-        response = input(f"Collection '{settings.qdrant_collection_name}' will be created/recreated. Continue? (y/n): ")
-        if response.lower() != 'y':
-            print("Aborted by user")
+    # The API reloads the lexical snapshot when it sees the vector index
+    # change, so it has to be written before the vectors.
+    if settings.lexical_index_path and not args.dry_run:
+        lexical_index = BM25Index(snapshot_path=settings.lexical_index_path)
+        if lexical_index.index_documents(preprocessor.iter_all_chunks()):
+            stats = lexical_index.get_stats()
+            print(f"Built lexical index: {stats['documents']} documents, {stats['vocabulary']} n-grams")
+            print(f"  Saved to: {settings.lexical_index_path}")
+
+    if not args.rebuild:
+        # Step 4: Sync changed chunks
+        print("\n[Step 4] Comparing source chunks with the collection...")
+        try:
+            vector_store.create_collection(recreate=False)
+            sync_service = IndexSyncService(bulk_embedder, vector_store, batch_size=index_batch_size)
+            plan = sync_service.plan(preprocessor.iter_all_chunks())
+            print(f"  New or changed: {len(plan.to_upsert)}")
+            print(f"  Stale:          {len(plan.to_delete)}")
+            print(f"  Unchanged:      {plan.unchanged}")
+            if plan.duplicates:
+                print(f"  Duplicates:     {plan.duplicates} (indexed once)")
+
+            if args.dry_run:
+                print("\nDry run, nothing changed")
+                return
+
+            bulk_embedder.expect(len(plan.to_upsert))
+            summary = sync_service.apply(plan)
+            print(
+                f"Synced in {summary['seconds']}s: {summary['upserted']} upserted, "
+                f"{summary['deleted']} deleted, {summary['unchanged']} unchanged"
+            )
+            if embedding_cache is not None:
+                stats = embedding_cache.get_stats()
+                print(f"Embedding cache: {stats['hits']} hits, {stats['misses']} misses")
+
+        except Exception as e:
+            print(f"Error syncing collection: {e}")
+            return
+    elif settings.vector_store_provider == "qdrant":
+        # Step 4: Build and publish a new collection version
+        print("\n[Step 4] Building a new collection version...")
+        try:
+            versions = QdrantCollectionVersions(vector_store.client, settings.qdrant_collection_name)
+            indexer = BlueGreenIndexer(
+                bulk_embedder,
+                versions,
+                lambda name: create_vector_store(collection_name=name, **store_kwargs),
+                batch_size=index_batch_size
+            )
+            print(f"Building {versions.next_name()} (serving: {versions.current() or 'none'})")
+            bulk_embedder.expect(chunk_count)
+            summary = indexer.rebuild(
+                preprocessor.iter_all_chunks(),
+                grace_seconds=args.grace_seconds,
+                keep_versions=args.keep_versions
+            )
+            print(
+                f"Published {summary['collection']} with {summary['points']} points "
+                f"in {summary['seconds']}s (previous: {summary['previous'] or 'none'})"
+            )
+            if summary["deleted"]:
+                print(f"Deleted retired collections: {', '.join(summary['deleted'])}")
+
+        except Exception as e:
+            print(f"Error rebuilding collection: {e}")
             return
+    else:
+        # Step 4: Create collection
+        print("\n[Step 4] Creating Qdrant collection...")
+        try:
+            if not args.yes:
+                if not sys.stdin.isatty():
+                    print("Error: Refusing to recreate the collection without a terminal; pass --yes")
+                    return
+                response = input(f"Collection '{settings.qdrant_collection_name}' will be created/recreated. Continue? (y/n): ")
+                if response.lower() != 'y':
+                    print("Aborted by user")
+                    return
         
-        vector_store.create_collection(recreate=True)
-        print(f"Created collection: {settings.qdrant_collection_name}")
+            vector_store.create_collection(recreate=True)
+            print(f"Created collection: {settings.qdrant_collection_name}")
         
-    except Exception as e:
-        print(f"Error creating collection: {e}")
-        return
+        except Exception as e:
+            print(f"Error creating collection: {e}")
+            return
     
-    # Step 6: Index documents
-    print("\n[Step 6] Indexing documents...")
-    try:
-        success = vector_store.index_documents(embeddings, chunks)
-        
-        if success:
-            print(f"Successfully indexed {len(chunks)} documents")
+        # Step 5: Embed and index documents batch by batch
+        print("\n[Step 5] Embedding and indexing documents...")
+        try:
+            bulk_embedder.expect(chunk_count)
+            indexed = 0
+            for batch in iter_batches(preprocessor.iter_all_chunks(), index_batch_size):
+                embeddings = bulk_embedder.encode([chunk["content"] for chunk in batch])
+                if not vector_store.index_documents(embeddings, batch):
+                    print(f"Error: Indexing chunks {indexed}-{indexed + len(batch)} failed")
+                    return
+                indexed += len(batch)
+            vector_store.flush()
+            print(f"Successfully indexed {indexed} documents")
+            if embedding_cache is not None:
+                stats = embedding_cache.get_stats()
+                print(f"Embedding cache: {stats['hits']} hits, {stats['misses']} misses")
             
-            info = vector_store.get_collection_info()
-            print(f"\nCollection Information:")
-            print(f"  Name: {info.get('name')}")
-            print(f"  Points: {info.get('points_count')}")
-            print(f"  Vectors: {info.get('vectors_count')}")
-            print(f"  Status: {info.get('status')}")
-        else:
-            print("Error: Indexing failed")
+        except Exception as e:
+            print(f"Error indexing documents: {e}")
             return
-            
-    except Exception as e:
-        print(f"Error indexing documents: {e}")
-        return
-    
-    # Step 7: Test search
-    print("\n[Step 7] Testing search...")
+
+    bulk_embedder.clear_checkpoints()
+    if embedding_cache is not None:
+        embedding_cache.flush()
+
+    info = vector_store.get_collection_info()
+    print(f"\nCollection Information:")
+    print(f"  Name: {info.get('name')}")
+    print(f"  Points: {info.get('points_count')}")
+    print(f"  Vectors: {info.get('vectors_count')}")
+    print(f"  Status: {info.get('status')}")
+
+    # Step 6: Test search
+    print("\n[Step 6] Testing search...")
     try:
         test_query = "Perso.ai는 무엇인가요?"
         print(f"Test query: {test_query}")
@@ -0,0 +1,133 @@
+"""Shared fixtures: offline RAG services over a small in-process index."""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GEMINI_API_KEY", "test")
+
+import pytest
+
+from app.domain.services import RAGService, AsyncRAGService
+from app.infrastructure.embedding import HashingEmbedding, AsyncHashingEmbedding
+from app.infrastructure.lexical import BM25Index
+from app.infrastructure.llm import FakeLLMClient, AsyncFakeLLMClient
+from app.infrastructure.vector_store import NumpyVectorStore, AsyncVectorStoreAdapter
+
+DIMENSION = 64
+
+QUESTIONS = [
+    "Perso.ai는 무엇인가요?",
+    "AI 더빙은 몇 개 언어를 지원하나요?",
+    "요금제는 어떻게 되나요?",
+    "영상 길이 제한이 있나요?",
+    "립싱크 기능은 무엇인가요?",
+    "무료 체험이 가능한가요?"
+]
+
+
+def make_chunk(index: int, question: str, answer: str) -> dict:
+    """Build a chunk shaped like ``PreprocessingService.iter_chunks`` output."""
+    return {
+        "id": str(index),
+        "question": question,
+        "answer": answer,
+        "content": f"질문: {question}\n답변: {answer}",
+        "metadata": {"source": "test.csv", "row_number": index, "category": "perso_ai"}
+    }
+
+
+class RecordingQueryProcessor:
+    """Query rewriter that records calls and fails on queries containing "fail"."""
+
+    def __init__(self):
+        self.calls = []
+
+    def process_query(self, query: str) -> str:
+        self.calls.append(query)
+        if "fail" in query:
+            raise RuntimeError(f"rewrite failed: {query}")
+        return f"{query.strip()} 설명"
+
+
+class AsyncRecordingQueryProcessor(RecordingQueryProcessor):
+    """Async variant of ``RecordingQueryProcessor``."""
+
+    async def process_query(self, query: str) -> str:
+        return RecordingQueryProcessor.process_query(self, query)
+
+
+class CountingEmbedding(HashingEmbedding):
+    """Hashing embedding that counts ``encode`` calls."""
+
+    def __init__(self, dimension: int = DIMENSION):
+        super().__init__(dimension=dimension)
+        self.calls = 0
+
+    def encode(self, texts):
+        self.calls += 1
+        return super().encode(texts)
+
+
+class AsyncCountingEmbedding(AsyncHashingEmbedding):
+    """Async hashing embedding that counts ``encode`` calls."""
+
+    def __init__(self, dimension: int = DIMENSION):
+        super().__init__(dimension=dimension)
+        self.calls = 0
+
+    async def encode(self, texts):
+        self.calls += 1
+        return await super().encode(texts)
+
+
+@pytest.fixture
+def chunks():
+    return [make_chunk(i + 1, question, f"답변 {i + 1}") for i, question in enumerate(QUESTIONS)]
+
+
+@pytest.fixture
+def vector_store(chunks):
+    store = NumpyVectorStore("test", DIMENSION)
+    embeddings = HashingEmbedding(dimension=DIMENSION).encode([chunk["content"] for chunk in chunks])
+    assert store.index_documents(embeddings, chunks)
+    return store
+
+
+@pytest.fixture
+def lexical_index(chunks):
+    index = BM25Index()
+    assert index.index_documents(chunks)
+    return index
+
+
+@pytest.fixture
+def make_service(vector_store):
+    """Build a sync service; components and settings can be overridden."""
+    def build(**overrides):
+        kwargs = {
+            "embedding_model": CountingEmbedding(),
+            "vector_store": vector_store,
+            "query_processor": RecordingQueryProcessor(),
+            "llm_client": FakeLLMClient(first_token_latency_ms=0, token_latency_ms=0),
+            "rewrite_mode": "never",
+            **overrides
+        }
+        return RAGService(**kwargs)
+    return build
+
+
+@pytest.fixture
+def make_async_service(vector_store):
+    """Build an async service over the same index."""
+    def build(**overrides):
+        kwargs = {
+            "embedding_model": AsyncCountingEmbedding(),
+            "vector_store": AsyncVectorStoreAdapter(vector_store),
+            "query_processor": AsyncRecordingQueryProcessor(),
+            "llm_client": AsyncFakeLLMClient(first_token_latency_ms=0, token_latency_ms=0),
+            "rewrite_mode": "never",
+            **overrides
+        }
+        return AsyncRAGService(**kwargs)
+    return build
@@ -0,0 +1,100 @@
+"""Batch chat: ordering, per-item failures and rewrite modes."""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.application import dependencies
+from app.core.config import settings
+from app.main import app
+from conftest import QUESTIONS
+
+UNRELATED = "오늘 서울 날씨 알려줘"
+
+
+def run_batch(service, queries):
+    result = service.chat_batch(queries, score_threshold=0.0)
+    return asyncio.run(result) if asyncio.iscoroutine(result) else result
+
+
+@pytest.fixture(params=["sync", "async"])
+def build(request, make_service, make_async_service):
+    return make_service if request.param == "sync" else make_async_service
+
+
+def test_results_follow_input_order(build):
+    service = build(rewrite_mode="always")
+    queries = [QUESTIONS[2], QUESTIONS[0], QUESTIONS[4]]
+
+    results = run_batch(service, queries)
+
+    assert [r["rewritten_query"] for r in results] == [f"{q} 설명" for q in queries]
+    assert [r["retrieved_chunks"][0]["metadata"]["question"] for r in results] == queries
+    assert all(r["error"] is None and r["answer"] for r in results)
+
+
+def test_failed_rewrite_only_fails_its_item(build):
+    service = build(rewrite_mode="always")
+    queries = [QUESTIONS[1], f"fail {QUESTIONS[3]}", QUESTIONS[5]]
+
+    results = run_batch(service, queries)
+
+    assert results[1]["answer"] is None
+    assert "rewrite failed" in results[1]["error"]
+    assert results[1]["retrieval_path"] is None
+    for i in (0, 2):
+        assert results[i]["error"] is None
+        assert results[i]["retrieved_chunks"][0]["metadata"]["question"] == queries[i]
+
+
+@pytest.mark.parametrize("mode, rewritten, paths", [
+    ("never", [], ["raw", "raw"]),
+    ("always", [QUESTIONS[2], UNRELATED], ["rewrite", "rewrite"]),
+    ("adaptive", [UNRELATED], ["raw", "rewrite_fallback"]),
+    ("speculative", [QUESTIONS[2], UNRELATED], ["raw", "rewrite_fallback"]),
+])
+def test_rewrite_modes(build, mode, rewritten, paths):
+    service = build(rewrite_mode=mode, rewrite_score_threshold=0.5)
+
+    results = run_batch(service, [QUESTIONS[2], UNRELATED])
+
+    assert sorted(service.query_processor.calls) == sorted(rewritten)
+    assert [r["retrieval_path"] for r in results] == paths
+    assert results[0]["rewritten_query"] == (f"{QUESTIONS[2]} 설명" if mode == "always" else QUESTIONS[2])
+
+
+@pytest.mark.parametrize("setting", [
+    {"rewrite_mode": "sometimes"},
+    {"retrieval_mode": "sparse"},
+    {"fusion": "borda"},
+])
+def test_unknown_modes_are_rejected(make_service, setting):
+    with pytest.raises(ValueError, match="Unknown"):
+        make_service(**setting)
+
+
+@pytest.fixture
+def client(make_async_service):
+    app.dependency_overrides[dependencies.get_async_rag_service] = lambda: make_async_service()
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_batch_endpoint_returns_items_in_order(client):
+    queries = [QUESTIONS[3], QUESTIONS[0]]
+
+    response = client.post(f"{settings.api_prefix}/chat/batch", json={"messages": queries})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["retrieved_chunks"][0]["metadata"]["question"] for r in results] == queries
+    assert [r["retrieval_path"] for r in results] == ["raw", "raw"]
+    assert all(r["error"] is None for r in results)
+
+
+@pytest.mark.parametrize("messages", [[], [""], [QUESTIONS[0], "   "]])
+def test_batch_endpoint_rejects_empty_messages(client, messages):
+    response = client.post(f"{settings.api_prefix}/chat/batch", json={"messages": messages})
+
+    assert response.status_code == 422
@@ -0,0 +1,68 @@
+"""Request deadlines degrade slow stages instead of failing the request."""
+
+import asyncio
+import time
+
+from app.infrastructure.llm import FakeLLMClient, AsyncFakeLLMClient
+from app.infrastructure.query_processor import create_query_processor, create_async_query_processor
+from conftest import QUESTIONS
+
+SLOW_MS = 3000
+BUDGET = 0.6
+
+
+def test_slow_generation_falls_back_to_extractive_answer(make_service):
+    service = make_service(
+        llm_client=FakeLLMClient(first_token_latency_ms=SLOW_MS, token_latency_ms=0),
+        request_timeout=BUDGET
+    )
+
+    start = time.perf_counter()
+    result = service.chat(QUESTIONS[1], score_threshold=0.0)
+
+    assert time.perf_counter() - start < SLOW_MS / 1000
+    assert result["served_by"] == "extractive_fallback"
+    assert result["answer"] == "답변 2"
+    assert "generate" in result["degraded"]
+
+
+def test_slow_rewrite_searches_the_raw_query(make_service):
+    service = make_service(
+        query_processor=create_query_processor(FakeLLMClient(first_token_latency_ms=SLOW_MS)),
+        rewrite_mode="always",
+        request_timeout=BUDGET
+    )
+
+    start = time.perf_counter()
+    result = service.chat(QUESTIONS[3], score_threshold=0.0)
+
+    assert time.perf_counter() - start < SLOW_MS / 1000
+    assert result["retrieval_path"] == "raw"
+    assert result["rewritten_query"] == QUESTIONS[3]
+    assert result["degraded"] == ["rewrite"]
+    assert result["served_by"] == "generation"
+
+
+def test_async_deadline_degrades_rewrite_and_generation(make_async_service):
+    slow = AsyncFakeLLMClient(first_token_latency_ms=SLOW_MS, token_latency_ms=0)
+    service = make_async_service(
+        query_processor=create_async_query_processor(slow),
+        llm_client=slow,
+        rewrite_mode="always",
+        request_timeout=BUDGET
+    )
+
+    start = time.perf_counter()
+    result = asyncio.run(service.chat(QUESTIONS[5], score_threshold=0.0))
+
+    assert time.perf_counter() - start < SLOW_MS / 1000
+    assert result["retrieval_path"] == "raw"
+    assert result["served_by"] == "extractive_fallback"
+    assert set(result["degraded"]) == {"rewrite", "generate"}
+
+
+def test_no_budget_means_no_degradation(make_service):
+    result = make_service(rewrite_mode="always").chat(QUESTIONS[0], score_threshold=0.0)
+
+    assert result["degraded"] == []
+    assert result["served_by"] == "generation"
@@ -0,0 +1,58 @@
+"""Content-ID sync planning and streamed preprocessing."""
+
+import csv
+
+from app.infrastructure.embedding import HashingEmbedding
+from app.infrastructure.vector_store import NumpyVectorStore, content_point_id
+from app.services.indexing import IndexSyncService
+from app.services.preprocessing import PreprocessingService
+from conftest import DIMENSION, make_chunk
+
+
+def make_sync():
+    store = NumpyVectorStore("sync", DIMENSION)
+    return IndexSyncService(HashingEmbedding(dimension=DIMENSION), store, batch_size=2)
+
+
+def test_first_sync_upserts_every_chunk(chunks):
+    sync = make_sync()
+
+    plan = sync.plan(iter(chunks))
+    summary = sync.apply(plan)
+
+    assert len(plan.to_upsert) == len(chunks)
+    assert plan.to_delete == [] and plan.unchanged == 0
+    assert summary["upserted"] == len(chunks)
+    assert set(sync.vector_store.get_point_ids()) == {content_point_id(chunk) for chunk in chunks}
+
+
+def test_resync_only_touches_changed_chunks(chunks):
+    sync = make_sync()
+    sync.sync(chunks)
+
+    edited = make_chunk(1, chunks[0]["question"], "새로운 답변")
+    source = [edited, *chunks[1:-1], chunks[1]]
+    plan = sync.plan(iter(source))
+
+    assert plan.to_upsert == [edited]
+    assert sorted(plan.to_delete) == sorted([content_point_id(chunks[0]), content_point_id(chunks[-1])])
+    assert plan.unchanged == len(chunks) - 2
+    assert plan.duplicates == 1
+
+    sync.apply(plan)
+    assert set(sync.vector_store.get_point_ids()) == {content_point_id(chunk) for chunk in source}
+    assert sync.plan(source).to_upsert == []
+
+
+def test_directory_chunks_stream_in_file_order(tmp_path):
+    for f in range(5):
+        with open(tmp_path / f"part{f}.csv", "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["content"])
+            for row in range(3):
+                writer.writerow([f"Q. 질문 {f}-{row} A. 답변 {f}-{row}"])
+
+    chunks = list(PreprocessingService(str(tmp_path), max_workers=2).iter_all_chunks())
+
+    assert [chunk["question"] for chunk in chunks] == [f"질문 {f}-{row}" for f in range(5) for row in range(3)]
+    assert [chunk["id"] for chunk in chunks] == [str(i) for i in range(1, 16)]
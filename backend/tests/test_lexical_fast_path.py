@@ -0,0 +1,61 @@
+"""Lexical fast path: restated questions skip embedding and vector search."""
+
+import asyncio
+import threading
+
+from conftest import QUESTIONS
+
+
+class ThreadRecordingIndex:
+    """Lexical index wrapper recording the thread of every search."""
+
+    def __init__(self, index):
+        self.index = index
+        self.threads = []
+
+    def __getattr__(self, name):
+        return getattr(self.index, name)
+
+    def search(self, query, top_k=10):
+        self.threads.append(threading.current_thread())
+        return self.index.search(query, top_k)
+
+
+def test_restated_question_skips_embedding(make_service, lexical_index):
+    service = make_service(lexical_index=lexical_index)
+
+    result = service.chat(QUESTIONS[2], score_threshold=0.0)
+
+    assert result["retrieval_path"] == "lexical"
+    assert result["retrieved_chunks"][0]["metadata"]["question"] == QUESTIONS[2]
+    assert result["retrieved_chunks"][0]["lexical_score"] >= service.lexical_fast_path_threshold
+    assert service.embedding_model.calls == 0
+
+
+def test_unmatched_question_falls_back_to_dense_search(make_service, lexical_index):
+    service = make_service(lexical_index=lexical_index)
+
+    result = service.chat("오늘 서울 날씨 알려줘", score_threshold=0.0)
+
+    assert result["retrieval_path"] == "raw"
+    assert service.embedding_model.calls == 1
+
+
+def test_fast_path_can_be_disabled(make_service, lexical_index):
+    service = make_service(lexical_index=lexical_index, lexical_fast_path_threshold=0.0)
+
+    result = service.chat(QUESTIONS[2], score_threshold=0.0)
+
+    assert result["retrieval_path"] == "raw"
+    assert service.embedding_model.calls == 1
+
+
+def test_async_fast_path_searches_off_the_event_loop(make_async_service, lexical_index):
+    index = ThreadRecordingIndex(lexical_index)
+    service = make_async_service(lexical_index=index)
+
+    result = asyncio.run(service.chat(QUESTIONS[4], score_threshold=0.0))
+
+    assert result["retrieval_path"] == "lexical"
+    assert service.embedding_model.calls == 0
+    assert index.threads and threading.main_thread() not in index.threads
@@ -0,0 +1,102 @@
+"""In-process vector stores against exact brute-force search."""
+
+import numpy as np
+import pytest
+
+from app.infrastructure.vector_store import NumpyVectorStore, IVFVectorStore
+
+POINTS = 600
+DIMENSION = 32
+TOP_K = 5
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(7)
+    vectors = rng.standard_normal((POINTS, DIMENSION)).astype(np.float32)
+    queries = rng.standard_normal((20, DIMENSION)).astype(np.float32)
+    return vectors, queries
+
+
+def exact_top_k(vectors, query, k=TOP_K):
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = normalized @ (query / np.linalg.norm(query))
+    return [str(i) for i in np.argsort(-scores)[:k]]
+
+
+def fill(store, vectors, batch=100):
+    for start in range(0, len(vectors), batch):
+        store.import_points(
+            (str(i), vectors[i], {"question": f"q{i}"}) for i in range(start, min(start + batch, len(vectors)))
+        )
+    return store
+
+
+def ids(hits):
+    return [str(hit["id"]) for hit in hits]
+
+
+def test_numpy_search_matches_exact(data):
+    vectors, queries = data
+    store = fill(NumpyVectorStore("exact", DIMENSION), vectors)
+
+    for query in queries:
+        assert ids(store.search(query, top_k=TOP_K, score_threshold=-1.0)) == exact_top_k(vectors, query)
+
+
+@pytest.mark.parametrize("quantization", ["none", "int8", "binary"])
+def test_search_batch_matches_single_searches(data, quantization):
+    vectors, queries = data
+    store = fill(NumpyVectorStore("batch", DIMENSION, quantization=quantization), vectors)
+
+    batched = store.search_batch(queries, top_k=TOP_K, score_threshold=-1.0)
+
+    assert [ids(hits) for hits in batched] == [
+        ids(store.search(query, top_k=TOP_K, score_threshold=-1.0)) for query in queries
+    ]
+
+
+def test_int8_rescored_search_finds_exact_top_hit(data):
+    vectors, queries = data
+    store = fill(NumpyVectorStore("int8", DIMENSION, quantization="int8"), vectors)
+
+    top = [ids(store.search(query, top_k=TOP_K, score_threshold=-1.0))[0] for query in queries]
+
+    assert top == [exact_top_k(vectors, query)[0] for query in queries]
+
+
+def test_int8_scale_is_refit_as_the_store_grows(data):
+    vectors, _ = data
+    store = fill(NumpyVectorStore("refit", DIMENSION, quantization="int8"), vectors, batch=50)
+
+    state = store._state
+    assert state.quantizer.fitted_rows > POINTS // 2
+    assert np.array_equal(state.codes, state.quantizer.encode(np.asarray(state.vectors)))
+
+
+def test_ivf_probing_every_list_is_exact(data):
+    vectors, queries = data
+    store = fill(IVFVectorStore("ivf", DIMENSION, nlist=16, nprobe=16, min_train_size=1), vectors)
+
+    for query in queries:
+        assert ids(store.search(query, top_k=TOP_K, score_threshold=-1.0)) == exact_top_k(vectors, query)
+
+
+def test_ivf_recall_grows_with_nprobe(data):
+    vectors, queries = data
+    store = fill(IVFVectorStore("ivf", DIMENSION, nlist=16, min_train_size=1), vectors)
+
+    def recall(nprobe):
+        store.nprobe = nprobe
+        found = [
+            len(set(ids(store.search(query, top_k=TOP_K, score_threshold=-1.0))) & set(exact_top_k(vectors, query)))
+            for query in queries
+        ]
+        return sum(found) / (TOP_K * len(queries))
+
+    assert recall(1) < recall(4) <= recall(16) == 1.0
+
+
+def test_unknown_quantization_is_rejected():
+    with pytest.raises(ValueError, match="Unknown vector_quantization"):
+        NumpyVectorStore("bad", DIMENSION, quantization="pq")
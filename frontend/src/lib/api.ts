@@ -13,7 +13,8 @@ export interface ChatRequest {
 
 export interface RetrievedChunk {
   content: string;
-  score: number;
+  score: number | null;
+  lexical_score?: number | null;
   metadata: Record<string, any>;
 }
 